@@ -0,0 +1,8 @@
+"""
+Offline performance benchmarks.
+
+Replays recorded DataForSEO, OpenAI, Google and Stability AI responses
+through local stand-ins so the API can be load-tested without credentials.
+Run with ``python -m benchmarks.run``; compare reports with
+``python -m benchmarks.compare``.
+"""
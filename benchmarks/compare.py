@@ -0,0 +1,113 @@
+"""
+Compare a benchmark result file against a baseline.
+
+Usage:
+    python -m benchmarks.compare results.json baseline.json [--max-regression 0.2]
+
+Exits with status 1 when any tracked metric regressed by more than the
+allowed fraction, so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+# (metric path, higher is better, absolute change ignored as noise)
+TRACKED_METRICS: List[Tuple[str, bool, float]] = [
+    ("throughput_rps", True, 0.5),
+    ("latency_ms.p50", False, 5.0),
+    ("latency_ms.p95", False, 5.0),
+    ("latency_ms.p99", False, 10.0),
+    ("loop_lag_ms.p99", False, 5.0),
+    ("peak_rss_mb", False, 16.0),
+]
+
+
+def _lookup(result: Dict[str, Any], path: str) -> float:
+    value: Any = result
+    for part in path.split("."):
+        value = value[part]
+    return float(value)
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    max_regression: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Find regressions between two result documents.
+
+    Args:
+        current: Result document from this run
+        baseline: Result document to compare against
+        max_regression: Allowed relative change in the worse direction
+
+    Returns:
+        One entry per regressed metric (scenario, metric, baseline, current, change);
+        scenarios missing from either side are skipped
+    """
+    regressions = []
+    for name, result in current.get("scenarios", {}).items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        if result.get("errors", 0) > base.get("errors", 0):
+            regressions.append({
+                "scenario": name,
+                "metric": "errors",
+                "baseline": base.get("errors", 0),
+                "current": result["errors"],
+                "change": None,
+            })
+        for path, higher_is_better, noise in TRACKED_METRICS:
+            try:
+                old, new = _lookup(base, path), _lookup(result, path)
+            except (KeyError, TypeError, ValueError):
+                continue
+            worse_by = (old - new) if higher_is_better else (new - old)
+            if worse_by <= noise or old <= 0:
+                continue
+            change = worse_by / old
+            if change > max_regression:
+                regressions.append({
+                    "scenario": name,
+                    "metric": path,
+                    "baseline": old,
+                    "current": new,
+                    "change": round(change, 3),
+                })
+    return regressions
+
+
+def format_regressions(regressions: List[Dict[str, Any]]) -> str:
+    if not regressions:
+        return "No regressions against baseline."
+    lines = ["Regressions against baseline:"]
+    for r in regressions:
+        change = f" ({r['change']:+.0%})" if r["change"] is not None else ""
+        lines.append(f"  {r['scenario']}: {r['metric']} {r['baseline']} -> {r['current']}{change}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("results", help="Result JSON from benchmarks.run")
+    parser.add_argument("baseline", help="Baseline result JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed relative regression per metric (default 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    with open(args.results) as f:
+        current = json.load(f)
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare_results(current, baseline, args.max_regression)
+    print(format_regressions(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Measurements collected while a benchmark scenario runs.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Percentile using linear interpolation between closest ranks.
+
+    Args:
+        values: Samples (any order)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        Interpolated value, or 0.0 for no samples
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return ordered[int(rank)]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """p50/p95/p99/mean/max of a sample set, rounded to 0.01."""
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    return {
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "p99": round(percentile(values, 99), 2),
+        "mean": round(sum(values) / len(values), 2),
+        "max": round(max(values), 2),
+    }
+
+
+class LoopLagMonitor:
+    """
+    Event-loop lag probe.
+
+    Schedules a wake-up every ``interval`` seconds and records how late it
+    fires; anything blocking the loop shows up as lag.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples_ms: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples_ms.append(max(0.0, (loop.time() - expected) * 1000.0))
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> Dict[str, float]:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return {
+            "p99": round(percentile(self.samples_ms, 99), 2),
+            "max": round(max(self.samples_ms, default=0.0), 2),
+        }
+
+
+class PeakRSSSampler:
+    """
+    Peak resident set size of this process while the sampler runs.
+
+    Samples from a background thread so a blocked event loop cannot hide a
+    spike. Falls back to ``ru_maxrss`` (process lifetime peak) without psutil.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        process = psutil.Process(os.getpid())
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, process.memory_info().rss)
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if PSUTIL_AVAILABLE:
+            self._thread = threading.Thread(target=self._sample, name="bench-rss", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> float:
+        """Stop sampling and return the peak in MiB."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self.peak_bytes = max(self.peak_bytes, psutil.Process(os.getpid()).memory_info().rss)
+        else:
+            import resource
+            # ru_maxrss is KiB on Linux
+            self.peak_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return round(self.peak_bytes / (1024 * 1024), 1)
+
+
+class Stopwatch:
+    """Wall-clock timer in milliseconds."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000.0
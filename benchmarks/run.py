@@ -0,0 +1,303 @@
+"""
+Offline benchmark runner.
+
+Drives the FastAPI application in-process (ASGI transport, no sockets) with
+every upstream replaced by recorded fixtures, and writes a JSON report with
+throughput, latency percentiles, event-loop lag and peak RSS per scenario
+and concurrency level.
+
+Usage:
+    python -m benchmarks.run --scenarios keywords_enhanced,blog_job \\
+        --concurrency 1,8 --iterations 40 --latency-profile fast \\
+        --output results.json [--baseline baseline.json]
+
+Cloud Tasks run through the in-process emulator, which delivers each task to
+the worker endpoint on the same application, so async job scenarios measure
+the full enqueue -> worker -> poll round trip.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .compare import compare_results, format_regressions
+from .metrics import LoopLagMonitor, PeakRSSSampler, Stopwatch, summarize
+from .scenarios import Scenario, ScenarioError, SCENARIOS, select
+from .upstreams import LATENCY_PROFILES, UpstreamReplay, install_upstreams, use_memory_cache
+
+BASE_URL = "http://bench"
+
+# Credentials only need to be present; every request they sign is replayed
+BENCH_ENV = {
+    "ENVIRONMENT": "benchmark",
+    "OPENAI_API_KEY": "sk-bench",
+    "DATAFORSEO_API_KEY": "bench",
+    "DATAFORSEO_API_SECRET": "bench",
+    "DATAFORSEO_API_LOGIN": "bench",
+    "DATAFORSEO_API_PASSWORD": "bench",
+    "GOOGLE_CUSTOM_SEARCH_API_KEY": "bench",
+    "GOOGLE_CUSTOM_SEARCH_ENGINE_ID": "bench",
+    "GOOGLE_KNOWLEDGE_GRAPH_API_KEY": "bench",
+    # Replayed searches cost nothing; the default daily budget would run out mid-run
+    "GOOGLE_CUSTOM_SEARCH_DAILY_QUOTA": "1000000",
+    "STABILITY_AI_API_KEY": "sk-bench",
+    "CLOUD_TASKS_EMULATOR": "true",
+    "CLOUD_RUN_SERVICE_URL": BASE_URL,
+    "STARTUP_WARM_ALL": "true",
+}
+
+# Settings that would point the app at real infrastructure
+DROPPED_ENV = ("REDIS_URL", "REDIS_HOST", "SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "CLOUD_RUN_WORKER_URL")
+
+
+def _configure_environment() -> None:
+    """Apply benchmark settings; real credentials are dropped so nothing leaks upstream."""
+    for name, value in BENCH_ENV.items():
+        os.environ[name] = value
+    for name in DROPPED_ENV:
+        os.environ.pop(name, None)
+
+
+def _install_task_emulator(client: httpx.AsyncClient) -> None:
+    """Deliver emulated Cloud Tasks to the worker endpoints of the app under test."""
+    from src.blog_writer_sdk.services import cloud_tasks_service
+    from src.blog_writer_sdk.services.task_queue_emulator import LocalTaskQueue
+
+    async def deliver(url: str, payload: Dict[str, Any]) -> None:
+        path = httpx.URL(url).path
+        response = await client.post(path, json=payload)
+        if response.status_code >= 400:
+            raise ScenarioError(f"Worker {path} -> {response.status_code}: {response.text[:200]}")
+
+    cloud_tasks_service._cloud_tasks_service = cloud_tasks_service.CloudTasksService(
+        emulator=LocalTaskQueue(dispatch=True, handler=deliver)
+    )
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    replay: UpstreamReplay,
+    concurrency: int,
+    iterations: int,
+    warmup: int,
+    offset: int
+) -> Dict[str, Any]:
+    """
+    Run one scenario at a fixed concurrency (closed loop).
+
+    Args:
+        client: Client bound to the application
+        scenario: Scenario to drive
+        replay: Upstream replay, for per-scenario call counts
+        concurrency: Number of workers issuing iterations back to back
+        iterations: Measured iterations in total
+        warmup: Unmeasured iterations run first, one at a time
+        offset: First iteration index, so topics differ between runs
+
+    Returns:
+        Result document for the report; ``failed`` is set (and latency left
+        out) when no iteration succeeded
+    """
+    for i in range(warmup):
+        await scenario.run(client, offset + i)
+    offset += warmup
+
+    latencies: List[float] = []
+    errors: List[str] = []
+    next_iteration = 0
+    calls_before = dict(replay.calls)
+
+    async def worker() -> None:
+        nonlocal next_iteration
+        while next_iteration < iterations:
+            iteration = next_iteration
+            next_iteration += 1
+            watch = Stopwatch()
+            try:
+                await scenario.run(client, offset + iteration)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+            else:
+                latencies.append(watch.elapsed_ms())
+
+    lag = LoopLagMonitor()
+    rss = PeakRSSSampler()
+    lag.start()
+    rss.start()
+    wall = Stopwatch()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed_s = wall.elapsed_ms() / 1000.0
+    loop_lag = await lag.stop()
+    peak_rss_mb = rss.stop()
+
+    upstream_calls = {
+        name: count - calls_before.get(name, 0)
+        for name, count in replay.calls.items()
+        if count - calls_before.get(name, 0)
+    }
+    failed = iterations > 0 and not latencies
+    return {
+        "scenario": scenario.name,
+        "concurrency": concurrency,
+        "iterations": iterations,
+        "failed": failed,
+        "errors": len(errors),
+        "error_rate": round(len(errors) / iterations, 3) if iterations else 0.0,
+        "error_samples": errors[:5],
+        "duration_s": round(elapsed_s, 3),
+        "throughput_rps": round(len(latencies) / elapsed_s, 3) if elapsed_s > 0 else 0.0,
+        # Percentiles of an all-failed run would read as a (very fast) result
+        "latency_ms": None if failed else summarize(latencies),
+        "loop_lag_ms": loop_lag,
+        "peak_rss_mb": peak_rss_mb,
+        "upstream_calls": dict(sorted(upstream_calls.items())),
+    }
+
+
+async def run_benchmarks(
+    scenarios: List[Scenario],
+    concurrency_levels: List[int],
+    iterations: int,
+    warmup: int,
+    replay: UpstreamReplay
+) -> Dict[str, Dict[str, Any]]:
+    """Start the application once and run every scenario at every concurrency level."""
+    with install_upstreams(replay):
+        from main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            use_memory_cache()
+            async with httpx.AsyncClient(transport=transport, base_url=BASE_URL, timeout=None) as client:
+                _install_task_emulator(client)
+                results: Dict[str, Dict[str, Any]] = {}
+                offset = 0
+                for scenario in scenarios:
+                    for concurrency in concurrency_levels:
+                        print(f"▶️ {scenario.name} @ concurrency {concurrency} ...", file=sys.stderr)
+                        result = await run_scenario(
+                            client, scenario, replay, concurrency, iterations, warmup, offset
+                        )
+                        offset += iterations + warmup
+                        results[f"{scenario.name}@c{concurrency}"] = result
+                        if result["failed"]:
+                            print(
+                                f"   ❌ FAILED: all {result['iterations']} iterations errored, "
+                                f"e.g. {result['error_samples'][0]}",
+                                file=sys.stderr,
+                            )
+                            continue
+                        print(
+                            f"   {result['throughput_rps']:.2f} req/s, "
+                            f"p50 {result['latency_ms']['p50']:.0f}ms, "
+                            f"p99 {result['latency_ms']['p99']:.0f}ms, "
+                            f"errors {result['errors']}",
+                            file=sys.stderr,
+                        )
+                return results
+
+
+def _parse_latency_overrides(values: List[str]) -> Dict[str, str]:
+    overrides = {}
+    for value in values:
+        upstream, sep, spec = value.partition("=")
+        if not sep:
+            raise ValueError(f"Expected UPSTREAM=SPEC, got '{value}'")
+        overrides[upstream.strip()] = spec.strip()
+    return overrides
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Offline performance benchmarks with replayed upstreams")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument("--concurrency", default="1,8",
+                        help="Comma-separated concurrency levels (default: 1,8)")
+    parser.add_argument("--iterations", type=int, default=20,
+                        help="Measured iterations per scenario and concurrency level (default: 20)")
+    parser.add_argument("--warmup", type=int, default=2,
+                        help="Unmeasured iterations before each measurement (default: 2)")
+    parser.add_argument("--latency-profile", choices=sorted(LATENCY_PROFILES), default="fast",
+                        help="Upstream latency profile (default: fast)")
+    parser.add_argument("--latency", action="append", default=[], metavar="UPSTREAM=SPEC",
+                        help="Override one upstream's latency, e.g. openai=uniform:min=100,max=400")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiply every upstream delay (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=1234, help="Latency RNG seed (default: 1234)")
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="Baseline report to compare against; exit 1 on regression")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="Allowed relative regression per metric with --baseline (default 0.2)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    scenarios = select([name.strip() for name in args.scenarios.split(",") if name.strip()])
+    concurrency_levels = [max(1, int(level)) for level in args.concurrency.split(",") if level.strip()]
+    latency = {**LATENCY_PROFILES[args.latency_profile], **_parse_latency_overrides(args.latency)}
+
+    _configure_environment()
+    # Application logging would dominate the measured CPU time
+    logging.disable(logging.WARNING)
+
+    replay = UpstreamReplay(latency, seed=args.seed, latency_scale=args.latency_scale)
+    started = time.time()
+    # The app prints startup banners; keep stdout for the JSON report
+    with contextlib.redirect_stdout(sys.stderr):
+        results = asyncio.run(run_benchmarks(scenarios, concurrency_levels, args.iterations, args.warmup, replay))
+
+    report = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "duration_s": round(time.time() - started, 1),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "concurrency": concurrency_levels,
+            "latency_profile": args.latency_profile,
+            "latency": {name: model.to_spec() for name, model in replay.latency.items()},
+            "latency_scale": args.latency_scale,
+            "seed": args.seed,
+        },
+        "scenarios": results,
+    }
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+        print(f"📝 Report written to {args.output}", file=sys.stderr)
+    else:
+        print(document)
+
+    status = 0
+    failed = [name for name, result in results.items() if result["failed"]]
+    if failed:
+        print(f"❌ Scenarios with no successful iteration: {', '.join(failed)}", file=sys.stderr)
+        status = 1
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_results(report, baseline, args.max_regression)
+        print(format_regressions(regressions), file=sys.stderr)
+        if regressions:
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Benchmark scenarios: one request flow against the application per iteration.
+
+A scenario call covers the whole user-visible operation, so async job
+scenarios include queueing, worker execution and polling until the result
+is available.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+# Topics are rotated (and suffixed per iteration) so per-process caches in
+# the DataForSEO client do not turn every call after the first into a hit
+TOPICS = [
+    "dog grooming",
+    "sourdough starter",
+    "home solar panels",
+    "trail running shoes",
+    "indoor herb garden",
+    "remote team onboarding",
+]
+
+JOB_POLL_INTERVAL = 0.05
+JOB_TIMEOUT = 120.0
+
+
+class ScenarioError(Exception):
+    """A scenario iteration did not complete successfully."""
+
+
+def topic_for(iteration: int) -> str:
+    """Topic for one iteration; unique across the first len(TOPICS) * N iterations."""
+    base = TOPICS[iteration % len(TOPICS)]
+    return f"{base} {iteration // len(TOPICS)}" if iteration >= len(TOPICS) else base
+
+
+def _check(response: httpx.Response, expected: int = 200) -> Dict[str, Any]:
+    if response.status_code != expected:
+        raise ScenarioError(f"{response.request.method} {response.request.url.path} -> {response.status_code}: {response.text[:200]}")
+    return response.json()
+
+
+async def _poll(
+    client: httpx.AsyncClient,
+    url: Callable[[], str],
+    done: Callable[[Dict[str, Any]], bool]
+) -> Dict[str, Any]:
+    """Poll a job status URL until ``done`` accepts the payload."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + JOB_TIMEOUT
+    while True:
+        data = _check(await client.get(url()))
+        if done(data):
+            return data
+        if loop.time() > deadline:
+            raise ScenarioError(f"Timed out polling {url()}")
+        await asyncio.sleep(JOB_POLL_INTERVAL)
+
+
+async def keywords_enhanced(client: httpx.AsyncClient, iteration: int) -> None:
+    topic = topic_for(iteration)
+    _check(await client.post("/api/v1/keywords/enhanced", json={
+        "keywords": [topic, f"{topic} tips"],
+        "location": "United States",
+    }))
+
+
+async def goal_based_analysis(client: httpx.AsyncClient, iteration: int) -> None:
+    topic = topic_for(iteration)
+    _check(await client.post("/api/v1/keywords/goal-based-analysis", json={
+        "keywords": [topic, f"best {topic}"],
+        "content_goal": "SEO & Rankings",
+    }))
+
+
+def _blog_request(iteration: int, mode: str) -> Dict[str, Any]:
+    topic = topic_for(iteration)
+    return {
+        "topic": f"The complete guide to {topic}",
+        "keywords": [topic, f"{topic} tips"],
+        "tone": "professional",
+        "length": "medium",
+        "mode": mode,
+    }
+
+
+async def blog_quick(client: httpx.AsyncClient, iteration: int) -> None:
+    _check(await client.post(
+        "/api/v1/blog/generate-enhanced",
+        params={"async_mode": "false"},
+        json=_blog_request(iteration, "quick_generate"),
+    ))
+
+
+async def blog_multi_phase(client: httpx.AsyncClient, iteration: int) -> None:
+    _check(await client.post(
+        "/api/v1/blog/generate-enhanced",
+        params={"async_mode": "false"},
+        json=_blog_request(iteration, "multi_phase"),
+    ))
+
+
+async def blog_job(client: httpx.AsyncClient, iteration: int) -> None:
+    created = _check(await client.post(
+        "/api/v1/blog/generate-enhanced",
+        params={"async_mode": "true"},
+        json=_blog_request(iteration, "quick_generate"),
+    ))
+    job_url = f"/api/v1/blog/jobs/{created['job_id']}"
+    seq = 0
+
+    def done(data: Dict[str, Any]) -> bool:
+        nonlocal seq
+        seq = data.get("last_seq") or seq
+        if data["status"] == "failed":
+            raise ScenarioError(f"Blog job failed: {data.get('error_message')}")
+        return data["status"] == "completed"
+
+    # Polls after the first only ask for new progress, as clients are expected to
+    status = await _poll(client, lambda: f"{job_url}?since={seq}" if seq else job_url, done)
+    if status.get("result_url"):
+        _check(await client.get(status["result_url"]))
+
+
+async def image_job(client: httpx.AsyncClient, iteration: int) -> None:
+    created = _check(await client.post("/api/v1/images/generate", json={
+        "prompt": f"A bright, editorial photo illustrating {topic_for(iteration)}",
+        "quality": "draft",
+    }))
+
+    def done(data: Dict[str, Any]) -> bool:
+        if data["status"] == "failed":
+            raise ScenarioError(f"Image job failed: {data.get('error_message')}")
+        return data["status"] == "completed"
+
+    job_url = f"/api/v1/images/jobs/{created['job_id']}"
+    await _poll(client, lambda: job_url, done)
+
+
+@dataclass
+class Scenario:
+    """A named request flow driven against the application."""
+    name: str
+    run: Callable[[httpx.AsyncClient, int], Awaitable[None]]
+    description: str
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    s.name: s for s in [
+        Scenario("keywords_enhanced", keywords_enhanced, "POST /api/v1/keywords/enhanced (DataForSEO fan-out)"),
+        Scenario("goal_based_analysis", goal_based_analysis, "POST /api/v1/keywords/goal-based-analysis"),
+        Scenario("blog_quick", blog_quick, "POST /api/v1/blog/generate-enhanced, quick_generate, synchronous"),
+        Scenario("blog_multi_phase", blog_multi_phase, "POST /api/v1/blog/generate-enhanced, multi_phase (LLM pipeline), synchronous"),
+        Scenario("blog_job", blog_job, "Async blog job: enqueue, worker, poll, fetch result"),
+        Scenario("image_job", image_job, "Async image job: enqueue, worker, poll until complete"),
+    ]
+}
+
+
+def select(names: List[str]) -> List[Scenario]:
+    """Resolve scenario names, raising ValueError for unknown ones."""
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(SCENARIOS)}")
+    return [SCENARIOS[name] for name in names]
@@ -0,0 +1,384 @@
+"""
+Local stand-ins for the upstream APIs, replaying recorded responses.
+
+Each upstream is replaced at its transport boundary so the application's own
+request building and response parsing still run:
+
+- DataForSEO: the pooled httpx client gets an ``httpx.MockTransport``
+- OpenAI: ``AsyncOpenAI`` is built on an ``httpx.MockTransport``
+- Google Custom Search, Knowledge Graph, Stability AI: a replay session
+  stands in for ``aiohttp.ClientSession``
+- Redis: the cache manager uses its in-memory fallback
+
+Every call sleeps for a delay drawn from the upstream's latency model before
+answering, so benchmarks see realistic concurrency without network access.
+"""
+
+import asyncio
+import copy
+import json
+import random
+import re
+from contextlib import contextmanager
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Named latency profiles: upstream -> latency spec (see LatencyModel.parse)
+LATENCY_PROFILES: Dict[str, Dict[str, str]] = {
+    # Medians and spreads observed in production logs
+    "realistic": {
+        "dataforseo": "lognormal:median=450,sigma=0.5",
+        "openai": "lognormal:median=2500,sigma=0.4",
+        "google": "lognormal:median=300,sigma=0.4",
+        "stability": "lognormal:median=6000,sigma=0.3",
+    },
+    # Same shape, 10x faster: keeps CI runs short
+    "fast": {
+        "dataforseo": "lognormal:median=45,sigma=0.5",
+        "openai": "lognormal:median=250,sigma=0.4",
+        "google": "lognormal:median=30,sigma=0.4",
+        "stability": "lognormal:median=600,sigma=0.3",
+    },
+    # No upstream delay: measures the service's own overhead
+    "zero": {
+        "dataforseo": "fixed:0",
+        "openai": "fixed:0",
+        "google": "fixed:0",
+        "stability": "fixed:0",
+    },
+}
+
+_PLACEHOLDER = re.compile(r"\{(keyword|topic)\}")
+
+
+class LatencyModel:
+    """
+    Latency distribution for one upstream.
+
+    Specs look like ``fixed:120``, ``uniform:min=50,max=200`` or
+    ``lognormal:median=450,sigma=0.5`` (all values in milliseconds, sigma
+    unitless).
+    """
+
+    KINDS = ("fixed", "uniform", "lognormal")
+
+    def __init__(self, kind: str, params: Dict[str, float], rng: random.Random):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution '{kind}' (expected one of {', '.join(self.KINDS)})")
+        self.kind = kind
+        self.params = params
+        self._rng = rng
+
+    @classmethod
+    def parse(cls, spec: str, rng: Optional[random.Random] = None) -> "LatencyModel":
+        """Build a model from a spec string."""
+        kind, _, rest = spec.partition(":")
+        params: Dict[str, float] = {}
+        for part in filter(None, rest.split(",")):
+            name, sep, value = part.partition("=")
+            if not sep:
+                name, value = "value", name
+            params[name.strip()] = float(value)
+        return cls(kind.strip(), params, rng or random.Random())
+
+    def sample_ms(self) -> float:
+        """Draw one delay in milliseconds."""
+        if self.kind == "fixed":
+            return self.params.get("value", 0.0)
+        if self.kind == "uniform":
+            return self._rng.uniform(self.params.get("min", 0.0), self.params.get("max", 0.0))
+        median = self.params.get("median", 0.0)
+        if median <= 0:
+            return 0.0
+        return median * self._rng.lognormvariate(0.0, self.params.get("sigma", 0.0))
+
+    def to_spec(self) -> str:
+        return f"{self.kind}:" + ",".join(f"{k}={v:g}" for k, v in self.params.items())
+
+
+def _render(template: Any, values: Dict[str, str]) -> Any:
+    """Substitute {keyword}/{topic} placeholders throughout a fixture."""
+    if isinstance(template, str):
+        return _PLACEHOLDER.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+    if isinstance(template, list):
+        return [_render(item, values) for item in template]
+    if isinstance(template, dict):
+        return {key: _render(value, values) for key, value in template.items()}
+    return template
+
+
+class UpstreamReplay:
+    """
+    Recorded upstream responses plus latency models and call counters.
+
+    Fixtures live in ``benchmarks/fixtures/<upstream>.json``.
+    """
+
+    def __init__(
+        self,
+        latency: Dict[str, str],
+        seed: int = 1234,
+        latency_scale: float = 1.0,
+        fixtures_dir: Path = FIXTURES_DIR
+    ):
+        """
+        Initialize the replay.
+
+        Args:
+            latency: Latency spec per upstream (dataforseo, openai, google, stability)
+            seed: RNG seed, so runs draw the same delays
+            latency_scale: Multiplier applied to every drawn delay
+            fixtures_dir: Directory holding the recorded responses
+        """
+        rng = random.Random(seed)
+        self.latency = {name: LatencyModel.parse(spec, random.Random(rng.random())) for name, spec in latency.items()}
+        self.latency_scale = latency_scale
+        self.fixtures = {
+            name: json.loads((fixtures_dir / f"{name}.json").read_text())
+            for name in ("dataforseo", "openai", "google", "stability")
+        }
+        self.calls: Counter = Counter()
+
+    async def delay(self, upstream: str) -> None:
+        model = self.latency.get(upstream)
+        delay_ms = model.sample_ms() * self.latency_scale if model else 0.0
+        await asyncio.sleep(delay_ms / 1000.0)
+
+    # DataForSEO -----------------------------------------------------------
+
+    def dataforseo_task(self, endpoint: str, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Build one task response from the endpoint's recorded template."""
+        fixtures = self.fixtures["dataforseo"]
+        entry = fixtures["endpoints"].get(endpoint, fixtures["default"])
+        keywords = [str(kw) for kw in task.get("keywords") or [task.get("keyword") or "dog grooming"]]
+        values = {"keyword": keywords[0], "topic": str(task.get("topic") or task.get("title") or keywords[0])}
+
+        if "item" in entry:
+            variants = entry.get("variants", [""])
+            items = [
+                _render(entry["item"], {**values, "keyword": f"{kw} {variant}".strip()})
+                for kw in keywords
+                for variant in variants
+            ]
+            result = copy.deepcopy(entry.get("result_wrapper"))
+            if result is None:
+                result = items
+            else:
+                result = [_render(result, values)]
+                result[0]["items"] = items
+                result[0]["items_count"] = len(items)
+        else:
+            result = _render(entry.get("result"), values)
+
+        return {
+            "id": f"bench-{self.calls['dataforseo']}",
+            "status_code": entry.get("status_code", 20000),
+            "status_message": entry.get("status_message", "Ok."),
+            "cost": entry.get("cost", 0.01),
+            "result_count": len(result) if isinstance(result, list) else 0,
+            "path": endpoint.split("/"),
+            "data": task,
+            "result": result,
+        }
+
+    async def dataforseo_handler(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.split("/v3/", 1)[-1]
+        self.calls["dataforseo"] += 1
+        self.calls[f"dataforseo:{endpoint}"] += 1
+        tasks = json.loads(request.content or b"[]")
+        await self.delay("dataforseo")
+        body = {
+            "version": "0.1.20250101",
+            "status_code": 20000,
+            "status_message": "Ok.",
+            "tasks_count": len(tasks),
+            "tasks_error": 0,
+            "tasks": [self.dataforseo_task(endpoint, task) for task in tasks],
+        }
+        return httpx.Response(200, json=body)
+
+    # OpenAI ---------------------------------------------------------------
+
+    def openai_completion(self, prompt: str) -> str:
+        """Pick the recorded completion whose match phrase appears in the prompt."""
+        lowered = prompt.lower()
+        for rule in self.fixtures["openai"]["completions"]:
+            if all(phrase in lowered for phrase in rule.get("match", [])):
+                return rule["content"]
+        return self.fixtures["openai"]["completions"][-1]["content"]
+
+    async def openai_handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        self.calls["openai"] += 1
+        prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []) if m.get("role") == "user")
+        content = self.openai_completion(prompt)
+        await self.delay("openai")
+        prompt_tokens = max(1, len(prompt) // 4)
+        completion_tokens = max(1, len(content) // 4)
+        return httpx.Response(200, json={
+            "id": f"chatcmpl-bench{self.calls['openai']}",
+            "object": "chat.completion",
+            "created": 1735689600,
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        })
+
+    # Google / Stability (aiohttp) -----------------------------------------
+
+    def google_response(self, url: str, params: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        fixtures = self.fixtures["google"]
+        query = str(params.get("q") or params.get("query") or "dog grooming")
+        if "kgsearch" in url:
+            self.calls["google:knowledge_graph"] += 1
+            return "google", _render(fixtures["knowledge_graph"], {"keyword": query, "topic": query})
+        self.calls["google:custom_search"] += 1
+        return "google", _render(fixtures["custom_search"], {"keyword": query, "topic": query})
+
+    def stability_response(self, url: str) -> Tuple[str, Dict[str, Any]]:
+        self.calls["stability"] += 1
+        fixtures = self.fixtures["stability"]
+        if url.endswith("/v1/user/account"):
+            return "stability", fixtures["account"]
+        return "stability", fixtures["text_to_image"]
+
+
+class _ReplayResponse:
+    """Just enough of ``aiohttp.ClientResponse`` for the clients in this repo."""
+
+    def __init__(self, status: int, payload: Any):
+        self.status = status
+        self._payload = payload
+
+    async def json(self, **kwargs: Any) -> Any:
+        return self._payload
+
+    async def text(self) -> str:
+        return json.dumps(self._payload)
+
+    async def read(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self) -> "_ReplayResponse":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _PendingResponse:
+    """Async context manager that waits for the upstream's latency first."""
+
+    def __init__(self, replay: UpstreamReplay, respond: Callable[[], Tuple[str, Any]]):
+        self._replay = replay
+        self._respond = respond
+
+    async def __aenter__(self) -> _ReplayResponse:
+        upstream, payload = self._respond()
+        await self._replay.delay(upstream)
+        return _ReplayResponse(200, copy.deepcopy(payload))
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class ReplaySession:
+    """Stand-in for ``aiohttp.ClientSession`` answering from the replay."""
+
+    def __init__(self, replay: UpstreamReplay, responder: Callable[[str, Dict[str, Any]], Tuple[str, Any]]):
+        self._replay = replay
+        self._responder = responder
+        self.closed = False
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs: Any) -> _PendingResponse:
+        return _PendingResponse(self._replay, lambda: self._responder(str(url), dict(params or {})))
+
+    def post(self, url: str, json: Any = None, **kwargs: Any) -> _PendingResponse:
+        return _PendingResponse(self._replay, lambda: self._responder(str(url), {}))
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@contextmanager
+def install_upstreams(replay: UpstreamReplay) -> Iterator[UpstreamReplay]:
+    """
+    Route every upstream call through ``replay`` for the duration of the block.
+
+    Must be entered before the application creates its clients (i.e. before
+    the lifespan starts).
+    """
+    from openai import AsyncOpenAI
+    from src.blog_writer_sdk.ai.openai_provider import OpenAIProvider
+    from src.blog_writer_sdk.image.stability_ai_provider import StabilityAIProvider
+    from src.blog_writer_sdk.integrations import dataforseo_integration
+    from src.blog_writer_sdk.integrations.google_custom_search import GoogleCustomSearchClient
+    from src.blog_writer_sdk.integrations.google_knowledge_graph import GoogleKnowledgeGraphClient
+
+    patches: List[Tuple[Any, str, Any]] = []
+
+    def patch(owner: Any, name: str, value: Any) -> None:
+        patches.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    dataforseo_clients: Dict[int, httpx.AsyncClient] = {}
+
+    def shared_http_client() -> httpx.AsyncClient:
+        loop_id = id(asyncio.get_running_loop())
+        client = dataforseo_clients.get(loop_id)
+        if client is None:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(replay.dataforseo_handler))
+            dataforseo_clients[loop_id] = client
+        return client
+
+    async def openai_initialize(self: OpenAIProvider) -> None:
+        self._client = AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(replay.openai_handler)),
+        )
+
+    def with_session(cls: Any) -> Callable[..., None]:
+        original = cls.__init__
+
+        def __init__(self: Any, *args: Any, **kwargs: Any) -> None:
+            original(self, *args, **kwargs)
+            self.session = ReplaySession(replay, replay.google_response)
+        return __init__
+
+    async def stability_initialize(self: StabilityAIProvider) -> None:
+        self._session = ReplaySession(replay, lambda url, params: replay.stability_response(url))
+
+    patch(dataforseo_integration, "_shared_http_client", shared_http_client)
+    patch(OpenAIProvider, "initialize", openai_initialize)
+    patch(GoogleCustomSearchClient, "__init__", with_session(GoogleCustomSearchClient))
+    patch(GoogleKnowledgeGraphClient, "__init__", with_session(GoogleKnowledgeGraphClient))
+    patch(StabilityAIProvider, "initialize", stability_initialize)
+    try:
+        yield replay
+    finally:
+        for owner, name, original in reversed(patches):
+            setattr(owner, name, original)
+
+
+def use_memory_cache() -> None:
+    """Point the shared cache manager at its in-memory fallback instead of Redis."""
+    from src.blog_writer_sdk.cache.redis_cache import get_cache_manager
+
+    cache_manager = get_cache_manager()
+    if cache_manager is not None:
+        cache_manager.redis_client = None
+
@@ -14,6 +14,7 @@ import math
 import json
 import re
 import base64
+from collections import deque
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 from contextlib import asynccontextmanager
@@ -27,6 +28,11 @@ startup_time = time.time()
 deployment_version = "2025-11-15-001"
 APP_VERSION = os.getenv("APP_VERSION", "1.3.6")
 
+# Opt-in per-module import timing (IMPORT_PROFILE=true); reported by /ready?verbose=true
+from src.blog_writer_sdk.monitoring.import_profiler import start_import_profiler, get_import_profiler
+if os.getenv("IMPORT_PROFILE", "false").lower() == "true":
+    start_import_profiler()
+
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, StreamingResponse
@@ -75,6 +81,9 @@ logger = get_blog_logger()
 # from src.blog_writer_sdk.services.dataforseo_credential_service import DataForSEOCredentialService
 # from src.blog_writer_sdk.models.credential_models import DataForSEOCredentials, TenantCredentialStatus
 from src.blog_writer_sdk.integrations.dataforseo_integration import DataForSEOClient
+from src.blog_writer_sdk.integrations.dataforseo_capabilities import get_capability_registry
+from src.blog_writer_sdk.integrations.dataforseo_clients import get_client_registry, get_dataforseo_client
+from src.blog_writer_sdk.integrations.dataforseo_integration import close_shared_http_clients
 
 # Global DataForSEO client for Phase 3 semantic integration
 dataforseo_client_global = None
@@ -105,6 +114,8 @@ from src.blog_writer_sdk.services.prompt_config_service import get_prompt_config
 from src.blog_writer_sdk.integrations.firebase_config_client import initialize_firebase_config_client
 from src.blog_writer_sdk.api.field_enhancement import router as field_enhancement_router
 from src.blog_writer_sdk.api.publishing_management import router as publishing_router
+from src.blog_writer_sdk.api.pagination import keyset_slice, ndjson_response
+from src.blog_writer_sdk.api.fast_json import fast_json_response
 from src.blog_writer_sdk.api.admin_management import router as admin_router
 from src.blog_writer_sdk.api.content_validation import router as content_validation_router
 from src.blog_writer_sdk.api.content_analysis_routing import router as content_analysis_router
@@ -129,12 +140,15 @@ from src.blog_writer_sdk.services.dataforseo_content_generation_service import (
     BlogType as DataForSEOBlogType
 )
 from src.blog_writer_sdk.models.job_models import (
+    PROGRESS_HISTORY_LIMIT,
     BlogGenerationJob,
     JobStatus,
     JobStatusResponse,
     CreateJobResponse
 )
 from src.blog_writer_sdk.services.cloud_tasks_service import get_cloud_tasks_service
+from src.blog_writer_sdk.services.job_result_store import get_job_result_store
+from src.blog_writer_sdk.services.service_registry import ServiceRegistry, get_service_registry
 
 # In-memory job storage (can be upgraded to Supabase/database later)
 blog_generation_jobs: Dict[str, BlogGenerationJob] = {}
@@ -439,6 +453,7 @@ class EnhancedKeywordAnalysisRequest(BaseModel):
     search_type: Optional[str] = Field("enhanced_keyword_analysis", description="Keyword search type (e.g., keyword_analysis, competitor, enhanced_keyword_analysis)")
     include_serp: bool = Field(default=False, description="Include SERP scrape preview (slower)")
     max_suggestions_per_keyword: int = Field(default=20, ge=5, le=150, description="Maximum keyword suggestions per seed keyword (up to 150 for comprehensive research)")
+    use_knowledge_graph: bool = Field(default=False, description="Mark clusters whose parent topic is a Google Knowledge Graph entity (extra lookups)")
 
 
 class ContentGoal(str, Enum):
@@ -539,6 +554,7 @@ class KeywordExtractionRequest(BaseModel):
     max_keywords: int = Field(default=20, ge=5, le=200, description="Maximum keywords to extract (up to 200 for comprehensive research)")
     max_ngram: int = Field(default=3, ge=1, le=5, description="Maximum words per keyphrase (phrase mode)")
     dedup_lim: float = Field(default=0.7, ge=0.1, le=0.99, description="Deduplication threshold for phrases")
+    use_knowledge_graph: bool = Field(default=False, description="Mark clusters whose parent topic is a Google Knowledge Graph entity (extra lookups)")
 
 
 class KeywordSuggestionRequest(BaseModel):
@@ -746,77 +762,115 @@ def load_env_from_secrets():
     else:
         print("⚠️ No secrets file found at /secrets/env, using system environment variables")
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Manage application lifespan."""
-    # Startup
-    print("🚀 Blog Writer SDK API starting up...")
-    
-    # Initialize user management default data
+# Global service registry: services are built on first use or during warm-up
+service_registry = get_service_registry()
+
+
+async def ensure_service(name: str) -> Any:
+    """Return a registered service, building it now if warm-up has not reached it yet."""
+    if name not in service_registry.names:
+        return None
+    return await service_registry.get(name)
+
+
+# Services MultiStageGenerationPipeline reads from module globals
+PIPELINE_SERVICES = (
+    "dataforseo_client",
+    "google_custom_search",
+    "google_search_console",
+    "google_knowledge_graph",
+    "readability_analyzer",
+    "citation_generator",
+    "serp_analyzer",
+    "semantic_integrator",
+    "quality_scorer",
+    "intent_analyzer",
+    "few_shot_extractor",
+    "length_optimizer",
+)
+
+
+async def ensure_pipeline_services() -> None:
+    """Build the pipeline's services now if background warm-up has not reached them yet."""
+    await asyncio.gather(*(ensure_service(name) for name in PIPELINE_SERVICES))
+
+
+async def annotate_entity_clusters(clustering: KeywordClustering, clustering_result: Any) -> None:
+    """Mark clusters whose parent topic is a Knowledge Graph entity; best effort."""
+    if clustering.knowledge_graph_client is None:
+        clustering.knowledge_graph_client = await ensure_service("google_knowledge_graph")
     try:
-        from src.blog_writer_sdk.api.user_management import initialize_default_data
-        initialize_default_data()
-        print("✅ User management initialized with default roles and system admin")
+        entities = await clustering.resolve_entity_clusters(clustering_result)
+        if entities:
+            logger.info(f"Knowledge Graph entities among cluster topics: {list(entities)[:5]}")
     except Exception as e:
-        print(f"⚠️ Failed to initialize user management: {e}")
-    
-    # Load environment variables from mounted secrets
-    load_env_from_secrets()
-    
-    # Initialize cache manager
-    redis_url = os.getenv("REDIS_URL")
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    redis_password = os.getenv("REDIS_PASSWORD")
-    
-    cache_manager = initialize_cache(
-        redis_url=redis_url,
-        redis_host=redis_host,
-        redis_port=redis_port,
-        redis_password=redis_password
-    )
-    print(f"✅ Cache manager initialized: {cache_manager}")
-    
-    # Initialize metrics collector
-    metrics_collector = initialize_metrics(retention_hours=24)
-    print(f"✅ Metrics collector initialized: {metrics_collector}")
+        logger.warning(f"Entity-based clustering failed: {e}, continuing without it")
+
+
+def _register_startup_services(registry: ServiceRegistry) -> None:
+    """
+    Register application services with the registry.
     
-    # Initialize cloud logging
-    cloud_logger = initialize_cloud_logging(
-        name="blog_writer_api",
-        use_cloud_logging=os.getenv("GOOGLE_CLOUD_PROJECT") is not None
-    )
-    print(f"✅ Cloud logging initialized: {cloud_logger}")
-    
-    # Initialize batch processor
-    global batch_processor
-    blog_writer = get_blog_writer()
-    batch_processor = BatchProcessor(
-        blog_writer=blog_writer,
-        max_concurrent=int(os.getenv("BATCH_MAX_CONCURRENT", "5")),
-        max_retries=int(os.getenv("BATCH_MAX_RETRIES", "2"))
-    )
-    print("✅ Batch processor initialized")
+    Nothing is constructed here. Critical services are warmed before the app
+    starts serving; the rest warm concurrently in the background (or on first
+    use via ``await service_registry.get(name)``). Each factory also sets the
+    module-level global that endpoints read.
+    """
+    def init_cache():
+        cache_manager = initialize_cache(
+            redis_url=os.getenv("REDIS_URL"),
+            redis_host=os.getenv("REDIS_HOST", "localhost"),
+            redis_port=int(os.getenv("REDIS_PORT", "6379")),
+            redis_password=os.getenv("REDIS_PASSWORD")
+        )
+        print(f"✅ Cache manager initialized: {cache_manager}")
+        return cache_manager
+    
+    def init_metrics():
+        metrics_collector = initialize_metrics(retention_hours=24)
+        print(f"✅ Metrics collector initialized: {metrics_collector}")
+        return metrics_collector
+    
+    def init_cloud_logging():
+        cloud_logger = initialize_cloud_logging(
+            name="blog_writer_api",
+            use_cloud_logging=os.getenv("GOOGLE_CLOUD_PROJECT") is not None
+        )
+        print(f"✅ Cloud logging initialized: {cloud_logger}")
+        return cloud_logger
+    
+    def init_batch_processor():
+        global batch_processor
+        batch_processor = BatchProcessor(
+            blog_writer=get_blog_writer(),
+            max_concurrent=int(os.getenv("BATCH_MAX_CONCURRENT", "5")),
+            max_retries=int(os.getenv("BATCH_MAX_RETRIES", "2"))
+        )
+        print("✅ Batch processor initialized")
+        return batch_processor
     
-    # Initialize AI providers from environment variables
-    try:
-        await initialize_from_env()
-        print("✅ AI providers initialized from environment")
-    except Exception as e:
-        print(f"⚠️ Failed to initialize AI providers from environment: {e}")
+    async def init_ai_providers():
+        # Provider misconfiguration must not keep the service from becoming ready
+        try:
+            await initialize_from_env()
+            print("✅ AI providers initialized from environment")
+            return True
+        except Exception as e:
+            print(f"⚠️ Failed to initialize AI providers from environment: {e}")
+            return None
     
-    # Initialize image providers from environment variables
-    try:
+    async def init_image_providers():
         await initialize_image_providers_from_env()
         print("✅ Image providers initialized from environment")
-    except Exception as e:
-        print(f"⚠️ Failed to initialize image providers from environment: {e}")
+        return True
     
-    # Initialize Supabase client
-    supabase_url = os.getenv("SUPABASE_URL")
-    supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
-    if supabase_url and supabase_key:
+    def init_supabase():
         global supabase_client, supabase_server_client
+        supabase_url = os.getenv("SUPABASE_URL")
+        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+        if not (supabase_url and supabase_key):
+            print("⚠️ Supabase credentials not found. Supabase client not initialized.")
+            return None
         supabase_client = create_client(supabase_url, supabase_key)
         print("✅ Supabase client initialized.")
         try:
@@ -829,162 +883,280 @@ async def lifespan(app: FastAPI):
         except Exception as supabase_exc:
             supabase_server_client = None
             print(f"⚠️ Supabase server client not initialized: {supabase_exc}")
-    else:
-        print("⚠️ Supabase credentials not found. Supabase client not initialized.")
+        return supabase_client
     
-    # Initialize Firebase/Firestore for prompt configuration
-    try:
+    def init_firebase():
+        # Firebase/Firestore for prompt configuration
         firebase_project_id = os.getenv("FIREBASE_PROJECT_ID") or os.getenv("GOOGLE_CLOUD_PROJECT")
-        if firebase_project_id:
-            initialize_firebase_config_client(project_id=firebase_project_id)
-            initialize_prompt_config_service()
-            print("✅ Firebase config client and prompt config service initialized.")
-        else:
+        if not firebase_project_id:
             print("⚠️ Firebase not configured (FIREBASE_PROJECT_ID not set)")
-    except Exception as e:
-        print(f"⚠️ Failed to initialize Firebase config client: {e}")
-
-    # Initialize Google Secret Manager client
-    global secret_manager_client
-    secret_manager_client = secretmanager.SecretManagerServiceClient()
-    print("✅ Google Secret Manager client initialized.")
-
-    # Initialize DataforSEO Credential Service (not implemented yet)
-    global dataforseo_credential_service
-    dataforseo_credential_service = None  # Service not implemented yet
-    print("⚠️ DataforSEO Credential Service not implemented yet. Using direct environment variables.")
-
-    # Initialize EnhancedKeywordAnalyzer
-    global enhanced_keyword_analyzer, dataforseo_client_global
-    # Get DataForSEO credentials from environment (loaded from secrets)
-    dataforseo_api_key = os.getenv("DATAFORSEO_API_KEY")
-    dataforseo_api_secret = os.getenv("DATAFORSEO_API_SECRET")
-    if dataforseo_api_key and dataforseo_api_secret:
-        enhanced_keyword_analyzer = EnhancedKeywordAnalyzer(
-            use_dataforseo=True,
-            api_key=dataforseo_api_key,
-            api_secret=dataforseo_api_secret,
-            location=os.getenv("DATAFORSEO_LOCATION", "United States"),
-            language_code=os.getenv("DATAFORSEO_LANGUAGE", "en"),
+            return None
+        initialize_firebase_config_client(project_id=firebase_project_id)
+        initialize_prompt_config_service()
+        print("✅ Firebase config client and prompt config service initialized.")
+        return firebase_project_id
+    
+    def init_secret_manager():
+        global secret_manager_client
+        secret_manager_client = secretmanager.SecretManagerServiceClient()
+        print("✅ Google Secret Manager client initialized.")
+        return secret_manager_client
+    
+    def init_enhanced_keyword_analyzer():
+        global enhanced_keyword_analyzer
+        dataforseo_api_key = os.getenv("DATAFORSEO_API_KEY")
+        dataforseo_api_secret = os.getenv("DATAFORSEO_API_SECRET")
+        if dataforseo_api_key and dataforseo_api_secret:
+            enhanced_keyword_analyzer = EnhancedKeywordAnalyzer(
+                use_dataforseo=True,
+                api_key=dataforseo_api_key,
+                api_secret=dataforseo_api_secret,
+                location=os.getenv("DATAFORSEO_LOCATION", "United States"),
+                language_code=os.getenv("DATAFORSEO_LANGUAGE", "en"),
+            )
+        else:
+            enhanced_keyword_analyzer = EnhancedKeywordAnalyzer(
+                use_dataforseo=False  # Disable if credentials not available
+            )
+        print("✅ EnhancedKeywordAnalyzer initialized.")
+        return enhanced_keyword_analyzer
+    
+    def init_dataforseo_client():
+        # DataForSEO client for semantic integration (Phase 3)
+        global dataforseo_client_global
+        dataforseo_api_key = os.getenv("DATAFORSEO_API_KEY")
+        dataforseo_api_secret = os.getenv("DATAFORSEO_API_SECRET")
+        if dataforseo_api_key and dataforseo_api_secret:
+            dataforseo_client_global = get_dataforseo_client(
+                api_key=dataforseo_api_key,
+                api_secret=dataforseo_api_secret,
+                location=os.getenv("DATAFORSEO_LOCATION", "United States"),
+                language_code=os.getenv("DATAFORSEO_LANGUAGE", "en"),
+            )
+            print("✅ DataForSEO Labs client initialized.")
+        else:
+            dataforseo_client_global = None
+            print("⚠️ DataForSEO Labs not configured (DATAFORSEO_API_KEY and DATAFORSEO_API_SECRET)")
+        return dataforseo_client_global
+    
+    def init_custom_search():
+        # Google Custom Search client (Phase 1)
+        global google_custom_search_client
+        google_api_key = os.getenv("GOOGLE_CUSTOM_SEARCH_API_KEY")
+        google_engine_id = os.getenv("GOOGLE_CUSTOM_SEARCH_ENGINE_ID")
+        if google_api_key and google_engine_id:
+            google_custom_search_client = GoogleCustomSearchClient(
+                api_key=google_api_key,
+                search_engine_id=google_engine_id
+            )
+            print("✅ Google Custom Search client initialized.")
+        else:
+            google_custom_search_client = None
+            print("⚠️ Google Custom Search not configured (GOOGLE_CUSTOM_SEARCH_API_KEY and GOOGLE_CUSTOM_SEARCH_ENGINE_ID)")
+        return google_custom_search_client
+    
+    def init_search_console():
+        # Google Search Console client (Phase 2)
+        global google_search_console_client
+        gsc_site_url = os.getenv("GSC_SITE_URL")
+        gsc_credentials_path = "/secrets/GSC_SERVICE_ACCOUNT_KEY"
+        google_search_console_client = None
+        if os.path.exists(gsc_credentials_path):
+            try:
+                if gsc_site_url:
+                    google_search_console_client = GoogleSearchConsoleClient(
+                        credentials_path=gsc_credentials_path,
+                        site_url=gsc_site_url
+                    )
+                else:
+                    google_search_console_client = GoogleSearchConsoleClient(
+                        credentials_path=gsc_credentials_path
+                    )
+                print("✅ Google Search Console client initialized.")
+            except Exception as e:
+                print(f"⚠️ Google Search Console initialization failed: {e}")
+        elif gsc_site_url:
+            print(f"⚠️ Google Search Console not configured (GSC credentials file not found at {gsc_credentials_path})")
+        else:
+            print("⚠️ Google Search Console not configured (GSC_SITE_URL not set)")
+        return google_search_console_client
+    
+    def init_knowledge_graph():
+        # Phase 3: Google Knowledge Graph
+        global google_knowledge_graph_client
+        kg_api_key = os.getenv("GOOGLE_KNOWLEDGE_GRAPH_API_KEY")
+        if kg_api_key:
+            google_knowledge_graph_client = GoogleKnowledgeGraphClient(api_key=kg_api_key)
+            print("✅ Google Knowledge Graph client initialized.")
+        else:
+            google_knowledge_graph_client = None
+            print("⚠️ Google Knowledge Graph not configured (GOOGLE_KNOWLEDGE_GRAPH_API_KEY)")
+        return google_knowledge_graph_client
+    
+    def init_readability_analyzer():
+        global readability_analyzer
+        readability_analyzer = ReadabilityAnalyzer()
+        return readability_analyzer
+    
+    def init_citation_generator():
+        global citation_generator
+        citation_generator = CitationGenerator(
+            google_search_client=google_custom_search_client,
+            dataforseo_client=dataforseo_client_global
         )
-    else:
-        enhanced_keyword_analyzer = EnhancedKeywordAnalyzer(
-            use_dataforseo=False  # Disable if credentials not available
+        return citation_generator
+    
+    def init_serp_analyzer():
+        global serp_analyzer
+        serp_analyzer = SERPAnalyzer(dataforseo_client=None)  # Will use DataForSEO if available
+        return serp_analyzer
+    
+    def init_semantic_integrator():
+        # Phase 3: Semantic keyword integrator (uses DataForSEO if available)
+        global semantic_integrator
+        semantic_integrator = SemanticKeywordIntegrator(dataforseo_client=dataforseo_client_global)
+        return semantic_integrator
+    
+    def init_quality_scorer():
+        global quality_scorer
+        quality_scorer = ContentQualityScorer(readability_analyzer=readability_analyzer)
+        return quality_scorer
+    
+    def init_intent_analyzer():
+        global intent_analyzer
+        intent_analyzer = IntentAnalyzer(dataforseo_client=dataforseo_client_global)
+        return intent_analyzer
+    
+    def init_few_shot_extractor():
+        global few_shot_extractor
+        few_shot_extractor = FewShotLearningExtractor(
+            google_search_client=google_custom_search_client,
+            dataforseo_client=dataforseo_client_global
         )
+        return few_shot_extractor
     
-    # Initialize DataForSEO client for semantic integration (Phase 3)
-    if dataforseo_api_key and dataforseo_api_secret:
-        dataforseo_client_global = DataForSEOClient(
-            api_key=dataforseo_api_key,
-            api_secret=dataforseo_api_secret,
-            location=os.getenv("DATAFORSEO_LOCATION", "United States"),
-            language_code=os.getenv("DATAFORSEO_LANGUAGE", "en"),
+    def init_length_optimizer():
+        global length_optimizer
+        length_optimizer = ContentLengthOptimizer(
+            google_search_client=google_custom_search_client,
+            dataforseo_client=dataforseo_client_global
         )
-        print("✅ DataForSEO Labs client initialized.")
-    else:
-        dataforseo_client_global = None
-        print("⚠️ DataForSEO Labs not configured (DATAFORSEO_API_KEY and DATAFORSEO_API_SECRET)")
-    
-    print("✅ EnhancedKeywordAnalyzer initialized.")
-    
-    # Initialize Google Custom Search client (Phase 1)
-    global google_custom_search_client
-    google_api_key = os.getenv("GOOGLE_CUSTOM_SEARCH_API_KEY")
-    google_engine_id = os.getenv("GOOGLE_CUSTOM_SEARCH_ENGINE_ID")
-    if google_api_key and google_engine_id:
-        google_custom_search_client = GoogleCustomSearchClient(
-            api_key=google_api_key,
-            search_engine_id=google_engine_id
+        return length_optimizer
+    
+    def init_topic_recommender():
+        global topic_recommender
+        keyword_clustering = KeywordClustering(knowledge_graph_client=google_knowledge_graph_client)
+        topic_recommender = TopicRecommendationEngine(
+            dataforseo_client=dataforseo_client_global,
+            google_search_client=google_custom_search_client,
+            ai_generator=ai_generator,
+            keyword_clustering=keyword_clustering
         )
-        print("✅ Google Custom Search client initialized.")
-    else:
-        google_custom_search_client = None
-        print("⚠️ Google Custom Search not configured (GOOGLE_CUSTOM_SEARCH_API_KEY and GOOGLE_CUSTOM_SEARCH_ENGINE_ID)")
+        print("✅ Topic Recommendation Engine initialized.")
+        return topic_recommender
     
-    # Initialize Google Search Console client (Phase 2)
-    global google_search_console_client
-    gsc_site_url = os.getenv("GSC_SITE_URL")
-    gsc_credentials_path = "/secrets/GSC_SERVICE_ACCOUNT_KEY"
+    def init_quota_manager():
+        global quota_manager
+        quota_manager = QuotaManager()  # In-memory for now, can be extended with database backend
+        print("✅ Quota Manager initialized.")
+        return quota_manager
     
-    # Check if GSC credentials file exists
-    if os.path.exists(gsc_credentials_path):
-        try:
-            if gsc_site_url:
-                google_search_console_client = GoogleSearchConsoleClient(
-                    credentials_path=gsc_credentials_path,
-                    site_url=gsc_site_url
-                )
-            else:
-                google_search_console_client = GoogleSearchConsoleClient(
-                    credentials_path=gsc_credentials_path
-                )
-            print("✅ Google Search Console client initialized.")
-        except Exception as e:
-            google_search_console_client = None
-            print(f"⚠️ Google Search Console initialization failed: {e}")
-    else:
-        google_search_console_client = None
-        if gsc_site_url:
-            print(f"⚠️ Google Search Console not configured (GSC credentials file not found at {gsc_credentials_path})")
-        else:
-            print("⚠️ Google Search Console not configured (GSC_SITE_URL not set)")
+    def init_keyword_difficulty_analyzer():
+        global keyword_difficulty_analyzer
+        keyword_difficulty_analyzer = KeywordDifficultyAnalyzer(dataforseo_client=dataforseo_client_global)
+        print("✅ Keyword Difficulty Analyzer initialized.")
+        return keyword_difficulty_analyzer
+    
+    # Critical: required before serving traffic
+    registry.register("cache", init_cache, critical=True)
+    registry.register("metrics", init_metrics, critical=True)
+    registry.register("batch_processor", init_batch_processor, critical=True)
+    registry.register("ai_providers", init_ai_providers, critical=True)
+    
+    # Independent clients; blocking constructors (credential discovery, files) run in threads
+    registry.register("cloud_logging", init_cloud_logging, in_thread=True)
+    registry.register("image_providers", init_image_providers)
+    registry.register("supabase", init_supabase)
+    registry.register("firebase", init_firebase, in_thread=True)
+    registry.register("secret_manager", init_secret_manager, in_thread=True)
+    registry.register("enhanced_keyword_analyzer", init_enhanced_keyword_analyzer)
+    registry.register("dataforseo_client", init_dataforseo_client)
+    registry.register("google_custom_search", init_custom_search)
+    registry.register("google_search_console", init_search_console, in_thread=True)
+    registry.register("google_knowledge_graph", init_knowledge_graph)
+    
+    # Multi-stage pipeline components (Phase 3 and additional enhancements)
+    registry.register("readability_analyzer", init_readability_analyzer)
+    registry.register("citation_generator", init_citation_generator,
+                      depends_on=["google_custom_search", "dataforseo_client"])
+    registry.register("serp_analyzer", init_serp_analyzer)
+    registry.register("semantic_integrator", init_semantic_integrator, depends_on=["dataforseo_client"])
+    registry.register("quality_scorer", init_quality_scorer, depends_on=["readability_analyzer"])
+    registry.register("intent_analyzer", init_intent_analyzer, depends_on=["dataforseo_client"])
+    registry.register("few_shot_extractor", init_few_shot_extractor,
+                      depends_on=["google_custom_search", "dataforseo_client"])
+    registry.register("length_optimizer", init_length_optimizer,
+                      depends_on=["google_custom_search", "dataforseo_client"])
+    registry.register("topic_recommender", init_topic_recommender,
+                      depends_on=["dataforseo_client", "google_custom_search", "google_knowledge_graph"])
+    registry.register("quota_manager", init_quota_manager)
+    registry.register("keyword_difficulty_analyzer", init_keyword_difficulty_analyzer,
+                      depends_on=["dataforseo_client"])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage application lifespan."""
+    # Startup
+    print("🚀 Blog Writer SDK API starting up...")
+    startup_started = time.perf_counter()
     
-    # Initialize multi-stage pipeline components
-    global readability_analyzer, citation_generator, serp_analyzer
-    global google_knowledge_graph_client, semantic_integrator, quality_scorer
-    global intent_analyzer, few_shot_extractor, length_optimizer
-    global dataforseo_content_generation_service
-    readability_analyzer = ReadabilityAnalyzer()
-    citation_generator = CitationGenerator(
-        google_search_client=google_custom_search_client,
-        dataforseo_client=dataforseo_client_global
+    # Module imports are done; stop timing them and check the import-time budget
+    import_profiler = get_import_profiler(create=True)
+    if import_profiler.active:
+        import_profiler.stop()
+    else:
+        import_profiler.record(
+            "main (set IMPORT_PROFILE=true for per-module detail)", (time.time() - startup_time) * 1000
+        )
+    import_report = import_profiler.report(top=5)
+    print(
+        f"⏱️ Imports took {import_report['total_ms']:.0f}ms "
+        f"(budget {import_report['budget_ms']:.0f}ms): "
+        + ", ".join(f"{m['module']}={m['cumulative_ms']:.0f}ms" for m in import_report["modules"])
     )
-    serp_analyzer = SERPAnalyzer(dataforseo_client=None)  # Will use DataForSEO if available
+    if import_report["over_budget"]:
+        logger.warning(f"Import time {import_report['total_ms']:.0f}ms exceeds budget {import_report['budget_ms']:.0f}ms")
     
-    # Phase 3: Google Knowledge Graph
-    kg_api_key = os.getenv("GOOGLE_KNOWLEDGE_GRAPH_API_KEY")
-    if kg_api_key:
-        google_knowledge_graph_client = GoogleKnowledgeGraphClient(api_key=kg_api_key)
-        print("✅ Google Knowledge Graph client initialized.")
+    # Initialize user management default data
+    try:
+        from src.blog_writer_sdk.api.user_management import initialize_default_data
+        initialize_default_data()
+        print("✅ User management initialized with default roles and system admin")
+    except Exception as e:
+        print(f"⚠️ Failed to initialize user management: {e}")
+    
+    # Load environment variables from mounted secrets (factories below read them)
+    load_env_from_secrets()
+    
+    # DataforSEO Credential Service (not implemented yet)
+    print("⚠️ DataforSEO Credential Service not implemented yet. Using direct environment variables.")
+    
+    _register_startup_services(service_registry)
+    
+    # Warm critical services before serving; the rest concurrently in the background.
+    # STARTUP_WARM_ALL=true restores fully warmed startup.
+    warm_all = os.getenv("STARTUP_WARM_ALL", "false").lower() == "true"
+    warm_up_task = None
+    if warm_all:
+        await service_registry.warm_up()
     else:
-        google_knowledge_graph_client = None
-        print("⚠️ Google Knowledge Graph not configured (GOOGLE_KNOWLEDGE_GRAPH_API_KEY)")
-    
-    # Phase 3: Semantic keyword integrator (uses DataForSEO if available)
-    semantic_integrator = SemanticKeywordIntegrator(dataforseo_client=dataforseo_client_global)
-    quality_scorer = ContentQualityScorer(readability_analyzer=readability_analyzer)
-    
-    # Additional enhancements: Intent analysis, few-shot learning, length optimization
-    intent_analyzer = IntentAnalyzer(dataforseo_client=dataforseo_client_global)
-    few_shot_extractor = FewShotLearningExtractor(
-        google_search_client=google_custom_search_client,
-        dataforseo_client=dataforseo_client_global
-    )
-    length_optimizer = ContentLengthOptimizer(
-        google_search_client=google_custom_search_client,
-        dataforseo_client=dataforseo_client_global
+        await service_registry.warm_up(service_registry.critical_names())
+        warm_up_task = service_registry.start_warm_up()
+    print(
+        f"✅ Critical services ready in {(time.perf_counter() - startup_started) * 1000:.0f}ms"
+        + ("" if warm_all else "; remaining services warming in background")
     )
-    print("✅ Phase 3 components initialized.")
-    print("✅ Additional enhancements initialized (intent analysis, few-shot learning, length optimization).")
-    
-    # Initialize Topic Recommendation Engine
-    global topic_recommender
-    from src.blog_writer_sdk.seo.keyword_clustering import KeywordClustering
-    keyword_clustering = KeywordClustering(knowledge_graph_client=google_knowledge_graph_client)
-    topic_recommender = TopicRecommendationEngine(
-        dataforseo_client=dataforseo_client_global,
-        google_search_client=google_custom_search_client,
-        ai_generator=ai_generator,
-        keyword_clustering=keyword_clustering
-    )
-    print("✅ Topic Recommendation Engine initialized.")
-    
-    # Initialize Phase 1-3 services
-    global quota_manager, keyword_difficulty_analyzer
-    quota_manager = QuotaManager()  # In-memory for now, can be extended with database backend
-    keyword_difficulty_analyzer = KeywordDifficultyAnalyzer(dataforseo_client=dataforseo_client_global)
-    print("✅ Quota Manager initialized.")
-    print("✅ Keyword Difficulty Analyzer initialized.")
 
     yield
     
@@ -992,8 +1164,13 @@ async def lifespan(app: FastAPI):
     print("📝 Blog Writer SDK API shutting down...")
     
     # Cleanup tasks
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
+    metrics_collector = service_registry.peek("metrics")
     if hasattr(metrics_collector, '_cleanup_task') and metrics_collector._cleanup_task:
         metrics_collector._cleanup_task.cancel()
+    await close_shared_http_clients()
+    await shutdown_tracing()
     
     print("✅ Cleanup completed")
 
@@ -1132,6 +1309,37 @@ async def usage_attribution_middleware(request: Request, call_next):
     set_usage_attribution_from_headers(request.headers)
     return await call_next(request)
 
+
+# Trace every request; Cloud Tasks workers continue the enqueuing request's trace.
+from src.blog_writer_sdk.monitoring.tracing import (
+    SpanKind, current_trace_id, end_trace, incoming_traceparent, shutdown_tracing, start_trace, timing_breakdown
+)
+
+
+@app.middleware("http")
+async def tracing_middleware(request: Request, call_next):
+    root = start_trace(
+        f"{request.method} {request.url.path}",
+        SpanKind.SERVER,
+        traceparent=incoming_traceparent(request.headers),
+        **{"http.method": request.method}
+    )
+    try:
+        response = await call_next(request)
+        root.set_attribute("http.status_code", response.status_code)
+        if root.trace_id:
+            response.headers["X-Trace-Id"] = root.trace_id
+        return response
+    except Exception as e:
+        root.record_error(e)
+        raise
+    finally:
+        # Name the span after the route template so traces group by endpoint
+        route = request.scope.get("route")
+        if root.trace_id and getattr(route, "path", None):
+            root.name = f"{request.method} {route.path}"
+        end_trace(root)
+
 # Include AI provider management router
 app.include_router(ai_provider_router)
 
@@ -1240,11 +1448,26 @@ blog_writer = BlogWriter(
     enable_ai_enhancement=ai_generator is not None,
 )
 
-# Phase 1-3 global services (initialized in lifespan)
+# Phase 1-3 global services (built by the service registry; see _register_startup_services)
 quota_manager = None
 keyword_difficulty_analyzer = None
 supabase_client: Optional[Client] = None
 supabase_server_client: Optional[SupabaseClient] = None
+secret_manager_client = None
+dataforseo_credential_service = None
+enhanced_keyword_analyzer = None
+google_custom_search_client = None
+google_search_console_client = None
+google_knowledge_graph_client = None
+readability_analyzer = None
+citation_generator = None
+serp_analyzer = None
+semantic_integrator = None
+quality_scorer = None
+intent_analyzer = None
+few_shot_extractor = None
+length_optimizer = None
+topic_recommender = None
 
 
 # Dependency to get blog writer instance
@@ -1273,12 +1496,15 @@ async def health_check():
 
 # Readiness probe endpoint
 @app.get("/ready")
-async def readiness_check():
+async def readiness_check(
+    verbose: bool = Query(False, description="Include per-service warm-up timings and the import-time report"),
+    require_all: bool = Query(False, description="Also wait for non-critical services to finish warming")
+):
     """
     Readiness probe endpoint for Cloud Run.
     
     Checks if the service is ready to accept traffic by verifying:
-    - Database connectivity (if applicable)
+    - Critical registry services are warmed (cache, metrics, batch processor, AI providers)
     - AI provider availability
     - Essential services status
     """
@@ -1290,6 +1516,19 @@ async def readiness_check():
                 content={"status": "not_ready", "reason": "Blog writer not initialized"}
             )
         
+        registry_status = service_registry.status()
+        warming = [name for name, info in registry_status.items() if info["state"] in ("pending", "warming")]
+        if not service_registry.is_ready(require_all=require_all):
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "not_ready",
+                    "reason": "Services still warming",
+                    "warming": warming,
+                    "timestamp": time.time()
+                }
+            )
+        
         # Check AI providers if enabled
         if blog_writer.enable_ai_enhancement and blog_writer.ai_generator:
             try:
@@ -1305,7 +1544,7 @@ async def readiness_check():
                 # AI providers not critical for readiness, log but don't fail
                 print(f"Warning: AI provider check failed: {e}")
         
-        return {
+        response = {
             "status": "ready",
             "timestamp": time.time(),
             "services": {
@@ -1313,8 +1552,15 @@ async def readiness_check():
                 "seo_optimizer": "available",
                 "keyword_analyzer": "available",
                 "ai_enhancement": blog_writer.enable_ai_enhancement
-            }
+            },
+            "warmed_services": [name for name, info in registry_status.items() if info["state"] == "ready"],
+            "warming": warming
         }
+        if verbose:
+            response["registry"] = registry_status
+            import_profiler = get_import_profiler()
+            response["imports"] = import_profiler.report() if import_profiler else None
+        return response
         
     except Exception as e:
         return JSONResponse(
@@ -1360,6 +1606,7 @@ async def root():
             "generate": "/api/v1/blog/generate-enhanced",
             "generate_gateway": "/api/v1/blog/generate-gateway",
             "analyze": "/api/v1/analyze",
+            "score_batch": "/api/v1/content/score-batch",
             "keywords": "/api/v1/keywords",
             "batch": "/api/v1/batch",
             "metrics": "/api/v1/metrics",
@@ -1630,7 +1877,7 @@ async def generate_blog_enhanced(
                     worker_url = f"{service_base_url}/api/v1/blog/worker"
                 
                 # Create Cloud Task
-                task_name = cloud_tasks_service.create_blog_generation_task(
+                task_name = await cloud_tasks_service.create_blog_generation_task_async(
                     request_data={
                         "job_id": job_id,
                         "request": request.dict(),
@@ -1704,7 +1951,7 @@ async def generate_blog_enhanced(
             logger.info("🔧 Multi-Phase mode: Citations are mandatory for premium content")
             
             # Ensure Google Custom Search is available for citations
-            if not google_custom_search_client:
+            if not google_custom_search_client and not await ensure_service("google_custom_search"):
                 logger.error("Multi-Phase mode requires Google Custom Search for citations")
                 raise HTTPException(
                     status_code=503,
@@ -1724,6 +1971,7 @@ async def generate_blog_enhanced(
             logger.info("🔷 Using DataForSEO Content Generation API for blog generation")
             
             # Initialize DataForSEO Content Generation Service
+            await ensure_service("dataforseo_client")
             content_service = DataForSEOContentGenerationService(dataforseo_client=dataforseo_client_global)
             await content_service.initialize(tenant_id="default")
             
@@ -1948,6 +2196,9 @@ async def generate_blog_enhanced(
             """Store progress updates for response."""
             progress_updates.append(update.dict())
         
+        # Pipeline services may still be warming in the background on a cold start
+        await ensure_pipeline_services()
+        
         # Handle Google Search Console client (multi-site support)
         gsc_client = None
         gsc_credentials_path = "/secrets/GSC_SERVICE_ACCOUNT_KEY"
@@ -2126,7 +2377,7 @@ async def generate_blog_enhanced(
         citations = []
         citation_warnings = []  # Initialize citation warnings list
         if request.use_citations:
-            if not google_custom_search_client:
+            if not google_custom_search_client and not await ensure_service("google_custom_search"):
                 if generation_mode == GenerationMode.MULTI_PHASE:
                     # Citations are mandatory for Multi-Phase - fail fast
                     raise HTTPException(
@@ -2442,9 +2693,22 @@ async def blog_generation_worker(request: Dict[str, Any]):
     3. Executes the blog generation pipeline
     4. Updates job with result or error
     5. Marks job as COMPLETED or FAILED
+    6. Stores the run's timing breakdown (from its trace) on the job
     
     This endpoint should not be called directly by clients.
     """
+    try:
+        return await _process_blog_generation_job(request)
+    finally:
+        job_id = request.get("job_id") if isinstance(request, dict) else None
+        job = blog_generation_jobs.get(job_id) if job_id else None
+        if job is not None:
+            job.trace_id = current_trace_id()
+            job.timings = timing_breakdown()
+
+
+async def _process_blog_generation_job(request: Dict[str, Any]):
+    """Run one blog generation job for the worker endpoint."""
     try:
         from src.blog_writer_sdk.monitoring.request_context import set_usage_attribution
         global blog_generation_jobs
@@ -2510,7 +2774,7 @@ async def blog_generation_worker(request: Dict[str, Any]):
             logger.info(f"Worker: 🔧 Multi-Phase mode: Citations are mandatory for premium content")
             
             # Ensure Google Custom Search is available for citations
-            if not google_custom_search_client:
+            if not google_custom_search_client and not await ensure_service("google_custom_search"):
                 logger.error(f"Worker: Multi-Phase mode requires Google Custom Search for citations")
                 job.status = JobStatus.FAILED
                 job.error_message = "Google Custom Search API is required for Multi-Phase workflow citations"
@@ -2529,24 +2793,22 @@ async def blog_generation_worker(request: Dict[str, Any]):
             logger.info(f"Worker: Using legacy flag - USE_DATAFORSEO={USE_DATAFORSEO}")
         
         try:
-            # Create progress callback that updates job
-            progress_updates = []
+            # Create progress callback that updates job (bounded like the job's own history)
+            progress_updates = deque(maxlen=PROGRESS_HISTORY_LIMIT)
             async def progress_callback(update):
                 """Update job progress."""
-                progress_updates.append(update.dict())
-                job.progress_updates = progress_updates
+                update_data = update.dict()
+                progress_updates.append(update_data)
                 
-                # Update current stage and progress
-                if "stage" in update:
-                    job.current_stage = update.get("stage", "processing")
-                if "progress_percentage" in update:
-                    job.progress_percentage = update.get("progress_percentage", 0.0)
+                # Bounded job history; also updates current stage and progress
+                job.add_progress(update_data)
             
             # Use DataForSEO Content Generation if enabled
             if USE_DATAFORSEO:
                 logger.info(f"Worker: 🔷 Using DataForSEO Content Generation API for blog generation")
                 
                 # Initialize DataForSEO Content Generation Service
+                await ensure_service("dataforseo_client")
                 content_service = DataForSEOContentGenerationService(dataforseo_client=dataforseo_client_global)
                 await content_service.initialize(tenant_id="default")
                 
@@ -2633,7 +2895,8 @@ async def blog_generation_worker(request: Dict[str, Any]):
                             category=getattr(blog_request, 'category', None),
                             product_name=getattr(blog_request, 'product_name', None),
                             items=getattr(blog_request, 'comparison_items', None),
-                            custom_instructions=blog_request.custom_instructions
+                            custom_instructions=blog_request.custom_instructions,
+                            progress_callback=progress_callback
                         )
                         
                         logger.info(f"Worker: DataForSEO generation completed: content_length={len(result.get('content', ''))}, tokens={result.get('tokens_used', 0)}")
@@ -2702,10 +2965,7 @@ async def blog_generation_worker(request: Dict[str, Any]):
                             warnings.append("Content length outside ±25% tolerance")
                         warnings.extend(research_warnings)
                         
-                        # Update job with result
-                        job.status = JobStatus.COMPLETED
-                        job.completed_at = datetime.utcnow()
-                        job.result = EnhancedBlogGenerationResponse(
+                        result_response = EnhancedBlogGenerationResponse(
                             title=sanitized["meta_title"] or result.get("title", blog_request.topic),
                             content=sanitized["content"],
                             excerpt=sanitized["excerpt"],
@@ -2727,12 +2987,18 @@ async def blog_generation_worker(request: Dict[str, Any]):
                             content_metadata={},
                             success=True,
                             warnings=warnings,
-                            progress_updates=progress_updates,
+                            progress_updates=list(progress_updates),
                             sanitization_applied=sanitized["sanitization_applied"],
                             artifacts_removed=sanitized["artifacts_removed"],
                             cost_breakdown=cost_breakdown,
                         )
                         
+                        # Store the result once, then mark the job completed
+                        get_job_result_store().put(job_id, result_response)
+                        job.result_available = True
+                        job.status = JobStatus.COMPLETED
+                        job.completed_at = datetime.utcnow()
+                        
                         logger.info(f"Worker: DataForSEO generation completed successfully for job {job_id}")
                         return JSONResponse(
                             status_code=200,
@@ -2758,6 +3024,9 @@ async def blog_generation_worker(request: Dict[str, Any]):
                         content={"error": "AI Content Generator is not initialized"}
                     )
             
+            # Pipeline services may still be warming in the background on a cold start
+            await ensure_pipeline_services()
+            
             # Handle Google Search Console client (multi-site support)
             gsc_client_worker = None
             gsc_credentials_path = "/secrets/GSC_SERVICE_ACCOUNT_KEY"
@@ -2885,7 +3154,7 @@ async def blog_generation_worker(request: Dict[str, Any]):
             citations = []
             citation_warnings = []  # Initialize citation warnings list
             if blog_request.use_citations:
-                if not google_custom_search_client:
+                if not google_custom_search_client and not await ensure_service("google_custom_search"):
                     if generation_mode == GenerationMode.MULTI_PHASE:
                         # Citations are mandatory for Multi-Phase - fail fast
                         job.status = JobStatus.FAILED
@@ -3159,19 +3428,20 @@ async def blog_generation_worker(request: Dict[str, Any]):
                 brand_recommendations=brand_recommendations,
                 success=True,
                 warnings=all_warnings,
-                progress_updates=progress_updates,
+                progress_updates=list(progress_updates),
                 sanitization_applied=sanitization_applied,
                 artifacts_removed=artifacts_removed,
                 image_positions=[],
                 cost_breakdown=cost_breakdown,
             )
             
-            # Update job with result
+            # Store the result once, then mark the job completed
+            get_job_result_store().put(job_id, response)
+            job.result_available = True
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.progress_percentage = 100.0
             job.current_stage = "completed"
-            job.result = response.dict()
             
             logger.info(f"Blog generation job {job_id} completed successfully")
             
@@ -3207,15 +3477,25 @@ async def blog_generation_worker(request: Dict[str, Any]):
 
 # Job status endpoint
 @app.get("/api/v1/blog/jobs/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    http_request: Request,
+    since: Optional[int] = Query(None, ge=0, description="Return only progress updates after this sequence number")
+):
     """
     Get the status of an async blog generation job.
     
+    Pollers should pass the previous response's ``last_seq`` as ``since`` to
+    receive only new progress updates, and fetch ``result_url`` once the job
+    has completed. Without ``since`` all retained updates and the result are
+    included, as before.
+    
     Returns:
     - Job status (pending, queued, processing, completed, failed)
     - Progress percentage
     - Current stage
-    - Result (if completed)
+    - Progress updates (deltas when 'since' is given)
+    - Result (if completed and 'since' is omitted)
     - Error message (if failed)
     """
     global blog_generation_jobs
@@ -3235,19 +3515,53 @@ async def get_job_status(job_id: str):
         # Average generation time is 240 seconds (4 minutes)
         estimated_time_remaining = max(0, int(240 - elapsed))
     
-    return JobStatusResponse(
+    progress_updates, history_truncated = job.progress_since(since or 0)
+    response = JobStatusResponse(
         job_id=job.job_id,
         status=job.status,
         progress_percentage=job.progress_percentage,
         current_stage=job.current_stage,
-        progress_updates=job.progress_updates,  # Include all progress updates for stage tracking
+        progress_updates=progress_updates,
+        last_seq=job.progress_seq,
+        history_truncated=history_truncated,
         created_at=job.created_at,
         started_at=job.started_at,
         completed_at=job.completed_at,
-        result=job.result,
+        result=None,
+        result_available=job.result_available,
+        result_url=f"/api/v1/blog/jobs/{job.job_id}/result" if job.result_available else None,
         error_message=job.error_message,
+        trace_id=job.trace_id,
+        timings=job.timings,
         estimated_time_remaining=estimated_time_remaining
     )
+    payload = response.model_dump(mode="json")
+    if since is None and job.result_available:
+        # Legacy pollers: splice in the result serialized at completion
+        payload["result"] = get_job_result_store().get(job.job_id)
+    return fast_json_response(payload, http_request)
+
+
+@app.get("/api/v1/blog/jobs/{job_id}/result")
+async def get_job_result(job_id: str, http_request: Request):
+    """
+    Get the result of a completed async blog generation job.
+    
+    The result is serialized once when the job completes; this endpoint
+    returns those bytes without re-encoding.
+    """
+    global blog_generation_jobs
+    
+    job = blog_generation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if not job.result_available:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} has no result (status: {job.status.value})")
+    
+    result = get_job_result_store().get(job_id)
+    if result is None:
+        raise HTTPException(status_code=410, detail=f"Result for job {job_id} is no longer stored")
+    return fast_json_response(result, http_request)
 
 
 # Streaming version of enhanced blog generation
@@ -3341,7 +3655,7 @@ async def generate_blog_enhanced_stream(
                     worker_url = f"{service_base_url}/api/v1/blog/worker"
                 
                 # Create Cloud Task
-                task_name = cloud_tasks_service.create_blog_generation_task(
+                task_name = await cloud_tasks_service.create_blog_generation_task_async(
                     request_data={
                         "job_id": job_id,
                         "request": request.dict(),
@@ -3430,16 +3744,15 @@ async def generate_blog_enhanced_stream(
                     # Yield update if stage or progress changed
                     if current_stage != last_stage or job.progress_percentage != last_progress:
                         # Get latest progress update if available
-                        latest_update = None
-                        if job.progress_updates:
-                            latest_update = job.progress_updates[-1]
+                        recent_updates, _ = job.progress_since(max(0, job.progress_seq - 5))
+                        latest_update = recent_updates[-1] if recent_updates else None
                         
                         yield await stream_blog_stage_update(
                             current_stage,
                             job.progress_percentage,
                             data={
                                 "current_stage": job.current_stage,
-                                "progress_updates": job.progress_updates[-5:] if job.progress_updates else [],  # Last 5 updates
+                                "progress_updates": recent_updates,  # Last 5 updates
                                 "latest_update": latest_update
                             },
                             message=latest_update.get("status", job.current_stage or "Processing") if latest_update else (job.current_stage or "Processing"),
@@ -3455,7 +3768,7 @@ async def generate_blog_enhanced_stream(
                         yield await stream_blog_stage_update(
                             BlogGenerationStage.COMPLETED,
                             100.0,
-                            data={"result": job.result},
+                            data={"result": get_job_result_store().load(job_id)},
                             message="Blog generation completed successfully",
                             job_id=job_id,
                             status="completed"
@@ -4238,13 +4551,8 @@ async def analyze_keywords_enhanced(
             results.update(additional_results)
         
         # Cluster keywords by parent topics
-        # Use global knowledge graph client if available
-        kg_client = None
-        try:
-            kg_client = google_knowledge_graph_client if 'google_knowledge_graph_client' in globals() else None
-        except:
-            pass
-        
+        # Knowledge Graph entity marking is opt-in (use_knowledge_graph)
+        kg_client = await ensure_service("google_knowledge_graph") if request.use_knowledge_graph else None
         clustering = KeywordClustering(knowledge_graph_client=kg_client)
         try:
             # Apply testing mode clustering limits
@@ -4255,6 +4563,8 @@ async def analyze_keywords_enhanced(
                 max_clusters=max_clusters,
                 max_keywords_per_cluster=max_keywords_per_cluster
             )
+            if request.use_knowledge_graph:
+                await annotate_entity_clusters(clustering, clustering_result)
             # Log clustering results for debugging
             logger.info(f"Clustering result: {clustering_result.cluster_count} clusters from {clustering_result.total_keywords} keywords")
             logger.info(f"Clusters: {[c.parent_topic for c in clustering_result.clusters[:5]]}")
@@ -4628,7 +4938,7 @@ async def analyze_keywords_enhanced(
             "serp_analysis": serp_analysis_summary
         }
         
-        return response_payload
+        return fast_json_response(response_payload, http_request)
     except HTTPException:
         raise
     except Exception as e:
@@ -4825,12 +5135,7 @@ async def analyze_keywords_enhanced_stream(
             )
             
             from src.blog_writer_sdk.seo.keyword_clustering import KeywordClustering
-            kg_client = None
-            try:
-                kg_client = google_knowledge_graph_client if 'google_knowledge_graph_client' in globals() else None
-            except:
-                pass
-            
+            kg_client = await ensure_service("google_knowledge_graph") if request.use_knowledge_graph else None
             clustering = KeywordClustering(knowledge_graph_client=kg_client)
             try:
                 max_clusters, max_keywords_per_cluster = apply_clustering_limits()
@@ -4840,6 +5145,8 @@ async def analyze_keywords_enhanced_stream(
                     max_clusters=max_clusters,
                     max_keywords_per_cluster=max_keywords_per_cluster
                 )
+                if request.use_knowledge_graph:
+                    await annotate_entity_clusters(clustering, clustering_result)
                 
                 yield await stream_stage_update(
                     KeywordSearchStage.CLUSTERING_KEYWORDS,
@@ -5487,7 +5794,7 @@ async def analyze_keyword_difficulty(
     """
     try:
         global keyword_difficulty_analyzer
-        if not keyword_difficulty_analyzer:
+        if not keyword_difficulty_analyzer and not await ensure_service("keyword_difficulty_analyzer"):
             raise HTTPException(status_code=503, detail="Difficulty analyzer not available")
         
         analysis = await keyword_difficulty_analyzer.analyze_difficulty(
@@ -5535,7 +5842,7 @@ async def get_quota_info(organization_id: str):
     """
     try:
         global quota_manager
-        if not quota_manager:
+        if not quota_manager and not await ensure_service("quota_manager"):
             raise HTTPException(status_code=503, detail="Quota manager not available")
         
         quota_info = await quota_manager.get_quota_info(organization_id)
@@ -5566,7 +5873,7 @@ async def set_quota_limits(
     """
     try:
         global quota_manager
-        if not quota_manager:
+        if not quota_manager and not await ensure_service("quota_manager"):
             raise HTTPException(status_code=503, detail="Quota manager not available")
         
         await quota_manager.set_quota_limits(
@@ -5605,7 +5912,7 @@ async def recommend_topics(
     try:
         global topic_recommender, ai_generator
         
-        if not topic_recommender:
+        if not topic_recommender and not await ensure_service("topic_recommender"):
             raise HTTPException(
                 status_code=503,
                 detail="Topic recommendation engine not available"
@@ -5713,19 +6020,16 @@ async def extract_keywords(
         )
         
         # Cluster keywords by parent topics
-        # Use global knowledge graph client if available
-        kg_client = None
-        try:
-            kg_client = google_knowledge_graph_client if 'google_knowledge_graph_client' in globals() else None
-        except:
-            pass
-        
+        # Knowledge Graph entity marking is opt-in (use_knowledge_graph)
+        kg_client = await ensure_service("google_knowledge_graph") if request.use_knowledge_graph else None
         clustering = KeywordClustering(knowledge_graph_client=kg_client)
         clustering_result = clustering.cluster_keywords(
             keywords=keywords,
             min_cluster_size=1,  # Allow single keywords to have parent topics
             max_clusters=None  # No limit
         )
+        if request.use_knowledge_graph:
+            await annotate_entity_clusters(clustering, clustering_result)
         
         # Build response with parent topics
         keywords_with_topics = []
@@ -6086,7 +6390,7 @@ async def analyze_keywords_goal_based(
                 "recommendations": _generate_brand_awareness_recommendations(content_analysis, keyword_overview)
             }
         
-        return results
+        return fast_json_response(results, http_request)
         
     except HTTPException:
         raise
@@ -6962,7 +7266,7 @@ async def get_ai_topic_suggestions(
         
         # Use TopicRecommendationEngine for AI-powered topic generation
         global topic_recommender, ai_generator
-        if not topic_recommender:
+        if not topic_recommender and not await ensure_service("topic_recommender"):
             raise HTTPException(status_code=503, detail="Topic recommendation engine not available")
         
         # Get AI-powered topic recommendations
@@ -7257,7 +7561,7 @@ async def get_ai_topic_suggestions_stream(
             )
             
             global topic_recommender
-            if not topic_recommender:
+            if not topic_recommender and not await ensure_service("topic_recommender"):
                 raise HTTPException(status_code=503, detail="Topic recommendation engine not available")
             
             try:
@@ -7883,13 +8187,31 @@ async def stream_batch_results(job_id: str):
 
 
 @app.get("/api/v1/batch")
-async def list_batch_jobs():
-    """List all batch jobs."""
-    if not batch_processor:
+async def list_batch_jobs(
+    status: Optional[str] = None,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(default=None, description="Cursor from next_cursor of the previous page"),
+    include_items: bool = Query(default=False, description="Include per-item requests and results"),
+    format: str = Query(default="json", pattern="^(json|ndjson)$"),
+):
+    """List batch jobs, newest first, with cursor pagination."""
+    if not batch_processor and not await ensure_service("batch_processor"):
         raise HTTPException(status_code=503, detail="Batch processor not available")
     
+    jobs = batch_processor.active_jobs.values()
+    if status:
+        jobs = [job for job in jobs if job.status.value == status]
+    serialize = (lambda job: job.to_dict()) if include_items else (lambda job: job.to_summary())
+    job_key = lambda job: (job.created_at, job.id)
+    
+    if format == "ndjson":
+        ordered, _ = keyset_slice(jobs, job_key, limit=None, cursor=cursor)
+        return ndjson_response((serialize(job) for job in ordered), filename="batch-jobs.ndjson")
+    
+    page, next_cursor = keyset_slice(jobs, job_key, limit=limit, cursor=cursor)
     return {
-        "jobs": batch_processor.list_batch_jobs(),
+        "jobs": [serialize(job) for job in page],
+        "next_cursor": next_cursor,
         "statistics": batch_processor.get_batch_statistics()
     }
 
@@ -8522,6 +8844,7 @@ async def competitive_gap(request: CompetitiveGapRequest) -> Dict[str, Any]:
     """
     Lightweight competitive gap analysis via DataForSEO (if configured).
     """
+    await ensure_service("dataforseo_client")
     if not dataforseo_client_global or not getattr(dataforseo_client_global, "is_configured", False):
         return {
             "keyword": request.keyword,
@@ -8553,6 +8876,7 @@ async def seo_top_pages(request: DomainSummaryRequest) -> Dict[str, Any]:
     """
     Placeholder top-pages summary. Returns warning if DataForSEO not configured.
     """
+    await ensure_service("dataforseo_client")
     if not dataforseo_client_global or not getattr(dataforseo_client_global, "is_configured", False):
         return {
             "domain": request.domain,
@@ -8577,6 +8901,7 @@ async def seo_domain_summary(request: DomainSummaryRequest) -> Dict[str, Any]:
     """
     Placeholder domain summary. Returns warning if DataForSEO not configured.
     """
+    await ensure_service("dataforseo_client")
     if not dataforseo_client_global or not getattr(dataforseo_client_global, "is_configured", False):
         return {
             "domain": request.domain,
@@ -8607,6 +8932,8 @@ async def cloudrun_status():
     - Resource usage
     - Environment information
     - Service configuration
+    - Known DataForSEO endpoint capabilities per tenant
+    - Shared DataForSEO clients and their cache hit rates
     """
     import psutil
     
@@ -8663,7 +8990,11 @@ async def cloudrun_status():
                     "used_percent": round((disk_usage.used / disk_usage.total) * 100, 1)
                 }
             },
-            "capabilities": capabilities
+            "capabilities": capabilities,
+            "dataforseo_capabilities": get_capability_registry().snapshot(),
+            "dataforseo_clients": get_client_registry().get_stats(),
+            "google_custom_search": google_custom_search_client.get_stats() if google_custom_search_client else None,
+            "job_results": get_job_result_store().get_stats()
         }
         
     except Exception as e:
@@ -5,20 +5,36 @@ This SDK provides comprehensive tools for creating, optimizing, and managing blo
 with a focus on SEO best practices and content quality.
 """
 
-from .core.blog_writer import BlogWriter
-from .core.content_analyzer import ContentAnalyzer
-from .core.seo_optimizer import SEOOptimizer
-from .models.blog_models import (
-    BlogPost,
-    BlogRequest,
-    SEOMetrics,
-    ContentQuality,
-    BlogGenerationResult,
-)
-from .seo.keyword_analyzer import KeywordAnalyzer
-from .seo.meta_generator import MetaTagGenerator
-from .formatters.markdown_formatter import MarkdownFormatter
-from .formatters.html_formatter import HTMLFormatter
+import importlib
+
+# Public names are imported on first access so that importing a submodule
+# (e.g. ``src.blog_writer_sdk.monitoring``) does not load the whole SDK.
+_LAZY_EXPORTS = {
+    "BlogWriter": ".core.blog_writer",
+    "ContentAnalyzer": ".core.content_analyzer",
+    "SEOOptimizer": ".core.seo_optimizer",
+    "BlogPost": ".models.blog_models",
+    "BlogRequest": ".models.blog_models",
+    "SEOMetrics": ".models.blog_models",
+    "ContentQuality": ".models.blog_models",
+    "BlogGenerationResult": ".models.blog_models",
+    "KeywordAnalyzer": ".seo.keyword_analyzer",
+    "MetaTagGenerator": ".seo.meta_generator",
+    "MarkdownFormatter": ".formatters.markdown_formatter",
+    "HTMLFormatter": ".formatters.html_formatter",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
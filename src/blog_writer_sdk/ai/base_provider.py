@@ -5,12 +5,21 @@ This module defines the abstract base classes for AI providers,
 enabling easy switching between different AI services.
 """
 
+import asyncio
+import logging
+import os
+import time
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, Union
 from enum import Enum
 from pydantic import BaseModel, Field
 from dataclasses import dataclass
 
+from .provider_routing import ProviderRouter
+from ..monitoring.tracing import SpanKind, span
+
+logger = logging.getLogger(__name__)
+
 
 class AIProviderType(str, Enum):
     """Supported AI provider types."""
@@ -223,12 +232,28 @@ class AIProviderConfig(BaseModel):
 class AIProviderManager:
     """
     Manager class for handling multiple AI providers with fallback support.
+    
+    Requests are routed to the fastest healthy provider (rolling latency and
+    error EWMA), hedged to the next provider when the first exceeds its p95
+    latency, and providers with an open circuit breaker are skipped.
     """
     
-    def __init__(self):
+    def __init__(self, router: Optional[ProviderRouter] = None, hedging_enabled: Optional[bool] = None):
+        """
+        Initialize the manager.
+        
+        Args:
+            router: Routing state (a fresh ProviderRouter by default)
+            hedging_enabled: Send a second request when the first is slow
+                (env AI_HEDGING_ENABLED, default true)
+        """
         self.providers: Dict[str, BaseAIProvider] = {}
         self.provider_configs: Dict[str, AIProviderConfig] = {}
         self.fallback_order: List[str] = []
+        self.router = router or ProviderRouter()
+        if hedging_enabled is None:
+            hedging_enabled = os.getenv("AI_HEDGING_ENABLED", "true").lower() == "true"
+        self.hedging_enabled = hedging_enabled
     
     def add_provider(self, name: str, provider: BaseAIProvider, config: AIProviderConfig):
         """Add an AI provider to the manager."""
@@ -270,40 +295,67 @@ class AIProviderManager:
         Returns:
             AI response with generated content
         """
-        providers_to_try = []
-        
-        # Add preferred provider first if specified and available
-        if preferred_provider and preferred_provider in self.providers:
-            if self.provider_configs[preferred_provider].enabled:
-                providers_to_try.append(preferred_provider)
-        
-        # Add fallback providers
-        for provider_name in self.fallback_order:
-            if provider_name not in providers_to_try:
-                providers_to_try.append(provider_name)
+        providers_to_try = self._route(preferred_provider, model)
         
         if not providers_to_try:
             raise AIProviderError("No enabled AI providers available", "manager")
         
+        candidates = iter(providers_to_try)
+        pending: Dict[asyncio.Task, tuple] = {}
         last_error = None
         
-        for provider_name in providers_to_try:
-            try:
-                provider = self.providers[provider_name]
-                response = await provider.generate_content(request, model)
-                return response
-            
-            except AIProviderRateLimitError as e:
-                last_error = e
-                continue  # Try next provider
-            
-            except AIProviderQuotaExceededError as e:
-                last_error = e
-                continue  # Try next provider
-            
-            except Exception as e:
-                last_error = e
-                continue  # Try next provider
+        def launch_next() -> bool:
+            for provider_name in candidates:
+                key = self.router.key(provider_name, model)
+                if not self.router.allow(key):
+                    continue
+                task = asyncio.ensure_future(self._traced_generate(provider_name, request, model))
+                pending[task] = (provider_name, key, time.perf_counter())
+                return True
+            return False
+        
+        if not launch_next():
+            # Every circuit is open: fail fast rather than hammering failing providers
+            raise AIProviderError("All AI providers are unavailable (circuit open)", "manager")
+        
+        try:
+            while pending:
+                hedge_delay = None
+                if self.hedging_enabled and len(pending) == 1:
+                    (_, key, started), = pending.values()
+                    hedge_delay = max(0.0, self.router.hedge_delay(key) - (time.perf_counter() - started))
+                
+                done, _ = await asyncio.wait(
+                    pending, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Primary is slower than its p95: hedge with the next provider
+                    if launch_next():
+                        logger.info(f"Hedging AI request after {hedge_delay:.2f}s")
+                    else:
+                        hedge_delay = None
+                        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    provider_name, key, started = pending.pop(task)
+                    elapsed = time.perf_counter() - started
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        # Rate limit, quota and other errors all move on to the next provider
+                        last_error = e
+                        self.router.record_failure(key, e)
+                        logger.warning(f"AI provider {provider_name} failed after {elapsed:.2f}s: {e}")
+                        continue
+                    self.router.record_success(key, elapsed)
+                    return response
+                
+                if not pending:
+                    launch_next()
+        finally:
+            for task, (_, key, started) in pending.items():
+                task.cancel()
+                self.router.record_abandoned(key, time.perf_counter() - started)
         
         # If we get here, all providers failed
         raise AIProviderError(
@@ -311,6 +363,30 @@ class AIProviderManager:
             "manager"
         )
     
+    async def _traced_generate(self, provider_name: str, request: AIRequest, model: Optional[str]) -> AIResponse:
+        """One provider attempt, recorded as an upstream span (cancelled hedges show as errors)."""
+        with span(f"llm {provider_name}", SpanKind.UPSTREAM, provider=provider_name, model=model) as call_span:
+            response = await self.providers[provider_name].generate_content(request, model)
+            call_span.set_attributes(model=response.model, tokens=response.tokens_used)
+            return response
+    
+    def _route(self, preferred_provider: Optional[str], model: Optional[str]) -> List[str]:
+        """Providers in try order: preferred first, the rest fastest-first, open circuits last."""
+        providers_to_try = []
+        
+        # Add preferred provider first if specified and available
+        if preferred_provider and preferred_provider in self.providers:
+            if self.provider_configs[preferred_provider].enabled:
+                providers_to_try.append(preferred_provider)
+        
+        # Add fallback providers ranked by observed latency
+        fallback = [name for name in self.fallback_order if name not in providers_to_try]
+        keys = {self.router.key(name, model): name for name in fallback}
+        providers_to_try.extend(keys[key] for key in self.router.rank(list(keys)))
+        
+        healthy = [name for name in providers_to_try if not self.router.is_open(self.router.key(name, model))]
+        return healthy + [name for name in providers_to_try if name not in healthy]
+    
     async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
         """Perform health checks on all providers."""
         results = {}
@@ -321,6 +397,7 @@ class AIProviderManager:
     def get_provider_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status information for all providers."""
         status = {}
+        routing = self.router.snapshot()
         for name, config in self.provider_configs.items():
             provider = self.providers.get(name)
             status[name] = {
@@ -328,6 +405,10 @@ class AIProviderManager:
                 "priority": config.priority,
                 "provider_type": config.provider_type.value,
                 "default_model": config.default_model,
-                "available": provider is not None
+                "available": provider is not None,
+                "routing": {
+                    key: stats for key, stats in routing.items()
+                    if key.split(":", 1)[0] == name
+                }
             }
         return status
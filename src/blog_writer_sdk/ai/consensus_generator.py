@@ -28,18 +28,42 @@ class ConsensusResult:
     total_cost: float
 
 
+# (provider, model_preference, label) for each draft, in synthesis order
+DEFAULT_DRAFT_MODELS: List[Tuple[str, str, str]] = [
+    ("openai", "gpt-4o", "GPT-4o"),
+    ("anthropic", "claude-3-5-sonnet-20241022", "Claude 3.5 Sonnet"),
+]
+
+
 class ConsensusGenerator:
     """Generates content using multi-model consensus approach."""
     
-    def __init__(self, ai_generator: AIContentGenerator):
+    def __init__(
+        self,
+        ai_generator: AIContentGenerator,
+        concurrent_drafts: bool = True,
+        min_drafts: Optional[int] = None,
+        draft_deadline: Optional[float] = None,
+        draft_models: Optional[List[Tuple[str, str, str]]] = None
+    ):
         """
         Initialize consensus generator.
         
         Args:
             ai_generator: AI content generator instance
+            concurrent_drafts: Launch all drafts together instead of one after another
+            min_drafts: Start synthesis as soon as this many drafts finish (first-k-of-n);
+                defaults to waiting for every draft
+            draft_deadline: Seconds to wait for drafts; once passed, unfinished drafts are
+                cancelled as long as at least one draft is available
+            draft_models: (provider, model_preference, label) tuples to draft with
         """
         self.ai_generator = ai_generator
         self.prompt_builder = EnhancedPromptBuilder()
+        self.concurrent_drafts = concurrent_drafts
+        self.draft_models = draft_models or DEFAULT_DRAFT_MODELS
+        self.min_drafts = max(1, min(min_drafts or len(self.draft_models), len(self.draft_models)))
+        self.draft_deadline = draft_deadline
     
     async def generate_with_consensus(
         self,
@@ -64,32 +88,47 @@ class ConsensusGenerator:
         Returns:
             ConsensusResult with synthesized content
         """
-        # Step 1: Generate draft with GPT-4o
-        logger.info("Generating draft with GPT-4o")
-        gpt_draft = await self._generate_draft(
-            topic, outline, keywords, tone, length,
-            provider="openai",
-            model_preference="gpt-4o",
-            additional_context=additional_context
-        )
-        
-        # Step 2: Generate alternative draft with Claude 3.5 Sonnet
-        logger.info("Generating alternative draft with Claude 3.5 Sonnet")
-        claude_draft = await self._generate_draft(
-            topic, outline, keywords, tone, length,
-            provider="anthropic",
-            model_preference="claude-3-5-sonnet-20241022",
-            additional_context=additional_context
-        )
+        # Step 1-2: Generate drafts (concurrently unless disabled)
+        if self.concurrent_drafts:
+            drafts = await self._generate_drafts_concurrently(
+                topic, outline, keywords, tone, length, additional_context
+            )
+        else:
+            drafts = []
+            for provider, model, label in self.draft_models:
+                logger.info(f"Generating draft with {label}")
+                drafts.append(await self._generate_draft(
+                    topic, outline, keywords, tone, length,
+                    provider=provider,
+                    model_preference=model,
+                    additional_context=additional_context
+                ))
         
         # Step 3: Use GPT-4o-mini to compare and extract best sections
-        logger.info("Synthesizing best sections")
-        synthesis_result = await self._synthesize_best_sections(
-            gpt_draft["content"],
-            claude_draft["content"],
-            topic,
-            keywords
-        )
+        if len(drafts) >= 2:
+            logger.info("Synthesizing best sections")
+            synthesis_result = await self._synthesize_best_sections(
+                drafts[0]["content"],
+                drafts[1]["content"],
+                topic,
+                keywords
+            )
+        else:
+            # Only one draft made it in time; nothing to compare
+            logger.info("Single draft available, skipping synthesis")
+            synthesis_result = {
+                "synthesized_content": drafts[0]["content"],
+                "tokens_used": 0,
+                "cost": 0.0,
+                "best_sections": {},
+                "metadata": {
+                    "synthesis_method": "single_draft",
+                    "drafts_compared": 1
+                }
+            }
+        synthesis_result.setdefault("metadata", {})["draft_providers"] = [
+            d["provider"] for d in drafts
+        ]
         
         # Step 4: Use Claude for final coherence check
         logger.info("Final coherence check with Claude")
@@ -100,34 +139,20 @@ class ConsensusGenerator:
         )
         
         # Calculate totals
-        total_tokens = (
-            gpt_draft["tokens_used"] +
-            claude_draft["tokens_used"] +
-            synthesis_result["tokens_used"] +
-            final_content["tokens_used"]
-        )
-        total_cost = (
-            gpt_draft.get("cost", 0) +
-            claude_draft.get("cost", 0) +
-            synthesis_result.get("cost", 0) +
-            final_content.get("cost", 0)
-        )
+        steps = drafts + [synthesis_result, final_content]
+        total_tokens = sum(step["tokens_used"] for step in steps)
+        total_cost = sum(step.get("cost", 0) for step in steps)
         
         return ConsensusResult(
             final_content=final_content["content"],
             draft_variations=[
                 {
-                    "provider": "openai",
-                    "content": gpt_draft["content"],
-                    "tokens": gpt_draft["tokens_used"],
-                    "cost": gpt_draft.get("cost", 0)
-                },
-                {
-                    "provider": "anthropic",
-                    "content": claude_draft["content"],
-                    "tokens": claude_draft["tokens_used"],
-                    "cost": claude_draft.get("cost", 0)
+                    "provider": draft["provider"],
+                    "content": draft["content"],
+                    "tokens": draft["tokens_used"],
+                    "cost": draft.get("cost", 0)
                 }
+                for draft in drafts
             ],
             synthesis_metadata=synthesis_result.get("metadata", {}),
             best_sections=synthesis_result.get("best_sections", {}),
@@ -135,6 +160,74 @@ class ConsensusGenerator:
             total_cost=total_cost
         )
     
+    async def _generate_drafts_concurrently(
+        self,
+        topic: str,
+        outline: str,
+        keywords: List[str],
+        tone: str,
+        length: str,
+        additional_context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Launch every draft at once and collect them under the first-k / deadline policy.
+        
+        Returns the completed drafts in ``draft_models`` order. Stragglers are
+        cancelled once ``min_drafts`` have finished or the deadline has passed
+        with at least one draft in hand.
+        """
+        loop = asyncio.get_running_loop()
+        tasks: Dict[asyncio.Task, int] = {}
+        for index, (provider, model, label) in enumerate(self.draft_models):
+            logger.info(f"Generating draft with {label}")
+            task = asyncio.create_task(self._generate_draft(
+                topic, outline, keywords, tone, length,
+                provider=provider,
+                model_preference=model,
+                additional_context=additional_context
+            ))
+            tasks[task] = index
+        
+        deadline = loop.time() + self.draft_deadline if self.draft_deadline else None
+        completed: Dict[int, Dict[str, Any]] = {}
+        errors: List[BaseException] = []
+        pending = set(tasks)
+        
+        try:
+            while pending and len(completed) < self.min_drafts:
+                timeout = None
+                if deadline is not None and completed:
+                    timeout = max(0.0, deadline - loop.time())
+                elif deadline is not None:
+                    # Nothing usable yet: keep waiting past the deadline for the first draft
+                    timeout = max(0.0, deadline - loop.time()) or None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        provider = self.draft_models[tasks[task]][0]
+                        logger.warning(f"Draft with {provider} failed: {task.exception()}")
+                        errors.append(task.exception())
+                    else:
+                        completed[tasks[task]] = task.result()
+                if not done and completed:
+                    logger.info(
+                        f"Draft deadline of {self.draft_deadline}s reached with "
+                        f"{len(completed)}/{len(self.draft_models)} drafts"
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if not completed:
+            raise errors[-1] if errors else RuntimeError("No consensus drafts were generated")
+        
+        return [completed[index] for index in sorted(completed)]
+    
     async def _generate_draft(
         self,
         topic: str,
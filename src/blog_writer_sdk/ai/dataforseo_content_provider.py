@@ -9,6 +9,7 @@ import time
 import logging
 from typing import Dict, List, Optional, Any
 from ..integrations.dataforseo_integration import DataForSEOClient
+from ..integrations.dataforseo_clients import get_client_registry
 from .base_provider import (
     BaseAIProvider,
     AIProviderType,
@@ -70,13 +71,13 @@ class DataForSEOContentProvider(BaseAIProvider):
     async def initialize(self) -> None:
         """Initialize the DataForSEO client."""
         if not self._client:
-            self._client = DataForSEOClient(
+            self._client = await get_client_registry().acquire(
+                "default",
                 api_key=self.api_key,
                 api_secret=self.api_secret,
                 location="United States",
                 language_code="en"
             )
-            await self._client.initialize_credentials("default")
     
     async def generate_content(
         self,
@@ -26,6 +26,8 @@ from ..seo.readability_analyzer import ReadabilityAnalyzer, ReadabilityMetrics
 from ..seo.semantic_keyword_integrator import SemanticKeywordIntegrator
 from ..seo.content_quality_scorer import ContentQualityScorer
 from ..seo.intent_analyzer import IntentAnalyzer, SearchIntent
+from ..utils.multi_pattern import get_cached_matcher
+from ..monitoring.tracing import SpanKind, span, start_span
 from enum import Enum
 import time
 
@@ -139,6 +141,16 @@ class MultiStageGenerationPipeline:
         self.dataforseo_client = dataforseo_client
         self.search_console = search_console
         self.progress_callback = progress_callback
+        # Stage timing: each new stage_number closes the previous stage's span
+        self._run_started: Optional[float] = None
+        self._stage_number: Optional[int] = None
+        self._stage_started: Optional[float] = None
+        self._stage_span: Any = None
+    
+    def _end_stage_span(self) -> None:
+        if self._stage_span is not None:
+            self._stage_span.end()
+            self._stage_span = None
     
     async def _emit_progress(
         self,
@@ -149,7 +161,18 @@ class MultiStageGenerationPipeline:
         details: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
     ):
-        """Emit progress update if callback is available."""
+        """Emit progress update if callback is available; a new stage_number also starts its span."""
+        now = time.perf_counter()
+        if self._run_started is None:
+            self._run_started = now
+        if stage_number != self._stage_number:
+            self._end_stage_span()
+            self._stage_number = stage_number
+            self._stage_started = now
+            self._stage_span = start_span(
+                f"stage {stage.value}", SpanKind.STAGE, stage=stage.value, stage_number=stage_number
+            )
+        
         if self.progress_callback:
             progress = ProgressUpdate(
                 stage=stage.value,
@@ -159,7 +182,9 @@ class MultiStageGenerationPipeline:
                 status=status,
                 details=details,
                 metadata=metadata or {},
-                timestamp=time.time()
+                timestamp=time.time(),
+                elapsed_ms=round((now - self._run_started) * 1000, 1),
+                stage_elapsed_ms=round((now - self._stage_started) * 1000, 1)
             )
             try:
                 await self.progress_callback(progress)
@@ -178,6 +203,9 @@ class MultiStageGenerationPipeline:
         """
         Generate content using multi-stage pipeline.
         
+        Each stage is recorded as a span in the active trace and progress
+        updates carry elapsed times.
+        
         Args:
             topic: Blog topic
             keywords: Target keywords
@@ -189,6 +217,24 @@ class MultiStageGenerationPipeline:
         Returns:
             PipelineResult with final content and metadata
         """
+        self._run_started = time.perf_counter()
+        self._stage_number = None
+        with span("pipeline generate", SpanKind.INTERNAL, keywords=len(keywords)):
+            try:
+                return await self._generate(topic, keywords, tone, length, template, additional_context)
+            finally:
+                self._end_stage_span()
+    
+    async def _generate(
+        self,
+        topic: str,
+        keywords: List[str],
+        tone: ContentTone,
+        length: ContentLength,
+        template: Optional[PromptTemplate],
+        additional_context: Optional[Dict[str, Any]]
+    ) -> PipelineResult:
+        """Run the stages; see generate."""
         import time
         start_time = time.time()
         stage_results = []
@@ -1474,6 +1520,22 @@ class MultiStageGenerationPipeline:
                 })
             available_count = len(link_sources)
         
+        # Compile every anchor/keyword of every link into one automaton; the
+        # payload (link index, keyword index) preserves the matching priority.
+        # Keyword 0 is the anchor text itself.
+        link_keywords = [
+            tuple([link_info['anchor_text'].lower()] + [k.lower() for k in link_info.get('keywords', [])])
+            for link_info in link_sources
+        ]
+        matcher = get_cached_matcher(
+            ("internal_links", tuple(link_keywords)),
+            (
+                (keyword, (link_index, keyword_index))
+                for link_index, keywords_to_check in enumerate(link_keywords)
+                for keyword_index, keyword in enumerate(keywords_to_check)
+            )
+        )
+        
         # Find natural insertion points in content
         lines = content.split('\n')
         fixed_lines = []
@@ -1507,52 +1569,68 @@ class MultiStageGenerationPipeline:
                 not line.strip().startswith('|') and  # Skip table rows
                 len(line.strip()) > 50):
                 
-                # Check if any link source matches this line
-                for link_info in link_sources:
+                # One pass over the line finds the first occurrence of every
+                # anchor/keyword; links are then considered in priority order
+                first_matches = matcher.first_occurrences(line)
+                if not first_matches:
+                    continue
+                
+                candidates: Dict[int, Dict[int, Any]] = {}
+                for (link_index, keyword_index), match in first_matches.items():
+                    candidates.setdefault(link_index, {})[keyword_index] = match
+                
+                chosen = []  # (start, end, link_info, keyword)
+                for link_index in sorted(candidates):
+                    link_info = link_sources[link_index]
                     if link_info['url'] in used_urls:
                         continue
                     
-                    # Try to find anchor text in line
-                    anchor_text = link_info['anchor_text']
-                    anchor_lower = anchor_text.lower()
-                    line_lower = line.lower()
-                    
-                    # Also check keywords associated with this link
-                    keywords_to_check = [anchor_lower] + [k.lower() for k in link_info.get('keywords', [])]
-                    
-                    for keyword in keywords_to_check:
-                        if keyword in line_lower and links_inserted < target_link_count:
-                            idx = line_lower.find(keyword)
-                            if idx != -1:
-                                before = line[:idx]
-                                # Check if already linked
-                                if '[' not in before[-20:] and '](' not in before[-20:]:
-                                    keyword_text = line[idx:idx+len(keyword)]
-                                    after = line[idx+len(keyword):]
-                                    
-                                    linked_keyword = f"[{keyword_text}]({link_info['url']})"
-                                    fixed_lines[-1] = before + linked_keyword + after
-                                    links_inserted += 1
-                                    used_urls.add(link_info['url'])
-                                    
-                                    # Calculate simple relevance score based on keyword match
-                                    relevance = 0.8 if keyword == anchor_lower else 0.6
-                                    
-                                    inserted_links.append({
-                                        'anchor_text': keyword_text,
-                                        'url': link_info['url'],
-                                        'target_title': link_info.get('target_title', ''),
-                                        'position': current_section,
-                                        'relevance_score': relevance,
-                                        # Legacy format fields for backwards compatibility
-                                        'text': keyword_text,
-                                    })
-                                    logger.info(f"Inserted internal link: {keyword_text} -> {link_info['url']} ({current_section})")
-                                    break
-                        if links_inserted >= target_link_count:
-                            break
+                    keywords_to_check = link_keywords[link_index]
+                    for keyword_index in sorted(candidates[link_index]):
+                        match = candidates[link_index][keyword_index]
+                        before = line[:match.start]
+                        # Check if already linked, or overlapping a link chosen for this line
+                        if '[' in before[-20:] or '](' in before[-20:]:
+                            continue
+                        if any(match.start < end and start < match.end for start, end, _, _ in chosen):
+                            continue
+                        
+                        chosen.append((match.start, match.end, link_info, keywords_to_check[keyword_index]))
+                        links_inserted += 1
+                        used_urls.add(link_info['url'])
+                        break
                     if links_inserted >= target_link_count:
                         break
+                
+                if not chosen:
+                    continue
+                
+                # Splice all links chosen for this line in one go
+                pieces = []
+                cursor = 0
+                for start, end, link_info, keyword in sorted(chosen, key=lambda c: c[0]):
+                    keyword_text = line[start:end]
+                    pieces.append(line[cursor:start])
+                    pieces.append(f"[{keyword_text}]({link_info['url']})")
+                    cursor = end
+                pieces.append(line[cursor:])
+                fixed_lines[-1] = ''.join(pieces)
+                
+                for start, end, link_info, keyword in chosen:
+                    keyword_text = line[start:end]
+                    # Calculate simple relevance score based on keyword match
+                    relevance = 0.8 if keyword == link_info['anchor_text'].lower() else 0.6
+                    
+                    inserted_links.append({
+                        'anchor_text': keyword_text,
+                        'url': link_info['url'],
+                        'target_title': link_info.get('target_title', ''),
+                        'position': current_section,
+                        'relevance_score': relevance,
+                        # Legacy format fields for backwards compatibility
+                        'text': keyword_text,
+                    })
+                    logger.info(f"Inserted internal link: {keyword_text} -> {link_info['url']} ({current_section})")
         
         if links_inserted > 0:
             logger.info(f"Inserted {links_inserted} internal links into content")
@@ -0,0 +1,244 @@
+"""
+Latency-aware routing for AI providers.
+
+Tracks rolling latency and error rates per provider/model, orders providers
+by expected latency, decides when a request should be hedged to a second
+provider, and trips a circuit breaker for providers that keep failing.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+
+class CircuitState:
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class ProviderStats:
+    """Rolling health of one provider/model pair."""
+    latency_ewma: Optional[float] = None
+    error_ewma: float = 0.0
+    recent_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    circuit_state: str = CircuitState.CLOSED
+    opened_at: Optional[float] = None
+    probe_in_flight: bool = False
+    last_error: Optional[str] = None
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.recent_latencies:
+            return None
+        ordered = sorted(self.recent_latencies)
+        rank = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+        return ordered[rank]
+
+
+class ProviderRouter:
+    """
+    Rolling latency/error tracking, routing order and circuit breakers.
+
+    Features:
+    - Latency and error EWMA per provider/model
+    - p95 over a window of recent latencies, used as the hedge delay
+    - Circuit breaker: opens after consecutive failures, lets one probe
+      through after the reset timeout (half-open), closes on success
+    """
+
+    def __init__(
+        self,
+        alpha: Optional[float] = None,
+        window: int = 100,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        min_samples: int = 5,
+        hedge_min_delay: Optional[float] = None,
+        default_hedge_delay: Optional[float] = None,
+        error_penalty: float = 4.0,
+        clock=time.monotonic
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            alpha: EWMA smoothing factor (env AI_ROUTING_EWMA_ALPHA, default 0.2)
+            window: Number of recent latencies kept for percentiles
+            failure_threshold: Consecutive failures that open the circuit
+                (env AI_CIRCUIT_FAILURE_THRESHOLD, default 5)
+            reset_timeout: Seconds before an open circuit allows a probe
+                (env AI_CIRCUIT_RESET_SECONDS, default 30)
+            min_samples: Samples needed before p95 is trusted
+            hedge_min_delay: Lower bound for the hedge delay in seconds
+                (env AI_HEDGE_MIN_DELAY_SECONDS, default 1)
+            default_hedge_delay: Hedge delay before enough samples exist
+                (env AI_HEDGE_DEFAULT_DELAY_SECONDS, default 15)
+            error_penalty: Weight of the error EWMA in the routing score
+            clock: Monotonic clock (overridable in tests)
+        """
+        self.alpha = alpha if alpha is not None else float(os.getenv("AI_ROUTING_EWMA_ALPHA", "0.2"))
+        self.window = window
+        self.failure_threshold = failure_threshold or int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.reset_timeout = (
+            reset_timeout if reset_timeout is not None
+            else float(os.getenv("AI_CIRCUIT_RESET_SECONDS", "30"))
+        )
+        self.min_samples = min_samples
+        self.hedge_min_delay = (
+            hedge_min_delay if hedge_min_delay is not None
+            else float(os.getenv("AI_HEDGE_MIN_DELAY_SECONDS", "1"))
+        )
+        self.default_hedge_delay = (
+            default_hedge_delay if default_hedge_delay is not None
+            else float(os.getenv("AI_HEDGE_DEFAULT_DELAY_SECONDS", "15"))
+        )
+        self.error_penalty = error_penalty
+        self._clock = clock
+        self._stats: Dict[str, ProviderStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(provider: str, model: Optional[str] = None) -> str:
+        return f"{provider}:{model or 'default'}"
+
+    def stats(self, key: str) -> ProviderStats:
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = ProviderStats(recent_latencies=deque(maxlen=self.window))
+            return stats
+
+    def record_success(self, key: str, latency: float) -> None:
+        """Record a successful call and close the circuit."""
+        stats = self.stats(key)
+        with self._lock:
+            self._observe_latency(stats, latency)
+            stats.error_ewma *= 1 - self.alpha
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            stats.circuit_state = CircuitState.CLOSED
+            stats.opened_at = None
+            stats.probe_in_flight = False
+
+    def record_failure(self, key: str, error: Optional[BaseException] = None) -> None:
+        """Record a failed call; opens the circuit past the threshold or on a failed probe."""
+        stats = self.stats(key)
+        with self._lock:
+            stats.error_ewma = stats.error_ewma * (1 - self.alpha) + self.alpha
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.probe_in_flight = False
+            stats.last_error = str(error) if error is not None else None
+            if (
+                stats.circuit_state == CircuitState.HALF_OPEN
+                or stats.consecutive_failures >= self.failure_threshold
+            ):
+                stats.circuit_state = CircuitState.OPEN
+                stats.opened_at = self._clock()
+
+    def record_abandoned(self, key: str, elapsed: float) -> None:
+        """
+        Record a call cancelled after losing a hedge race.
+
+        The elapsed time is a lower bound on its latency, so it is fed into
+        the latency EWMA; otherwise a provider that always loses would never
+        look slow. It does not count as a failure.
+        """
+        stats = self.stats(key)
+        with self._lock:
+            self._observe_latency(stats, elapsed)
+            stats.probe_in_flight = False
+
+    def _observe_latency(self, stats: ProviderStats, latency: float) -> None:
+        stats.recent_latencies.append(latency)
+        if stats.latency_ewma is None:
+            stats.latency_ewma = latency
+        else:
+            stats.latency_ewma += self.alpha * (latency - stats.latency_ewma)
+
+    def allow(self, key: str) -> bool:
+        """
+        Whether a request may be sent (claims the half-open probe slot).
+
+        Args:
+            key: Provider/model key
+
+        Returns:
+            False while the circuit is open or a probe is already in flight
+        """
+        stats = self.stats(key)
+        with self._lock:
+            if stats.circuit_state == CircuitState.CLOSED:
+                return True
+            if stats.circuit_state == CircuitState.OPEN:
+                if self._clock() - (stats.opened_at or 0) < self.reset_timeout:
+                    return False
+                stats.circuit_state = CircuitState.HALF_OPEN
+            if stats.probe_in_flight:
+                return False
+            stats.probe_in_flight = True
+            return True
+
+    def is_open(self, key: str) -> bool:
+        stats = self.stats(key)
+        return (
+            stats.circuit_state == CircuitState.OPEN
+            and self._clock() - (stats.opened_at or 0) < self.reset_timeout
+        )
+
+    def score(self, key: str) -> Optional[float]:
+        """Expected latency penalized by error rate; None without samples."""
+        stats = self.stats(key)
+        if stats.latency_ewma is None:
+            return None
+        return stats.latency_ewma * (1 + self.error_penalty * stats.error_ewma)
+
+    def rank(self, keys: List[str]) -> List[str]:
+        """
+        Order keys fastest-first.
+
+        Keys without latency samples keep their position (configured
+        priority); measured keys are re-sorted among the remaining slots.
+        """
+        scores = {key: self.score(key) for key in keys}
+        measured = iter(sorted((k for k in keys if scores[k] is not None), key=lambda k: scores[k]))
+        return [next(measured) if scores[key] is not None else key for key in keys]
+
+    def hedge_delay(self, key: str) -> float:
+        """Seconds to wait on ``key`` before hedging: its p95 once known."""
+        stats = self.stats(key)
+        if len(stats.recent_latencies) < self.min_samples:
+            return self.default_hedge_delay
+        return max(self.hedge_min_delay, stats.percentile(95) or 0.0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Routing state per provider/model for status endpoints."""
+        with self._lock:
+            keys = list(self._stats)
+        result = {}
+        for key in keys:
+            stats = self.stats(key)
+            p95 = stats.percentile(95)
+            result[key] = {
+                "latency_ewma_ms": round(stats.latency_ewma * 1000, 1) if stats.latency_ewma is not None else None,
+                "latency_p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+                "error_rate": round(stats.error_ewma, 4),
+                "successes": stats.successes,
+                "failures": stats.failures,
+                "circuit_state": (
+                    CircuitState.HALF_OPEN
+                    if stats.circuit_state == CircuitState.OPEN and not self.is_open(key)
+                    else stats.circuit_state
+                ),
+                "last_error": stats.last_error,
+            }
+        return result
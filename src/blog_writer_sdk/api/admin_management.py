@@ -18,7 +18,6 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-import asyncio
 import json
 
 # Google Cloud imports
@@ -34,11 +33,16 @@ except ImportError:
 
 from ..services.auth_service import get_auth_service, AuthService
 from ..services.usage_logger import get_usage_logger, UsageLogger
+from ..monitoring.log_tail import LogFilter, get_log_tailer
+from .pagination import keyset_slice, ndjson_response
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/admin", tags=["Admin Management"])
 
+# Seconds of silence before an SSE log stream sends a keep-alive comment
+LOG_STREAM_KEEPALIVE_SECONDS = 15.0
+
 
 # ============================================================================
 # Helper Functions
@@ -967,60 +971,40 @@ async def get_logs(
 @router.get("/logs/stream")
 async def stream_logs(
     severity: Optional[str] = None,
+    request_id: Optional[str] = None,
+    org_id: Optional[str] = None,
+    replay: int = Query(default=50, ge=0, le=1000),
     admin: Dict = Depends(require_admin)
 ):
     """
     Stream logs in real-time using Server-Sent Events (SSE).
     
-    Connect to this endpoint to receive live log updates.
+    Connect to this endpoint to receive live log updates. All viewers share
+    one background Cloud Logging tail; filters are applied server-side.
+    
+    Args:
+        severity: Minimum severity level
+        request_id: Only records for this request ID
+        org_id: Only records for this organization
+        replay: Number of recent matching records to send first
     """
     if not GOOGLE_CLOUD_AVAILABLE:
         raise HTTPException(status_code=503, detail="Cloud Logging not available")
     
+    tailer = get_log_tailer()
+    log_filter = LogFilter(min_severity=severity, request_id=request_id, org_id=org_id)
+    
     async def generate():
-        client = cloud_logging.Client()
-        project_id = get_project_id()
-        service_name = os.getenv("K_SERVICE", "blog-writer-api")
-        
-        last_timestamp = datetime.utcnow()
-        
-        while True:
-            try:
-                # Query for new logs since last check
-                time_filter = f'timestamp > "{last_timestamp.isoformat()}Z"'
-                filters = [
-                    time_filter,
-                    f'resource.type="cloud_run_revision"',
-                    f'resource.labels.service_name="{service_name}"'
-                ]
-                
-                if severity:
-                    filters.append(f'severity >= "{severity.upper()}"')
-                
-                full_filter = " AND ".join(filters)
-                
-                for entry in client.list_entries(
-                    filter_=full_filter,
-                    order_by=cloud_logging.ASCENDING,
-                    max_results=50
-                ):
-                    if entry.timestamp:
-                        last_timestamp = max(last_timestamp, entry.timestamp)
-                    
-                    log_data = {
-                        "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
-                        "severity": entry.severity if hasattr(entry, 'severity') else "DEFAULT",
-                        "message": entry.payload if isinstance(entry.payload, str) else str(entry.payload)
-                    }
-                    
-                    yield f"data: {json.dumps(log_data)}\n\n"
-                
-                # Wait before next poll
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                yield f"data: {json.dumps({'error': str(e)})}\n\n"
-                await asyncio.sleep(5)
+        records = tailer.subscribe(log_filter, replay=replay, heartbeat=LOG_STREAM_KEEPALIVE_SECONDS)
+        try:
+            async for record in records:
+                if record is None:
+                    # Comment line keeps proxies from closing an idle stream
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {json.dumps(record, default=str)}\n\n"
+        finally:
+            await records.aclose()
     
     return StreamingResponse(
         generate(),
@@ -1360,15 +1344,34 @@ async def get_ai_cache_stats(
 # Job Management Endpoints
 # ============================================================================
 
+def _job_summary(job) -> Dict[str, Any]:
+    """Summary row for a blog generation job (no request payload or result)."""
+    return {
+        "job_id": job.job_id,
+        "status": job.status.value,
+        "topic": job.request.get("topic") if job.request else None,
+        "progress_percentage": job.progress_percentage,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+        "error": job.error_message
+    }
+
+
 @router.get("/jobs")
 async def list_jobs(
     status: Optional[str] = None,
     limit: int = Query(default=50, le=200),
     offset: int = 0,
+    cursor: Optional[str] = Query(default=None, description="Cursor from next_cursor of the previous page"),
+    format: str = Query(default="json", pattern="^(json|ndjson)$"),
     admin: Dict = Depends(require_admin)
 ):
     """
     List all blog generation jobs with pagination.
+    
+    Jobs are ordered by (created_at, job_id) descending. Pass the returned
+    next_cursor to fetch the following page; format=ndjson streams every
+    matching job summary.
     """
     # Import the jobs dict from main.py
     # This is a simplified version - in production you'd use a database
@@ -1381,30 +1384,29 @@ async def list_jobs(
         if status:
             jobs = [j for j in jobs if j.status.value == status]
         
-        # Sort by created_at descending
-        jobs.sort(key=lambda x: x.created_at, reverse=True)
+        job_key = lambda j: (j.created_at, j.job_id)
+        
+        if format == "ndjson":
+            ordered, _ = keyset_slice(jobs, job_key, limit=None, cursor=cursor)
+            return ndjson_response((_job_summary(j) for j in ordered), filename="jobs.ndjson")
         
-        # Paginate
         total = len(jobs)
-        jobs = jobs[offset:offset + limit]
+        if cursor:
+            page, next_cursor = keyset_slice(jobs, job_key, limit=limit, cursor=cursor)
+        else:
+            page, next_cursor = keyset_slice(jobs, job_key, limit=offset + limit)
+            page = page[offset:]
         
         return {
-            "jobs": [
-                {
-                    "job_id": j.job_id,
-                    "status": j.status.value,
-                    "topic": j.request.topic if j.request else None,
-                    "created_at": j.created_at.isoformat() if j.created_at else None,
-                    "completed_at": j.completed_at.isoformat() if j.completed_at else None,
-                    "error": j.error
-                }
-                for j in jobs
-            ],
+            "jobs": [_job_summary(j) for j in page],
             "total": total,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1420,6 +1422,7 @@ async def get_job(
     """
     try:
         from main import blog_generation_jobs
+        from ..services.job_result_store import get_job_result_store
         
         job = blog_generation_jobs.get(job_id)
         if not job:
@@ -1429,7 +1432,7 @@ async def get_job(
             "job_id": job.job_id,
             "status": job.status.value,
             "request": job.request.dict() if job.request else None,
-            "result": job.result.dict() if job.result else None,
+            "result": get_job_result_store().load(job_id) if job.result_available else None,
             "error": job.error,
             "created_at": job.created_at.isoformat() if job.created_at else None,
             "started_at": job.started_at.isoformat() if job.started_at else None,
@@ -1504,6 +1507,7 @@ async def retry_job(
     try:
         from main import blog_generation_jobs
         from ..models.job_models import JobStatus
+        from ..services.job_result_store import get_job_result_store
         
         job = blog_generation_jobs.get(job_id)
         if not job:
@@ -1518,7 +1522,8 @@ async def retry_job(
         # Reset job status
         job.status = JobStatus.PENDING
         job.error = None
-        job.result = None
+        job.result_available = False
+        get_job_result_store().discard(job_id)
         job.started_at = None
         job.completed_at = None
         
@@ -15,7 +15,8 @@ from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import JSONResponse
 
 from ..ai.base_provider import AIProviderType
-from ..integrations.dataforseo_integration import DataForSEOClient, EnhancedKeywordAnalyzer
+from ..integrations.dataforseo_integration import EnhancedKeywordAnalyzer
+from ..integrations.dataforseo_clients import get_dataforseo_client
 
 logger = logging.getLogger(__name__)
 
@@ -249,14 +250,16 @@ async def test_dataforseo_connection(config: DataForSEOConfig) -> Dict[str, Any]
             }
         
         # Test with a simple keyword analysis
-        client = DataForSEOClient(
+        client = get_dataforseo_client(
+            api_key=config.api_key,
+            api_secret=config.api_secret,
             location=config.location,
             language_code=config.language_code
         )
         
         # Test with a simple keyword
         test_keywords = ["test keyword"]
-        result = await client.get_search_volume_data(test_keywords)
+        result = await client.get_search_volume_data(test_keywords, config.location, config.language_code, "default")
         
         if result:
             return {
@@ -413,7 +416,7 @@ async def get_keyword_suggestions(
             )
         
         # Initialize DataForSEO client
-        client = DataForSEOClient(location=location, language_code=language)
+        client = get_dataforseo_client(location=location, language_code=language)
         
         # Get keyword suggestions (this would use real DataForSEO API)
         # For now, we'll return structured suggestions
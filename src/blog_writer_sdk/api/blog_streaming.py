@@ -5,11 +5,12 @@ Provides Server-Sent Events (SSE) streaming for blog generation
 to show real-time progress of generation stages.
 """
 
-import json
 import time
 from typing import Dict, Any, Optional
 from enum import Enum
 
+from .fast_json import sse_event
+
 
 class BlogGenerationStage(str, Enum):
     """Stages of blog generation process."""
@@ -98,5 +99,5 @@ async def stream_blog_stage_update(
         SSE-formatted string
     """
     update = create_blog_stage_update(stage, progress, data, message, job_id, status)
-    return f"data: {json.dumps(update)}\n\n"
+    return sse_event(update)
 
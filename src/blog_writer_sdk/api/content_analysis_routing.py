@@ -26,22 +26,31 @@ def get_supabase_optional() -> SupabaseClient | None:
         return None
 
 
+_evidence_store: EvidenceStore | None = None
+
+
 def get_content_analysis_service() -> ContentAnalysisService:
-    supabase = get_supabase_optional()
-    evidence_store = EvidenceStore(supabase=supabase)
-    return ContentAnalysisService(evidence_store=evidence_store)
+    # Share one store so cached analyses/evidence are reusable across requests
+    global _evidence_store
+    if _evidence_store is None:
+        _evidence_store = EvidenceStore(supabase=get_supabase_optional())
+    return ContentAnalysisService(evidence_store=_evidence_store)
 
 
 @router.post("/analyze")
 async def analyze_content(
     request: ContentAnalysisRequest,
+    force_refresh: bool = False,
     service: ContentAnalysisService = Depends(get_content_analysis_service),
 ):
     """
     Run category-based enrichment and persist evidence for reuse.
+
+    Unchanged content with a fresh stored analysis is served from that
+    analysis, refetching only expired sources; set force_refresh to bypass.
     """
     try:
-        result = await service.analyze(request)
+        result = await service.analyze(request, force_refresh=force_refresh)
         return result
     except Exception as e:
         logger.error(f"Analyze failed: {e}", exc_info=True)
@@ -6,6 +6,8 @@ Checks for artifacts, structure, SEO, links, and readability.
 """
 
 import re
+import time
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
@@ -13,6 +15,7 @@ from pydantic import BaseModel, Field
 
 from ..utils.content_sanitizer import detect_artifacts, strip_markdown_for_analysis
 from ..seo.readability_analyzer import ReadabilityAnalyzer
+from ..seo.batch_scorer import BatchContentScorer
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +73,30 @@ class ContentValidationResponse(BaseModel):
     summary: ValidationSummary = Field(..., description="Summary of issues by severity")
 
 
+class BatchScoringDocument(BaseModel):
+    """A single document in a batch scoring request."""
+    id: Optional[str] = Field(None, description="Caller-supplied identifier echoed in the result")
+    content: str = Field(..., description="HTML or markdown content to score")
+    title: Optional[str] = Field(None, description="Blog title")
+    excerpt: Optional[str] = Field(None, description="Meta description/excerpt")
+    keywords: List[str] = Field(default_factory=list, description="Target keywords (first is primary)")
+
+
+class BatchScoringRequest(BaseModel):
+    """Request for batch readability/SEO scoring."""
+    documents: List[BatchScoringDocument] = Field(
+        ..., min_length=1, max_length=1000, description="Documents to score (max 1000)"
+    )
+
+
+class BatchScoringResponse(BaseModel):
+    """Response from batch readability/SEO scoring."""
+    results: List[Dict[str, Any]] = Field(..., description="Per-document scores, in request order")
+    total: int = Field(..., description="Number of documents scored")
+    average_overall_score: float = Field(..., description="Mean overall score across the batch")
+    processing_time_ms: float = Field(..., description="Server-side scoring time")
+
+
 # ============================================================================
 # Validation Endpoint
 # ============================================================================
@@ -143,6 +170,36 @@ async def validate_content(request: ContentValidationRequest):
         raise HTTPException(status_code=500, detail=f"Validation failed: {str(e)}")
 
 
+@router.post("/score-batch", response_model=BatchScoringResponse)
+async def score_content_batch(request: BatchScoringRequest):
+    """
+    Score readability and on-page SEO for many documents in one call.
+    
+    Intended for re-scoring whole archives (e.g. before a migration) without
+    issuing one request per document. Each document is parsed once and the
+    per-document aggregates are computed in a single vectorized pass.
+    """
+    try:
+        start = time.perf_counter()
+        documents = [doc.model_dump() for doc in request.documents]
+        scorer = BatchContentScorer()
+        # Scoring is CPU-bound; keep the event loop free for other requests
+        results = await asyncio.to_thread(scorer.score_documents, documents)
+        
+        average = sum(r["overall_score"] for r in results) / len(results) if results else 0.0
+        
+        return BatchScoringResponse(
+            results=results,
+            total=len(results),
+            average_overall_score=round(average, 1),
+            processing_time_ms=round((time.perf_counter() - start) * 1000, 2)
+        )
+        
+    except Exception as e:
+        logger.error(f"Batch content scoring failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Batch scoring failed: {str(e)}")
+
+
 # ============================================================================
 # Individual Check Functions
 # ============================================================================
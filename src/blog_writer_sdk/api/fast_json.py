@@ -0,0 +1,298 @@
+"""
+Fast JSON serialization for large API responses and SSE events.
+
+Endpoints returning big nested payloads can opt in by returning
+``fast_json_response(...)`` instead of a dict: the payload is serialized
+once with orjson (stdlib ``json`` fallback), Pydantic models are dumped
+directly instead of going through ``jsonable_encoder``, and the body is
+gzip/brotli-compressed when the client's Accept-Encoding allows it.
+
+Immutable sub-payloads (e.g. a completed job's result) can be wrapped in
+``cached_fragment`` so they are serialized once and spliced into later
+responses as raw bytes.
+"""
+
+import dataclasses
+import gzip
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Hashable, List, Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    brotli = None
+
+
+# Bodies smaller than this are sent uncompressed
+COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("JSON_FRAGMENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if ORJSON_AVAILABLE else 0
+
+# Placeholder prefix for spliced fragments (random per process so payload text can't collide)
+_FRAGMENT_TOKEN = f"__json_fragment_{uuid.uuid4().hex}_"
+
+
+class JSONFragment:
+    """Pre-serialized JSON bytes spliced verbatim into an encoded document."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types orjson/json don't handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON bytes.
+
+    Args:
+        content: Dicts/lists, Pydantic models, dataclasses or JSONFragments
+
+    Returns:
+        Encoded JSON
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode("utf-8")
+    if isinstance(content, JSONFragment):
+        return content.data
+
+    fragments: List[JSONFragment] = []
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, JSONFragment):
+            fragments.append(obj)
+            return f"{_FRAGMENT_TOKEN}{len(fragments) - 1}"
+        return _default(obj)
+
+    encoded = None
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(content, default=default, option=_ORJSON_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError):
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            fragments.clear()
+    if encoded is None:
+        encoded = json.dumps(
+            content, default=default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    for index, fragment in enumerate(fragments):
+        encoded = encoded.replace(f'"{_FRAGMENT_TOKEN}{index}"'.encode(), fragment.data, 1)
+    return encoded
+
+
+class _FragmentCache:
+    """LRU of serialized fragments bounded by total bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, JSONFragment]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[JSONFragment]:
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is not None:
+                self._entries.move_to_end(key)
+            return fragment
+
+    def put(self, key: Hashable, fragment: JSONFragment) -> None:
+        if len(fragment) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = fragment
+            self._size += len(fragment)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            fragment = self._entries.pop(key, None)
+            if fragment is not None:
+                self._size -= len(fragment)
+
+
+_fragment_cache = _FragmentCache(FRAGMENT_CACHE_MAX_BYTES)
+
+
+def cached_fragment(key: Hashable, content: Any) -> JSONFragment:
+    """
+    Serialize ``content`` once per key and reuse the bytes afterwards.
+
+    Only use for content that no longer changes under ``key`` (e.g. a
+    completed job's result).
+
+    Args:
+        key: Cache key identifying the immutable content
+        content: Value to serialize on a miss
+
+    Returns:
+        Fragment to embed in a response payload
+    """
+    fragment = _fragment_cache.get(key)
+    if fragment is None:
+        fragment = JSONFragment(dumps(content))
+        _fragment_cache.put(key, fragment)
+    return fragment
+
+
+def invalidate_fragment(key: Hashable) -> None:
+    _fragment_cache.invalidate(key)
+
+
+def negotiate_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """
+    Pick a response encoding from an Accept-Encoding header.
+
+    Prefers brotli (when installed) over gzip; ties on q-value keep that
+    preference. Returns None for small bodies or when nothing is acceptable.
+    """
+    if not accept_encoding or size < COMPRESSION_MIN_BYTES:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    supported = (["br"] if BROTLI_AVAILABLE else []) + ["gzip"]
+    wildcard = weights.get("*", 0.0)
+    ranked = sorted(
+        ((weights.get(name, wildcard), -position, name) for position, name in enumerate(supported)),
+        reverse=True,
+    )
+    quality, _, name = ranked[0]
+    return name if quality > 0 else None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with ``dumps`` and optionally compressed.
+
+    Content is serialized as-is; return it directly from an endpoint so
+    FastAPI's ``jsonable_encoder`` pass is skipped.
+    """
+
+    def __init__(
+        self,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+        accept_encoding: Optional[str] = None
+    ):
+        super().__init__(content, status_code, headers, media_type, background)
+        encoding = negotiate_encoding(accept_encoding, len(self.body))
+        if encoding:
+            self.body = compress(self.body, encoding)
+            self.headers["content-encoding"] = encoding
+            self.headers["content-length"] = str(len(self.body))
+        if accept_encoding is not None:
+            self.headers["vary"] = "Accept-Encoding"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_response(
+    content: Any,
+    request: Optional[Request] = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None
+) -> FastJSONResponse:
+    """
+    Build a FastJSONResponse, compressing per the request's Accept-Encoding.
+
+    Args:
+        content: Payload (dict, list, Pydantic model, may contain JSONFragments)
+        request: Incoming request, used for encoding negotiation
+        status_code: HTTP status code
+        headers: Extra response headers
+
+    Returns:
+        Response ready to return from an endpoint
+    """
+    accept_encoding = request.headers.get("accept-encoding", "") if request is not None else None
+    return FastJSONResponse(content, status_code=status_code, headers=headers, accept_encoding=accept_encoding)
+
+
+def sse_event(payload: Any, event: Optional[str] = None) -> str:
+    """
+    Format a payload as a Server-Sent Events message.
+
+    Args:
+        payload: JSON-serializable payload
+        event: Optional SSE event name
+
+    Returns:
+        SSE-formatted string
+    """
+    data = dumps(payload).decode("utf-8")
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {data}\n\n"
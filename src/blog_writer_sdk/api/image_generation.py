@@ -13,7 +13,7 @@ import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response
 from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
 
@@ -28,7 +28,8 @@ from ..models.image_models import (
     ImageEditRequest,
     ImageProviderConfig,
     ImageProviderStatus,
-    ImageGenerationJob
+    ImageGenerationJob,
+    ImageGenerationJobSummary
 )
 from ..models.image_job_models import (
     ImageJobStatus,
@@ -39,6 +40,7 @@ from ..models.image_job_models import (
     BatchImageGenerationResponse
 )
 from ..services.cloud_tasks_service import get_cloud_tasks_service
+from .pagination import keyset_slice, ndjson_response
 from .image_streaming import (
     ImageGenerationStage,
     create_image_stage_update,
@@ -339,30 +341,52 @@ async def get_image_generation_job(job_id: str):
         )
 
 
-@router.get("/jobs", response_model=List[ImageGenerationJob])
+@router.get("/jobs", response_model=List[ImageGenerationJobSummary])
 async def list_image_generation_jobs(
+    response: Response,
     status: Optional[str] = None,
-    limit: int = 50,
-    offset: int = 0
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    format: str = Query("json", pattern="^(json|ndjson)$")
 ):
     """
     List image generation jobs with optional filtering.
     
-    This endpoint provides a list of image generation jobs with
-    optional filtering by status and pagination support.
+    This endpoint provides job summaries (newest first) with optional
+    filtering by status and cursor pagination; the cursor for the next
+    page is returned in the X-Next-Cursor header. Full results are
+    available from GET /jobs/{job_id}.
     """
     try:
-        jobs = list(image_jobs.values())
+        jobs = image_jobs.values()
         
         # Filter by status if provided
         if status:
             jobs = [job for job in jobs if job.status == status]
         
+        job_key = lambda job: (job.created_at, job.job_id)
+        
+        if format == "ndjson":
+            ordered, _ = keyset_slice(jobs, job_key, limit=None, cursor=cursor)
+            return ndjson_response(
+                (ImageGenerationJobSummary.from_job(job).model_dump(mode="json") for job in ordered),
+                filename="image-jobs.ndjson"
+            )
+        
         # Apply pagination
-        jobs = jobs[offset:offset + limit]
+        if cursor:
+            page, next_cursor = keyset_slice(jobs, job_key, limit=limit, cursor=cursor)
+        else:
+            page, next_cursor = keyset_slice(jobs, job_key, limit=offset + limit)
+            page = page[offset:]
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
         
-        return jobs
+        return [ImageGenerationJobSummary.from_job(job) for job in page]
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list image generation jobs: {e}")
         raise HTTPException(
@@ -635,7 +659,7 @@ async def generate_image_async(
             worker_url = f"{service_base_url}/api/v1/images/worker"
         
         # Create Cloud Task
-        task_name = cloud_tasks_service.create_image_generation_task(
+        task_name = await cloud_tasks_service.create_image_generation_task_async(
             request_data={
                 "job_id": job_id,
                 "request": request.dict(),
@@ -756,7 +780,7 @@ async def generate_image_stream(
                     worker_url = f"{service_base_url}/api/v1/images/worker"
                 
                 # Create Cloud Task
-                task_name = cloud_tasks_service.create_image_generation_task(
+                task_name = await cloud_tasks_service.create_image_generation_task_async(
                     request_data={
                         "job_id": job_id,
                         "request": request.dict(),
@@ -1028,6 +1052,7 @@ async def batch_generate_images(request: BatchImageGenerationRequest):
         job_ids = []
         
         # Create jobs for each image
+        jobs = []
         for image_request in request.images:
             is_draft = request.workflow == "draft_then_final" and image_request.quality.value == "draft"
             
@@ -1043,32 +1068,46 @@ async def batch_generate_images(request: BatchImageGenerationRequest):
             
             image_generation_jobs[job_id] = job
             job_ids.append(job_id)
-            
-            # Get Cloud Tasks service
-            cloud_tasks_service = get_cloud_tasks_service()
-            
-            # Get worker URL
-            worker_url = os.getenv("CLOUD_RUN_WORKER_URL")
-            if not worker_url:
-                service_base_url = os.getenv("CLOUD_RUN_SERVICE_URL", "https://blog-writer-api-dev-kq42l26tuq-od.a.run.app")
-                worker_url = f"{service_base_url}/api/v1/images/worker"
-            
-            # Create Cloud Task
-            task_name = cloud_tasks_service.create_image_generation_task(
-                request_data={
-                    "job_id": job_id,
-                    "request": image_request.dict(),
-                    "usage": get_usage_attribution(),
-                },
-                worker_url=worker_url,
-                queue_name=os.getenv("CLOUD_TASKS_IMAGE_QUEUE_NAME", "image-generation-queue")
-            )
-            
-            # Update job
+            jobs.append(job)
+        
+        # Get Cloud Tasks service
+        cloud_tasks_service = get_cloud_tasks_service()
+        
+        # Get worker URL
+        worker_url = os.getenv("CLOUD_RUN_WORKER_URL")
+        if not worker_url:
+            service_base_url = os.getenv("CLOUD_RUN_SERVICE_URL", "https://blog-writer-api-dev-kq42l26tuq-od.a.run.app")
+            worker_url = f"{service_base_url}/api/v1/images/worker"
+        
+        # Enqueue all Cloud Tasks concurrently
+        usage = get_usage_attribution()
+        task_names = await cloud_tasks_service.enqueue_batch(
+            [
+                {"job_id": job.job_id, "request": job.request, "usage": usage}
+                for job in jobs
+            ],
+            worker_url=worker_url,
+            queue_name=os.getenv("CLOUD_TASKS_IMAGE_QUEUE_NAME", "image-generation-queue")
+        )
+        
+        # Update jobs
+        failed = 0
+        for job, task_name in zip(jobs, task_names):
+            if isinstance(task_name, Exception):
+                failed += 1
+                job.status = ImageJobStatus.FAILED
+                job.error_message = f"Failed to queue job: {task_name}"
+                job.completed_at = datetime.utcnow()
+                continue
             job.task_name = task_name
             job.status = ImageJobStatus.QUEUED
             job.queued_at = datetime.utcnow()
         
+        if jobs and failed == len(jobs):
+            raise RuntimeError(f"All {failed} image tasks failed to enqueue: {task_names[0]}")
+        if failed:
+            logger.warning(f"Batch {batch_id}: {failed}/{len(jobs)} image tasks failed to enqueue")
+        
         logger.info(f"Created batch image generation: {batch_id} with {len(job_ids)} jobs")
         
         # Estimate completion time
@@ -14,6 +14,7 @@ from ..models.integration_models import (
     InterlinkOpportunity,
 )
 from ..seo.interlinking_analyzer import InterlinkingAnalyzer
+from ..seo.interlinking_index import get_interlink_index_registry
 from ..integrations.supabase_client import SupabaseClient
 from .. import BlogWriter
 
@@ -40,6 +41,20 @@ def get_writer_dependency() -> BlogWriter:
         return _BW(enable_seo_optimization=True, enable_quality_analysis=True)
 
 
+def interlink_site_key(tenant_id: Optional[str], provider: Any, connection: Dict[str, Any]) -> str:
+    """Key identifying a tenant's site for the cached interlinking index."""
+    provider_name = getattr(provider, "value", provider)
+    site = connection.get("site_id") or connection.get("site_url") or connection.get("collection_id") or ""
+    return f"{tenant_id or 'anonymous'}:{provider_name}:{site}"
+
+
+def sync_interlink_index(analyzer: InterlinkingAnalyzer, site_key: str, existing_content: List[Dict[str, Any]]):
+    """Sync the site's cached index with the submitted inventory and return it."""
+    index, counts = get_interlink_index_registry().sync(site_key, analyzer.normalize_content(existing_content))
+    logger.info(f"Interlink index for {site_key}: {len(index)} items, changes {counts}")
+    return index
+
+
 def validate_structure(structure: Optional[Dict[str, Any]]) -> Tuple[bool, str]:
     """Validate structure and return (is_valid, error_message)."""
     if not structure:
@@ -122,11 +137,17 @@ async def connect_and_recommend(
         try:
             logger.info(f"Using interlinking analyzer with {len(existing_content)} existing content items")
             interlinking_analyzer = InterlinkingAnalyzer()
+            index = sync_interlink_index(
+                interlinking_analyzer,
+                interlink_site_key(request.tenant_id, request.provider, request.connection),
+                existing_content
+            )
             
             # Analyze interlinking opportunities
             analysis_result = interlinking_analyzer.analyze_interlinking_opportunities(
                 keywords=request.keywords,
-                existing_content=existing_content
+                existing_content=existing_content,
+                index=index
             )
             
             # Convert to response format
@@ -318,11 +339,17 @@ async def connect_and_recommend_v2(
     try:
         logger.info(f"Analyzing interlinking opportunities for {len(request.keywords)} keywords against {len(existing_content)} content items")
         interlinking_analyzer = InterlinkingAnalyzer()
+        index = sync_interlink_index(
+            interlinking_analyzer,
+            interlink_site_key(request.tenant_id, request.provider, request.connection),
+            existing_content
+        )
         
         # Analyze interlinking opportunities
         analysis_result = interlinking_analyzer.analyze_interlinking_opportunities(
             keywords=request.keywords,
-            existing_content=existing_content
+            existing_content=existing_content,
+            index=index
         )
         
         # Convert to response format with full interlink opportunities
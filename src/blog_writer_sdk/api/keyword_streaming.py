@@ -5,11 +5,12 @@ Provides Server-Sent Events (SSE) streaming for keyword analysis
 to show real-time progress of search stages.
 """
 
-import json
 import time
 from typing import Dict, Any, Optional, Callable, AsyncGenerator
 from enum import Enum
 
+from .fast_json import sse_event
+
 class KeywordSearchStage(str, Enum):
     """Stages of keyword search process."""
     INITIALIZING = "initializing"
@@ -75,7 +76,7 @@ async def stream_stage_update(stage: KeywordSearchStage, progress: float, data:
         SSE-formatted string
     """
     update = create_stage_update(stage, progress, data, message)
-    return f"data: {json.dumps(update)}\n\n"
+    return sse_event(update)
 
 async def stream_keyword_search_stages(
     search_func: Callable,
@@ -0,0 +1,147 @@
+"""
+Keyset pagination and NDJSON streaming helpers for list endpoints.
+
+List endpoints order rows by ``(created_at, id)`` descending and hand out an
+opaque cursor encoding the last row's key. The next page continues strictly
+after that key, so pages stay stable while new rows are inserted and the
+database never has to skip over an offset.
+"""
+
+import base64
+import heapq
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched per round trip when streaming an export
+EXPORT_PAGE_SIZE = 500
+
+CursorKey = Tuple[str, str]
+
+
+def _to_iso(value: Union[datetime, str, None]) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value or ""
+
+
+def encode_cursor(created_at: Union[datetime, str, None], row_id: Any) -> str:
+    """Encode the ``(created_at, id)`` key of the last returned row."""
+    raw = json.dumps([_to_iso(created_at), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return str(created_at), str(row_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def apply_keyset(query: Any, cursor: Optional[str], created_column: str = "created_at", id_column: str = "id") -> Any:
+    """
+    Order a Supabase query by ``(created_at, id)`` descending, starting after a cursor.
+
+    Args:
+        query: Supabase/PostgREST query builder
+        cursor: Cursor from the previous page, if any
+
+    Returns:
+        Query with ordering and keyset filter applied
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.or_(
+            f'{created_column}.lt."{created_at}",'
+            f'and({created_column}.eq."{created_at}",{id_column}.lt."{row_id}")'
+        )
+    return query.order(created_column, desc=True).order(id_column, desc=True)
+
+
+def next_cursor(rows: List[Dict[str, Any]], limit: int) -> Optional[str]:
+    """Cursor for the page after ``rows``, or None if this was the last page."""
+    if len(rows) < limit or not rows:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.get("created_at"), last.get("id"))
+
+
+def _sort_key(created_at: Union[datetime, str, None], row_id: Any) -> Tuple[float, str]:
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at) if created_at else None
+    return (created_at.timestamp() if created_at else float("-inf"), str(row_id))
+
+
+def keyset_slice(
+    items: Iterable[Any],
+    key: Callable[[Any], Tuple[Union[datetime, str, None], Any]],
+    limit: Optional[int],
+    cursor: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Page an in-memory collection by ``(created_at, id)`` descending.
+
+    Only the requested page is sorted (a bounded heap), not the whole collection.
+
+    Args:
+        items: Objects to page
+        key: Returns ``(created_at, id)`` for an item
+        limit: Page size (None returns everything after the cursor)
+        cursor: Cursor from the previous page, if any
+
+    Returns:
+        Tuple of (page items, next cursor or None)
+    """
+    keyed = ((_sort_key(*key(item)), item) for item in items)
+    if cursor:
+        after = _sort_key(*decode_cursor(cursor))
+        keyed = (pair for pair in keyed if pair[0] < after)
+
+    if limit is None:
+        page = [item for _, item in sorted(keyed, key=lambda pair: pair[0], reverse=True)]
+        return page, None
+
+    top = heapq.nlargest(limit + 1, keyed, key=lambda pair: pair[0])
+    page = [item for _, item in top[:limit]]
+    cursor_out = encode_cursor(*key(page[-1])) if len(top) > limit else None
+    return page, cursor_out
+
+
+def _dumps(row: Any) -> str:
+    return json.dumps(row, default=str, separators=(",", ":")) + "\n"
+
+
+def ndjson_response(rows: Union[Iterable[Any], AsyncIterator[Any]], filename: Optional[str] = None) -> StreamingResponse:
+    """
+    Stream rows as newline-delimited JSON.
+
+    Args:
+        rows: Sync or async iterable of JSON-serializable rows
+        filename: Optional download filename
+
+    Returns:
+        StreamingResponse with one JSON document per line
+    """
+    async def generate():
+        if hasattr(rows, "__aiter__"):
+            async for row in rows:
+                yield _dumps(row)
+        else:
+            for row in rows:
+                yield _dumps(row)
+
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'} if filename else None
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -1,9 +1,10 @@
 """
 API endpoints for multi-CMS publishing management.
 """
+import asyncio
 import logging
 from typing import List, Optional, Dict, Any, Tuple
-from fastapi import APIRouter, HTTPException, Depends, Header, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from datetime import datetime
 
 from ..models.publishing_models import (
@@ -25,11 +26,18 @@ from ..models.publishing_models import (
 from ..services.publishing_service import PublishingService
 from ..integrations.supabase_client import SupabaseClient
 from ..models.blog_models import BlogGenerationResult
+from .pagination import EXPORT_PAGE_SIZE, apply_keyset, ndjson_response, next_cursor
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/publishing", tags=["Publishing"])
 
+# Columns needed to render a post list; the body is only fetched on request
+BLOG_POST_SUMMARY_COLUMNS = (
+    "id,title,excerpt,slug,status,created_at,updated_at,published_at,"
+    "published_url,word_count,total_cost,cost_breakdown"
+)
+
 
 # Dependencies
 def get_supabase_client() -> Optional[SupabaseClient]:
@@ -782,9 +790,13 @@ async def update_draft_publishing_target(
 # Blog Posts List with Role-Based Cost Filtering
 @router.get("/blog-posts", response_model=List[BlogPostWithCosts])
 async def list_blog_posts(
+    response: Response,
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0),
+    offset: int = Query(0, ge=0, description="Offset pagination (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    include_content: bool = Query(False, description="Include full post bodies"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json, or ndjson to stream every matching post"),
     role_ctx: Tuple[Optional[UserRole], Optional[str], Optional[str]] = Depends(get_user_role),
     supabase: Optional[SupabaseClient] = Depends(get_supabase_client),
 ):
@@ -792,6 +804,8 @@ async def list_blog_posts(
     List blog posts with role-based cost visibility.
     
     Costs are only visible to admins, owners, system_admin, and super_admin.
+    Returns summary columns ordered by (created_at, id) descending; the cursor
+    for the next page is returned in the X-Next-Cursor header.
     """
     role, user_id, org_id = role_ctx
     
@@ -812,26 +826,49 @@ async def list_blog_posts(
         
         # Fetch blog posts (filtered by org_id)
         table_name = supabase._get_table_name("blog_posts")
-        query = supabase.client.table(table_name).select("*").eq("org_id", org_id)
-        
-        if status:
-            query = query.eq("status", status)
-        
-        query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-        result = query.execute()
-        
-        # Convert to response models with role-based cost filtering
-        posts = []
-        for post_data in result.data:
-            post = BlogPostWithCosts.from_blog_post(
+        columns = BLOG_POST_SUMMARY_COLUMNS + (",content" if include_content else "")
+        
+        def fetch_page(page_cursor: Optional[str], page_size: int, page_offset: int = 0):
+            query = supabase.client.table(table_name).select(columns).eq("org_id", org_id)
+            if status:
+                query = query.eq("status", status)
+            query = apply_keyset(query, page_cursor)
+            if page_cursor:
+                query = query.limit(page_size)
+            else:
+                query = query.range(page_offset, page_offset + page_size - 1)
+            return query.execute().data or []
+        
+        def to_post(post_data: Dict[str, Any]) -> BlogPostWithCosts:
+            # Convert to response models with role-based cost filtering
+            return BlogPostWithCosts.from_blog_post(
                 post_data,
                 user_role=role,
                 include_costs=can_view_costs
             )
-            posts.append(post)
         
-        return posts
+        if format == "ndjson":
+            async def export_rows():
+                page_cursor = cursor
+                while True:
+                    rows = await asyncio.to_thread(fetch_page, page_cursor, EXPORT_PAGE_SIZE)
+                    for row in rows:
+                        yield to_post(row).model_dump(mode="json", exclude_none=True)
+                    page_cursor = next_cursor(rows, EXPORT_PAGE_SIZE)
+                    if not page_cursor:
+                        break
+            
+            return ndjson_response(export_rows(), filename="blog-posts.ndjson")
+        
+        rows = fetch_page(cursor, limit, offset)
+        page_cursor = next_cursor(rows, limit)
+        if page_cursor:
+            response.headers["X-Next-Cursor"] = page_cursor
+        
+        return [to_post(row) for row in rows]
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list blog posts: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list blog posts: {str(e)}")
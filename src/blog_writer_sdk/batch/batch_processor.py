@@ -80,6 +80,21 @@ class BatchJob:
         else:
             self.progress = 100.0
     
+    def to_summary(self) -> Dict[str, Any]:
+        """Convert to a list-view dictionary without per-item requests and results."""
+        return {
+            'id': self.id,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'completed_at': self.completed_at.isoformat() if self.completed_at else None,
+            'progress': self.progress,
+            'total_items': self.total_items,
+            'completed_items': self.completed_items,
+            'failed_items': self.failed_items,
+            'metadata': self.metadata
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -353,9 +368,11 @@ class BatchProcessor:
         job = self.active_jobs[job_id]
         return job.to_dict()
     
-    def list_batch_jobs(self) -> List[Dict[str, Any]]:
-        """List all batch jobs."""
-        return [job.to_dict() for job in self.active_jobs.values()]
+    def list_batch_jobs(self, include_items: bool = True) -> List[Dict[str, Any]]:
+        """List all batch jobs, optionally as summaries without items."""
+        if include_items:
+            return [job.to_dict() for job in self.active_jobs.values()]
+        return [job.to_summary() for job in self.active_jobs.values()]
     
     def cancel_batch_job(self, job_id: str) -> bool:
         """Cancel a batch job."""
@@ -20,6 +20,7 @@ except ImportError:
     redis = None
 
 from ..models.blog_models import BlogPost, SEOMetrics, ContentQuality
+from ..monitoring.tracing import SpanKind, span
 
 
 logger = logging.getLogger(__name__)
@@ -137,7 +138,9 @@ class CacheManager:
             if self.redis_client:
                 # Try Redis first
                 try:
-                    value = await self.redis_client.get(key)
+                    with span("cache get", SpanKind.CACHE, backend="redis") as lookup:
+                        value = await self.redis_client.get(key)
+                        lookup.set_attribute("hit", bool(value))
                     if value:
                         return self._deserialize_data(value, data_type)
                 except Exception as e:
@@ -171,7 +174,8 @@ class CacheManager:
             if self.redis_client:
                 # Try Redis first
                 try:
-                    await self.redis_client.setex(key, ttl, serialized_value)
+                    with span("cache set", SpanKind.CACHE, backend="redis"):
+                        await self.redis_client.setex(key, ttl, serialized_value)
                     return True
                 except Exception as e:
                     logger.warning(f"Redis set failed: {e}")
@@ -7,8 +7,9 @@ content generation, SEO optimization, and quality analysis.
 
 import asyncio
 import logging
+import os
 import time
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional
 from datetime import datetime
 
 from ..models.blog_models import (
@@ -50,6 +51,7 @@ class BlogWriter:
         enhanced_keyword_analyzer: Optional[EnhancedKeywordAnalyzer] = None,
         ai_content_generator: Optional[AIContentGenerator] = None,
         enable_ai_enhancement: bool = False,
+        max_concurrent_sections: Optional[int] = None,
     ):
         """
         Initialize the BlogWriter.
@@ -62,12 +64,18 @@ class BlogWriter:
             enhanced_keyword_analyzer: Optional enhanced keyword analyzer with external API support
             ai_content_generator: Optional AI content generator for enhanced content creation
             enable_ai_enhancement: Whether to use AI for content enhancement
+            max_concurrent_sections: Generation and keyword-analysis calls in flight
+                at once, shared by every request this writer handles
         """
         self.default_tone = default_tone
         self.default_length = default_length
         self.enable_seo_optimization = enable_seo_optimization
         self.enable_quality_analysis = enable_quality_analysis
         self.enable_ai_enhancement = enable_ai_enhancement
+        self.max_concurrent_sections = max_concurrent_sections or int(
+            os.getenv("BLOG_WRITER_MAX_CONCURRENT_SECTIONS", "4")
+        )
+        self._section_semaphore: Optional[asyncio.Semaphore] = None
         
         # Initialize components
         self.content_generator = ContentGenerator()
@@ -91,27 +99,32 @@ class BlogWriter:
         start_time = time.time()
         
         try:
-            # Step 1: Analyze keywords and competition
-            if request.keywords:
-                keyword_analysis = await self._analyze_keywords(request.keywords)
-                if request.focus_keyword:
-                    focus_analysis = await self.keyword_analyzer.analyze_keyword(
-                        request.focus_keyword
-                    )
-            
-            # Step 2: Generate content structure
-            content_outline = await self._create_content_outline(request)
+            # Steps 1-3: keyword analysis runs alongside outline and content generation
+            async def build_content() -> str:
+                content_outline = await self._create_content_outline(request)
+                return await self._generate_content(request, content_outline)
             
-            # Step 3: Generate main content
-            content = await self._generate_content(request, content_outline)
+            keywords = list(request.keywords or [])
+            if request.focus_keyword and keywords:
+                keywords.append(request.focus_keyword)
+            keyword_analysis, content = await asyncio.gather(
+                self._analyze_keywords(keywords),
+                build_content(),
+            )
             
             # Step 4: Optimize for SEO
             if self.enable_seo_optimization:
                 content = await self._optimize_content_for_seo(content, request)
             
-            # Step 5: Generate title and meta tags
-            title = await self._generate_title(request, content)
-            meta_tags = await self._generate_meta_tags(title, content, request)
+            # Step 5: Title and meta tags, with quality analysis (content only) alongside
+            async def build_title_and_meta():
+                title = await self._generate_title(request, content)
+                return title, await self._generate_meta_tags(title, content, request)
+            
+            (title, meta_tags), content_quality = await asyncio.gather(
+                build_title_and_meta(),
+                self._maybe(self.enable_quality_analysis, self.content_analyzer.analyze_quality, content),
+            )
             
             # Step 6: Create final blog post
             blog_post = await self._create_blog_post(
@@ -120,13 +133,9 @@ class BlogWriter:
                 meta_tags=meta_tags,
                 request=request,
             )
+            blog_post.content_quality = content_quality
             
-            # Step 7: Analyze quality and SEO
-            if self.enable_quality_analysis:
-                blog_post.content_quality = await self.content_analyzer.analyze_quality(
-                    blog_post.content
-                )
-            
+            # Step 7: SEO analysis needs the final title and meta tags
             if self.enable_seo_optimization:
                 blog_post.seo_metrics = await self.seo_optimizer.analyze_seo(
                     content=blog_post.content,
@@ -161,17 +170,50 @@ class BlogWriter:
             )
     
     async def _analyze_keywords(self, keywords: List[str]) -> Dict:
-        """Analyze provided keywords for SEO potential."""
-        analysis_results = {}
+        """
+        Analyze keywords for SEO potential in one batch.
+        
+        Duplicates are analyzed once. Analyzers with a batch API get a single
+        call; otherwise keywords are analyzed concurrently within the section
+        budget. A failing keyword is recorded as ``{"error": ...}``.
+        """
+        unique = list(dict.fromkeys(k for k in keywords if k))
+        if not unique:
+            return {}
         
-        for keyword in keywords:
+        batch = getattr(self.keyword_analyzer, "analyze_keywords_comprehensive", None)
+        if batch is not None:
             try:
-                analysis = await self.keyword_analyzer.analyze_keyword(keyword)
-                analysis_results[keyword] = analysis
+                async with self._sections():
+                    return await batch(unique, "default")
             except Exception as e:
-                analysis_results[keyword] = {"error": str(e)}
+                return {keyword: {"error": str(e)} for keyword in unique}
         
-        return analysis_results
+        async def analyze(keyword: str):
+            try:
+                async with self._sections():
+                    return await self.keyword_analyzer.analyze_keyword(keyword)
+            except Exception as e:
+                return {"error": str(e)}
+        
+        results = await asyncio.gather(*(analyze(keyword) for keyword in unique))
+        return dict(zip(unique, results))
+    
+    def _sections(self) -> asyncio.Semaphore:
+        """Concurrency budget shared by every generation on this writer."""
+        if self._section_semaphore is None:
+            self._section_semaphore = asyncio.Semaphore(self.max_concurrent_sections)
+        return self._section_semaphore
+    
+    async def _bounded(self, call: Awaitable[Any]) -> Any:
+        """Await a generation call within the section budget."""
+        async with self._sections():
+            return await call
+    
+    @staticmethod
+    async def _maybe(enabled: bool, analyze, *args, **kwargs) -> Any:
+        """Run an optional analysis so it can be gathered; None when disabled."""
+        return await analyze(*args, **kwargs) if enabled else None
     
     async def _create_content_outline(self, request: BlogRequest) -> Dict:
         """Create a structured outline for the content."""
@@ -225,46 +267,7 @@ class BlogWriter:
             return await self._generate_ai_enhanced_content(request, outline)
         
         # Fallback to traditional generation
-        content_parts = []
-        
-        # Introduction
-        if outline["include_introduction"]:
-            intro = await self.content_generator.generate_introduction(
-                topic=request.topic,
-                tone=request.tone,
-                keywords=request.keywords[:3],  # Use top 3 keywords
-            )
-            content_parts.append(intro)
-        
-        # Main sections
-        for section in outline["sections"]:
-            section_content = await self.content_generator.generate_section(
-                heading=section["heading"],
-                topic=request.topic,
-                keyword_focus=section.get("keyword_focus"),
-                tone=request.tone,
-                target_words=section["estimated_words"],
-            )
-            content_parts.append(f"## {section['heading']}\n\n{section_content}")
-        
-        # FAQ section
-        if outline["include_faq"]:
-            faq_content = await self.content_generator.generate_faq(
-                topic=request.topic,
-                keywords=request.keywords,
-            )
-            content_parts.append(f"## Frequently Asked Questions\n\n{faq_content}")
-        
-        # Conclusion
-        if outline["include_conclusion"]:
-            conclusion = await self.content_generator.generate_conclusion(
-                topic=request.topic,
-                tone=request.tone,
-                key_points=request.keywords[:3],
-            )
-            content_parts.append(f"## Conclusion\n\n{conclusion}")
-        
-        return "\n\n".join(content_parts)
+        return await self._generate_traditional_content(request, outline)
     
     async def _generate_ai_enhanced_content(self, request: BlogRequest, outline: Dict) -> str:
         """Generate AI-enhanced content using the AI content generator."""
@@ -297,46 +300,52 @@ class BlogWriter:
             return await self._generate_traditional_content(request, outline)
     
     async def _generate_traditional_content(self, request: BlogRequest, outline: Dict) -> str:
-        """Generate content using traditional methods (fallback)."""
-        content_parts = []
+        """
+        Generate content using traditional methods (fallback).
+        
+        The introduction, sections, FAQ and conclusion are independent, so they
+        are generated concurrently within the section budget and assembled in
+        outline order.
+        """
+        keywords = request.keywords or []
+        parts = []  # (heading or None, awaitable)
         
-        # Introduction
         if outline["include_introduction"]:
-            intro = await self.content_generator.generate_introduction(
+            parts.append((None, self.content_generator.generate_introduction(
                 topic=request.topic,
                 tone=request.tone,
-                keywords=request.keywords[:3] if request.keywords else [],
-            )
-            content_parts.append(intro)
+                keywords=keywords[:3],  # Use top 3 keywords
+            )))
         
-        # Main sections
         for section in outline["sections"]:
-            section_content = await self.content_generator.generate_section(
+            parts.append((section["heading"], self.content_generator.generate_section(
                 heading=section["heading"],
                 topic=request.topic,
                 keyword_focus=section.get("keyword_focus"),
                 tone=request.tone,
                 target_words=section["estimated_words"],
-            )
-            content_parts.append(f"## {section['heading']}\n\n{section_content}")
+            )))
         
-        # FAQ section
         if outline["include_faq"]:
-            faq_content = await self.content_generator.generate_faq(
+            parts.append(("Frequently Asked Questions", self.content_generator.generate_faq(
                 topic=request.topic,
-                keywords=request.keywords or [],
-            )
-            content_parts.append(f"## Frequently Asked Questions\n\n{faq_content}")
+                keywords=keywords,
+            )))
         
-        # Conclusion
         if outline["include_conclusion"]:
-            conclusion = await self.content_generator.generate_conclusion(
+            parts.append(("Conclusion", self.content_generator.generate_conclusion(
                 topic=request.topic,
                 tone=request.tone,
-                key_points=request.keywords[:3] if request.keywords else [],
-            )
-            content_parts.append(f"## Conclusion\n\n{conclusion}")
+                key_points=keywords[:3],
+            )))
         
+        # gather() returns results in submission order, whatever order they finish in
+        generated = await asyncio.gather(*(self._bounded(call) for _, call in parts))
+        
+        content_parts = [
+            text if heading is None else f"## {heading}\n\n{text}"
+            for (heading, _), text in zip(parts, generated)
+        ]
         return "\n\n".join(content_parts)
     
     async def _optimize_content_for_seo(self, content: str, request: BlogRequest) -> str:
@@ -467,18 +476,19 @@ class BlogWriter:
                 slug=create_slug(title) if title else "untitled",
             )
             
-            # Perform analysis
-            if self.enable_quality_analysis:
-                blog_post.content_quality = await self.content_analyzer.analyze_quality(content)
-            
-            if self.enable_seo_optimization:
-                blog_post.seo_metrics = await self.seo_optimizer.analyze_seo(
+            # Quality and SEO analyses are independent
+            blog_post.content_quality, blog_post.seo_metrics = await asyncio.gather(
+                self._maybe(self.enable_quality_analysis, self.content_analyzer.analyze_quality, content),
+                self._maybe(
+                    self.enable_seo_optimization,
+                    self.seo_optimizer.analyze_seo,
                     content=content,
                     title=title,
                     meta_tags=meta_tags,
                     keywords=[],
                     focus_keyword=None,
-                )
+                ),
+            )
             
             return BlogGenerationResult(
                 success=True,
@@ -13,6 +13,7 @@ from .media_storage import (
     CloudinaryStorage,
     CloudflareR2Storage,
     MediaStorageManager,
+    MediaUploadPipeline,
     create_cloudinary_storage,
     create_cloudflare_r2_storage,
     create_media_storage_manager
@@ -35,6 +36,7 @@ __all__ = [
     "CloudinaryStorage",
     "CloudflareR2Storage",
     "MediaStorageManager",
+    "MediaUploadPipeline",
     "create_cloudinary_storage",
     "create_cloudflare_r2_storage",
     "create_media_storage_manager",
@@ -0,0 +1,247 @@
+"""
+Micro-batching for DataForSEO requests.
+
+DataForSEO accepts an array of tasks per POST. Single-task calls for the
+same endpoint/location/language that arrive within a short window are
+coalesced into one multi-task request and the response is split back so
+each caller receives a normal single-task response.
+
+Per-task errors stay isolated: each caller gets its own task (with its own
+status_code). If the batched POST itself fails or the response cannot be
+matched back to the submitted tasks, every task is re-sent on its own and
+the endpoint is demoted to single-task requests for the rest of the process.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_STATUS = 20000
+
+# Endpoints eligible for coalescing and the max tasks per POST for each
+DEFAULT_ENDPOINT_TASK_LIMITS: Dict[str, int] = {
+    "keywords_data/google_ads/search_volume/live": 100,
+    "dataforseo_labs/bulk_keyword_difficulty/live": 100,
+    "dataforseo_labs/search_intent/live": 100,
+    "serp/google/organic/live/advanced": 100,
+}
+
+_TAG_PREFIX = "mb-"
+
+SendFunc = Callable[[str, List[Dict[str, Any]], str], Awaitable[Dict[str, Any]]]
+
+
+def micro_batching_enabled() -> bool:
+    return os.getenv("DATAFORSEO_MICRO_BATCHING", "false").lower() in ("1", "true", "yes")
+
+
+@dataclass
+class _PendingTask:
+    task: Dict[str, Any]
+    tag: Optional[str]
+    tenant_id: str
+    future: "asyncio.Future[Dict[str, Any]]"
+
+
+@dataclass
+class _PendingBatch:
+    endpoint: str
+    entries: List[_PendingTask] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class DataForSEOMicroBatcher:
+    """
+    Coalesces concurrent single-task DataForSEO calls into multi-task POSTs.
+
+    Features:
+    - Batches keyed by endpoint, location and language
+    - Flush on a short window or when the endpoint's task limit is reached
+    - Responses demultiplexed by task tag, falling back to task order
+    - Per-task fallback when a batched request fails
+    """
+
+    def __init__(
+        self,
+        send: SendFunc,
+        window_ms: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            send: Coroutine ``send(endpoint, payload, tenant_id)`` that posts
+                a task array and returns the decoded response
+            window_ms: Coalescing window in milliseconds
+                (env DATAFORSEO_BATCH_WINDOW_MS, default 5)
+            endpoint_limits: Max tasks per POST for each batchable endpoint
+        """
+        self._send = send
+        self.window = (
+            window_ms if window_ms is not None
+            else float(os.getenv("DATAFORSEO_BATCH_WINDOW_MS", "5"))
+        ) / 1000.0
+        self.endpoint_limits = dict(endpoint_limits or DEFAULT_ENDPOINT_TASK_LIMITS)
+        self._pending: Dict[Tuple[Any, ...], _PendingBatch] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+        self._next_tag = 0
+        self._stats = {"requests": 0, "posts": 0, "batched_posts": 0, "fallback_tasks": 0}
+
+    def accepts(self, endpoint: str, payload: List[Dict[str, Any]]) -> bool:
+        """Whether a request can go through the batcher."""
+        return len(payload) == 1 and self.endpoint_limits.get(endpoint, 1) > 1
+
+    async def submit(self, endpoint: str, task: Dict[str, Any], tenant_id: str) -> Dict[str, Any]:
+        """
+        Queue a single task and wait for its share of the batched response.
+
+        Args:
+            endpoint: API endpoint path
+            task: Task parameters
+            tenant_id: Tenant ID
+
+        Returns:
+            Response shaped as if the task had been sent on its own
+        """
+        loop = asyncio.get_running_loop()
+        key = (
+            id(loop),
+            endpoint,
+            task.get("location_name", task.get("location_code")),
+            task.get("language_code", task.get("language_name")),
+        )
+
+        tag = None
+        if "tag" not in task:
+            self._next_tag += 1
+            tag = f"{_TAG_PREFIX}{self._next_tag}"
+            task = {**task, "tag": tag}
+
+        entry = _PendingTask(task=task, tag=tag, tenant_id=tenant_id, future=loop.create_future())
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch(endpoint=endpoint)
+        batch.entries.append(entry)
+        self._stats["requests"] += 1
+
+        if len(batch.entries) >= self.endpoint_limits.get(endpoint, 1):
+            self._flush(key)
+        elif batch.timer is None:
+            batch.timer = loop.call_later(self.window, self._flush, key)
+
+        return await entry.future
+
+    def _flush(self, key: Tuple[Any, ...]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        dispatch = asyncio.get_running_loop().create_task(self._dispatch(batch.endpoint, batch.entries))
+        self._dispatches.add(dispatch)
+        dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, endpoint: str, entries: List[_PendingTask]) -> None:
+        entries = [entry for entry in entries if not entry.future.done()]
+        if not entries:
+            return
+        try:
+            if len(entries) == 1:
+                await self._send_individually(endpoint, entries, count_fallback=False)
+                return
+
+            self._stats["posts"] += 1
+            self._stats["batched_posts"] += 1
+            response = await self._send(endpoint, [entry.task for entry in entries], entries[0].tenant_id)
+            tasks = self._match_tasks(response, entries)
+            if tasks is None:
+                logger.warning(
+                    f"Batched DataForSEO request to {endpoint} failed or could not be matched; "
+                    f"re-sending {len(entries)} tasks individually and disabling batching for this endpoint"
+                )
+                self.endpoint_limits[endpoint] = 1
+                await self._send_individually(endpoint, entries)
+                return
+
+            for entry, task in zip(entries, tasks):
+                if not entry.future.done():
+                    entry.future.set_result(self._single_task_response(response, task, entry.tag))
+        except Exception as e:
+            for entry in entries:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+
+    async def _send_individually(
+        self,
+        endpoint: str,
+        entries: List[_PendingTask],
+        count_fallback: bool = True
+    ) -> None:
+        async def send_one(entry: _PendingTask) -> None:
+            try:
+                response = await self._send(endpoint, [entry.task], entry.tenant_id)
+            except Exception as e:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+                return
+            if entry.tag and isinstance(response, dict) and isinstance(response.get("tasks"), list):
+                response = {**response, "tasks": [self._strip_tag(task, entry.tag) for task in response["tasks"]]}
+            if not entry.future.done():
+                entry.future.set_result(response)
+
+        self._stats["posts"] += len(entries)
+        if count_fallback:
+            self._stats["fallback_tasks"] += len(entries)
+        await asyncio.gather(*(send_one(entry) for entry in entries))
+
+    @staticmethod
+    def _match_tasks(response: Any, entries: List[_PendingTask]) -> Optional[List[Dict[str, Any]]]:
+        """Pair response tasks with submitted entries; None if they don't line up."""
+        if not isinstance(response, dict) or response.get("status_code") != SUCCESS_STATUS:
+            return None
+        tasks = response.get("tasks")
+        if not isinstance(tasks, list) or len(tasks) != len(entries):
+            return None
+
+        by_tag = {}
+        for task in tasks:
+            data = task.get("data") if isinstance(task, dict) else None
+            if isinstance(data, dict) and data.get("tag"):
+                by_tag[data["tag"]] = task
+        return [
+            by_tag.get(entry.tag, tasks[index]) if entry.tag else tasks[index]
+            for index, entry in enumerate(entries)
+        ]
+
+    @staticmethod
+    def _strip_tag(task: Any, tag: str) -> Any:
+        data = task.get("data") if isinstance(task, dict) else None
+        if not isinstance(data, dict) or data.get("tag") != tag:
+            return task
+        return {**task, "data": {k: v for k, v in data.items() if k != "tag"}}
+
+    @classmethod
+    def _single_task_response(cls, response: Dict[str, Any], task: Dict[str, Any], tag: Optional[str]) -> Dict[str, Any]:
+        envelope = {
+            k: v for k, v in response.items()
+            if k not in ("tasks", "tasks_count", "tasks_error", "cost")
+        }
+        envelope["cost"] = task.get("cost", 0)
+        envelope["tasks_count"] = 1
+        envelope["tasks_error"] = 0 if task.get("status_code") == SUCCESS_STATUS else 1
+        envelope["tasks"] = [cls._strip_tag(task, tag) if tag else task]
+        return envelope
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Coalescing counters for status endpoints."""
+        return {
+            **self._stats,
+            "window_ms": round(self.window * 1000, 2),
+            "pending": sum(len(batch.entries) for batch in self._pending.values()),
+            "batched_endpoints": sorted(e for e, limit in self.endpoint_limits.items() if limit > 1),
+        }
@@ -0,0 +1,350 @@
+"""
+Per-tenant DataForSEO endpoint capability registry.
+
+Remembers what each tenant's DataForSEO account can actually do so requests
+don't rediscover it with a full round trip every time:
+
+- which candidate path works for a capability (e.g. AI search volume)
+- endpoints that need a subscription the tenant doesn't have (40204)
+- paths the API doesn't know (40400/40402)
+- endpoint variants unsupported for a location/platform scope
+
+Entries expire after a per-status TTL. They are kept in process and written
+through to the shared cache manager (Redis when configured) so other
+instances pick them up.
+"""
+
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..cache.redis_cache import get_cache_manager
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_STATUS = 20000
+SUBSCRIPTION_REQUIRED_STATUS = 40204
+INVALID_PATH_STATUSES = (40400, 40402)
+# Field rejected for the given scope (e.g. location not supported by a platform);
+# only cached when the message names one of the scope fields
+UNSUPPORTED_STATUSES = (40501,)
+SCOPE_FIELDS = ("location", "language", "platform")
+
+_CACHE_PREFIX = "blogwriter:dataforseo_capability"
+
+
+class CapabilityStatus:
+    """Known endpoint states."""
+    AVAILABLE = "available"
+    SUBSCRIPTION_REQUIRED = "subscription_required"
+    INVALID_PATH = "invalid_path"
+    UNSUPPORTED = "unsupported"
+
+
+NEGATIVE_STATUSES = (
+    CapabilityStatus.SUBSCRIPTION_REQUIRED,
+    CapabilityStatus.INVALID_PATH,
+    CapabilityStatus.UNSUPPORTED,
+)
+
+DEFAULT_STATUS_TTLS: Dict[str, int] = {
+    CapabilityStatus.AVAILABLE: 86400,             # 24 hours
+    CapabilityStatus.SUBSCRIPTION_REQUIRED: 3600,  # 1 hour; plans can be upgraded
+    CapabilityStatus.INVALID_PATH: 86400,          # 24 hours
+    CapabilityStatus.UNSUPPORTED: 21600,           # 6 hours
+}
+
+
+def classify_status(status_code: Any, message: Optional[str] = None, scoped: bool = False) -> Optional[str]:
+    """
+    Map a DataForSEO task status code to a capability status.
+
+    Args:
+        status_code: Task-level status code
+        message: Task-level status message
+        scoped: Whether the call was made for a specific location/platform;
+            field errors are only cached as "unsupported" in that case
+
+    Returns:
+        Capability status, or None for transient/request-specific results
+    """
+    if status_code == SUCCESS_STATUS:
+        return CapabilityStatus.AVAILABLE
+    if status_code == SUBSCRIPTION_REQUIRED_STATUS:
+        return CapabilityStatus.SUBSCRIPTION_REQUIRED
+    if status_code in INVALID_PATH_STATUSES:
+        return CapabilityStatus.INVALID_PATH
+    if (
+        scoped
+        and status_code in UNSUPPORTED_STATUSES
+        and any(name in (message or "").lower() for name in SCOPE_FIELDS)
+    ):
+        return CapabilityStatus.UNSUPPORTED
+    return None
+
+
+def task_status(response: Any) -> Tuple[Optional[int], Optional[str]]:
+    """First task's status code and message from a DataForSEO response."""
+    if not isinstance(response, dict):
+        return None, None
+    tasks = response.get("tasks")
+    if not isinstance(tasks, list) or not tasks or not isinstance(tasks[0], dict):
+        return None, None
+    return tasks[0].get("status_code"), tasks[0].get("status_message")
+
+
+@dataclass
+class CapabilityRecord:
+    """What is known about one endpoint (or capability) for one tenant."""
+    status: str
+    endpoint: str
+    scope: str = ""
+    status_code: Optional[int] = None
+    message: Optional[str] = None
+    checked_at: float = 0.0
+    expires_at: float = 0.0
+
+    @property
+    def is_negative(self) -> bool:
+        return self.status in NEGATIVE_STATUSES
+
+    def to_response(self) -> Dict[str, Any]:
+        """Synthetic single-task response equivalent to the cached failure."""
+        message = self.message or self.status.replace("_", " ")
+        return {
+            "status_code": SUCCESS_STATUS,
+            "status_message": "Ok.",
+            "cost": 0,
+            "tasks_count": 1,
+            "tasks_error": 1,
+            "tasks": [{
+                "status_code": self.status_code,
+                "status_message": message,
+                "cost": 0,
+                "result": None,
+                "data": {"capability_cache": self.status},
+            }],
+        }
+
+
+class DataForSEOCapabilityRegistry:
+    """
+    TTL'd registry of endpoint capabilities per tenant.
+
+    Features:
+    - Positive entries for working endpoint paths
+    - Negative caching of subscription-gated, invalid and unsupported endpoints
+    - Write-through to the shared cache manager, read-through on local miss
+    - Short-lived local "nothing known" markers so hot paths don't hit Redis
+      on every call
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, int]] = None,
+        remote_check_interval: Optional[float] = None,
+        cache_manager_getter: Callable[[], Any] = get_cache_manager,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            ttls: Seconds each status stays cached
+            remote_check_interval: Seconds a local miss is trusted before the
+                shared cache is consulted again
+                (env DATAFORSEO_CAPABILITY_REMOTE_CHECK_SECONDS, default 60)
+            cache_manager_getter: Returns the shared CacheManager (or None)
+            clock: Wall clock (shared across instances, overridable in tests)
+        """
+        self.ttls = {**DEFAULT_STATUS_TTLS, **(ttls or {})}
+        self.remote_check_interval = (
+            remote_check_interval if remote_check_interval is not None
+            else float(os.getenv("DATAFORSEO_CAPABILITY_REMOTE_CHECK_SECONDS", "60"))
+        )
+        self._cache_manager_getter = cache_manager_getter
+        self._clock = clock
+        self._records: Dict[Tuple[str, str, str], CapabilityRecord] = {}
+        self._remote_checked: Dict[Tuple[str, str, str], float] = {}
+        self._stats = {"hits": 0, "skipped_requests": 0, "remote_hits": 0}
+
+    @staticmethod
+    def _remote_key(key: Tuple[str, str, str]) -> str:
+        tenant_id, endpoint, scope = key
+        return f"{_CACHE_PREFIX}:{tenant_id}:{endpoint}:{scope}"
+
+    async def get(self, tenant_id: str, endpoint: str, scope: str = "") -> Optional[CapabilityRecord]:
+        """
+        Look up a live record.
+
+        Args:
+            tenant_id: Tenant ID
+            endpoint: Endpoint path or capability name
+            scope: Optional location/platform qualifier
+
+        Returns:
+            The record, or None if nothing unexpired is known
+        """
+        key = (tenant_id, endpoint, scope)
+        now = self._clock()
+        record = self._records.get(key)
+        if record is not None:
+            if record.expires_at > now:
+                self._stats["hits"] += 1
+                return record
+            del self._records[key]
+
+        if now - self._remote_checked.get(key, float("-inf")) < self.remote_check_interval:
+            return None
+        self._remote_checked[key] = now
+
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is None:
+            return None
+        try:
+            stored = await cache_manager.get(self._remote_key(key))
+        except Exception as e:
+            logger.warning(f"Capability registry read failed: {e}")
+            return None
+        if not isinstance(stored, dict):
+            return None
+        try:
+            record = CapabilityRecord(**stored)
+        except TypeError:
+            return None
+        if record.expires_at <= now:
+            return None
+        self._records[key] = record
+        self._stats["remote_hits"] += 1
+        return record
+
+    async def record(
+        self,
+        tenant_id: str,
+        endpoint: str,
+        status_code: Any,
+        message: Optional[str] = None,
+        scope: str = ""
+    ) -> Optional[CapabilityRecord]:
+        """
+        Record the outcome of a call.
+
+        Successes only replace a missing or negative entry; transient errors
+        are ignored.
+
+        Args:
+            tenant_id: Tenant ID
+            endpoint: Endpoint path or capability name
+            status_code: Task status code returned by DataForSEO
+            message: Task status message
+            scope: Optional location/platform qualifier
+
+        Returns:
+            The stored record, or None if nothing was recorded
+        """
+        status = classify_status(status_code, message, scoped=bool(scope))
+        if status is None:
+            return None
+        key = (tenant_id, endpoint, scope)
+        existing = self._records.get(key)
+        now = self._clock()
+        if (
+            status == CapabilityStatus.AVAILABLE
+            and existing is not None
+            and existing.status == status
+            and existing.expires_at > now
+        ):
+            return existing
+        return await self._store(key, CapabilityRecord(
+            status=status,
+            endpoint=endpoint,
+            scope=scope,
+            status_code=status_code,
+            message=message,
+            checked_at=now,
+            expires_at=now + self.ttls[status],
+        ))
+
+    async def blocked(self, tenant_id: str, endpoint: str, scope: str = "") -> Optional[CapabilityRecord]:
+        """Return the negative record if the endpoint is known not to work."""
+        record = await self.get(tenant_id, endpoint, scope)
+        if record is not None and record.is_negative:
+            self._stats["skipped_requests"] += 1
+            return record
+        return None
+
+    async def get_working_path(self, tenant_id: str, capability: str) -> Optional[str]:
+        """Endpoint path remembered as working for a capability."""
+        record = await self.get(tenant_id, capability)
+        if record is not None and record.status == CapabilityStatus.AVAILABLE:
+            return record.endpoint
+        return None
+
+    async def set_working_path(self, tenant_id: str, capability: str, endpoint: str) -> None:
+        """Remember which endpoint path serves a capability."""
+        key = (tenant_id, capability, "")
+        existing = self._records.get(key)
+        now = self._clock()
+        if existing is not None and existing.endpoint == endpoint and existing.expires_at > now:
+            return
+        ttl = self.ttls[CapabilityStatus.AVAILABLE]
+        await self._store(key, CapabilityRecord(
+            status=CapabilityStatus.AVAILABLE,
+            endpoint=endpoint,
+            status_code=SUCCESS_STATUS,
+            checked_at=now,
+            expires_at=now + ttl,
+        ))
+
+    async def _store(self, key: Tuple[str, str, str], record: CapabilityRecord) -> CapabilityRecord:
+        self._records[key] = record
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is not None:
+            ttl = max(1, int(record.expires_at - record.checked_at))
+            try:
+                await cache_manager.set(self._remote_key(key), asdict(record), ttl=ttl)
+            except Exception as e:
+                logger.warning(f"Capability registry write failed: {e}")
+        if record.is_negative:
+            logger.info(
+                f"DataForSEO capability cached: {record.endpoint} [{record.scope or 'all'}] "
+                f"for tenant {key[0]} is {record.status} ({record.status_code})"
+            )
+        return record
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        """Drop local entries (all, or one tenant's)."""
+        for key in [k for k in self._records if tenant_id is None or k[0] == tenant_id]:
+            del self._records[key]
+        self._remote_checked.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Unexpired local entries grouped by tenant, for status endpoints."""
+        now = self._clock()
+        tenants: Dict[str, list] = {}
+        for (tenant_id, name, scope), record in sorted(self._records.items()):
+            if record.expires_at <= now:
+                continue
+            tenants.setdefault(tenant_id, []).append({
+                "name": name,
+                "endpoint": record.endpoint,
+                "scope": scope or None,
+                "status": record.status,
+                "status_code": record.status_code,
+                "expires_in_seconds": round(record.expires_at - now),
+            })
+        return {"tenants": tenants, **self._stats}
+
+
+# Global registry instance
+_capability_registry: Optional[DataForSEOCapabilityRegistry] = None
+
+
+def get_capability_registry() -> DataForSEOCapabilityRegistry:
+    """Get the process-wide capability registry."""
+    global _capability_registry
+    if _capability_registry is None:
+        _capability_registry = DataForSEOCapabilityRegistry()
+    return _capability_registry
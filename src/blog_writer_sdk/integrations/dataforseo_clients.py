@@ -0,0 +1,234 @@
+"""
+Process-wide registry of shared DataForSEO clients.
+
+Subsystems ask the registry for a client instead of constructing their own,
+so every caller with the same tenant, credentials and market settings shares
+one response cache, one credential state and the pooled HTTP connections.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .dataforseo_integration import DataForSEOClient
+
+logger = logging.getLogger(__name__)
+
+ClientKey = Tuple[str, str, str, str]
+
+
+class DataForSEOClientRegistry:
+    """
+    Hands out shared DataForSEOClient instances.
+
+    Features:
+    - Clients keyed by tenant, credentials fingerprint, location and language
+      (response cache keys don't all include the market, so clients with
+      different defaults are kept apart)
+    - One-time credential initialization per client, with refresh
+    - LRU bound on the number of clients (e.g. connection tests with ad-hoc keys)
+    - Instance counts and per-client cache hit rates for status endpoints
+    """
+
+    def __init__(self, max_clients: Optional[int] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            max_clients: Maximum shared clients kept
+                (env DATAFORSEO_CLIENT_REGISTRY_MAX, default 64)
+        """
+        self.max_clients = max_clients or int(os.getenv("DATAFORSEO_CLIENT_REGISTRY_MAX", "64"))
+        self._clients: "OrderedDict[ClientKey, DataForSEOClient]" = OrderedDict()
+        self._initialized: Dict[ClientKey, bool] = {}
+        self._init_locks: Dict[ClientKey, asyncio.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(
+        tenant_id: str,
+        api_key: str,
+        api_secret: str,
+        location: str,
+        language_code: str,
+        credential_service: Any = None
+    ) -> ClientKey:
+        if api_key or api_secret:
+            credentials = "keys:" + hashlib.sha256(f"{api_key}:{api_secret}".encode()).hexdigest()[:16]
+        elif credential_service is not None:
+            credentials = f"service:{id(credential_service)}"
+        else:
+            credentials = "unconfigured"
+        return (tenant_id, credentials, location, language_code)
+
+    def get_client(
+        self,
+        tenant_id: str = "default",
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        location: Optional[str] = None,
+        language_code: Optional[str] = None,
+        credential_service: Any = None
+    ) -> DataForSEOClient:
+        """
+        Get (or create) the shared client for these settings.
+
+        Credentials, location and language fall back to the same environment
+        variables DataForSEOClient uses, so equivalent calls share a client.
+
+        Args:
+            tenant_id: Tenant ID
+            api_key: DataForSEO API key
+            api_secret: DataForSEO API secret
+            location: Default location for search data
+            language_code: Default language code
+            credential_service: Optional credential service for multi-tenant support
+
+        Returns:
+            Shared DataForSEOClient
+        """
+        return self._resolve(tenant_id, api_key, api_secret, location, language_code, credential_service)[1]
+
+    def _resolve(
+        self,
+        tenant_id: str,
+        api_key: Optional[str],
+        api_secret: Optional[str],
+        location: Optional[str],
+        language_code: Optional[str],
+        credential_service: Any
+    ) -> Tuple[ClientKey, DataForSEOClient]:
+        api_key = (api_key or os.getenv("DATAFORSEO_API_KEY") or "").strip()
+        api_secret = (api_secret or os.getenv("DATAFORSEO_API_SECRET") or "").strip()
+        location = location or os.getenv("DATAFORSEO_LOCATION", "United States")
+        language_code = language_code or os.getenv("DATAFORSEO_LANGUAGE", "en")
+        key = self._key(tenant_id, api_key, api_secret, location, language_code, credential_service)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                return key, client
+            client = DataForSEOClient(
+                credential_service=credential_service,
+                api_key=api_key or None,
+                api_secret=api_secret or None,
+                location=location,
+                language_code=language_code,
+            )
+            self._clients[key] = client
+            while len(self._clients) > self.max_clients:
+                evicted, _ = self._clients.popitem(last=False)
+                self._initialized.pop(evicted, None)
+                self._init_locks.pop(evicted, None)
+            logger.info(f"Created shared DataForSEO client for tenant {tenant_id} ({location}/{language_code})")
+            return key, client
+
+    async def acquire(
+        self,
+        tenant_id: str = "default",
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        location: Optional[str] = None,
+        language_code: Optional[str] = None,
+        credential_service: Any = None
+    ) -> DataForSEOClient:
+        """
+        Get the shared client with credentials initialized for ``tenant_id``.
+
+        Takes the same arguments as ``get_client``.
+
+        Returns:
+            Shared DataForSEOClient ready to use
+        """
+        key, client = self._resolve(tenant_id, api_key, api_secret, location, language_code, credential_service)
+        if self._initialized.get(key):
+            return client
+        lock = self._init_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if not self._initialized.get(key):
+                await client.initialize_credentials(tenant_id)
+                self._initialized[key] = True
+        return client
+
+    async def refresh_credentials(self, tenant_id: Optional[str] = None) -> int:
+        """
+        Reload credentials from the credential service for shared clients.
+
+        Clients built from explicit (or environment) keys keep them; clients
+        backed by a credential service are re-initialized in place.
+
+        Args:
+            tenant_id: Only refresh this tenant's clients (all when None)
+
+        Returns:
+            Number of clients refreshed
+        """
+        with self._lock:
+            targets = [
+                (key, client) for key, client in self._clients.items()
+                if (tenant_id is None or key[0] == tenant_id)
+                and not key[1].startswith("keys:")
+            ]
+        for key, client in targets:
+            lock = self._init_locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                client.api_key = ""
+                client.api_secret = ""
+                client.is_configured = False
+                await client.initialize_credentials(key[0])
+                self._initialized[key] = True
+        return len(targets)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._initialized.clear()
+            self._init_locks.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Instance counts and per-client cache hit rates."""
+        with self._lock:
+            entries = list(self._clients.items())
+        clients = []
+        for key, client in entries:
+            cache = client._cache
+            hits, misses = getattr(cache, "hits", 0), getattr(cache, "misses", 0)
+            lookups = hits + misses
+            clients.append({
+                "tenant_id": key[0],
+                "location": key[2],
+                "language_code": key[3],
+                "configured": client.is_configured,
+                "cache_entries": len(cache),
+                "cache_hits": hits,
+                "cache_misses": misses,
+                "cache_hit_rate": round(hits / lookups, 4) if lookups else None,
+            })
+        return {
+            "shared_clients": len(entries),
+            "live_instances": len(DataForSEOClient._live_instances),
+            "max_clients": self.max_clients,
+            "clients": clients,
+        }
+
+
+# Global registry instance
+_client_registry: Optional[DataForSEOClientRegistry] = None
+
+
+def get_client_registry() -> DataForSEOClientRegistry:
+    """Get the process-wide DataForSEO client registry."""
+    global _client_registry
+    if _client_registry is None:
+        _client_registry = DataForSEOClientRegistry()
+    return _client_registry
+
+
+def get_dataforseo_client(tenant_id: str = "default", **kwargs: Any) -> DataForSEOClient:
+    """Shortcut for ``get_client_registry().get_client(...)``."""
+    return get_client_registry().get_client(tenant_id, **kwargs)
@@ -9,30 +9,86 @@ import asyncio
 import httpx
 import base64
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import os
 import logging
 from contextlib import asynccontextmanager
 import time
+import weakref
 
 from src.blog_writer_sdk.monitoring.metrics import metrics_collector, monitor_performance
 from src.blog_writer_sdk.monitoring.cloud_logging import get_blog_logger, log_api_request
+from src.blog_writer_sdk.monitoring.tracing import SpanKind, span
 # DataForSEOCredentialService import removed - service not implemented yet
 
 from ..models.blog_models import KeywordAnalysis, SEODifficulty
+from .dataforseo_batching import DataForSEOMicroBatcher, micro_batching_enabled
+from .dataforseo_capabilities import get_capability_registry, task_status
 
 logger = get_blog_logger()
 
+# Platform selection policies for LLM mentions search in auto mode
+LLM_MENTIONS_FIRST_NON_EMPTY = "first_non_empty"
+LLM_MENTIONS_BEST = "best"
+LLM_MENTIONS_PLATFORMS = ["chat_gpt", "google"]
+
+# Pooled HTTP clients shared by every DataForSEOClient, one per event loop
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Keep-alive HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_shared_http_clients() -> None:
+    """Close the pooled HTTP client of the running event loop (call on shutdown)."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+class _InstrumentedCache(dict):
+    """Response cache that counts lookups (``key in cache``) that hit or miss."""
+
+    def __init__(self):
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: object) -> bool:
+        found = super().__contains__(key)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return found
+
+
 class DataForSEOClient:
     """
     Client for direct DataForSEO API integration.
     
     This class provides methods to get real SEO data including
     search volume, keyword difficulty, and competitor analysis.
+    
+    Prefer ``get_dataforseo_client`` (integrations.dataforseo_clients) over
+    constructing clients directly so caches and connections are shared.
     """
     
-    def __init__(self, credential_service: Any = None, api_key: Optional[str] = None, api_secret: Optional[str] = None, location: Optional[str] = None, language_code: Optional[str] = None):
+    # Every live instance, for instrumentation of stray per-call clients
+    _live_instances: "weakref.WeakSet[DataForSEOClient]" = weakref.WeakSet()
+    
+    def __init__(self, credential_service: Any = None, api_key: Optional[str] = None, api_secret: Optional[str] = None, location: Optional[str] = None, language_code: Optional[str] = None, micro_batching: Optional[bool] = None):
         """
         Initialize DataForSEO client.
         
@@ -42,6 +98,8 @@ class DataForSEOClient:
             api_secret: DataForSEO API secret (optional, can also use env vars)
             location: Location for search data (e.g., "United States", "United Kingdom")
             language_code: Language code for search data (e.g., "en", "es")
+            micro_batching: Coalesce concurrent single-task calls into multi-task
+                POSTs (defaults to env DATAFORSEO_MICRO_BATCHING, off)
         """
         self.base_url = "https://api.dataforseo.com/v3"
         self.credential_service = credential_service
@@ -52,12 +110,17 @@ class DataForSEOClient:
         self.location = location or os.getenv("DATAFORSEO_LOCATION", "United States")
         self.language_code = language_code or os.getenv("DATAFORSEO_LANGUAGE", "en")
         self.is_configured = bool(self.api_key and self.api_secret)
-        self._cache = {}
+        self._cache = _InstrumentedCache()
+        DataForSEOClient._live_instances.add(self)
         # Increased cache TTL to reduce API calls:
         # - Keyword data changes slowly, safe to cache for 24 hours
         # - SERP data more dynamic, cached separately with shorter TTL
         self._cache_ttl = 86400  # 24 hours for keyword data (was 1 hour)
         self._serp_cache_ttl = 21600  # 6 hours for SERP data (more dynamic)
+        if micro_batching is None:
+            micro_batching = micro_batching_enabled()
+        self._batcher = DataForSEOMicroBatcher(self._send_request) if micro_batching else None
+        self.capabilities = get_capability_registry()
     
     async def initialize_credentials(self, tenant_id: str):
         # If already configured from constructor, skip re-initialization
@@ -226,6 +289,30 @@ class DataForSEOClient:
             log_api_request("dataforseo", endpoint, 0, 0.0, message="API not configured", tenant_id=tenant_id)
             return self._fallback_data(endpoint, payload)
 
+        # Skip endpoints known to be subscription-gated or nonexistent for this tenant
+        blocked = await self.capabilities.blocked(tenant_id, endpoint)
+        if blocked is not None:
+            logger.debug(f"Skipping DataForSEO {endpoint} for tenant {tenant_id}: cached {blocked.status}")
+            return blocked.to_response()
+
+        if self._batcher is not None and self._batcher.accepts(endpoint, payload):
+            data = await self._batcher.submit(endpoint, payload[0], tenant_id)
+        else:
+            data = await self._send_request(endpoint, payload, tenant_id, use_ai_format)
+
+        status_code, status_message = task_status(data)
+        if status_code is not None:
+            await self.capabilities.record(tenant_id, endpoint, status_code, status_message)
+        return data
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        payload: List[Dict[str, Any]],
+        tenant_id: str,
+        use_ai_format: bool = True
+    ) -> Dict[str, Any]:
+        """POST a task array to DataForSEO; returns fallback data on failure."""
         # Append .ai for optimized responses (Priority 3: AI-optimized format)
         if use_ai_format and not endpoint.endswith('.ai') and not endpoint.endswith('/live'):
             # Only append .ai if endpoint doesn't already have it and is not a /live endpoint
@@ -247,9 +334,10 @@ class DataForSEOClient:
 
         try:
             start_time = time.perf_counter()
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, headers=headers, json=payload, timeout=30.0)
-                response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
+            with span(f"dataforseo {endpoint}", SpanKind.UPSTREAM, endpoint=endpoint, tasks=len(payload)) as call_span:
+                response = await _shared_http_client().post(url, headers=headers, json=payload, timeout=30.0)
+                call_span.set_attribute("http.status_code", response.status_code)
+            response.raise_for_status()  # Raise an exception for 4xx or 5xx status codes
             end_time = time.perf_counter()
             duration = end_time - start_time
             log_api_request("dataforseo", endpoint, response.status_code, duration, message="Success", tenant_id=tenant_id)
@@ -526,6 +614,12 @@ class DataForSEOClient:
                 "ai_optimization/keyword_data/live",  # Alternative (without search_volume)
                 "keywords_data/ai_optimization/search_volume/live",  # Original (known to be wrong)
             ]
+            # Try the path that worked last time first; known-dead paths are answered
+            # from the capability registry without a round trip
+            working_path = await self.capabilities.get_working_path(tenant_id, "ai_search_volume")
+            if working_path in endpoint_paths_to_try:
+                endpoint_paths_to_try.remove(working_path)
+                endpoint_paths_to_try.insert(0, working_path)
             
             data = None
             last_error = None
@@ -542,10 +636,12 @@ class DataForSEOClient:
                         if task_status == 20000:
                             # Success! This is the correct path
                             logger.info(f"✅ Found correct AI search volume endpoint: {endpoint_path}")
+                            await self.capabilities.set_working_path(tenant_id, "ai_search_volume", endpoint_path)
                             break
                         elif task_status == 40204:
                             # Path is correct but needs subscription
                             logger.info(f"✅ AI search volume endpoint path is correct: {endpoint_path} (subscription needed)")
+                            await self.capabilities.set_working_path(tenant_id, "ai_search_volume", endpoint_path)
                             break
                         elif task_status == 40402:
                             # Invalid path, try next one
@@ -2528,7 +2624,8 @@ class DataForSEOClient:
         tenant_id: str = "default",
         platform: str = "chat_gpt",  # "chat_gpt" or "google" or "auto" for automatic fallback
         limit: int = 100,
-        filters: Optional[List[Any]] = None
+        filters: Optional[List[Any]] = None,
+        selection_policy: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Search for LLM mentions using DataForSEO AI Optimization API.
@@ -2536,11 +2633,17 @@ class DataForSEOClient:
         This endpoint finds what topics, keywords, and URLs are being cited by AI agents
         (ChatGPT, Google AI/Gemini) in their responses.
         
-        Platform fallback strategy:
-        - If platform="auto" or no results found: Try chat_gpt first, then google
+        Platform strategy:
+        - platform="auto": chat_gpt and google are queried concurrently; the
+          selection policy decides which answer is used and the other call is
+          cancelled once it is no longer needed
         - chat_gpt: Works best for United States (lower volume but available)
         - google: Works for multiple locations (US, UK, Germany, Canada, Australia) with higher volume
         
+        Results are cached per platform and location (including empty ones),
+        as is the platform that had data for a target, so repeat lookups don't
+        pay for another request.
+        
         Critical for: Discovering AI-optimized topics and content gaps.
         
         Args:
@@ -2549,9 +2652,12 @@ class DataForSEOClient:
             location_name: Location for analysis
             language_code: Language code (not used by API but kept for compatibility)
             tenant_id: Tenant ID
-            platform: "chat_gpt", "google", or "auto" (auto tries chat_gpt then google)
+            platform: "chat_gpt", "google", or "auto" (auto queries both)
             limit: Maximum number of results
             filters: Optional filters array
+            selection_policy: Auto-mode policy, "first_non_empty" (first platform
+                to answer with mentions) or "best" (highest mention count); defaults
+                to env DATAFORSEO_LLM_MENTIONS_POLICY or "first_non_empty"
             
         Returns:
             Dictionary with LLM mentions data including:
@@ -2574,24 +2680,46 @@ class DataForSEOClient:
                 target_obj = {"keyword": target}  # Default to keyword
             
             # Determine platforms to try
-            platforms_to_try = []
-            if platform == "auto":
-                # Auto mode: Try chat_gpt first, then google
-                platforms_to_try = ["chat_gpt", "google"]
-            elif platform in ["chat_gpt", "google"]:
-                # Single platform specified
+            if platform in LLM_MENTIONS_PLATFORMS:
                 platforms_to_try = [platform]
             else:
-                # Unknown platform, default to auto
-                logger.warning(f"Unknown platform '{platform}', using auto fallback")
-                platforms_to_try = ["chat_gpt", "google"]
-            
-            # Try each platform until we get results
-            best_result = None
-            best_total_count = 0
-            last_error = None
-            
+                if platform != "auto":
+                    logger.warning(f"Unknown platform '{platform}', using auto fallback")
+                platforms_to_try = list(LLM_MENTIONS_PLATFORMS)
+            policy = selection_policy or os.getenv("DATAFORSEO_LLM_MENTIONS_POLICY", LLM_MENTIONS_FIRST_NON_EMPTY)
+            
+            now = datetime.now().timestamp()
+            filters_key = json.dumps(filters, sort_keys=True, default=str) if filters else ""
+            base_cache_key = f"llm_mentions_{target_type}_{target}_{location_name}_{limit}_{hash(filters_key)}"
+            platform_hint_key = f"llm_mentions_platform_{target_type}_{target}_{location_name}"
+            
+            # A platform already known to have data for this target/location is used alone
+            if len(platforms_to_try) > 1 and platform_hint_key in self._cache:
+                hinted_platform, ts = self._cache[platform_hint_key]
+                if hinted_platform in platforms_to_try and now - ts < self._cache_ttl:
+                    platforms_to_try = [hinted_platform]
+            
+            # (total_count, processed result) per platform, in the order answers arrived;
+            # None marks a failed platform
+            outcomes: Dict[str, Optional[Tuple[int, Optional[Dict[str, Any]]]]] = {}
+            uncached_platforms = []
             for platform_to_try in platforms_to_try:
+                cache_key = f"{base_cache_key}_{platform_to_try}"
+                if cache_key in self._cache:
+                    cached_outcome, ts = self._cache[cache_key]
+                    if now - ts < self._cache_ttl:
+                        logger.info(f"✅ Cache HIT for LLM mentions: '{target}' on '{platform_to_try}' in '{location_name}'")
+                        outcomes[platform_to_try] = cached_outcome
+                        continue
+                uncached_platforms.append(platform_to_try)
+            
+            async def query_platform(platform_to_try: str) -> Optional[Tuple[int, Optional[Dict[str, Any]]]]:
+                endpoint = "ai_optimization/llm_mentions/search/live"
+                scope = f"{platform_to_try}:{location_name}"
+                blocked = await self.capabilities.blocked(tenant_id, endpoint, scope)
+                if blocked is not None:
+                    logger.info(f"Skipping LLM mentions platform '{platform_to_try}' for '{location_name}': cached {blocked.status}")
+                    return None
                 try:
                     # Note: AI optimization LLM mentions endpoint doesn't accept language_code parameter
                     payload = [{
@@ -2605,51 +2733,64 @@ class DataForSEOClient:
                     if filters:
                         payload[0]["filters"] = filters
                     
-                    logger.info(f"Trying LLM mentions API with platform='{platform_to_try}' for keyword='{target}' in location='{location_name}'")
-                    data = await self._make_request("ai_optimization/llm_mentions/search/live", payload, tenant_id)
+                    logger.info(f"Querying LLM mentions API with platform='{platform_to_try}' for keyword='{target}' in location='{location_name}'")
+                    data = await self._make_request(endpoint, payload, tenant_id)
                     
-                    # Check if we got results
-                    if data.get("tasks") and len(data["tasks"]) > 0:
-                        task = data["tasks"][0]
-                        if task.get('status_code') == 20000:
-                            result_list = task.get("result", [])
-                            if result_list and len(result_list) > 0:
-                                first_result = result_list[0]
-                                total_count = first_result.get('total_count', 0)
-                                
-                                # If we have data, process it and use it
-                                if total_count > 0:
-                                    logger.info(f"✅ Platform '{platform_to_try}' returned {total_count:,} mentions for '{target}'")
-                                    # Process this result
-                                    processed_result = self._process_llm_mentions_response(
-                                        data, platform_to_try, target, target_type, limit
-                                    )
-                                    if processed_result:
-                                        # This platform has data, use it
-                                        best_result = processed_result
-                                        best_total_count = total_count
-                                        break  # Found data, stop trying other platforms
-                                    elif total_count > best_total_count:
-                                        # Keep track of best result even if processing failed
-                                        best_result = processed_result
-                                        best_total_count = total_count
-                                else:
-                                    logger.info(f"Platform '{platform_to_try}' returned 0 mentions, trying next platform...")
-                            else:
-                                logger.debug(f"Platform '{platform_to_try}' returned no result data")
-                        else:
-                            logger.warning(f"Platform '{platform_to_try}' returned error: {task.get('status_code')} - {task.get('status_message')}")
-                            last_error = f"{task.get('status_code')} - {task.get('status_message')}"
-                    else:
+                    if not data.get("tasks"):
                         logger.warning(f"Platform '{platform_to_try}' returned no tasks")
+                        return None
+                    task = data["tasks"][0]
+                    await self.capabilities.record(
+                        tenant_id, endpoint, task.get("status_code"), task.get("status_message"), scope=scope
+                    )
+                    if task.get("status_code") != 20000:
+                        logger.warning(f"Platform '{platform_to_try}' returned error: {task.get('status_code')} - {task.get('status_message')}")
+                        return None
+                    
+                    result_list = task.get("result") or []
+                    total_count = (result_list[0].get("total_count", 0) or 0) if result_list else 0
+                    processed_result = None
+                    if total_count > 0:
+                        logger.info(f"✅ Platform '{platform_to_try}' returned {total_count:,} mentions for '{target}'")
+                        processed_result = self._process_llm_mentions_response(
+                            data, platform_to_try, target, target_type, limit
+                        )
+                    else:
+                        logger.info(f"Platform '{platform_to_try}' returned 0 mentions")
+                    outcome = (total_count, processed_result)
+                    # Empty answers are cached too so they aren't paid for again
+                    self._cache[f"{base_cache_key}_{platform_to_try}"] = (outcome, datetime.now().timestamp())
+                    return outcome
                 except Exception as e:
-                    logger.warning(f"Error trying platform '{platform_to_try}': {e}")
-                    last_error = str(e)
-                    continue
+                    logger.warning(f"Error querying platform '{platform_to_try}': {e}")
+                    return None
+            
+            def has_data(outcome: Optional[Tuple[int, Optional[Dict[str, Any]]]]) -> bool:
+                return bool(outcome and outcome[0] > 0 and outcome[1])
             
-            # Use best result if found, otherwise return empty result
-            if best_result:
-                logger.info(f"✅ Using LLM mentions data from platform '{best_result.get('platform', 'unknown')}' with {best_result.get('mentions_count', 0):,} mentions")
+            decided = policy != LLM_MENTIONS_BEST and any(has_data(o) for o in outcomes.values())
+            if uncached_platforms and not decided:
+                tasks = {asyncio.create_task(query_platform(p)): p for p in uncached_platforms}
+                pending = set(tasks)
+                try:
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            outcomes[tasks[task]] = task.result()
+                        if policy != LLM_MENTIONS_BEST and any(has_data(outcomes[tasks[t]]) for t in done):
+                            break
+                finally:
+                    for task in pending:
+                        task.cancel()
+            
+            with_data = [(p, o) for p, o in outcomes.items() if has_data(o)]
+            if with_data:
+                if policy == LLM_MENTIONS_BEST:
+                    # Ties keep platform preference order
+                    with_data.sort(key=lambda item: (-item[1][0], platforms_to_try.index(item[0])))
+                chosen_platform, (total_count, best_result) = with_data[0]
+                self._cache[platform_hint_key] = (chosen_platform, datetime.now().timestamp())
+                logger.info(f"✅ Using LLM mentions data from platform '{chosen_platform}' with {best_result.get('mentions_count', 0):,} mentions")
                 return best_result
             else:
                 logger.warning(f"⚠️  No LLM mentions data found for '{target}' in '{location_name}' after trying {len(platforms_to_try)} platforms")
@@ -3151,7 +3292,8 @@ class EnhancedKeywordAnalyzer:
         """
         self.use_dataforseo = use_dataforseo
         if use_dataforseo and credential_service:
-            self.dataforseo_client = DataForSEOClient(credential_service=credential_service)
+            from .dataforseo_clients import get_dataforseo_client
+            self.dataforseo_client = get_dataforseo_client(credential_service=credential_service)
         else:
             self.dataforseo_client = None
     
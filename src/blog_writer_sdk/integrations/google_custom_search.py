@@ -6,30 +6,247 @@ using Google Custom Search API.
 """
 
 import os
+import time
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from urllib.parse import quote_plus
 import logging
 
+from ..cache.redis_cache import get_cache_manager
+from ..monitoring.tracing import SpanKind, traced
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
 logger = logging.getLogger(__name__)
 
+# Seconds a cached result set counts as fresh, per calling method.
+# Recency searches go stale quickly; source and brand lookups barely change.
+DEFAULT_CACHE_TTLS: Dict[str, int] = {
+    "search": 6 * 3600,
+    "recent": 3600,
+    "sources": 24 * 3600,
+    "competitors": 12 * 3600,
+    "products": 24 * 3600,
+}
+
+_CACHE_PREFIX = "blogwriter:cse"
+
+SearchKey = Tuple[str, int, str, str, str, str]
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query for cache keys (case and whitespace)."""
+    return " ".join(query.split()).casefold()
+
+
+class SearchQuotaTracker:
+    """
+    Daily Custom Search quota budget.
+
+    Counts API requests (one per result page) against the daily limit, which
+    Google resets at midnight Pacific time. Once the remaining budget drops to
+    the reserve, callers serve stale cached results instead of spending it.
+    Counts are per process; a quota error from the API marks the day as
+    exhausted, which keeps instances that undercount from retrying.
+    """
+
+    def __init__(
+        self,
+        daily_limit: Optional[int] = None,
+        reserve: Optional[float] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            daily_limit: API requests allowed per day
+                (env GOOGLE_CUSTOM_SEARCH_DAILY_QUOTA, default 100)
+            reserve: Fraction of the daily limit kept back for uncached queries
+                (env GOOGLE_CUSTOM_SEARCH_QUOTA_RESERVE, default 0.2)
+            clock: Wall clock (overridable in tests)
+        """
+        self.daily_limit = daily_limit or int(os.getenv("GOOGLE_CUSTOM_SEARCH_DAILY_QUOTA", "100"))
+        if reserve is None:
+            reserve = float(os.getenv("GOOGLE_CUSTOM_SEARCH_QUOTA_RESERVE", "0.2"))
+        self.reserve = max(0, int(self.daily_limit * reserve))
+        self._clock = clock
+        self._day = self._today()
+        self.used = 0
+        self.exhausted = False
+
+    def _today(self) -> str:
+        return datetime.fromtimestamp(self._clock(), QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+    def _roll(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self.used = 0
+            self.exhausted = False
+
+    def remaining(self) -> int:
+        """API requests left today."""
+        self._roll()
+        return 0 if self.exhausted else max(0, self.daily_limit - self.used)
+
+    def is_low(self) -> bool:
+        """Whether the budget is down to the reserve."""
+        return self.remaining() <= self.reserve
+
+    def record(self, requests: int = 1) -> None:
+        """Count API requests made."""
+        self._roll()
+        self.used += requests
+
+    def mark_exhausted(self) -> None:
+        """Record that the API reported the quota as exceeded."""
+        self._roll()
+        self.exhausted = True
+
+    def snapshot(self) -> Dict[str, Any]:
+        remaining = self.remaining()
+        return {
+            "day": self._day,
+            "daily_limit": self.daily_limit,
+            "used": self.used,
+            "remaining": remaining,
+            "reserve": self.reserve,
+            "exhausted": self.exhausted,
+        }
+
+
+class SearchResultCache:
+    """
+    Search results keyed by normalized query and search parameters.
+
+    Entries are kept well past their freshness TTL so they can be served
+    stale when the quota runs low. They live in a bounded in-process LRU
+    and are written through to the shared cache manager (Redis when
+    configured) so every instance benefits.
+    """
+
+    def __init__(
+        self,
+        stale_ttl: Optional[int] = None,
+        max_entries: int = 5000,
+        cache_manager_getter: Callable[[], Any] = get_cache_manager,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            stale_ttl: Seconds entries are kept for stale serving
+                (env GOOGLE_CUSTOM_SEARCH_STALE_SECONDS, default 7 days)
+            max_entries: In-process LRU size
+            cache_manager_getter: Returns the shared CacheManager (or None)
+            clock: Wall clock (overridable in tests)
+        """
+        self.stale_ttl = stale_ttl or int(os.getenv("GOOGLE_CUSTOM_SEARCH_STALE_SECONDS", str(7 * 86400)))
+        self.max_entries = max_entries
+        self._cache_manager_getter = cache_manager_getter
+        self._clock = clock
+        self._entries: "OrderedDict[SearchKey, Tuple[List[Dict[str, Any]], float]]" = OrderedDict()
+
+    @staticmethod
+    def _remote_key(key: SearchKey) -> str:
+        return f"{_CACHE_PREFIX}:" + "|".join(str(part) for part in key)
+
+    async def get(self, key: SearchKey) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """
+        Look up a result set.
+
+        Returns:
+            (results, age_seconds) or None when nothing usable is cached
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[1] + self.stale_ttl > now:
+                self._entries.move_to_end(key)
+                return entry[0], now - entry[1]
+            del self._entries[key]
+
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is not None:
+            try:
+                stored = await cache_manager.get(self._remote_key(key))
+            except Exception as e:
+                logger.warning(f"Search cache read failed: {e}")
+                stored = None
+            if isinstance(stored, dict) and stored.get("fetched_at", 0) + self.stale_ttl > now:
+                entry = (stored.get("results") or [], stored["fetched_at"])
+                self._put_local(key, entry)
+                return entry[0], now - entry[1]
+        return None
+
+    async def set(self, key: SearchKey, results: List[Dict[str, Any]]) -> None:
+        """Store a complete result set."""
+        entry = (results, self._clock())
+        self._put_local(key, entry)
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is not None:
+            try:
+                await cache_manager.set(
+                    self._remote_key(key),
+                    {"results": results, "fetched_at": entry[1]},
+                    ttl=self.stale_ttl,
+                )
+            except Exception as e:
+                logger.warning(f"Search cache write failed: {e}")
+
+    def _put_local(self, key: SearchKey, entry: Tuple[List[Dict[str, Any]], float]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 
 class GoogleCustomSearchClient:
-    """Client for Google Custom Search API."""
+    """
+    Client for Google Custom Search API.
+    
+    Features:
+    - Result cache on normalized queries with per-method freshness TTLs
+    - Concurrent identical searches share one API call
+    - Daily quota budget; stale results are served once it runs low
+    """
     
-    def __init__(self, api_key: Optional[str] = None, search_engine_id: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_engine_id: Optional[str] = None,
+        cache_ttls: Optional[Dict[str, int]] = None,
+        result_cache: Optional[SearchResultCache] = None,
+        quota: Optional[SearchQuotaTracker] = None
+    ):
         """
         Initialize Google Custom Search client.
         
         Args:
             api_key: Google Custom Search API key (or from GOOGLE_CUSTOM_SEARCH_API_KEY env)
             search_engine_id: Custom Search Engine ID (or from GOOGLE_CUSTOM_SEARCH_ENGINE_ID env)
+            cache_ttls: Freshness TTL overrides per method (see DEFAULT_CACHE_TTLS)
+            result_cache: Result cache (a new SearchResultCache by default)
+            quota: Daily quota tracker (a new SearchQuotaTracker by default)
         """
         self.api_key = api_key or os.getenv("GOOGLE_CUSTOM_SEARCH_API_KEY")
         self.search_engine_id = search_engine_id or os.getenv("GOOGLE_CUSTOM_SEARCH_ENGINE_ID")
         self.base_url = "https://www.googleapis.com/customsearch/v1"
         self.session: Optional[aiohttp.ClientSession] = None
+        self.cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        self.result_cache = result_cache or SearchResultCache()
+        self.quota = quota or SearchQuotaTracker()
+        self._inflight: Dict[Tuple[int, SearchKey], "asyncio.Future[Tuple[List[Dict[str, Any]], bool]]"] = {}
+        self._stats = {"api_searches": 0, "cache_hits": 0, "stale_served": 0, "deduplicated": 0, "quota_skipped": 0}
         
         if not self.api_key or not self.search_engine_id:
             logger.warning("Google Custom Search API credentials not configured")
@@ -51,11 +268,16 @@ class GoogleCustomSearchClient:
         language: str = "en",
         country: str = "us",
         date_restrict: Optional[str] = None,
-        safe: str = "active"
+        safe: str = "active",
+        cache_kind: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Perform a Google Custom Search.
         
+        Results are served from cache while fresh for ``cache_kind``. When the
+        daily quota is down to its reserve, any cached result is served
+        instead of calling the API.
+        
         Args:
             query: Search query
             num_results: Number of results to return (max 10 per request)
@@ -63,6 +285,8 @@ class GoogleCustomSearchClient:
             country: Country code (e.g., 'us')
             date_restrict: Date restriction (e.g., 'd7' for past week, 'm1' for past month)
             safe: Safe search level ('active', 'off')
+            cache_kind: Freshness TTL to apply (defaults to 'recent' with a
+                date restriction, otherwise 'search')
         
         Returns:
             List of search results with title, link, snippet, etc.
@@ -71,9 +295,75 @@ class GoogleCustomSearchClient:
             logger.warning("Google Custom Search not configured, returning empty results")
             return []
         
+        kind = cache_kind or ("recent" if date_restrict else "search")
+        key: SearchKey = (normalize_query(query), num_results, language, country, date_restrict or "", safe)
+        cached = await self.result_cache.get(key)
+        if cached is not None:
+            results, age = cached
+            if age < self.cache_ttls.get(kind, self.cache_ttls["search"]):
+                self._stats["cache_hits"] += 1
+                return [dict(r) for r in results]
+            if self.quota.is_low():
+                self._stats["stale_served"] += 1
+                logger.info(f"Custom Search quota low, serving stale results for '{query}'")
+                return [dict(r) for r in results]
+        if self.quota.remaining() <= 0:
+            self._stats["quota_skipped"] += 1
+            logger.warning(f"Custom Search daily quota exhausted, skipping '{query}'")
+            return []
+        
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            self._stats["deduplicated"] += 1
+            results, _ = await asyncio.shield(pending)
+            return [dict(r) for r in results]
+        
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = pending
+        try:
+            results, complete = await self._fetch_results(
+                query, num_results, language, country, date_restrict, safe
+            )
+            if complete:
+                await self.result_cache.set(key, results)
+            elif not results and cached is not None:
+                # API failed: stale data beats an empty answer
+                self._stats["stale_served"] += 1
+                results = cached[0]
+            pending.set_result((results, complete))
+        except asyncio.CancelledError:
+            pending.set_result((cached[0] if cached else [], False))
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            pending.exception()  # retrieved here; waiters re-raise it
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+        return [dict(r) for r in results]
+    
+    @traced("google custom_search", SpanKind.UPSTREAM)
+    async def _fetch_results(
+        self,
+        query: str,
+        num_results: int,
+        language: str,
+        country: str,
+        date_restrict: Optional[str],
+        safe: str
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Call the API, paging as needed.
+        
+        Returns:
+            (results, complete) where complete is False if any page failed
+        """
         if not self.session:
             self.session = aiohttp.ClientSession()
         
+        self._stats["api_searches"] += 1
+        complete = True
         results = []
         start_index = 1
         
@@ -96,6 +386,11 @@ class GoogleCustomSearchClient:
             if date_restrict:
                 params["dateRestrict"] = date_restrict
             
+            if self.quota.remaining() <= 0:
+                complete = False
+                break
+            
+            self.quota.record()
             try:
                 async with self.session.get(self.base_url, params=params) as response:
                     if response.status == 200:
@@ -119,13 +414,25 @@ class GoogleCustomSearchClient:
                     else:
                         error_text = await response.text()
                         logger.error(f"Google Custom Search API error: {response.status} - {error_text}")
+                        if response.status == 429 or "quota" in error_text.lower() or "ratelimitexceeded" in error_text.lower():
+                            self.quota.mark_exhausted()
+                        complete = False
                         break
                         
             except Exception as e:
                 logger.error(f"Error performing Google Custom Search: {e}")
+                complete = False
                 break
         
-        return results[:num_results]
+        return results[:num_results], complete
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache, dedup and quota counters."""
+        return {
+            **self._stats,
+            "cached_queries": len(self.result_cache._entries),
+            "quota": self.quota.snapshot(),
+        }
     
     async def search_for_sources(
         self,
@@ -145,7 +452,7 @@ class GoogleCustomSearchClient:
             List of authoritative sources
         """
         query = f"{topic} {' '.join(keywords[:3])}"
-        results = await self.search(query, num_results=num_results)
+        results = await self.search(query, num_results=num_results, cache_kind="sources")
         
         # Filter for authoritative domains (can be customized)
         authoritative_domains = [
@@ -208,7 +515,8 @@ class GoogleCustomSearchClient:
         results = await self.search(
             topic,
             num_results=10,
-            date_restrict=date_restrict
+            date_restrict=date_restrict,
+            cache_kind="recent"
         )
         
         return results
@@ -228,7 +536,7 @@ class GoogleCustomSearchClient:
         Returns:
             Analysis of competitor content
         """
-        results = await self.search(keyword, num_results=num_results)
+        results = await self.search(keyword, num_results=num_results, cache_kind="competitors")
         
         analysis = {
             "keyword": keyword,
@@ -267,7 +575,7 @@ class GoogleCustomSearchClient:
         """
         # Search for product reviews and comparisons
         query = f"{product_query} brands models review comparison"
-        results = await self.search(query, num_results=num_results)
+        results = await self.search(query, num_results=num_results, cache_kind="products")
         
         # Extract brand names from results
         brands = []
@@ -6,28 +6,221 @@ using Google Knowledge Graph API.
 """
 
 import os
+import re
+import time
 import asyncio
 import aiohttp
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from urllib.parse import quote_plus
 import logging
 
+from ..cache.redis_cache import get_cache_manager
+from ..monitoring.tracing import SpanKind, traced
+
 logger = logging.getLogger(__name__)
 
+# Capitalized phrases ("New York", "Google Cloud") as entity candidates
+ENTITY_SPAN_PATTERN = re.compile(r'\b[A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+)*\b')
+SENTENCE_START_PATTERN = re.compile(r'(?:^|[.!?:]\s+|\n\s*(?:[#>*-]+\s*)?)$')
+MAX_ENTITY_WORDS = 3
+
+# Capitalized words that are almost never entities on their own
+NON_ENTITY_WORDS = frozenset({
+    "The", "This", "That", "These", "Those", "There", "Their", "They", "Then",
+    "What", "When", "Where", "Which", "Who", "Why", "How", "If", "It", "Its",
+    "In", "On", "At", "For", "From", "With", "By", "To", "Of", "And", "But",
+    "Or", "So", "As", "An", "A", "We", "You", "Your", "Our", "My", "He", "She",
+    "Is", "Are", "Be", "Can", "Will", "Do", "Does", "Not", "No", "Yes", "All",
+    "Some", "Many", "Most", "More", "Each", "Every", "Here", "Also", "However",
+    "First", "Next", "Finally", "Step", "Conclusion", "Introduction", "Summary",
+})
+
+_CACHE_PREFIX = "blogwriter:kg_entity"
+
+
+def normalize_entity_name(name: str) -> str:
+    """Case- and whitespace-insensitive entity key."""
+    return " ".join(name.split()).casefold()
+
+
+def score_entity_candidates(content: str, limit: int = 10) -> List[str]:
+    """
+    Rank capitalized spans in content by how likely they are entities.
+
+    Spans are scored by frequency, with a bonus for multi-word names and a
+    penalty for single words that only ever appear at the start of a
+    sentence (where any word is capitalized).
+
+    Args:
+        content: Text to scan
+        limit: Maximum candidates returned
+
+    Returns:
+        Candidate names, best first (ties keep first appearance order)
+    """
+    stats: Dict[str, List[Any]] = {}  # key -> [name, count, mid_sentence_count, first_position]
+    for position, match in enumerate(ENTITY_SPAN_PATTERN.finditer(content)):
+        words = match.group(0).split()
+        start = match.start()
+        # Drop leading function words ("The Google Cloud" -> "Google Cloud")
+        while words and words[0] in NON_ENTITY_WORDS:
+            start = content.index(words[1], start) if len(words) > 1 else start
+            words = words[1:]
+        if not words or len(words) > MAX_ENTITY_WORDS:
+            continue
+        name = " ".join(words)
+        key = normalize_entity_name(name)
+        entry = stats.get(key)
+        if entry is None:
+            entry = stats[key] = [name, 0, 0, position]
+        entry[1] += 1
+        if not SENTENCE_START_PATTERN.search(content, 0, start):
+            entry[2] += 1
+
+    scored = []
+    for name, count, mid_sentence, first_position in stats.values():
+        words = len(name.split())
+        if words == 1 and mid_sentence == 0:
+            # Only seen sentence-initially: weak evidence
+            score = count * 0.25
+        else:
+            score = count + mid_sentence * 0.5
+        score *= 1 + 0.5 * (words - 1)
+        scored.append((-score, first_position, name))
+    scored.sort()
+    return [name for _, _, name in scored[:limit]]
+
+
+class EntityCache:
+    """
+    Resolved-entity cache keyed by normalized name and language.
+
+    Found entities are kept for a long TTL, names the Knowledge Graph
+    doesn't know are cached as negative entries with a shorter TTL. Entries
+    live in a bounded in-process LRU and are written through to the shared
+    cache manager (Redis when configured) so they survive restarts and are
+    shared across instances.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[int] = None,
+        negative_ttl: Optional[int] = None,
+        max_entries: int = 10000,
+        cache_manager_getter: Callable[[], Any] = get_cache_manager,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds found entities are kept
+                (env KNOWLEDGE_GRAPH_ENTITY_TTL_SECONDS, default 30 days)
+            negative_ttl: Seconds unknown names are kept
+                (env KNOWLEDGE_GRAPH_NEGATIVE_TTL_SECONDS, default 1 day)
+            max_entries: In-process LRU size
+            cache_manager_getter: Returns the shared CacheManager (or None)
+            clock: Wall clock (overridable in tests)
+        """
+        self.ttl = ttl or int(os.getenv("KNOWLEDGE_GRAPH_ENTITY_TTL_SECONDS", str(30 * 86400)))
+        self.negative_ttl = negative_ttl or int(os.getenv("KNOWLEDGE_GRAPH_NEGATIVE_TTL_SECONDS", "86400"))
+        self.max_entries = max_entries
+        self._cache_manager_getter = cache_manager_getter
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _remote_key(key: Tuple[str, str]) -> str:
+        name, language = key
+        return f"{_CACHE_PREFIX}:{language}:{name}"
+
+    async def get(self, name: str, language: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a name.
+
+        Returns:
+            (found_in_cache, entity) where entity is None for negative entries
+        """
+        key = (normalize_entity_name(name), language)
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            del self._entries[key]
+
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is not None:
+            try:
+                stored = await cache_manager.get(self._remote_key(key))
+            except Exception as e:
+                logger.warning(f"Entity cache read failed: {e}")
+                stored = None
+            if isinstance(stored, dict) and stored.get("expires_at", 0) > now:
+                self._put_local(key, stored.get("entity"), stored["expires_at"])
+                self.hits += 1
+                return True, stored.get("entity")
+
+        self.misses += 1
+        return False, None
+
+    async def set(self, name: str, language: str, entity: Optional[Dict[str, Any]]) -> None:
+        """Store a lookup result (None for names the Knowledge Graph doesn't know)."""
+        key = (normalize_entity_name(name), language)
+        ttl = self.ttl if entity is not None else self.negative_ttl
+        expires_at = self._clock() + ttl
+        self._put_local(key, entity, expires_at)
+        cache_manager = self._cache_manager_getter()
+        if cache_manager is not None:
+            try:
+                await cache_manager.set(
+                    self._remote_key(key), {"entity": entity, "expires_at": expires_at}, ttl=ttl
+                )
+            except Exception as e:
+                logger.warning(f"Entity cache write failed: {e}")
+
+    def _put_local(self, key: Tuple[str, str], entity: Optional[Dict[str, Any]], expires_at: float) -> None:
+        self._entries[key] = (entity, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 
 class GoogleKnowledgeGraphClient:
-    """Client for Google Knowledge Graph API."""
+    """
+    Client for Google Knowledge Graph API.
     
-    def __init__(self, api_key: Optional[str] = None):
+    Features:
+    - Entity resolution with bounded concurrent lookups
+    - Persistent entity cache (normalized name + language) with negative entries
+    - Scored candidate extraction from content before any lookup
+    """
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        entity_cache: Optional[EntityCache] = None
+    ):
         """
         Initialize Google Knowledge Graph client.
         
         Args:
             api_key: Google Knowledge Graph API key (or from GOOGLE_KNOWLEDGE_GRAPH_API_KEY env)
+            max_concurrency: Concurrent entity lookups
+                (env KNOWLEDGE_GRAPH_MAX_CONCURRENCY, default 8)
+            entity_cache: Cache for resolved entities (created if omitted)
         """
         self.api_key = api_key or os.getenv("GOOGLE_KNOWLEDGE_GRAPH_API_KEY")
         self.base_url = "https://kgsearch.googleapis.com/v1/entities:search"
         self.session: Optional[aiohttp.ClientSession] = None
+        self.max_concurrency = max_concurrency or int(os.getenv("KNOWLEDGE_GRAPH_MAX_CONCURRENCY", "8"))
+        self.entity_cache = entity_cache or EntityCache()
         
         if not self.api_key:
             logger.warning("Google Knowledge Graph API key not configured")
@@ -63,9 +256,21 @@ class GoogleKnowledgeGraphClient:
         Returns:
             List of entity results
         """
+        return await self._search(query, limit, languages, types, indent) or []
+    
+    @traced("google knowledge_graph", SpanKind.UPSTREAM)
+    async def _search(
+        self,
+        query: str,
+        limit: int = 10,
+        languages: List[str] = None,
+        types: List[str] = None,
+        indent: bool = True
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Search entities; returns None on errors so they aren't cached as misses."""
         if not self.api_key:
             logger.warning("Knowledge Graph API key not configured")
-            return []
+            return None
         
         if not self.session:
             self.session = aiohttp.ClientSession()
@@ -106,10 +311,10 @@ class GoogleKnowledgeGraphClient:
                 else:
                     error_text = await response.text()
                     logger.error(f"Knowledge Graph API error: {response.status} - {error_text}")
-                    return []
+                    return None
         except Exception as e:
             logger.error(f"Error querying Knowledge Graph: {e}")
-            return []
+            return None
     
     async def get_entity_details(
         self,
@@ -126,46 +331,84 @@ class GoogleKnowledgeGraphClient:
         Returns:
             Entity details or None
         """
-        entities = await self.search_entities(
-            query=entity_name,
-            limit=1,
-            languages=[language]
-        )
+        resolved = await self.resolve_entities([entity_name], language)
+        return resolved.get(entity_name)
+    
+    async def resolve_entities(
+        self,
+        names: List[str],
+        language: str = "en"
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Resolve many names at once.
+        
+        Cached names (found or known-unknown) are answered without a request;
+        the rest are looked up concurrently, at most ``max_concurrency`` at a
+        time, and cached. Names differing only in case/whitespace share one
+        lookup. Failed lookups are not cached.
+        
+        Args:
+            names: Entity names
+            language: Language code
+        
+        Returns:
+            Mapping of each input name to its entity (None if not found)
+        """
+        resolved: Dict[str, Optional[Dict[str, Any]]] = {}
+        to_fetch: Dict[str, List[str]] = {}  # normalized name -> input spellings
+        for name in names:
+            if name in resolved:
+                continue
+            key = normalize_entity_name(name)
+            if key in to_fetch:
+                to_fetch[key].append(name)
+                continue
+            cached, entity = await self.entity_cache.get(name, language)
+            if cached:
+                resolved[name] = entity
+            else:
+                to_fetch[key] = [name]
+        
+        if not to_fetch:
+            return resolved
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def lookup(spellings: List[str]) -> None:
+            async with semaphore:
+                entities = await self._search(query=spellings[0], limit=1, languages=[language])
+            entity = entities[0] if entities else None
+            if entities is not None:
+                await self.entity_cache.set(spellings[0], language, entity)
+            for spelling in spellings:
+                resolved[spelling] = entity
         
-        if entities:
-            return entities[0]
-        return None
+        await asyncio.gather(*(lookup(spellings) for spellings in to_fetch.values()))
+        return resolved
     
     async def extract_entities_from_content(
         self,
         content: str,
-        limit: int = 10
+        limit: int = 10,
+        language: str = "en"
     ) -> List[Dict[str, Any]]:
         """
         Extract entities mentioned in content.
         
         Args:
             content: Content to analyze
-            limit: Maximum number of entities to extract
+            limit: Maximum number of candidate names to resolve
+            language: Language code
         
         Returns:
-            List of extracted entities
+            List of extracted entities, most prominent candidates first
         """
-        # Simple extraction: look for capitalized phrases
-        # In production, could use NLP for better extraction
-        import re
-        potential_entities = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', content)
-        
-        unique_entities = list(set(potential_entities))[:limit]
-        
-        extracted = []
-        for entity_name in unique_entities:
-            if len(entity_name.split()) <= 3:  # Limit to reasonable entity names
-                entity_details = await self.get_entity_details(entity_name)
-                if entity_details:
-                    extracted.append(entity_details)
+        candidates = score_entity_candidates(content, limit)
+        if not candidates:
+            return []
         
-        return extracted
+        resolved = await self.resolve_entities(candidates, language)
+        return [resolved[name] for name in candidates if resolved.get(name)]
     
     def generate_schema_markup(
         self,
@@ -234,11 +477,11 @@ class GoogleKnowledgeGraphClient:
         Returns:
             Complete structured data schema
         """
-        # Get main entity
-        main_entity = await self.get_entity_details(topic)
-        
-        # Extract related entities
-        related_entities = await self.extract_entities_from_content(content, limit=5)
+        # Resolve the main entity and related entities concurrently
+        main_entity, related_entities = await asyncio.gather(
+            self.get_entity_details(topic),
+            self.extract_entities_from_content(content, limit=5)
+        )
         
         # Build comprehensive schema
         schema = {
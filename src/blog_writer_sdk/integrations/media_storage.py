@@ -7,9 +7,13 @@ blog-related media assets.
 """
 
 import os
+import io
+import random
+import asyncio
+import hashlib
 import logging
 import httpx
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, BinaryIO, Callable, Awaitable
 from datetime import datetime
 import base64
 import json
@@ -18,13 +22,84 @@ from abc import ABC, abstractmethod
 from ..models.blog_models import BlogPost, BlogGenerationResult
 
 
+# Media can be passed fully buffered or as a readable binary stream
+MediaData = Union[bytes, BinaryIO]
+
+# Files above this size are uploaded in chunks / multipart
+STREAMING_UPLOAD_THRESHOLD = 8 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class _SharedStream(io.RawIOBase):
+    """Read-only view of a caller's stream that survives clients closing it."""
+
+    def __init__(self, stream: BinaryIO):
+        super().__init__()
+        self._stream = stream
+        self.name = getattr(stream, "name", None)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def close(self) -> None:
+        # Leave the underlying stream open so retries can rewind it
+        pass
+
+
+def open_media_stream(media_data: MediaData) -> BinaryIO:
+    """Return a rewound, readable stream over buffered or streamed media."""
+    if isinstance(media_data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(bytes(media_data))
+    media_data.seek(0)
+    return _SharedStream(media_data)
+
+
+def media_size(media_data: MediaData) -> int:
+    """Size of the media in bytes without reading it into memory."""
+    if isinstance(media_data, (bytes, bytearray, memoryview)):
+        return len(media_data)
+    position = media_data.tell()
+    size = media_data.seek(0, io.SEEK_END)
+    media_data.seek(position)
+    return size
+
+
+def media_content_hash(media_data: MediaData, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of the media, read in chunks for streams."""
+    if isinstance(media_data, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(media_data).hexdigest()
+    digest = hashlib.sha256()
+    media_data.seek(0)
+    for chunk in iter(lambda: media_data.read(chunk_size), b""):
+        digest.update(chunk)
+    media_data.seek(0)
+    return digest.hexdigest()
+
+
 class MediaStorageProvider(ABC):
     """Abstract base class for media storage providers."""
     
     @abstractmethod
     async def upload_media(
         self, 
-        media_data: bytes, 
+        media_data: MediaData, 
         filename: str,
         folder: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -80,7 +155,7 @@ class CloudinaryStorage(MediaStorageProvider):
     
     async def upload_media(
         self, 
-        media_data: bytes, 
+        media_data: MediaData, 
         filename: str,
         folder: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -88,8 +163,11 @@ class CloudinaryStorage(MediaStorageProvider):
         """
         Upload media to Cloudinary.
         
+        Files larger than STREAMING_UPLOAD_THRESHOLD are sent with chunked
+        upload_large so they are never posted as a single request body.
+        
         Args:
-            media_data: Media file data
+            media_data: Media file data (bytes or binary stream)
             filename: Original filename
             folder: Upload folder (overrides default)
             metadata: Additional metadata
@@ -121,11 +199,22 @@ class CloudinaryStorage(MediaStorageProvider):
             if metadata:
                 upload_options.update(metadata)
             
-            # Upload to Cloudinary
-            result = cloudinary.uploader.upload(
-                media_data,
-                **upload_options
-            )
+            # Upload to Cloudinary (SDK is synchronous; keep it off the event loop)
+            stream = open_media_stream(media_data)
+            if media_size(media_data) > STREAMING_UPLOAD_THRESHOLD:
+                result = await asyncio.to_thread(
+                    cloudinary.uploader.upload_large,
+                    stream,
+                    chunk_size=UPLOAD_CHUNK_SIZE,
+                    filename=filename,
+                    **upload_options
+                )
+            else:
+                result = await asyncio.to_thread(
+                    cloudinary.uploader.upload,
+                    stream,
+                    **upload_options
+                )
             
             self.logger.info(f"Uploaded media to Cloudinary: {result['public_id']}")
             
@@ -249,11 +338,27 @@ class CloudflareR2Storage(MediaStorageProvider):
         # R2 endpoint
         self.endpoint_url = f"https://{self.account_id}.r2.cloudflarestorage.com"
         
+        self._s3_client = None
         self.logger = logging.getLogger(__name__)
     
+    def _get_s3_client(self):
+        """Create the S3 client for R2 once and reuse it across uploads."""
+        if self._s3_client is None:
+            import boto3
+            from botocore.client import Config
+            
+            self._s3_client = boto3.client(
+                's3',
+                endpoint_url=self.endpoint_url,
+                aws_access_key_id=self.access_key_id,
+                aws_secret_access_key=self.secret_access_key,
+                config=Config(signature_version='s3v4')
+            )
+        return self._s3_client
+    
     async def upload_media(
         self, 
-        media_data: bytes, 
+        media_data: MediaData, 
         filename: str,
         folder: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None
@@ -261,8 +366,11 @@ class CloudflareR2Storage(MediaStorageProvider):
         """
         Upload media to Cloudflare R2.
         
+        Large files are streamed as an S3 multipart upload instead of a
+        single put_object body.
+        
         Args:
-            media_data: Media file data
+            media_data: Media file data (bytes or binary stream)
             filename: Original filename
             folder: Upload folder
             metadata: Additional metadata
@@ -271,29 +379,28 @@ class CloudflareR2Storage(MediaStorageProvider):
             Dictionary containing upload details
         """
         try:
-            import boto3
-            from botocore.client import Config
+            from boto3.s3.transfer import TransferConfig
             
-            # Create S3 client for R2
-            s3_client = boto3.client(
-                's3',
-                endpoint_url=self.endpoint_url,
-                aws_access_key_id=self.access_key_id,
-                aws_secret_access_key=self.secret_access_key,
-                config=Config(signature_version='s3v4')
-            )
+            s3_client = self._get_s3_client()
             
             # Generate key
             timestamp = datetime.now().strftime("%Y/%m/%d")
             key = f"{folder or 'blog-media'}/{timestamp}/{filename}"
             
-            # Upload to R2
-            s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=media_data,
-                ContentType=self._get_content_type(filename),
-                Metadata=metadata or {}
+            # Upload to R2 (multipart above the threshold; boto3 is synchronous)
+            await asyncio.to_thread(
+                s3_client.upload_fileobj,
+                open_media_stream(media_data),
+                self.bucket_name,
+                key,
+                ExtraArgs={
+                    "ContentType": self._get_content_type(filename),
+                    "Metadata": metadata or {}
+                },
+                Config=TransferConfig(
+                    multipart_threshold=STREAMING_UPLOAD_THRESHOLD,
+                    multipart_chunksize=UPLOAD_CHUNK_SIZE
+                )
             )
             
             # Generate public URL
@@ -309,7 +416,7 @@ class CloudflareR2Storage(MediaStorageProvider):
                 "url": public_url,
                 "bucket": self.bucket_name,
                 "key": key,
-                "size": len(media_data),
+                "size": media_size(media_data),
                 "content_type": self._get_content_type(filename),
                 "created_at": datetime.now().isoformat()
             }
@@ -344,20 +451,12 @@ class CloudflareR2Storage(MediaStorageProvider):
             True if successful
         """
         try:
-            import boto3
-            from botocore.client import Config
-            
-            # Create S3 client for R2
-            s3_client = boto3.client(
-                's3',
-                endpoint_url=self.endpoint_url,
-                aws_access_key_id=self.access_key_id,
-                aws_secret_access_key=self.secret_access_key,
-                config=Config(signature_version='s3v4')
-            )
-            
             # Delete object
-            s3_client.delete_object(Bucket=self.bucket_name, Key=media_id)
+            await asyncio.to_thread(
+                self._get_s3_client().delete_object,
+                Bucket=self.bucket_name,
+                Key=media_id
+            )
             
             self.logger.info(f"Deleted media from Cloudflare R2: {media_id}")
             return True
@@ -400,6 +499,8 @@ class MediaStorageManager:
         """
         self.primary_provider = primary_provider
         self.fallback_providers: List[MediaStorageProvider] = []
+        # One pipeline per folder, so completed uploads are remembered across batches
+        self._upload_pipelines: Dict[Optional[str], "MediaUploadPipeline"] = {}
         self.logger = logging.getLogger(__name__)
     
     def add_fallback_provider(self, provider: MediaStorageProvider):
@@ -408,7 +509,7 @@ class MediaStorageManager:
     
     async def upload_media(
         self, 
-        media_data: bytes, 
+        media_data: MediaData, 
         filename: str,
         folder: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
@@ -486,37 +587,160 @@ class MediaStorageManager:
     async def batch_upload_media(
         self,
         media_files: List[Dict[str, Any]],
-        folder: Optional[str] = None
+        folder: Optional[str] = None,
+        max_concurrency: int = 4,
+        max_attempts: int = 3
     ) -> List[Dict[str, Any]]:
         """
-        Upload multiple media files.
+        Upload multiple media files concurrently.
+        
+        Identical files (by content hash and alt text) are uploaded once. Uploads
+        completed by earlier batches to the same folder are reused, so re-running
+        a partially failed batch only uploads the files that failed.
         
         Args:
             media_files: List of media file dictionaries
             folder: Upload folder
-            
+            max_concurrency: Maximum uploads in flight
+            max_attempts: Attempts per file before reporting an error
+        
         Returns:
-            List of upload results
+            List of upload results, in input order
         """
-        results = []
-        
-        for media_file in media_files:
-            try:
-                result = await self.upload_media(
+        pipeline = self._upload_pipelines.get(folder)
+        if pipeline is None:
+            pipeline = MediaUploadPipeline(
+                upload_fn=lambda media_file: self.upload_media(
                     media_data=media_file["data"],
                     filename=media_file["filename"],
                     folder=folder,
                     metadata=media_file.get("metadata")
                 )
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Failed to upload {media_file.get('filename', 'unknown')}: {str(e)}")
+            )
+            self._upload_pipelines[folder] = pipeline
+        pipeline.max_concurrency = max(1, max_concurrency)
+        pipeline.max_attempts = max(1, max_attempts)
+        return await pipeline.upload_all(media_files)
+
+
+class MediaUploadPipeline:
+    """
+    Bounded-concurrency media uploader with content-hash dedup and per-file retry.
+    
+    Files are deduplicated by content hash and alt text, so identical images
+    with different alt text keep their own upload. Completed uploads are
+    remembered by that key, so calling upload_all again after a partial
+    failure only re-uploads the files that failed.
+    """
+    
+    def __init__(
+        self,
+        upload_fn: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        max_concurrency: int = 4,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5
+    ):
+        """
+        Initialize upload pipeline.
+        
+        Args:
+            upload_fn: Coroutine uploading one media file dict (with "data" and "filename")
+            max_concurrency: Maximum uploads in flight
+            max_attempts: Attempts per file before giving up
+            backoff_base: Base delay in seconds for jittered exponential backoff
+        """
+        self.upload_fn = upload_fn
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.logger = logging.getLogger(__name__)
+    
+    async def upload_all(
+        self,
+        media_files: List[Dict[str, Any]],
+        raise_on_error: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload media files, preserving input order in the results.
+        
+        Args:
+            media_files: Media file dicts with "data" and "filename"
+            raise_on_error: Raise the first failure instead of returning error entries
+        
+        Returns:
+            One result per input file; failures are {"error", "filename"} dicts
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Hashing large files is CPU and I/O bound; keep it off the event loop
+        hashes = await asyncio.to_thread(
+            lambda: [self._dedup_key(f) for f in media_files]
+        )
+        
+        # One upload per unique (content hash, alt text) not already uploaded
+        pending: Dict[str, Dict[str, Any]] = {}
+        for media_file, digest in zip(media_files, hashes):
+            if digest not in self.completed:
+                pending.setdefault(digest, media_file)
+        if len(pending) < len(media_files):
+            self.logger.info(
+                f"Uploading {len(pending)} of {len(media_files)} media files "
+                f"(duplicates and earlier uploads reused)"
+            )
+        
+        async def upload_one(digest: str, media_file: Dict[str, Any]) -> None:
+            async with semaphore:
+                self.completed[digest] = await self._upload_with_retry(media_file)
+        
+        outcomes = await asyncio.gather(
+            *(upload_one(digest, media_file) for digest, media_file in pending.items()),
+            return_exceptions=True
+        )
+        errors = {
+            digest: outcome
+            for digest, outcome in zip(pending.keys(), outcomes)
+            if isinstance(outcome, Exception)
+        }
+        
+        if errors and raise_on_error:
+            raise next(iter(errors.values()))
+        
+        results = []
+        for media_file, digest in zip(media_files, hashes):
+            if digest in errors:
                 results.append({
-                    "error": str(e),
+                    "error": str(errors[digest]),
                     "filename": media_file.get("filename", "unknown")
                 })
-        
+            else:
+                # Copies, so callers annotating one result do not change its duplicates
+                results.append(dict(self.completed[digest]))
         return results
+    
+    @staticmethod
+    def _dedup_key(media_file: Dict[str, Any]) -> str:
+        """Content hash qualified by alt text, so per-image alt text is not lost."""
+        digest = media_content_hash(media_file["data"])
+        alt_text = media_file.get("alt_text") or (media_file.get("metadata") or {}).get("alt_text")
+        return f"{digest}:{alt_text}" if alt_text else digest
+    
+    async def _upload_with_retry(self, media_file: Dict[str, Any]) -> Dict[str, Any]:
+        """Upload one file, retrying with jittered exponential backoff."""
+        filename = media_file.get("filename", "unknown")
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self.upload_fn(media_file)
+            except Exception as e:
+                if attempt >= self.max_attempts:
+                    self.logger.error(f"Failed to upload {filename}: {str(e)}")
+                    raise
+                delay = random.uniform(0, self.backoff_base * (2 ** (attempt - 1)))
+                self.logger.warning(
+                    f"Upload of {filename} failed (attempt {attempt}/{self.max_attempts}): "
+                    f"{str(e)}; retrying in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
 
 
 # Factory functions for easy setup
@@ -18,6 +18,12 @@ except ImportError:
     create_client = None
     Client = None
 
+try:
+    from supabase import acreate_client, AsyncClient
+except ImportError:
+    acreate_client = None
+    AsyncClient = None
+
 from ..models.blog_models import BlogPost, BlogGenerationResult
 
 
@@ -54,8 +60,20 @@ class SupabaseClient:
             raise ValueError("Supabase URL and key are required")
         
         self.client: Client = create_client(self.supabase_url, self.supabase_key)
+        self._async_client: Optional["AsyncClient"] = None
         self.logger = logging.getLogger(__name__)
     
+    async def get_async_client(self) -> Optional["AsyncClient"]:
+        """
+        Lazily create the non-blocking Supabase client.
+        
+        Returns:
+            Async client, or None if the installed supabase package has no async API
+        """
+        if self._async_client is None and acreate_client:
+            self._async_client = await acreate_client(self.supabase_url, self.supabase_key)
+        return self._async_client
+    
     def _get_table_name(self, base_name: str) -> str:
         """
         Get environment-specific table name.
@@ -14,6 +14,7 @@ import base64
 import json
 
 from ..models.blog_models import BlogPost, BlogGenerationResult
+from .media_storage import MediaUploadPipeline
 
 
 class WebflowClient:
@@ -311,6 +312,9 @@ class WebflowPublisher:
         """
         Publish blog post with associated media files.
         
+        Media files are uploaded concurrently (deduplicated by content hash)
+        before the post is created; uploaded media keeps the input order.
+        
         Args:
             blog_result: Generated blog content
             media_files: List of media files to upload
@@ -325,13 +329,14 @@ class WebflowPublisher:
             
             # Upload media files if provided
             if media_files:
-                for media_file in media_files:
-                    media_result = await self.webflow_client.upload_media(
+                pipeline = MediaUploadPipeline(
+                    upload_fn=lambda media_file: self.webflow_client.upload_media(
                         media_data=media_file["data"],
                         filename=media_file["filename"],
                         alt_text=media_file.get("alt_text")
                     )
-                    published_media.append(media_result)
+                )
+                published_media = await pipeline.upload_all(media_files, raise_on_error=True)
             
             # Publish the blog post
             blog_result.images = published_media  # Attach uploaded media
@@ -10,6 +10,7 @@ from content-quality scoring.
 from __future__ import annotations
 
 import hashlib
+import json
 from enum import Enum
 from typing import Dict, List, Optional
 
@@ -103,6 +104,19 @@ class ContentAnalysisRequest(BaseModel):
         """Stable hash of the content for cache reuse."""
         return hashlib.sha256(self.content.encode("utf-8")).hexdigest()
 
+    def entity_key(self) -> str:
+        """Stable hash of the entity identifiers; analyses are only reused for the same entity."""
+        identifiers = [
+            self.entity_type.value if self.entity_type else None,
+            self.entity_name,
+            self.google_cid,
+            self.google_hotel_identifier,
+            self.tripadvisor_url_path,
+            self.trustpilot_domain,
+            self.canonical_url,
+        ]
+        return hashlib.sha256(json.dumps(identifiers).encode("utf-8")).hexdigest()
+
 
 class EvidenceRecord(BaseModel):
     """Normalized evidence record persisted for reuse."""
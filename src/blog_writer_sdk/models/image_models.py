@@ -247,6 +247,34 @@ class ImageGenerationJob(BaseModel):
     retry_count: int = Field(default=0, ge=0, description="Number of retry attempts")
 
 
+class ImageGenerationJobSummary(BaseModel):
+    """List view of an image generation job (no request options or image payloads)."""
+    
+    job_id: str = Field(..., description="Unique job identifier")
+    status: str = Field(..., description="Job status")
+    prompt: str = Field(..., description="Generation prompt")
+    provider: ImageProviderType = Field(..., description="Image generation provider")
+    progress_percentage: float = Field(default=0.0, description="Generation progress")
+    image_count: int = Field(default=0, description="Number of generated images")
+    created_at: datetime = Field(..., description="Job creation time")
+    completed_at: Optional[datetime] = Field(None, description="When generation completed")
+    error_message: Optional[str] = Field(None, description="Error message if failed")
+    
+    @classmethod
+    def from_job(cls, job: ImageGenerationJob) -> "ImageGenerationJobSummary":
+        return cls(
+            job_id=job.job_id,
+            status=job.status,
+            prompt=job.request.prompt,
+            provider=job.request.provider,
+            progress_percentage=job.progress_percentage,
+            image_count=len(job.result.images) if job.result else 0,
+            created_at=job.created_at,
+            completed_at=job.completed_at,
+            error_message=job.error_message
+        )
+
+
 class ImageVariationRequest(BaseModel):
     """Request model for generating image variations."""
     
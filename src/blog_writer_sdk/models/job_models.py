@@ -2,13 +2,19 @@
 Job status models for async blog generation.
 
 These models track the status and results of asynchronous blog generation jobs
-processed via Cloud Tasks.
+processed via Cloud Tasks. Job records stay compact: progress is a bounded log
+with sequence numbers, and results live in the job result store.
 """
 
+import os
+from collections import deque
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Deque, List, Optional, Dict, Any, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Progress updates retained per job (older ones are dropped)
+PROGRESS_HISTORY_LIMIT = int(os.getenv("JOB_PROGRESS_HISTORY_LIMIT", "50"))
 
 
 class JobStatus(str, Enum):
@@ -34,8 +40,8 @@ class BlogGenerationJob(BaseModel):
     progress_percentage: float = Field(default=0.0, ge=0, le=100, description="Generation progress")
     current_stage: Optional[str] = Field(None, description="Current pipeline stage")
     
-    # Results
-    result: Optional[Dict[str, Any]] = Field(None, description="Blog generation result (when completed)")
+    # Results (stored in the job result store, fetched once on completion)
+    result_available: bool = Field(default=False, description="Whether a result has been stored")
     
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Job creation time")
@@ -51,11 +57,66 @@ class BlogGenerationJob(BaseModel):
     # Cloud Tasks metadata
     task_name: Optional[str] = Field(None, description="Cloud Tasks task name")
     
-    # Progress updates from pipeline
-    progress_updates: list[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Progress updates from pipeline stages"
+    # Tracing
+    trace_id: Optional[str] = Field(None, description="Trace ID of the worker run")
+    timings: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Timing breakdown of the worker run (stages, upstream calls, cache and DB spans)"
     )
+    
+    # Progress updates from pipeline (ring buffer)
+    progress_updates: Deque[Dict[str, Any]] = Field(
+        default_factory=lambda: deque(maxlen=PROGRESS_HISTORY_LIMIT),
+        description="Most recent progress updates from pipeline stages, each with a 'seq' number"
+    )
+    progress_seq: int = Field(default=0, ge=0, description="Sequence number of the latest progress update")
+    
+    @field_validator("progress_updates", mode="after")
+    @classmethod
+    def _bound_progress(cls, updates: Deque[Dict[str, Any]]) -> Deque[Dict[str, Any]]:
+        return deque(updates, maxlen=PROGRESS_HISTORY_LIMIT)
+    
+    def add_progress(self, update: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Append a progress update, dropping the oldest beyond the history limit.
+        
+        Args:
+            update: Progress update data
+        
+        Returns:
+            The stored update with its 'seq' number
+        """
+        self.progress_seq += 1
+        entry = {**update, "seq": self.progress_seq}
+        self.progress_updates.append(entry)
+        if "stage" in update:
+            self.current_stage = update["stage"] or self.current_stage
+        if "progress_percentage" in update:
+            self.progress_percentage = update["progress_percentage"]
+        return entry
+    
+    def progress_since(self, seq: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Progress updates newer than ``seq``.
+        
+        Walks back from the newest entry, so the cost is proportional to the
+        number of new updates rather than the job's history.
+        
+        Args:
+            seq: Last sequence number the client has seen
+        
+        Returns:
+            (updates in order, truncated) where truncated means some updates
+            after ``seq`` have already been dropped from the ring buffer
+        """
+        updates = []
+        for entry in reversed(self.progress_updates):
+            if entry["seq"] <= seq:
+                break
+            updates.append(entry)
+        updates.reverse()
+        truncated = bool(updates) and updates[0]["seq"] > seq + 1
+        return updates, truncated
 
 
 class JobStatusResponse(BaseModel):
@@ -69,7 +130,15 @@ class JobStatusResponse(BaseModel):
     # Progress updates for stage tracking
     progress_updates: list[Dict[str, Any]] = Field(
         default_factory=list,
-        description="All progress updates from pipeline stages. Use this to track stage completion."
+        description=(
+            "Progress updates from pipeline stages newer than the requested 'since' "
+            "sequence (all retained updates when 'since' is omitted)."
+        )
+    )
+    last_seq: int = Field(default=0, description="Sequence number of the latest update; pass as 'since' on the next poll")
+    history_truncated: bool = Field(
+        default=False,
+        description="Some updates after 'since' were dropped from the bounded history"
     )
     
     # Timestamps
@@ -78,11 +147,26 @@ class JobStatusResponse(BaseModel):
     completed_at: Optional[datetime] = Field(None, description="Completion time")
     
     # Results (only if completed)
-    result: Optional[Dict[str, Any]] = Field(None, description="Result if completed")
+    result: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Result if completed and 'since' was omitted; delta pollers fetch result_url once instead"
+    )
+    result_available: bool = Field(default=False, description="Whether the result can be fetched")
+    result_url: Optional[str] = Field(None, description="Endpoint returning the stored result")
     
     # Error (only if failed)
     error_message: Optional[str] = Field(None, description="Error if failed")
     
+    # Tracing (set once the worker finishes)
+    trace_id: Optional[str] = Field(None, description="Trace ID of the worker run")
+    timings: Optional[Dict[str, Any]] = Field(
+        None,
+        description=(
+            "Timing breakdown: total_ms, stages in start order, totals per span kind "
+            "(upstream, cache, db, ...) and the slowest individual spans"
+        )
+    )
+    
     # Estimated time
     estimated_time_remaining: Optional[int] = Field(None, description="Estimated seconds remaining")
 
@@ -33,6 +33,8 @@ class ProgressUpdate(BaseModel):
     details: Optional[str] = Field(None, description="Detailed status information")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     timestamp: float = Field(..., description="Timestamp of the update")
+    elapsed_ms: Optional[float] = Field(None, description="Milliseconds since generation started")
+    stage_elapsed_ms: Optional[float] = Field(None, description="Milliseconds since the current stage started")
 
 
 class ProgressCallback:
@@ -233,8 +233,15 @@ class BlogPostWithCosts(BaseModel):
     """Blog post with costs (only visible to admins/owners)."""
     id: str
     title: str
-    content: str
+    content: Optional[str] = Field(None, description="Post body (omitted from list summaries)")
+    excerpt: Optional[str] = None
+    slug: Optional[str] = None
     status: str
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    published_at: Optional[datetime] = None
+    published_url: Optional[str] = None
+    word_count: Optional[int] = None
     total_cost: Optional[float] = Field(None, description="Total cost (only for admins/owners)")
     cost_breakdown: Optional[CostBreakdown] = Field(None, description="Cost breakdown (only for admins/owners)")
     publishing_metadata: Optional[PublishingMetadata] = None
@@ -255,8 +262,15 @@ class BlogPostWithCosts(BaseModel):
         return cls(
             id=blog_post.get("id", ""),
             title=blog_post.get("title", ""),
-            content=blog_post.get("content", ""),
+            content=blog_post.get("content"),
+            excerpt=blog_post.get("excerpt"),
+            slug=blog_post.get("slug"),
             status=blog_post.get("status", "draft"),
+            created_at=blog_post.get("created_at"),
+            updated_at=blog_post.get("updated_at"),
+            published_at=blog_post.get("published_at"),
+            published_url=blog_post.get("published_url"),
+            word_count=blog_post.get("word_count"),
             total_cost=blog_post.get("total_cost") if can_view_costs else None,
             cost_breakdown=blog_post.get("cost_breakdown") if can_view_costs else None,
             publishing_metadata=blog_post.get("publishing_metadata")
@@ -14,6 +14,16 @@ from .metrics import (
     get_metrics_collector,
     metrics_collector
 )
+from .tracing import (
+    SpanKind,
+    span,
+    start_span,
+    start_trace,
+    end_trace,
+    traced,
+    current_traceparent,
+    timing_breakdown
+)
 
 __all__ = [
     "MetricsCollector",
@@ -22,5 +32,13 @@ __all__ = [
     "monitor_performance",
     "initialize_metrics", 
     "get_metrics_collector",
-    "metrics_collector"
+    "metrics_collector",
+    "SpanKind",
+    "span",
+    "start_span",
+    "start_trace",
+    "end_trace",
+    "traced",
+    "current_traceparent",
+    "timing_breakdown"
 ]
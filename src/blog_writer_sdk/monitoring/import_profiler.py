@@ -0,0 +1,141 @@
+"""
+Startup import-time profiler.
+
+Measures how long each module takes to import (like ``python -X importtime``)
+by wrapping ``builtins.__import__`` while the application is starting, and
+reports the most expensive modules against an import-time budget. Loaders and
+module objects are left untouched; the hook is removed once startup is done.
+
+The hook slows imports slightly and shifts thread timing during startup, so it
+is opt-in (IMPORT_PROFILE=true); without it only the total is reported.
+"""
+
+import builtins
+import os
+import sys
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class ImportProfiler:
+    """
+    Record cumulative and self import time per module.
+
+    Only first imports are timed (modules already in ``sys.modules`` cost
+    nothing). Cumulative time includes nested imports; self time excludes them.
+    """
+
+    def __init__(self, budget_ms: Optional[float] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            budget_ms: Import-time budget (defaults to IMPORT_TIME_BUDGET_MS, 5000)
+        """
+        self.budget_ms = budget_ms if budget_ms is not None else float(os.getenv("IMPORT_TIME_BUDGET_MS", "5000"))
+        self.cumulative_ms: Dict[str, float] = {}
+        self.self_ms: Dict[str, float] = {}
+        self.extra_ms: Dict[str, float] = {}
+        self._original_import = None
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+        self._local = threading.local()
+
+    def start(self) -> "ImportProfiler":
+        """Install the import hook."""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            self._started = time.perf_counter()
+            builtins.__import__ = self._timed_import
+        return self
+
+    @property
+    def active(self) -> bool:
+        return self._original_import is not None
+
+    def stop(self) -> None:
+        """Remove the import hook."""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+            self._stopped = time.perf_counter()
+
+    def record(self, label: str, duration_ms: float) -> None:
+        """Record time measured outside the hook (e.g. imports before it was installed)."""
+        self.extra_ms[label] = self.extra_ms.get(label, 0.0) + duration_ms
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import or builtins.__import__
+        # Relative and already-loaded imports are not first imports worth timing
+        if level or name in sys.modules:
+            return original(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.cumulative_ms[name] = self.cumulative_ms.get(name, 0.0) + elapsed
+            self.self_ms[name] = self.self_ms.get(name, 0.0) + max(elapsed - children, 0.0)
+
+    def total_ms(self) -> float:
+        """Wall time while profiling plus externally recorded time."""
+        if self._started is None:
+            return sum(self.extra_ms.values())
+        end = self._stopped if self._stopped is not None else time.perf_counter()
+        return (end - self._started) * 1000 + sum(self.extra_ms.values())
+
+    def report(self, top: int = 20) -> Dict[str, Any]:
+        """
+        Build the import budget report.
+
+        Args:
+            top: Number of most expensive modules to include
+
+        Returns:
+            Totals, budget status and the top modules by cumulative time
+        """
+        modules: List[Dict[str, Any]] = [
+            {
+                "module": name,
+                "cumulative_ms": round(cumulative, 1),
+                "self_ms": round(self.self_ms.get(name, 0.0), 1),
+            }
+            for name, cumulative in sorted(self.cumulative_ms.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ]
+        total = self.total_ms()
+        return {
+            "total_ms": round(total, 1),
+            "budget_ms": self.budget_ms,
+            "over_budget": total > self.budget_ms,
+            "recorded": {label: round(ms, 1) for label, ms in self.extra_ms.items()},
+            "modules": modules,
+        }
+
+
+# Global profiler instance
+_import_profiler: Optional[ImportProfiler] = None
+
+
+def start_import_profiler(budget_ms: Optional[float] = None) -> ImportProfiler:
+    """Create and start the global import profiler."""
+    global _import_profiler
+    if _import_profiler is None:
+        _import_profiler = ImportProfiler(budget_ms=budget_ms)
+    return _import_profiler.start()
+
+
+def get_import_profiler(create: bool = False) -> Optional[ImportProfiler]:
+    """Get the global import profiler, optionally creating an idle one."""
+    global _import_profiler
+    if _import_profiler is None and create:
+        _import_profiler = ImportProfiler()
+    return _import_profiler
@@ -0,0 +1,292 @@
+"""
+Shared Cloud Logging tail with fan-out to live subscribers.
+
+One background task per instance polls Cloud Logging (in a worker thread, so
+the event loop is never blocked) and appends structured records to an
+in-memory ring buffer. Any number of subscribers (e.g. admin SSE streams)
+receive new records from that single poll, filtered server-side by severity,
+request ID or organization. The tailer only polls while someone is watching.
+"""
+
+import asyncio
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set
+
+try:
+    from google.cloud import logging as cloud_logging
+    GOOGLE_CLOUD_LOGGING_AVAILABLE = True
+except ImportError:
+    GOOGLE_CLOUD_LOGGING_AVAILABLE = False
+    cloud_logging = None
+
+logger = logging.getLogger(__name__)
+
+SEVERITY_RANK = {
+    "DEFAULT": 0,
+    "DEBUG": 100,
+    "INFO": 200,
+    "NOTICE": 300,
+    "WARNING": 400,
+    "ERROR": 500,
+    "CRITICAL": 600,
+    "ALERT": 700,
+    "EMERGENCY": 800,
+}
+
+
+def severity_rank(severity: Optional[str]) -> int:
+    return SEVERITY_RANK.get((severity or "DEFAULT").upper(), 0)
+
+
+@dataclass
+class LogFilter:
+    """Server-side subscriber filter; unset fields match everything."""
+    min_severity: Optional[str] = None
+    request_id: Optional[str] = None
+    org_id: Optional[str] = None
+
+    def matches(self, record: Dict[str, Any]) -> bool:
+        if self.min_severity and severity_rank(record.get("severity")) < severity_rank(self.min_severity):
+            return False
+        if self.request_id and record.get("request_id") != self.request_id:
+            return False
+        if self.org_id and record.get("org_id") != self.org_id:
+            return False
+        return True
+
+
+def entry_to_record(entry: Any) -> Dict[str, Any]:
+    """Convert a Cloud Logging entry into a structured record."""
+    payload = entry.payload
+    labels = dict(entry.labels) if getattr(entry, "labels", None) else {}
+    fields = payload if isinstance(payload, dict) else {}
+    return {
+        "insert_id": getattr(entry, "insert_id", None),
+        "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
+        "severity": getattr(entry, "severity", None) or "DEFAULT",
+        "message": payload if isinstance(payload, str) else fields.get("message", str(payload)),
+        "request_id": fields.get("request_id") or labels.get("request_id"),
+        "org_id": fields.get("org_id") or labels.get("org_id"),
+        "labels": labels,
+        "trace": getattr(entry, "trace", None),
+    }
+
+
+class _Subscriber:
+    """Bounded per-subscriber queue; slow consumers drop their oldest records."""
+
+    def __init__(self, log_filter: LogFilter, max_queue: int):
+        self.filter = log_filter
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def offer(self, record: Dict[str, Any]) -> None:
+        if not self.filter.matches(record):
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(record)
+
+
+class LogTailer:
+    """
+    Single poller feeding a ring buffer and any number of subscribers.
+
+    Features:
+    - One Cloud Logging query per poll interval regardless of viewer count
+    - Blocking client calls run in a worker thread
+    - Recent records replayed to new subscribers from the ring buffer
+    - Polling stops once the last subscriber has been gone for ``idle_timeout``
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[Callable[[datetime], List[Dict[str, Any]]]] = None,
+        buffer_size: int = 1000,
+        poll_interval: float = 2.0,
+        idle_timeout: float = 30.0,
+        max_queue: int = 500,
+        page_size: int = 200
+    ):
+        """
+        Initialize the tailer.
+
+        Args:
+            fetch: Blocking function returning records newer than a timestamp
+                (defaults to querying Cloud Logging for this Cloud Run service)
+            buffer_size: Records kept for replay
+            poll_interval: Seconds between polls
+            idle_timeout: Seconds without subscribers before polling stops
+            max_queue: Per-subscriber backlog before oldest records are dropped
+            page_size: Maximum entries fetched per poll
+        """
+        self._fetch = fetch or self._fetch_cloud_logging
+        self.buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.poll_interval = poll_interval
+        self.idle_timeout = idle_timeout
+        self.max_queue = max_queue
+        self.page_size = page_size
+        self._subscribers: Set[_Subscriber] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._client = None
+        self._last_timestamp = datetime.now(timezone.utc)
+        self._boundary_ids: Set[str] = set()
+        self.polls = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _fetch_cloud_logging(self, since: datetime) -> List[Dict[str, Any]]:
+        if self._client is None:
+            self._client = cloud_logging.Client()
+        service_name = os.getenv("K_SERVICE", "blog-writer-api")
+        full_filter = " AND ".join([
+            f'timestamp >= "{since.isoformat()}"',
+            'resource.type="cloud_run_revision"',
+            f'resource.labels.service_name="{service_name}"',
+        ])
+        return [
+            entry_to_record(entry)
+            for entry in self._client.list_entries(
+                filter_=full_filter,
+                order_by=cloud_logging.ASCENDING,
+                max_results=self.page_size
+            )
+        ]
+
+    def publish(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Append new records to the buffer and fan them out.
+
+        Records already seen at the last timestamp boundary are skipped, since
+        polls overlap by one timestamp to avoid missing same-instant entries.
+
+        Returns:
+            Number of new records published
+        """
+        published = 0
+        for record in records:
+            insert_id = record.get("insert_id")
+            if insert_id and insert_id in self._boundary_ids:
+                continue
+            timestamp = record.get("timestamp")
+            if timestamp:
+                parsed = datetime.fromisoformat(timestamp)
+                if parsed.tzinfo is None:
+                    parsed = parsed.replace(tzinfo=timezone.utc)
+                if parsed > self._last_timestamp:
+                    self._last_timestamp = parsed
+                    self._boundary_ids = set()
+                if insert_id and parsed == self._last_timestamp:
+                    self._boundary_ids.add(insert_id)
+            self.buffer.append(record)
+            for subscriber in self._subscribers:
+                subscriber.offer(record)
+            published += 1
+        return published
+
+    async def poll_once(self) -> int:
+        """Fetch and publish one batch of records."""
+        records = await asyncio.to_thread(self._fetch, self._last_timestamp)
+        self.polls += 1
+        self.last_error = None
+        return self.publish(records)
+
+    async def _run(self) -> None:
+        idle_since: Optional[float] = None
+        loop = asyncio.get_running_loop()
+        while True:
+            if self._subscribers:
+                idle_since = None
+            else:
+                idle_since = idle_since or loop.time()
+                if loop.time() - idle_since >= self.idle_timeout:
+                    break
+            try:
+                await self.poll_once()
+            except Exception as e:
+                self.last_error = str(e)
+                logger.warning(f"Log tail poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+        self._task = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def subscribe(
+        self,
+        log_filter: Optional[LogFilter] = None,
+        replay: int = 0,
+        heartbeat: Optional[float] = None
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield matching records as they arrive.
+
+        Args:
+            log_filter: Server-side filter
+            replay: Number of recent matching records to yield first (at most max_queue)
+            heartbeat: If set, yield None after this many idle seconds
+
+        Yields:
+            Structured log records (or None as a heartbeat)
+        """
+        subscriber = _Subscriber(log_filter or LogFilter(), self.max_queue)
+        if replay:
+            # The queue holds at most max_queue records; replay no more than fits
+            replay = min(replay, self.max_queue)
+            recent = [r for r in self.buffer if subscriber.filter.matches(r)][-replay:]
+            for record in recent:
+                subscriber.offer(record)
+        self._subscribers.add(subscriber)
+        self._ensure_running()
+        try:
+            while True:
+                try:
+                    record = await asyncio.wait_for(subscriber.queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    record = None
+                yield record
+        finally:
+            self._subscribers.discard(subscriber)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "subscribers": self.subscriber_count,
+            "buffered": len(self.buffer),
+            "polls": self.polls,
+            "last_timestamp": self._last_timestamp.isoformat(),
+            "last_error": self.last_error,
+        }
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global tailer instance
+_log_tailer: Optional[LogTailer] = None
+
+
+def get_log_tailer() -> LogTailer:
+    """Get the global log tailer."""
+    global _log_tailer
+    if _log_tailer is None:
+        _log_tailer = LogTailer(
+            buffer_size=int(os.getenv("LOG_TAIL_BUFFER_SIZE", "1000")),
+            poll_interval=float(os.getenv("LOG_TAIL_POLL_INTERVAL", "2.0"))
+        )
+    return _log_tailer
@@ -16,6 +16,7 @@ import psutil
 import sys
 
 from ..models.blog_models import BlogGenerationResult
+from .tracing import span
 
 
 logger = logging.getLogger(__name__)
@@ -372,7 +373,7 @@ class MetricsCollector:
 
 # Performance monitoring decorator
 def monitor_performance(operation_name: str, metrics_collector: Optional[MetricsCollector] = None):
-    """Decorator to monitor function performance."""
+    """Decorator to monitor function performance; calls also appear as spans in the active trace."""
     def decorator(func: Callable):
         async def async_wrapper(*args, **kwargs):
             start_time = time.time()
@@ -380,7 +381,8 @@ def monitor_performance(operation_name: str, metrics_collector: Optional[Metrics
             error = None
             
             try:
-                result = await func(*args, **kwargs)
+                with span(operation_name):
+                    result = await func(*args, **kwargs)
                 success = True
                 return result
             except Exception as e:
@@ -400,7 +402,8 @@ def monitor_performance(operation_name: str, metrics_collector: Optional[Metrics
             error = None
             
             try:
-                result = func(*args, **kwargs)
+                with span(operation_name):
+                    result = func(*args, **kwargs)
                 success = True
                 return result
             except Exception as e:
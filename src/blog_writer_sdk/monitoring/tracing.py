@@ -0,0 +1,633 @@
+"""
+Lightweight request tracing.
+
+Each request (or Cloud Tasks worker call) gets a trace held in a context
+variable next to the usage attribution in ``request_context``. Code opens
+nested spans for pipeline stages, upstream calls (DataForSEO, LLM providers,
+Google), cache lookups and database writes; spans started in child tasks
+attach to the span that was current when the task was created.
+
+Finished traces go to an OTLP/HTTP collector (OTLP JSON encoding) or to the
+structured log, and ``timing_breakdown`` summarizes a trace for per-job
+timing reports. Trace context crosses process boundaries as a W3C
+``traceparent`` header.
+
+Configuration (environment):
+- TRACING_ENABLED: "false" disables span recording entirely
+- TRACING_EXPORTER: "otlp", "log" or "none" (default: otlp when an OTLP
+  endpoint is configured, otherwise log)
+- OTEL_EXPORTER_OTLP_TRACES_ENDPOINT / OTEL_EXPORTER_OTLP_ENDPOINT,
+  OTEL_EXPORTER_OTLP_HEADERS, OTEL_SERVICE_NAME: standard OTLP settings
+- TRACING_LOG_MIN_MS: only traces at least this long are logged (default 1000)
+- TRACING_MAX_SPANS: spans kept per trace (default 512)
+"""
+
+import asyncio
+import logging
+import os
+import secrets
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SPANS = 512
+DEFAULT_LOG_MIN_MS = 1000.0
+
+
+class SpanKind(str, Enum):
+    """What a span measures; used to group timings."""
+    SERVER = "server"
+    STAGE = "stage"
+    UPSTREAM = "upstream"
+    CACHE = "cache"
+    DB = "db"
+    INTERNAL = "internal"
+
+
+# OTLP span kinds: SERVER=2, CLIENT=3, INTERNAL=1
+_OTLP_KIND = {
+    SpanKind.SERVER: 2,
+    SpanKind.UPSTREAM: 3,
+    SpanKind.CACHE: 3,
+    SpanKind.DB: 3,
+}
+
+
+def _new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "name", "kind", "trace", "span_id", "parent_id", "attributes",
+        "start_ns", "end_ns", "error", "_started", "_duration_ms", "_previous",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        kind: SpanKind,
+        trace: "Trace",
+        parent_id: Optional[str],
+        attributes: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.kind = kind
+        self.trace = trace
+        self.span_id = _new_span_id()
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._duration_ms: Optional[float] = None
+        self._previous: Optional[Span] = None
+
+    @property
+    def trace_id(self) -> str:
+        return self.trace.trace_id
+
+    @property
+    def ended(self) -> bool:
+        return self.end_ns is not None
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration so far for open spans, final duration once ended."""
+        if self._duration_ms is not None:
+            return self._duration_ms
+        return (time.perf_counter() - self._started) * 1000.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def record_error(self, error: BaseException) -> None:
+        self.error = f"{type(error).__name__}: {error}"[:300]
+
+    def end(self) -> None:
+        """Finish the span and, if it is current, make its parent current again."""
+        if self.end_ns is not None:
+            return
+        self._duration_ms = (time.perf_counter() - self._started) * 1000.0
+        self.end_ns = self.start_ns + int(self._duration_ms * 1_000_000)
+        if _current_span.get() is self:
+            _current_span.set(self._previous)
+        self.trace.add(self)
+
+    def traceparent(self) -> str:
+        """W3C trace context header value pointing at this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self, origin_ns: Optional[int] = None) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind.value,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "duration_ms": round(self.duration_ms, 2),
+        }
+        if origin_ns is not None:
+            data["start_offset_ms"] = round((self.start_ns - origin_ns) / 1_000_000, 2)
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _NoopSpan:
+    """Returned when tracing is off or no trace is active; accepts and drops everything."""
+
+    name = ""
+    span_id = None
+    trace_id = None
+    ended = True
+    duration_ms = 0.0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, **attributes: Any) -> None:
+        pass
+
+    def record_error(self, error: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """Finished spans of one trace, bounded to ``max_spans``."""
+
+    def __init__(self, trace_id: Optional[str] = None, max_spans: int = DEFAULT_MAX_SPANS):
+        self.trace_id = trace_id or _new_trace_id()
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.root: Optional[Span] = None
+        self.exported = False
+
+    def add(self, span: Span) -> None:
+        if self.exported:
+            # Background work outliving the request; its trace has already gone out
+            return
+        if len(self.spans) >= self.max_spans and span is not self.root:
+            self.dropped += 1
+            return
+        self.spans.append(span)
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("blogwriter_current_span", default=None)
+
+
+def _enabled() -> bool:
+    return os.getenv("TRACING_ENABLED", "true").lower() != "false"
+
+
+def current_span() -> Optional[Span]:
+    """The active span in this context, if any."""
+    return _current_span.get()
+
+
+def current_trace_id() -> Optional[str]:
+    active = _current_span.get()
+    return active.trace_id if active is not None else None
+
+
+def current_traceparent() -> Optional[str]:
+    """``traceparent`` header value for propagating the active trace."""
+    active = _current_span.get()
+    return active.traceparent() if active is not None else None
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Parse a W3C ``traceparent`` header.
+
+    Returns:
+        (trace_id, parent_span_id), or None when absent or malformed
+    """
+    if not value:
+        return None
+    parts = value.strip().lower().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    trace_id, span_id = parts[1], parts[2]
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+    except ValueError:
+        return None
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+def parse_cloud_trace_context(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Parse Google's ``X-Cloud-Trace-Context: TRACE_ID/SPAN_ID;o=1`` header."""
+    if not value:
+        return None
+    trace_part, _, rest = value.partition("/")
+    span_part = rest.split(";", 1)[0]
+    try:
+        span_id = f"{int(span_part):016x}" if span_part else _new_span_id()
+        int(trace_part, 16)
+    except ValueError:
+        return None
+    if len(trace_part) != 32 or len(span_id) != 16:
+        return None
+    return trace_part.lower(), span_id
+
+
+def incoming_traceparent(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Trace context of an incoming request as a ``traceparent`` value.
+
+    Prefers the W3C header (set by Cloud Tasks enqueueing and other traced
+    clients) and falls back to Cloud Run's ``X-Cloud-Trace-Context``.
+    """
+    traceparent = headers.get("traceparent")
+    if parse_traceparent(traceparent):
+        return traceparent
+    cloud = parse_cloud_trace_context(headers.get("x-cloud-trace-context"))
+    if cloud:
+        return f"00-{cloud[0]}-{cloud[1]}-01"
+    return None
+
+
+def start_trace(
+    name: str,
+    kind: SpanKind = SpanKind.SERVER,
+    traceparent: Optional[str] = None,
+    **attributes: Any
+) -> Any:
+    """
+    Start a new trace (continuing ``traceparent`` when given) and make its root current.
+
+    The caller must ``end_trace`` the returned root span. Returns ``NOOP_SPAN``
+    when tracing is disabled.
+    """
+    if not _enabled():
+        return NOOP_SPAN
+    parent = parse_traceparent(traceparent) if traceparent else None
+    trace = Trace(
+        trace_id=parent[0] if parent else None,
+        max_spans=int(os.getenv("TRACING_MAX_SPANS", DEFAULT_MAX_SPANS)),
+    )
+    root = Span(name, kind, trace, parent[1] if parent else None, attributes)
+    trace.root = root
+    root._previous = _current_span.get()
+    _current_span.set(root)
+    return root
+
+
+def end_trace(root: Any) -> None:
+    """End a trace's root span and hand the trace to the exporter."""
+    if not isinstance(root, Span):
+        return
+    root.end()
+    trace = root.trace
+    if trace.exported:
+        return
+    trace.exported = True
+    try:
+        get_span_exporter().export(trace)
+    except Exception as e:
+        logger.debug(f"Trace export failed: {e}")
+
+
+def start_span(name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> Any:
+    """
+    Start a child of the current span and make it current until ``end()``.
+
+    For spans whose start and end sit in different places (e.g. pipeline
+    stages announced by progress events); prefer ``span`` otherwise.
+    Returns ``NOOP_SPAN`` outside a trace.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return NOOP_SPAN
+    child = Span(name, kind, parent.trace, parent.span_id, attributes)
+    child._previous = parent
+    _current_span.set(child)
+    return child
+
+
+@contextmanager
+def span(name: str, kind: SpanKind = SpanKind.INTERNAL, **attributes: Any) -> Iterator[Any]:
+    """
+    Time a block as a child of the current span.
+
+    Exceptions are recorded on the span and re-raised. Outside a trace this
+    yields ``NOOP_SPAN`` and costs next to nothing.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield NOOP_SPAN
+        return
+    child = Span(name, kind, parent.trace, parent.span_id, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        child.end()
+
+
+def traced(name: str, kind: SpanKind = SpanKind.INTERNAL) -> Callable:
+    """Decorator wrapping each call of a sync or async function in a span."""
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name, kind):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, kind):
+                return func(*args, **kwargs)
+        return sync_wrapper
+    return decorator
+
+
+def timing_breakdown(trace: Optional[Trace] = None, slowest: int = 10) -> Optional[Dict[str, Any]]:
+    """
+    Summarize a trace (default: the current one) for timing reports.
+
+    Kind totals add up span durations, so concurrent calls are each counted
+    in full and can exceed the wall-clock total.
+
+    Returns:
+        total_ms, stages (in start order), totals per kind, the slowest
+        non-stage spans and span counts; None outside a trace
+    """
+    if trace is None:
+        active = _current_span.get()
+        if active is None:
+            return None
+        trace = active.trace
+    root = trace.root
+    origin = root.start_ns if root is not None else min((s.start_ns for s in trace.spans), default=0)
+
+    by_kind: Dict[str, Dict[str, Any]] = {}
+    stages = []
+    others = []
+    for s in trace.spans:
+        if s is root:
+            continue
+        bucket = by_kind.setdefault(s.kind.value, {"count": 0, "total_ms": 0.0, "errors": 0})
+        bucket["count"] += 1
+        bucket["total_ms"] += s.duration_ms
+        if s.error:
+            bucket["errors"] += 1
+        if s.kind == SpanKind.STAGE:
+            stages.append(s)
+        else:
+            others.append(s)
+    for bucket in by_kind.values():
+        bucket["total_ms"] = round(bucket["total_ms"], 2)
+
+    stages.sort(key=lambda s: s.start_ns)
+    others.sort(key=lambda s: s.duration_ms, reverse=True)
+    return {
+        "trace_id": trace.trace_id,
+        "total_ms": round(root.duration_ms, 2) if root is not None else None,
+        "stages": [s.to_dict(origin) for s in stages],
+        "by_kind": by_kind,
+        "slowest": [s.to_dict(origin) for s in others[:slowest]],
+        "span_count": len(trace.spans),
+        "dropped_spans": trace.dropped,
+    }
+
+
+# Exporters ---------------------------------------------------------------
+
+
+class SpanExporter:
+    """Receives each finished trace."""
+
+    def export(self, trace: Trace) -> None:
+        raise NotImplementedError
+
+    async def shutdown(self) -> None:
+        pass
+
+
+class NoopSpanExporter(SpanExporter):
+    def export(self, trace: Trace) -> None:
+        pass
+
+
+class LogSpanExporter(SpanExporter):
+    """
+    Writes slow traces to the structured log, one record per trace.
+
+    Records carry Cloud Logging's trace field when GOOGLE_CLOUD_PROJECT is
+    set, so they line up with the request logs in Cloud Trace.
+    """
+
+    def __init__(self, min_duration_ms: float = DEFAULT_LOG_MIN_MS, project_id: Optional[str] = None):
+        self.min_duration_ms = min_duration_ms
+        self.project_id = project_id
+        self._logger = logging.getLogger("blog_writer.tracing")
+
+    def export(self, trace: Trace) -> None:
+        root = trace.root
+        if root is None or root.duration_ms < self.min_duration_ms:
+            return
+        extra: Dict[str, Any] = {"trace_timing": timing_breakdown(trace)}
+        if self.project_id:
+            extra["logging.googleapis.com/trace"] = f"projects/{self.project_id}/traces/{trace.trace_id}"
+        self._logger.info(f"Trace {root.name}: {root.duration_ms:.0f}ms, {len(trace.spans)} spans", extra=extra)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+
+class OTLPSpanExporter(SpanExporter):
+    """
+    Sends spans to an OTLP/HTTP collector using the JSON encoding.
+
+    Traces are queued and posted in batches from a background task on the
+    running loop, so request handling never waits on the collector. When the
+    queue is full new spans are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        service_name: str = "blog-writer-api",
+        max_queue: int = 4096,
+        batch_size: int = 512,
+        flush_interval: float = 2.0
+    ):
+        self.endpoint = endpoint
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.service_name = service_name
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: Deque[Span] = deque()
+        self._flusher: Optional[asyncio.Task] = None
+        self._client = None
+
+    def export(self, trace: Trace) -> None:
+        for s in trace.spans:
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                continue
+            self._queue.append(s)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_loop())
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+                "scopeSpans": [{
+                    "scope": {"name": "blog_writer_sdk"},
+                    "spans": [self._span(s) for s in spans],
+                }],
+            }]
+        }
+
+    def _span(self, s: Span) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            "name": s.name,
+            "kind": _OTLP_KIND.get(s.kind, 1),
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns or s.start_ns),
+            "attributes": _otlp_attributes({**s.attributes, "blogwriter.span_kind": s.kind.value}),
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        }
+        if s.parent_id:
+            data["parentSpanId"] = s.parent_id
+        return data
+
+    async def _flush_loop(self) -> None:
+        while self._queue:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued so far."""
+        import httpx
+
+        while self._queue:
+            batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=5.0)
+            try:
+                response = await self._client.post(self.endpoint, json=self._payload(batch), headers=self.headers)
+                if response.status_code >= 400:
+                    logger.warning(f"OTLP export rejected ({response.status_code}): {response.text[:200]}")
+            except Exception as e:
+                logger.warning(f"OTLP export failed, dropping {len(batch)} spans: {e}")
+
+    async def shutdown(self) -> None:
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def _parse_otlp_headers(value: str) -> Dict[str, str]:
+    headers = {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        key, sep, val = part.partition("=")
+        if sep:
+            headers[key.strip()] = val.strip()
+    return headers
+
+
+def _exporter_from_env() -> SpanExporter:
+    traces_endpoint = os.getenv("OTEL_EXPORTER_OTLP_TRACES_ENDPOINT")
+    base_endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if not traces_endpoint and base_endpoint:
+        traces_endpoint = f"{base_endpoint.rstrip('/')}/v1/traces"
+
+    kind = os.getenv("TRACING_EXPORTER", "otlp" if traces_endpoint else "log").lower()
+    if kind == "otlp" and traces_endpoint:
+        return OTLPSpanExporter(
+            traces_endpoint,
+            headers=_parse_otlp_headers(os.getenv("OTEL_EXPORTER_OTLP_HEADERS", "")),
+            service_name=os.getenv("OTEL_SERVICE_NAME") or os.getenv("K_SERVICE") or "blog-writer-api",
+        )
+    if kind == "otlp":
+        logger.warning("TRACING_EXPORTER=otlp but no OTLP endpoint configured; logging traces instead")
+        kind = "log"
+    if kind == "log":
+        return LogSpanExporter(
+            min_duration_ms=float(os.getenv("TRACING_LOG_MIN_MS", DEFAULT_LOG_MIN_MS)),
+            project_id=os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("GCP_PROJECT_ID"),
+        )
+    return NoopSpanExporter()
+
+
+_span_exporter: Optional[SpanExporter] = None
+
+
+def get_span_exporter() -> SpanExporter:
+    """Process-wide exporter, configured from the environment on first use."""
+    global _span_exporter
+    if _span_exporter is None:
+        _span_exporter = _exporter_from_env()
+    return _span_exporter
+
+
+def set_span_exporter(exporter: Optional[SpanExporter]) -> None:
+    """Replace the exporter (None re-reads the environment on next use)."""
+    global _span_exporter
+    _span_exporter = exporter
+
+
+async def shutdown_tracing() -> None:
+    """Flush pending spans; call on application shutdown."""
+    if _span_exporter is not None:
+        await _span_exporter.shutdown()
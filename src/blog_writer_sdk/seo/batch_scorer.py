@@ -0,0 +1,387 @@
+"""
+Batch Readability and SEO Scoring
+
+Scores many documents in a single call. Each document is parsed once into a
+shared ParsedDocument representation, syllable counts are memoized across the
+whole batch, and per-document aggregates are computed column-wise with NumPy
+when it is installed (pure-Python fallback otherwise).
+"""
+
+import re
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_MD_HEADER_RE = re.compile(r'^#+\s+', re.MULTILINE)
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+_MD_BOLD_RE = re.compile(r'\*\*([^\*]+)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*([^\*]+)\*')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+_H1_RE = re.compile(r'^#\s+.+$|<h1[\s>]', re.MULTILINE | re.IGNORECASE)
+_H2_RE = re.compile(r'^##\s+.+$|<h2[\s>]', re.MULTILINE | re.IGNORECASE)
+_H3_RE = re.compile(r'^###\s+.+$|<h3[\s>]', re.MULTILINE | re.IGNORECASE)
+_LIST_ITEM_RE = re.compile(r'^[-*+]\s+.+$|^\d+\.\s+.+$|<li[\s>]', re.MULTILINE | re.IGNORECASE)
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg')
+
+_VOWELS = frozenset('aeiouy')
+
+
+@lru_cache(maxsize=65536)
+def count_syllables(word: str) -> int:
+    """
+    Count syllables in a word (approximation), memoized per word.
+
+    Same heuristic as ReadabilityAnalyzer: vowel groups, minus a silent
+    trailing 'e', with a minimum of one syllable.
+    """
+    word = word.lower()
+    if len(word) <= 3:
+        return 1
+
+    syllable_count = 0
+    previous_was_vowel = False
+    for char in word:
+        is_vowel = char in _VOWELS
+        if is_vowel and not previous_was_vowel:
+            syllable_count += 1
+        previous_was_vowel = is_vowel
+
+    if word.endswith('e'):
+        syllable_count -= 1
+
+    return max(1, syllable_count)
+
+
+@dataclass
+class ParsedDocument:
+    """Parsed representation of a document shared by all batch checks."""
+    content: str
+    text: str
+    words: List[str]
+    sentence_count: int
+    paragraph_count: int
+    syllable_count: int
+    h1_count: int
+    h2_count: int
+    h3_count: int
+    list_count: int
+    internal_links: int
+    external_links: int
+    title: Optional[str] = None
+    excerpt: Optional[str] = None
+    keywords: List[str] = field(default_factory=list)
+    doc_id: Optional[str] = None
+
+    @classmethod
+    def parse(
+        cls,
+        content: str,
+        title: Optional[str] = None,
+        excerpt: Optional[str] = None,
+        keywords: Optional[List[str]] = None,
+        doc_id: Optional[str] = None,
+    ) -> "ParsedDocument":
+        """Parse raw HTML/Markdown content once."""
+        internal_links = 0
+        external_links = 0
+        for _, url in _MD_LINK_RE.findall(content):
+            if url.endswith(_IMAGE_EXTENSIONS):
+                continue
+            if url.startswith(('http://', 'https://')):
+                external_links += 1
+            elif url.startswith(('/', '#')):
+                internal_links += 1
+
+        text = _HTML_TAG_RE.sub('', content)
+        text = _MD_HEADER_RE.sub('', text)
+        text = _MD_LINK_RE.sub(r'\1', text)
+        text = _MD_BOLD_RE.sub(r'\1', text)
+        text = _MD_ITALIC_RE.sub(r'\1', text)
+        text = text.strip()
+
+        words = _WORD_RE.findall(text.lower())
+        sentences = [s for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+        paragraphs = [p for p in text.split('\n\n') if p.strip()]
+
+        return cls(
+            content=content,
+            text=text,
+            words=words,
+            sentence_count=len(sentences),
+            paragraph_count=len(paragraphs),
+            syllable_count=sum(count_syllables(w) for w in words),
+            h1_count=len(_H1_RE.findall(content)),
+            h2_count=len(_H2_RE.findall(content)),
+            h3_count=len(_H3_RE.findall(content)),
+            list_count=len(_LIST_ITEM_RE.findall(content)),
+            internal_links=internal_links,
+            external_links=external_links,
+            title=title,
+            excerpt=excerpt,
+            keywords=list(keywords or []),
+            doc_id=doc_id,
+        )
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    def primary_keyword_stats(self) -> Dict[str, Any]:
+        """Occurrences of the primary keyword and whether it appears early."""
+        if not self.keywords:
+            return {"count": 0, "in_intro": False}
+        keyword = self.keywords[0].lower()
+        return {
+            "count": self.content.lower().count(keyword),
+            "in_intro": keyword in self.content[:500].lower(),
+        }
+
+
+class BatchContentScorer:
+    """
+    Scores readability and on-page SEO for many documents at once.
+
+    Thresholds mirror ReadabilityAnalyzer and the content validation checks so
+    batch scores line up with single-document results.
+    """
+
+    def __init__(
+        self,
+        target_reading_ease: float = 60.0,
+        max_sentence_length: int = 20,
+        max_paragraph_length: int = 4,
+    ):
+        self.target_reading_ease = target_reading_ease
+        self.max_sentence_length = max_sentence_length
+        self.max_paragraph_length = max_paragraph_length
+
+    def score_documents(self, documents: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score a batch of documents.
+
+        Args:
+            documents: Dicts with ``content`` and optional ``id``, ``title``,
+                ``excerpt`` and ``keywords``
+
+        Returns:
+            One result dict per input document, in input order
+        """
+        parsed = [
+            ParsedDocument.parse(
+                content=doc.get("content") or "",
+                title=doc.get("title"),
+                excerpt=doc.get("excerpt"),
+                keywords=doc.get("keywords") or [],
+                doc_id=doc.get("id"),
+            )
+            for doc in documents
+        ]
+        return self.score_parsed(parsed)
+
+    def score_parsed(self, parsed: Sequence[ParsedDocument]) -> List[Dict[str, Any]]:
+        """Score already-parsed documents."""
+        if not parsed:
+            return []
+
+        columns = self._build_columns(parsed)
+        if NUMPY_AVAILABLE:
+            aggregates = self._aggregate_numpy(columns)
+        else:
+            aggregates = self._aggregate_python(columns)
+
+        results = []
+        for i, doc in enumerate(parsed):
+            results.append({
+                "id": doc.doc_id,
+                "word_count": doc.word_count,
+                "readability": {
+                    "flesch_reading_ease": round(float(aggregates["flesch"][i]), 1),
+                    "grade_level": float(aggregates["grade_level"][i]),
+                    "avg_sentence_length": round(float(aggregates["avg_sentence_length"][i]), 1),
+                    "avg_syllables_per_word": round(float(aggregates["avg_syllables"][i]), 2),
+                    "avg_paragraph_length": round(float(aggregates["avg_paragraph_length"][i]), 1),
+                    "score": round(float(aggregates["readability_score"][i]), 1),
+                },
+                "structure": {
+                    "h1_count": doc.h1_count,
+                    "h2_count": doc.h2_count,
+                    "h3_count": doc.h3_count,
+                    "paragraph_count": doc.paragraph_count,
+                    "list_count": doc.list_count,
+                },
+                "seo": {
+                    "keyword_density": (
+                        round(float(aggregates["keyword_density"][i]), 2) if doc.keywords else None
+                    ),
+                    "title_length": len(doc.title) if doc.title else 0,
+                    "meta_description_length": len(doc.excerpt) if doc.excerpt else 0,
+                    "internal_links": doc.internal_links,
+                    "external_links": doc.external_links,
+                    "score": round(float(aggregates["seo_score"][i]), 1),
+                },
+                "overall_score": int(round(float(aggregates["overall_score"][i]))),
+            })
+        return results
+
+    def _build_columns(self, parsed: Sequence[ParsedDocument]) -> Dict[str, List[float]]:
+        """Collect per-document counts into columns."""
+        columns: Dict[str, List[float]] = {
+            "words": [], "sentences": [], "syllables": [], "paragraphs": [],
+            "headings": [], "lists": [], "h1": [], "internal_links": [],
+            "has_keyword": [], "keyword_count": [], "keyword_in_intro": [],
+            "has_title": [], "title_length": [], "has_excerpt": [], "excerpt_length": [],
+        }
+        for doc in parsed:
+            kw_stats = doc.primary_keyword_stats()
+            columns["words"].append(doc.word_count)
+            columns["sentences"].append(doc.sentence_count)
+            columns["syllables"].append(doc.syllable_count)
+            columns["paragraphs"].append(doc.paragraph_count)
+            columns["headings"].append(doc.h1_count + doc.h2_count + doc.h3_count)
+            columns["lists"].append(doc.list_count)
+            columns["h1"].append(doc.h1_count)
+            columns["internal_links"].append(doc.internal_links)
+            columns["has_keyword"].append(1 if doc.keywords else 0)
+            columns["keyword_count"].append(kw_stats["count"])
+            columns["keyword_in_intro"].append(1 if kw_stats["in_intro"] else 0)
+            columns["has_title"].append(1 if doc.title else 0)
+            columns["title_length"].append(len(doc.title) if doc.title else 0)
+            columns["has_excerpt"].append(1 if doc.excerpt else 0)
+            columns["excerpt_length"].append(len(doc.excerpt) if doc.excerpt else 0)
+        return columns
+
+    def _aggregate_numpy(self, columns: Dict[str, List[float]]) -> Dict[str, Any]:
+        """Compute all per-document aggregates in vectorized passes."""
+        c = {name: np.asarray(values, dtype=np.float64) for name, values in columns.items()}
+
+        def safe_div(a, b):
+            return np.divide(a, b, out=np.zeros_like(a), where=b > 0)
+
+        avg_sentence_length = safe_div(c["words"], c["sentences"])
+        avg_syllables = safe_div(c["syllables"], c["words"])
+        avg_paragraph_length = safe_div(c["sentences"], c["paragraphs"])
+        flesch = np.clip(206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables, 0, 100)
+        grade_level = np.select(
+            [flesch >= 90, flesch >= 80, flesch >= 70, flesch >= 60, flesch >= 50, flesch >= 30],
+            [5.0, 6.0, 7.0, 8.0, 9.0, 10.0],
+            default=12.0,
+        )
+
+        readability = np.full(flesch.shape, 100.0)
+        readability -= np.where(
+            flesch < self.target_reading_ease,
+            np.minimum(20, (self.target_reading_ease - flesch) / 2),
+            0,
+        )
+        readability -= np.where(avg_sentence_length > self.max_sentence_length, 15, 0)
+        readability -= np.where(avg_paragraph_length > self.max_paragraph_length, 10, 0)
+        readability -= np.where(safe_div(c["headings"], c["words"]) * 300 < 1, 10, 0)
+        readability -= np.where((c["lists"] == 0) & (c["words"] > 500), 5, 0)
+        readability -= np.where((c["paragraphs"] < 5) & (c["words"] > 1000), 5, 0)
+        readability = np.maximum(readability, 0)
+
+        density = safe_div(c["keyword_count"], c["words"]) * 100
+        has_kw = c["has_keyword"] > 0
+        seo = np.full(flesch.shape, 100.0)
+        seo -= np.where((c["has_title"] > 0) & ((c["title_length"] < 30) | (c["title_length"] > 70)), 10, 0)
+        seo -= np.where((c["has_excerpt"] > 0) & ((c["excerpt_length"] < 120) | (c["excerpt_length"] > 160)), 10, 0)
+        seo -= np.where(has_kw & (c["keyword_in_intro"] == 0), 15, 0)
+        seo -= np.where(has_kw & (c["words"] > 0) & (density < 0.5), 5, 0)
+        seo -= np.where(has_kw & (density > 3), 15, 0)
+        seo -= np.where(c["h1"] == 0, 15, 0)
+        seo -= np.where(c["internal_links"] == 0, 15, np.where(c["internal_links"] < 3, 5, 0))
+        seo = np.maximum(seo, 0)
+
+        overall = np.clip((readability + seo) / 2, 0, 100)
+
+        return {
+            "avg_sentence_length": avg_sentence_length,
+            "avg_syllables": avg_syllables,
+            "avg_paragraph_length": avg_paragraph_length,
+            "flesch": flesch,
+            "grade_level": grade_level,
+            "readability_score": readability,
+            "keyword_density": density,
+            "seo_score": seo,
+            "overall_score": overall,
+        }
+
+    def _aggregate_python(self, columns: Dict[str, List[float]]) -> Dict[str, List[float]]:
+        """Row-wise fallback with the same formulas when NumPy is unavailable."""
+        out: Dict[str, List[float]] = {
+            "avg_sentence_length": [], "avg_syllables": [], "avg_paragraph_length": [],
+            "flesch": [], "grade_level": [], "readability_score": [],
+            "keyword_density": [], "seo_score": [], "overall_score": [],
+        }
+        for i in range(len(columns["words"])):
+            row = {name: values[i] for name, values in columns.items()}
+            words = row["words"]
+            asl = words / row["sentences"] if row["sentences"] > 0 else 0.0
+            aspw = row["syllables"] / words if words > 0 else 0.0
+            apl = row["sentences"] / row["paragraphs"] if row["paragraphs"] > 0 else 0.0
+            flesch = max(0.0, min(100.0, 206.835 - 1.015 * asl - 84.6 * aspw))
+            grade = 12.0
+            for threshold, level in ((90, 5.0), (80, 6.0), (70, 7.0), (60, 8.0), (50, 9.0), (30, 10.0)):
+                if flesch >= threshold:
+                    grade = level
+                    break
+
+            readability = 100.0
+            if flesch < self.target_reading_ease:
+                readability -= min(20, (self.target_reading_ease - flesch) / 2)
+            if asl > self.max_sentence_length:
+                readability -= 15
+            if apl > self.max_paragraph_length:
+                readability -= 10
+            if (row["headings"] / words if words > 0 else 0) * 300 < 1:
+                readability -= 10
+            if row["lists"] == 0 and words > 500:
+                readability -= 5
+            if row["paragraphs"] < 5 and words > 1000:
+                readability -= 5
+            readability = max(0.0, readability)
+
+            density = row["keyword_count"] / words * 100 if words > 0 else 0.0
+            has_kw = row["has_keyword"] > 0
+            seo = 100.0
+            if row["has_title"] and (row["title_length"] < 30 or row["title_length"] > 70):
+                seo -= 10
+            if row["has_excerpt"] and (row["excerpt_length"] < 120 or row["excerpt_length"] > 160):
+                seo -= 10
+            if has_kw and not row["keyword_in_intro"]:
+                seo -= 15
+            if has_kw and words > 0 and density < 0.5:
+                seo -= 5
+            if has_kw and density > 3:
+                seo -= 15
+            if row["h1"] == 0:
+                seo -= 15
+            if row["internal_links"] == 0:
+                seo -= 15
+            elif row["internal_links"] < 3:
+                seo -= 5
+            seo = max(0.0, seo)
+
+            out["avg_sentence_length"].append(asl)
+            out["avg_syllables"].append(aspw)
+            out["avg_paragraph_length"].append(apl)
+            out["flesch"].append(flesch)
+            out["grade_level"].append(grade)
+            out["readability_score"].append(readability)
+            out["keyword_density"].append(density)
+            out["seo_score"].append(seo)
+            out["overall_score"].append(max(0.0, min(100.0, (readability + seo) / 2)))
+        return out
@@ -14,6 +14,7 @@ from datetime import datetime, timedelta
 from .keyword_analyzer import KeywordAnalyzer
 from ..models.blog_models import KeywordAnalysis, SEODifficulty
 from ..integrations.dataforseo_integration import DataForSEOClient
+from ..integrations.dataforseo_clients import get_dataforseo_client
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ class EnhancedKeywordAnalyzer(KeywordAnalyzer):
         self._df_client: Optional[DataForSEOClient] = None
         if self.use_dataforseo and api_key and api_secret:
             try:
-                self._df_client = DataForSEOClient(
+                self._df_client = get_dataforseo_client(
                     api_key=api_key,
                     api_secret=api_secret,
                     location=self.location,
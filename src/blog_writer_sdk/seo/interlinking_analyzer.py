@@ -1,12 +1,14 @@
 """
 Interlinking analyzer for matching keywords to existing content.
 """
+import heapq
 import logging
-from datetime import datetime
-from typing import List, Dict, Any, Tuple, Set
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple, Set
 from dateutil import parser as date_parser
 
 from ..models.integration_models import ExistingContentItem, InterlinkOpportunity
+from .interlinking_index import InterlinkIndex
 
 logger = logging.getLogger(__name__)
 
@@ -31,11 +33,11 @@ class InterlinkingAnalyzer:
         normalized = []
         
         for item in existing_content:
-            # Normalize keywords to lowercase
+            # Normalize keywords to lowercase (blank keywords would match everything)
             keywords = item.get('keywords', [])
             keywords_normalized = [
                 kw.lower().strip() 
-                for kw in keywords if kw
+                for kw in keywords if kw and kw.strip()
             ]
             
             normalized.append({
@@ -47,15 +49,48 @@ class InterlinkingAnalyzer:
                 'keywords_normalized': keywords_normalized,
                 'categories': item.get('categories', []),
                 'published_at': item.get('published_at'),
+                'published_date': self._parse_published(item.get('published_at')),
                 'excerpt': item.get('excerpt', ''),
             })
         
         return normalized
     
+    @staticmethod
+    def _parse_published(published_at: Any) -> Optional[datetime]:
+        if not published_at:
+            return None
+        try:
+            try:
+                published = datetime.fromisoformat(published_at)
+            except (ValueError, TypeError):
+                published = date_parser.parse(published_at)
+            # stdlib UTC keeps datetime.now(tz) cheap when scoring many candidates
+            return published.astimezone(timezone.utc) if published.tzinfo else published
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.debug(f"Could not parse published_at date: {e}")
+            return None
+    
+    def build_index(self, normalized_content: List[Dict[str, Any]]) -> InterlinkIndex:
+        """
+        Build an inverted index over normalized content.
+        
+        Args:
+            normalized_content: Items from normalize_content (first occurrence of an ID wins)
+            
+        Returns:
+            Index usable by match_keywords_to_content and analyze_interlinking_opportunities
+        """
+        index = InterlinkIndex()
+        for content in normalized_content:
+            if content.get('id') not in index:
+                index.upsert(content)
+        return index
+    
     def match_keywords_to_content(
         self,
         keywords: List[str],
-        existing_content: List[Dict[str, Any]]
+        existing_content: List[Dict[str, Any]],
+        index: Optional[InterlinkIndex] = None
     ) -> Dict[str, List[Dict[str, Any]]]:
         """
         Match keywords to existing content.
@@ -63,10 +98,21 @@ class InterlinkingAnalyzer:
         Args:
             keywords: List of keywords to match
             existing_content: List of normalized content items
+            index: Prebuilt index over the content; when given, matches come
+                from postings lookups instead of scanning every item
             
         Returns:
             Dictionary mapping keywords to list of matches
         """
+        if index is not None:
+            return {
+                keyword: [
+                    {'content': index.content(position), 'match_type': match_type, 'score': score}
+                    for position, match_type, score in index.search(keyword)
+                ]
+                for keyword in keywords
+            }
+        
         matches = {}
         
         for keyword in keywords:
@@ -163,7 +209,7 @@ class InterlinkingAnalyzer:
         # Boost score based on recency (newer content gets slight boost)
         if content.get('published_at'):
             try:
-                published_date = date_parser.parse(content['published_at'])
+                published_date = content.get('published_date') or date_parser.parse(content['published_at'])
                 days_old = (datetime.now(published_date.tzinfo) - published_date).days
                 
                 # Content less than 30 days old gets 10% boost
@@ -233,23 +279,28 @@ class InterlinkingAnalyzer:
     def analyze_interlinking_opportunities(
         self,
         keywords: List[str],
-        existing_content: List[Dict[str, Any]]
+        existing_content: List[Dict[str, Any]],
+        index: Optional[InterlinkIndex] = None,
+        top_k: int = 10
     ) -> Dict[str, Any]:
         """
         Complete interlinking analysis.
         
         Args:
             keywords: List of keywords to analyze
-            existing_content: List of existing content items
+            existing_content: List of existing content items (ignored when index is given)
+            index: Prebuilt (e.g. per-site cached) index over the content
+            top_k: Maximum opportunities per keyword
             
         Returns:
             Dictionary with analysis results
         """
-        # Normalize content
-        normalized_content = self.normalize_content(existing_content)
+        if index is None:
+            # Normalize and index content for this request only
+            index = self.build_index(self.normalize_content(existing_content))
         
         # Match keywords to content
-        matches = self.match_keywords_to_content(keywords, normalized_content)
+        matches = self.match_keywords_to_content(keywords, [], index=index)
         
         # Process matches and calculate scores
         per_keyword_results = []
@@ -258,10 +309,10 @@ class InterlinkingAnalyzer:
             keyword_matches = matches.get(keyword, [])
             
             # Calculate relevance scores
-            opportunities = []
+            scored = []
             seen_content_ids: Set[str] = set()
             
-            for match in keyword_matches:
+            for order, match in enumerate(keyword_matches):
                 content = match['content']
                 content_id = content['id']
                 
@@ -280,20 +331,19 @@ class InterlinkingAnalyzer:
                 
                 # Only include opportunities with score >= 0.4
                 if relevance_score >= 0.4:
-                    anchor_text = self.generate_anchor_text(keyword, content)
-                    
-                    opportunities.append({
-                        'target_url': content['url'],
-                        'target_title': content['title'],
-                        'anchor_text': anchor_text,
-                        'relevance_score': round(relevance_score, 2)
-                    })
-            
-            # Sort by relevance score (descending)
-            opportunities.sort(key=lambda x: x['relevance_score'], reverse=True)
+                    scored.append((round(relevance_score, 2), -order, content))
             
-            # Limit to top 10 opportunities per keyword
-            opportunities = opportunities[:10]
+            # Keep the top_k by relevance score (ties keep content order);
+            # anchor text is only generated for the survivors
+            opportunities = [
+                {
+                    'target_url': content['url'],
+                    'target_title': content['title'],
+                    'anchor_text': self.generate_anchor_text(keyword, content),
+                    'relevance_score': relevance_score
+                }
+                for relevance_score, _, content in heapq.nlargest(top_k, scored, key=lambda x: x[:2])
+            ]
             
             per_keyword_results.append({
                 'keyword': keyword,
@@ -0,0 +1,315 @@
+"""
+Inverted index over a site's existing content for interlinking.
+
+Matching a keyword against every content item is O(keywords x items x item
+keywords). The index answers the same questions from postings instead:
+
+- exact keyword lookups from a keyword map
+- "content keyword inside the query" by looking up every substring of the query
+- "query inside a content keyword / title" through trigram postings, verified
+  with a substring check
+- word overlap from word postings
+
+Indexes are kept per site by ``InterlinkIndexRegistry`` and synced
+incrementally (only added, changed or removed items are re-indexed), so
+repeated requests for large inventories reuse the same structures.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (doc position, match type, base score)
+IndexMatch = Tuple[int, str, float]
+
+GRAM_SIZE = 3
+
+# Scores per match type, as in the original linear matcher
+EXACT_SCORE = 1.0
+PARTIAL_SCORE = 0.7
+TITLE_SCORE = 0.8
+OVERLAP_MIN_RATIO = 0.3
+OVERLAP_WEIGHT = 0.6
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _intersect(postings: List[Set[Any]]) -> Set[Any]:
+    if not postings:
+        return set()
+    postings = sorted(postings, key=len)
+    result = set(postings[0])
+    for posting in postings[1:]:
+        result &= posting
+        if not result:
+            break
+    return result
+
+
+def content_fingerprint(item: Dict[str, Any]) -> str:
+    """Stable hash of the fields that affect matching and scoring."""
+    relevant = {
+        key: item.get(key)
+        for key in ("title", "url", "slug", "keywords", "categories", "published_at", "excerpt")
+    }
+    return hashlib.sha1(json.dumps(relevant, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class _IndexedDoc:
+    position: int
+    content: Dict[str, Any]
+    keywords: Set[str]
+    title_lower: str
+    words: Set[str]
+    fingerprint: str
+
+
+class InterlinkIndex:
+    """
+    Incrementally updatable index of normalized content items.
+
+    Items are the normalized dicts produced by
+    ``InterlinkingAnalyzer.normalize_content``.
+    """
+
+    def __init__(self):
+        self._docs: Dict[int, _IndexedDoc] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._keyword_docs: Dict[str, Set[int]] = {}
+        self._keyword_grams: Dict[str, Set[str]] = {}
+        self._max_keyword_length = 0
+        self._title_grams: Dict[str, Set[int]] = {}
+        self._word_docs: Dict[str, Set[int]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, content_id: Any) -> bool:
+        return str(content_id) in self._positions
+
+    def fingerprint(self, content_id: Any) -> Optional[str]:
+        position = self._positions.get(str(content_id))
+        return self._docs[position].fingerprint if position is not None else None
+
+    def content(self, position: int) -> Dict[str, Any]:
+        return self._docs[position].content
+
+    def upsert(self, content: Dict[str, Any], fingerprint: Optional[str] = None) -> None:
+        """Add or replace one normalized content item."""
+        content_id = str(content.get("id"))
+        with self._lock:
+            position = self._positions.get(content_id)
+            if position is not None:
+                self._unindex(self._docs[position])
+            else:
+                position = self._next_position
+                self._next_position += 1
+                self._positions[content_id] = position
+
+            keywords = set(content["keywords_normalized"])
+            title_lower = content["title"].lower()
+            doc = _IndexedDoc(
+                position=position,
+                content=content,
+                keywords=keywords,
+                title_lower=title_lower,
+                words=set(" ".join(content["keywords_normalized"] + [title_lower]).split()),
+                fingerprint=fingerprint or content_fingerprint(content),
+            )
+            self._docs[position] = doc
+
+            for keyword in keywords:
+                docs = self._keyword_docs.setdefault(keyword, set())
+                if not docs:
+                    self._max_keyword_length = max(self._max_keyword_length, len(keyword))
+                    for gram in _grams(keyword):
+                        self._keyword_grams.setdefault(gram, set()).add(keyword)
+                docs.add(position)
+            for gram in _grams(title_lower):
+                self._title_grams.setdefault(gram, set()).add(position)
+            for word in doc.words:
+                self._word_docs.setdefault(word, set()).add(position)
+
+    def remove(self, content_id: Any) -> bool:
+        """Remove an item by content ID."""
+        with self._lock:
+            position = self._positions.pop(str(content_id), None)
+            if position is None:
+                return False
+            self._unindex(self._docs.pop(position))
+            return True
+
+    def _unindex(self, doc: _IndexedDoc) -> None:
+        for keyword in doc.keywords:
+            docs = self._keyword_docs.get(keyword)
+            if docs is None:
+                continue
+            docs.discard(doc.position)
+            if not docs:
+                del self._keyword_docs[keyword]
+                for gram in _grams(keyword):
+                    self._discard(self._keyword_grams, gram, keyword)
+        for gram in _grams(doc.title_lower):
+            self._discard(self._title_grams, gram, doc.position)
+        for word in doc.words:
+            self._discard(self._word_docs, word, doc.position)
+
+    @staticmethod
+    def _discard(postings: Dict[Any, Set[Any]], key: Any, value: Any) -> None:
+        values = postings.get(key)
+        if values is not None:
+            values.discard(value)
+            if not values:
+                del postings[key]
+
+    def _keywords_containing(self, text: str) -> Set[str]:
+        """Indexed keywords that contain ``text``."""
+        if len(text) < GRAM_SIZE:
+            return {kw for kw in self._keyword_docs if text in kw}
+        postings = [self._keyword_grams.get(gram, set()) for gram in _grams(text)]
+        return {kw for kw in _intersect(postings) if text in kw}
+
+    def _keywords_within(self, text: str) -> Set[str]:
+        """Indexed keywords that are substrings of ``text``."""
+        found = set()
+        for start in range(len(text)):
+            for end in range(start + 1, min(len(text), start + self._max_keyword_length) + 1):
+                candidate = text[start:end]
+                if candidate in self._keyword_docs:
+                    found.add(candidate)
+        return found
+
+    def _titles_containing(self, text: str) -> Set[int]:
+        if len(text) < GRAM_SIZE:
+            return {p for p, doc in self._docs.items() if text in doc.title_lower}
+        postings = [self._title_grams.get(gram, set()) for gram in _grams(text)]
+        return {p for p in _intersect(postings) if text in self._docs[p].title_lower}
+
+    def search(self, keyword: str) -> List[IndexMatch]:
+        """
+        Find content matching a keyword.
+
+        Each item gets its strongest match type in the same precedence as the
+        linear matcher: exact, partial, title, then word overlap.
+
+        Returns:
+            Matches ordered by index position
+        """
+        keyword_lower = keyword.lower().strip()
+        if not keyword_lower:
+            return []
+
+        with self._lock:
+            matches: Dict[int, Tuple[str, float]] = {}
+
+            for position in self._keyword_docs.get(keyword_lower, ()):
+                matches[position] = ("exact", EXACT_SCORE)
+
+            partial_keywords = self._keywords_within(keyword_lower) | self._keywords_containing(keyword_lower)
+            for content_keyword in partial_keywords:
+                for position in self._keyword_docs[content_keyword]:
+                    matches.setdefault(position, ("partial", PARTIAL_SCORE))
+
+            for position in self._titles_containing(keyword_lower):
+                matches.setdefault(position, ("title", TITLE_SCORE))
+
+            keyword_words = set(keyword_lower.split())
+            overlaps: Dict[int, int] = {}
+            for word in keyword_words:
+                for position in self._word_docs.get(word, ()):
+                    overlaps[position] = overlaps.get(position, 0) + 1
+            for position, overlap in overlaps.items():
+                if position in matches:
+                    continue
+                ratio = overlap / len(keyword_words)
+                if ratio >= OVERLAP_MIN_RATIO:
+                    matches[position] = ("word_overlap", ratio * OVERLAP_WEIGHT)
+
+            return [(position, kind, score) for position, (kind, score) in sorted(matches.items())]
+
+
+class InterlinkIndexRegistry:
+    """
+    Per-site interlinking indexes, synced incrementally and bounded LRU.
+
+    Callers send their full inventory with each request; syncing only
+    re-indexes items whose fingerprint changed and drops items that are gone.
+    """
+
+    def __init__(self, max_sites: Optional[int] = None):
+        self.max_sites = max_sites or int(os.getenv("INTERLINK_INDEX_MAX_SITES", "50"))
+        self._indexes: "OrderedDict[str, Tuple[str, InterlinkIndex]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, site_key: str) -> Optional[InterlinkIndex]:
+        entry = self._indexes.get(site_key)
+        return entry[1] if entry else None
+
+    def sync(self, site_key: str, normalized_content: Iterable[Dict[str, Any]]) -> Tuple[InterlinkIndex, Dict[str, int]]:
+        """
+        Bring a site's index in line with its current inventory.
+
+        Args:
+            site_key: Tenant/site identifier
+            normalized_content: Normalized content items (first occurrence of an ID wins)
+
+        Returns:
+            Tuple of (index, counts of added/updated/removed/unchanged items)
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        for content in normalized_content:
+            items.setdefault(str(content.get("id")), content)
+        fingerprints = {content_id: content_fingerprint(content) for content_id, content in items.items()}
+        inventory_hash = hashlib.sha1("".join(sorted(fingerprints.values())).encode()).hexdigest()
+
+        with self._lock:
+            entry = self._indexes.get(site_key)
+            if entry is None:
+                index = InterlinkIndex()
+            else:
+                index = entry[1]
+                self._indexes.move_to_end(site_key)
+            if entry is not None and entry[0] == inventory_hash:
+                return index, {"added": 0, "updated": 0, "removed": 0, "unchanged": len(items)}
+            self._indexes[site_key] = (inventory_hash, index)
+            while len(self._indexes) > self.max_sites:
+                self._indexes.popitem(last=False)
+
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        for content_id in [cid for cid in list(index._positions) if cid not in items]:
+            index.remove(content_id)
+            counts["removed"] += 1
+        for content_id, content in items.items():
+            current = index.fingerprint(content_id)
+            if current == fingerprints[content_id]:
+                counts["unchanged"] += 1
+                continue
+            counts["updated" if current else "added"] += 1
+            index.upsert(content, fingerprints[content_id])
+
+        logger.debug(f"Interlink index for {site_key} synced: {counts}")
+        return index, counts
+
+
+# Global registry instance
+_interlink_index_registry: Optional[InterlinkIndexRegistry] = None
+
+
+def get_interlink_index_registry() -> InterlinkIndexRegistry:
+    """Get the global interlink index registry."""
+    global _interlink_index_registry
+    if _interlink_index_registry is None:
+        _interlink_index_registry = InterlinkIndexRegistry()
+    return _interlink_index_registry
@@ -168,6 +168,41 @@ class KeywordClustering:
             cluster_count=len(merged_clusters)
         )
     
+    async def resolve_entity_clusters(
+        self,
+        result: ClusteringResult,
+        language: str = "en",
+        max_lookups: int = 20
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Entity-based grouping: mark clusters whose parent topic is a known entity.
+        
+        Parent topics are resolved in one batched call through the Knowledge
+        Graph client's entity cache, so repeated topics across requests cost
+        no lookups. Only exact (case-insensitive) name matches count.
+        
+        Args:
+            result: Clustering result to annotate in place
+            language: Language code for entity lookups
+            max_lookups: Maximum distinct parent topics resolved
+        
+        Returns:
+            Mapping of parent topic to its Knowledge Graph entity
+        """
+        if not self.knowledge_graph_client or not result.clusters:
+            return {}
+        
+        topics = list(dict.fromkeys(c.parent_topic for c in result.clusters if c.parent_topic))[:max_lookups]
+        resolved = await self.knowledge_graph_client.resolve_entities(topics, language)
+        entities = {
+            topic: entity for topic, entity in resolved.items()
+            if entity and " ".join(entity.get("name", "").split()).casefold() == " ".join(topic.split()).casefold()
+        }
+        for cluster in result.clusters:
+            if cluster.parent_topic in entities:
+                cluster.category_type = "entity"
+        return entities
+    
     def _normalize_keyword(self, keyword: str) -> str:
         """Normalize keyword for clustering."""
         # Lowercase and strip
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+from .batch_scorer import count_syllables
+
 logger = logging.getLogger(__name__)
 
 
@@ -229,27 +231,8 @@ class ReadabilityAnalyzer:
         return words
     
     def _count_syllables(self, word: str) -> int:
-        """Count syllables in a word (approximation)."""
-        word = word.lower()
-        if len(word) <= 3:
-            return 1
-        
-        vowels = 'aeiouy'
-        syllable_count = 0
-        previous_was_vowel = False
-        
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
-        
-        # Handle silent e
-        if word.endswith('e'):
-            syllable_count -= 1
-        
-        # Minimum 1 syllable
-        return max(1, syllable_count)
+        """Count syllables in a word (approximation, memoized)."""
+        return count_syllables(word)
     
     def _calculate_flesch_reading_ease(
         self,
@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Any, Set
 from dataclasses import dataclass
 import re
 
+from ..utils.multi_pattern import MultiPatternMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -215,27 +217,44 @@ class SemanticKeywordIntegrator:
         """Identify natural points in content for keyword integration."""
         integration_points = []
         
+        # Word postings for every cluster, built once: a sentence's words are
+        # looked up once instead of re-checking each cluster/keyword pair
+        # (same rule as _is_semantically_relevant: the sentence must share a
+        # word with the primary keyword and with the related keyword)
+        primary_postings: Dict[str, Set[int]] = {}
+        related_postings: Dict[str, List[tuple]] = {}
+        for cluster_index, cluster in enumerate(clusters):
+            for word in set(cluster.primary_keyword.lower().split()):
+                primary_postings.setdefault(word, set()).add(cluster_index)
+            for keyword_index, related_keyword in enumerate(cluster.related_keywords[:5]):
+                for word in set(related_keyword.lower().split()):
+                    related_postings.setdefault(word, []).append((cluster_index, keyword_index))
+        
         # Split content into sentences
         sentences = re.split(r'[.!?]+\s+', content)
         
         for i, sentence in enumerate(sentences):
-            sentence_lower = sentence.lower()
+            sentence_words = set(sentence.lower().split())
+            
+            clusters_with_primary: Set[int] = set()
+            best_related: Dict[int, int] = {}
+            for word in sentence_words:
+                clusters_with_primary.update(primary_postings.get(word, ()))
+                for cluster_index, keyword_index in related_postings.get(word, ()):
+                    if keyword_index < best_related.get(cluster_index, keyword_index + 1):
+                        best_related[cluster_index] = keyword_index
             
             # Check if sentence could naturally include related keywords
-            for cluster in clusters:
-                for related_keyword in cluster.related_keywords[:5]:
-                    related_lower = related_keyword.lower()
-                    
-                    # Check if related keyword is semantically relevant to sentence
-                    if self._is_semantically_relevant(sentence, related_keyword, cluster.primary_keyword):
-                        integration_points.append({
-                            "position": i,
-                            "sentence": sentence,
-                            "keyword": related_keyword,
-                            "cluster": cluster.primary_keyword,
-                            "suggestion": cluster.usage_suggestions.get(related_keyword, "")
-                        })
-                        break  # One keyword per sentence max
+            for cluster_index in sorted(clusters_with_primary & best_related.keys()):
+                cluster = clusters[cluster_index]
+                related_keyword = cluster.related_keywords[best_related[cluster_index]]
+                integration_points.append({
+                    "position": i,
+                    "sentence": sentence,
+                    "keyword": related_keyword,
+                    "cluster": cluster.primary_keyword,
+                    "suggestion": cluster.usage_suggestions.get(related_keyword, "")
+                })
         
         return integration_points
     
@@ -323,16 +342,14 @@ class SemanticKeywordIntegrator:
         clusters: List[KeywordCluster]
     ) -> List[str]:
         """Extract which keywords were actually used in content."""
-        content_lower = content.lower()
-        used = []
-        
+        keywords = []
         for cluster in clusters:
-            if cluster.primary_keyword.lower() in content_lower:
-                used.append(cluster.primary_keyword)
-            
-            for related in cluster.related_keywords:
-                if related.lower() in content_lower:
-                    used.append(related)
+            keywords.append(cluster.primary_keyword)
+            keywords.extend(cluster.related_keywords)
+        
+        # Single pass over the content for all keywords
+        matcher = MultiPatternMatcher((keyword, keyword) for keyword in keywords)
+        used = {match.payload for match in matcher.iter_matches(content)}
         
-        return list(set(used))  # Remove duplicates
+        return list(used)
 
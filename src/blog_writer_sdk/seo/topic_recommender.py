@@ -8,13 +8,215 @@ Recommends high-ranking blog topics based on:
 - AI-powered topic generation (Claude)
 """
 
+import asyncio
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import operator
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Keywords per keyword_overview request (DataForSEO accepts up to 700)
+OVERVIEW_BATCH_SIZE = 700
+
+# Suggestions / related keywords requested per seed keyword
+SUGGESTIONS_PER_SEED = 500
+RELATED_PER_SEED = 300
+
+# Scoring tiers: (comparison, [(threshold, points), ...], default points).
+# The first matching tier wins, as in an if/elif chain.
+Tiers = Tuple[Any, Sequence[Tuple[float, float]], float]
+
+RANKING_TIERS: Dict[str, Tiers] = {
+    "search_volume": (operator.ge, [(10000, 40), (5000, 35), (1000, 30), (500, 25), (100, 20)], 10),
+    "difficulty": (operator.le, [(30, 30), (50, 25), (70, 20)], 10),
+    "competition": (operator.le, [(0.3, 20), (0.5, 15), (0.7, 10)], 5),
+    "cpc": (operator.ge, [(5.0, 10), (2.0, 8), (1.0, 6), (0.5, 4)], 2),
+}
+
+OPPORTUNITY_TIERS: Dict[str, Tiers] = {
+    "search_volume": (operator.ge, [(1000, 40), (500, 30), (100, 20)], 10),
+    "difficulty": (operator.le, [(40, 35), (60, 25)], 15),
+    "competition": (operator.le, [(0.4, 25), (0.6, 15)], 5),
+}
+
+GAP_OPPORTUNITY_TIERS: Dict[str, Tiers] = {
+    "gap_size": (operator.ge, [(50, 40), (30, 30), (10, 20)], 10),
+    "competitor_coverage_pct": (operator.le, [(30, 30), (50, 20), (70, 10)], 0),
+    "total_results": (operator.lt, [(5, 30), (8, 20)], 10),
+}
+
+
+def _column(values: Sequence[float]):
+    if NUMPY_AVAILABLE:
+        return np.asarray(values, dtype=float)
+    return [float(v) for v in values]
+
+
+def _tier_points(values, tiers: Tiers):
+    """Points per value for one tier table (vectorized with NumPy)."""
+    compare, levels, default = tiers
+    if NUMPY_AVAILABLE:
+        return np.select([compare(values, threshold) for threshold, _ in levels], [points for _, points in levels], default)
+    return [
+        next((points for threshold, points in levels if compare(value, threshold)), default)
+        for value in values
+    ]
+
+
+def _tiered_total(tier_table: Dict[str, Tiers], columns: Dict[str, Any], cap: Optional[float] = None):
+    parts = [_tier_points(columns[name], tiers) for name, tiers in tier_table.items()]
+    if NUMPY_AVAILABLE:
+        total = np.sum(parts, axis=0).astype(float)
+        return np.minimum(total, cap) if cap is not None else total
+    total = [float(sum(values)) for values in zip(*parts)]
+    return [min(value, cap) for value in total] if cap is not None else total
+
+
+def ranking_scores(search_volume, difficulty, competition, cpc):
+    """Ranking scores (0-100) for columns of keyword metrics."""
+    return _tiered_total(RANKING_TIERS, {
+        "search_volume": _column(search_volume),
+        "difficulty": _column(difficulty),
+        "competition": _column(competition),
+        "cpc": _column(cpc),
+    })
+
+
+def opportunity_scores(search_volume, difficulty, competition):
+    """Content opportunity scores (0-100) for columns of keyword metrics."""
+    return _tiered_total(OPPORTUNITY_TIERS, {
+        "search_volume": _column(search_volume),
+        "difficulty": _column(difficulty),
+        "competition": _column(competition),
+    }, cap=100.0)
+
+
+def gap_opportunity_scores(competitor_coverage_pct, your_coverage_pct, total_results):
+    """Content gap opportunity scores (0-100) for columns of SERP coverage."""
+    competitor = _column(competitor_coverage_pct)
+    yours = _column(your_coverage_pct)
+    gap_size = competitor - yours if NUMPY_AVAILABLE else [c - y for c, y in zip(competitor, yours)]
+    return _tiered_total(GAP_OPPORTUNITY_TIERS, {
+        "gap_size": gap_size,
+        "competitor_coverage_pct": competitor,
+        "total_results": _column(total_results),
+    }, cap=100.0)
+
+
+def normalize_topic_key(keyword: Optional[str]) -> str:
+    """Dedup key for a primary keyword (case and whitespace insensitive)."""
+    return " ".join((keyword or "").lower().split())
+
+
+class TopicCandidateTable:
+    """
+    Columnar candidate set for scoring and selecting topics in bulk.
+
+    Metrics are held as NumPy columns (lists without NumPy) so scoring,
+    filtering and top-k selection are single passes over the whole set.
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        search_volume: Sequence[float],
+        difficulty: Sequence[float],
+        competition: Sequence[float],
+        cpc: Sequence[float],
+        ranking_score: Optional[Sequence[float]] = None,
+        opportunity_score: Optional[Sequence[float]] = None
+    ):
+        self.keywords = list(keywords)
+        self.search_volume = _column(search_volume)
+        self.difficulty = _column(difficulty)
+        self.competition = _column(competition)
+        self.cpc = _column(cpc)
+        self.ranking_score = (
+            _column(ranking_score) if ranking_score is not None
+            else ranking_scores(self.search_volume, self.difficulty, self.competition, self.cpc)
+        )
+        self.opportunity_score = (
+            _column(opportunity_score) if opportunity_score is not None
+            else opportunity_scores(self.search_volume, self.difficulty, self.competition)
+        )
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    @classmethod
+    def from_topics(cls, topics: Sequence["RecommendedTopic"]) -> "TopicCandidateTable":
+        """Build from existing topics, keeping their stored scores."""
+        return cls(
+            keywords=[t.primary_keyword for t in topics],
+            search_volume=[t.search_volume or 0 for t in topics],
+            difficulty=[t.difficulty if t.difficulty is not None else 50.0 for t in topics],
+            competition=[t.competition if t.competition is not None else 0.5 for t in topics],
+            cpc=[t.cpc or 0.0 for t in topics],
+            ranking_score=[t.ranking_score for t in topics],
+            opportunity_score=[t.opportunity_score for t in topics],
+        )
+
+    def unique_mask(self):
+        """True for the first occurrence of each normalized primary keyword."""
+        seen = set()
+        keep = []
+        for keyword in self.keywords:
+            key = normalize_topic_key(keyword)
+            keep.append(bool(key) and key not in seen)
+            seen.add(key)
+        return np.asarray(keep, dtype=bool) if NUMPY_AVAILABLE else keep
+
+    def criteria_mask(self, min_search_volume: int, max_difficulty: float):
+        """True where volume and difficulty meet the thresholds."""
+        if NUMPY_AVAILABLE:
+            return (self.search_volume >= min_search_volume) & (self.difficulty <= max_difficulty)
+        return [v >= min_search_volume and d <= max_difficulty for v, d in zip(self.search_volume, self.difficulty)]
+
+    def where(self, *masks):
+        """Combine boolean columns with AND."""
+        if NUMPY_AVAILABLE:
+            return np.logical_and.reduce([np.asarray(m, dtype=bool) for m in masks])
+        return [all(values) for values in zip(*masks)]
+
+    @staticmethod
+    def first_k(mask, k: int) -> List[int]:
+        """Indices of the first k rows where ``mask`` is true."""
+        if NUMPY_AVAILABLE:
+            return [int(i) for i in np.flatnonzero(mask)[:k]]
+        return [i for i, keep in enumerate(mask) if keep][:k]
+
+    @staticmethod
+    def top_k(scores, k: int, mask=None) -> List[int]:
+        """
+        Indices of the k highest scores (ties keep input order).
+
+        Uses argpartition (or a heap without NumPy) so only the winners are sorted.
+        """
+        if k <= 0:
+            return []
+        if not NUMPY_AVAILABLE:
+            candidates = [i for i in range(len(scores)) if mask is None or mask[i]]
+            return heapq.nsmallest(k, candidates, key=lambda i: (-scores[i], i))
+
+        indices = np.arange(len(scores)) if mask is None else np.flatnonzero(mask)
+        values = np.asarray(scores, dtype=float)[indices]
+        if indices.size > k:
+            threshold = values[np.argpartition(values, indices.size - k)[indices.size - k]]
+            keep = values >= threshold
+            indices, values = indices[keep], values[keep]
+        order = np.lexsort((indices, -values))[:k]
+        return [int(i) for i in indices[order]]
+
 
 @dataclass
 class RecommendedTopic:
@@ -110,6 +312,7 @@ class TopicRecommendationEngine:
             logger.info(f"✅ DataForSEO client available, starting keyword analysis...")
             try:
                 # Get related keywords and suggestions
+                candidate_keywords: List[str] = []
                 for seed in seed_keywords[:5]:  # Limit to avoid too many API calls
                     try:
                         # Get keyword suggestions
@@ -118,7 +321,7 @@ class TopicRecommendationEngine:
                             location_name=location,
                             language_code=language,
                             tenant_id="default",
-                            limit=50
+                            limit=SUGGESTIONS_PER_SEED
                         )
                         
                         # Get related keywords
@@ -128,62 +331,41 @@ class TopicRecommendationEngine:
                             language_code=language,
                             tenant_id="default",
                             depth=1,
-                            limit=30
+                            limit=RELATED_PER_SEED
                         )
                         
                         # Parse related keywords response
                         related_keywords_list = []
                         if isinstance(related, dict) and "items" in related:
-                            related_keywords_list = [r.get("keyword", "") for r in related.get("items", [])[:20] if r.get("keyword")]
+                            related_keywords_list = [r.get("keyword", "") for r in related.get("items", [])[:RELATED_PER_SEED] if r.get("keyword")]
                         elif isinstance(related, list):
-                            related_keywords_list = [r.get("keyword", "") for r in related[:20] if isinstance(r, dict) and r.get("keyword")]
+                            related_keywords_list = [r.get("keyword", "") for r in related[:RELATED_PER_SEED] if isinstance(r, dict) and r.get("keyword")]
                         
                         # Parse suggestions response
                         suggestions_list = []
                         if isinstance(suggestions, list):
-                            suggestions_list = [s.get("keyword", "") for s in suggestions[:30] if isinstance(s, dict) and s.get("keyword")]
+                            suggestions_list = [s.get("keyword", "") for s in suggestions[:SUGGESTIONS_PER_SEED] if isinstance(s, dict) and s.get("keyword")]
                         elif isinstance(suggestions, dict) and "items" in suggestions:
-                            suggestions_list = [s.get("keyword", "") for s in suggestions.get("items", [])[:30] if s.get("keyword")]
+                            suggestions_list = [s.get("keyword", "") for s in suggestions.get("items", [])[:SUGGESTIONS_PER_SEED] if s.get("keyword")]
                         
                         logger.info(f"📊 Seed '{seed}': {len(suggestions_list)} suggestions, {len(related_keywords_list)} related keywords")
                         
-                        # Combine and analyze
-                        candidate_keywords = (suggestions_list or []) + (related_keywords_list or [])
-                        
-                        if not candidate_keywords:
+                        seed_candidates = (suggestions_list or []) + (related_keywords_list or [])
+                        if not seed_candidates:
                             logger.warning(f"⚠️ No candidate keywords found for seed '{seed}'")
+                        candidate_keywords.extend(seed_candidates)
                         
-                        # Analyze each candidate
-                        if candidate_keywords:
-                            logger.info(f"Analyzing {len(set(candidate_keywords))} candidate keywords for seed '{seed}'")
-                            analyzed_count = 0
-                            filtered_count = 0
-                            added_count = 0
-                            for keyword in set(candidate_keywords):
-                                if not keyword or len(keyword) < 3:
-                                    continue
-                                
-                                topic = await self._analyze_topic_potential(
-                                    keyword, location, language
-                                )
-                                
-                                if topic:
-                                    analyzed_count += 1
-                                    if self._meets_criteria(topic, min_search_volume, max_difficulty):
-                                        all_topics.append(topic)
-                                        added_count += 1
-                                        logger.debug(f"✅ Topic added: {topic.topic} (volume={topic.search_volume}, difficulty={topic.difficulty:.1f})")
-                                    else:
-                                        filtered_count += 1
-                                        logger.debug(f"❌ Topic filtered: {topic.topic} (volume={topic.search_volume}<{min_search_volume} or difficulty={topic.difficulty:.1f}>{max_difficulty})")
-                            
-                            if analyzed_count > 0:
-                                logger.info(f"Seed '{seed}': {analyzed_count} analyzed, {filtered_count} filtered, {added_count} added")
-                                
                     except Exception as e:
                         logger.warning(f"Failed to get suggestions for {seed}: {e}")
                         continue
                         
+                # Score all candidates in one pass, then build only the winners
+                dfs_topics = await self._analyze_candidates(
+                    candidate_keywords, location, language,
+                    min_search_volume, max_difficulty, max_topics
+                )
+                all_topics.extend(dfs_topics)
+                
             except Exception as e:
                 logger.warning(f"DataForSEO topic analysis failed: {e}")
         
@@ -207,18 +389,27 @@ class TopicRecommendationEngine:
             except Exception as e:
                 logger.warning(f"AI topic generation failed: {e}")
         
-        # Step 4: Deduplicate and score topics
-        unique_topics = self._deduplicate_topics(all_topics)
-        scored_topics = sorted(
-            unique_topics,
-            key=lambda t: t.ranking_score,
-            reverse=True
-        )[:max_topics]
+        # Step 4: Deduplicate and select the top-ranked topics
+        all_topics = [t for t in all_topics if t]
+        table = TopicCandidateTable.from_topics(all_topics)
+        scored_topics = [
+            all_topics[i] for i in table.top_k(table.ranking_score, max_topics, table.unique_mask())
+        ]
         
-        # Step 5: Categorize topics
-        high_priority = [t for t in scored_topics if t.ranking_score >= 70][:5]
-        trending = [t for t in scored_topics if t.search_volume > 1000 and t.difficulty < 50][:5]
-        low_competition = [t for t in scored_topics if t.difficulty < 40][:5]
+        # Step 5: Categorize topics (first 5 per bucket in ranked order)
+        ranked = TopicCandidateTable.from_topics(scored_topics)
+        
+        def bucket(condition) -> List[RecommendedTopic]:
+            return [scored_topics[i] for i in ranked.first_k(condition, 5)]
+        
+        if NUMPY_AVAILABLE:
+            high_priority = bucket(ranked.ranking_score >= 70)
+            trending = bucket((ranked.search_volume > 1000) & (ranked.difficulty < 50))
+            low_competition = bucket(ranked.difficulty < 40)
+        else:
+            high_priority = bucket([score >= 70 for score in ranked.ranking_score])
+            trending = bucket([v > 1000 and d < 50 for v, d in zip(ranked.search_volume, ranked.difficulty)])
+            low_competition = bucket([d < 40 for d in ranked.difficulty])
         
         return TopicRecommendationResult(
             recommended_topics=scored_topics,
@@ -229,6 +420,131 @@ class TopicRecommendationEngine:
             analysis_date=datetime.now().isoformat()
         )
     
+    async def _analyze_candidates(
+        self,
+        candidate_keywords: List[str],
+        location: str,
+        language: str,
+        min_search_volume: int,
+        max_difficulty: float,
+        max_topics: int
+    ) -> List[RecommendedTopic]:
+        """
+        Score candidate keywords as a table and build topics for the best ones.
+        
+        Metrics come from batched keyword overviews; related keywords and
+        content gaps are only fetched for the selected top ``max_topics``.
+        """
+        keywords = list(dict.fromkeys(
+            k for k in candidate_keywords if k and len(k) >= 3
+        ))
+        if not keywords:
+            return []
+        
+        metrics = await self._fetch_keyword_metrics(keywords, location, language)
+        analyzed = [k for k in keywords if k in metrics]
+        if not analyzed:
+            return []
+        
+        table = TopicCandidateTable(
+            keywords=analyzed,
+            search_volume=[metrics[k][0] for k in analyzed],
+            difficulty=[metrics[k][1] for k in analyzed],
+            competition=[metrics[k][2] for k in analyzed],
+            cpc=[metrics[k][3] for k in analyzed],
+        )
+        eligible = table.where(table.criteria_mask(min_search_volume, max_difficulty), table.unique_mask())
+        selected = table.top_k(table.ranking_score, max_topics, eligible)
+        logger.info(
+            f"Scored {len(analyzed)} of {len(keywords)} candidate keywords, "
+            f"{int(sum(eligible))} met criteria, building {len(selected)} topics"
+        )
+        
+        topics = await asyncio.gather(*(
+            self._build_topic(
+                table.keywords[i], metrics[table.keywords[i]], location, language,
+                ranking_score=float(table.ranking_score[i]),
+                opportunity_score=float(table.opportunity_score[i])
+            )
+            for i in selected
+        ))
+        return [t for t in topics if t]
+    
+    async def _fetch_keyword_metrics(
+        self,
+        keywords: List[str],
+        location: str,
+        language: str
+    ) -> Dict[str, Tuple[int, float, float, float]]:
+        """Fetch (volume, difficulty, competition, cpc) per keyword in batched overview calls."""
+        if not self.df_client or not keywords:
+            return {}
+        
+        batches = [keywords[i:i + OVERVIEW_BATCH_SIZE] for i in range(0, len(keywords), OVERVIEW_BATCH_SIZE)]
+        overviews = await asyncio.gather(*(
+            self.df_client.get_keyword_overview(
+                keywords=batch,
+                location_name=location,
+                language_code=language,
+                tenant_id="default"
+            )
+            for batch in batches
+        ), return_exceptions=True)
+        
+        metrics: Dict[str, Tuple[int, float, float, float]] = {}
+        for batch, overview in zip(batches, overviews):
+            if isinstance(overview, Exception):
+                logger.warning(f"Keyword overview failed for {len(batch)} keywords: {overview}")
+                continue
+            for keyword, data in self._overview_rows(overview, batch).items():
+                metrics[keyword] = self._overview_metrics(data)
+        return metrics
+    
+    @staticmethod
+    def _overview_rows(overview: Any, keywords: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Map requested keywords to their overview rows across response formats."""
+        if not isinstance(overview, dict) or not overview:
+            return {}
+        
+        if "tasks" in overview:
+            items = []
+            for task in overview.get("tasks") or []:
+                for result in (task or {}).get("result") or []:
+                    items.extend((result or {}).get("items") or [])
+        else:
+            items = overview.get("items")
+        
+        rows: Dict[str, Dict[str, Any]] = {}
+        if items is None:
+            # Keyword-keyed format
+            for keyword in keywords:
+                if isinstance(overview.get(keyword), dict):
+                    rows[keyword] = overview[keyword]
+            return rows
+        
+        items = [item for item in items if isinstance(item, dict)]
+        if len(keywords) == 1 and items and not any(item.get("keyword") for item in items):
+            return {keywords[0]: items[0]}
+        
+        by_key = {}
+        for item in items:
+            by_key.setdefault(normalize_topic_key(item.get("keyword")), item)
+        for keyword in keywords:
+            item = by_key.get(normalize_topic_key(keyword))
+            if item is not None:
+                rows[keyword] = item
+        return rows
+    
+    @staticmethod
+    def _overview_metrics(data: Dict[str, Any]) -> Tuple[int, float, float, float]:
+        """Extract (volume, difficulty, competition, cpc) from an overview row."""
+        info = {**(data.get("keyword_info") or {}), **(data.get("keyword_properties") or {}), **data}
+        search_volume = info.get("search_volume", 0) or info.get("monthly_searches", 0) or 0
+        difficulty = info.get("keyword_difficulty", 50.0) or info.get("difficulty", 50.0) or 50.0
+        competition = info.get("competition", 0.5) or info.get("competition_index", 0.5) or 0.5
+        cpc = info.get("cpc", 0.0) or info.get("cost_per_click", 0.0) or 0.0
+        return search_volume, difficulty, competition, cpc
+    
     async def _analyze_topic_potential(
         self,
         keyword: str,
@@ -240,95 +556,68 @@ class TopicRecommendationEngine:
             if not self.df_client:
                 return None
             
-            # Get keyword overview
-            overview = await self.df_client.get_keyword_overview(
-                keywords=[keyword],
-                location_name=location,
-                language_code=language,
-                tenant_id="default"
-            )
-            
-            if not overview:
-                return None
-            
-            # Handle different response formats
-            if isinstance(overview, dict):
-                if keyword in overview:
-                    data = overview[keyword]
-                elif "items" in overview:
-                    items = overview.get("items", [])
-                    if items and len(items) > 0:
-                        data = items[0]
-                    else:
-                        return None
-                else:
-                    return None
-            else:
+            metrics = await self._fetch_keyword_metrics([keyword], location, language)
+            if keyword not in metrics:
                 return None
+            return await self._build_topic(keyword, metrics[keyword], location, language)
             
-            search_volume = data.get("search_volume", 0) or data.get("monthly_searches", 0)
-            difficulty = data.get("keyword_difficulty", 50.0) or data.get("difficulty", 50.0)
-            competition = data.get("competition", 0.5) or data.get("competition_index", 0.5)
-            cpc = data.get("cpc", 0.0) or data.get("cost_per_click", 0.0)
-            
-            # Get related keywords
-            related = await self.df_client.get_related_keywords(
-                keyword=keyword,
-                location_name=location,
-                language_code=language,
-                tenant_id="default",
-                depth=1,
-                limit=10
-            )
-            # Handle different response formats
-            related_keywords = []
-            if isinstance(related, dict):
-                if "items" in related:
-                    related_keywords = [r.get("keyword", "") for r in related.get("items", [])[:10] if r.get("keyword")]
-                elif isinstance(related, list):
-                    related_keywords = [r.get("keyword", "") for r in related[:10] if isinstance(r, dict) and r.get("keyword")]
-            elif isinstance(related, list):
-                related_keywords = [r.get("keyword", "") for r in related[:10] if isinstance(r, dict) and r.get("keyword")]
-            
-            # Calculate ranking score
-            ranking_score = self._calculate_ranking_score(
-                search_volume, difficulty, competition, cpc
-            )
-            
-            # Calculate opportunity score (content gap potential)
-            opportunity_score = self._calculate_opportunity_score(
-                search_volume, difficulty, competition
-            )
-            
-            # Estimate traffic potential
-            estimated_traffic = int(search_volume * 0.1)  # Conservative estimate: 10% CTR
-            
-            # Generate reason
-            reason = self._generate_recommendation_reason(
-                search_volume, difficulty, competition, cpc
-            )
-            
-            # Find content gaps
-            content_gaps = await self._identify_content_gaps(keyword)
-            
-            return RecommendedTopic(
-                topic=keyword.title(),
-                primary_keyword=keyword,
-                search_volume=search_volume,
-                difficulty=difficulty,
-                competition=competition,
-                cpc=cpc,
-                ranking_score=ranking_score,
-                opportunity_score=opportunity_score,
-                related_keywords=related_keywords,
-                content_gaps=content_gaps,
-                estimated_traffic=estimated_traffic,
-                reason=reason
+        except Exception as e:
+            logger.warning(f"Failed to analyze topic potential for {keyword}: {e}")
+            return None
+    
+    async def _build_topic(
+        self,
+        keyword: str,
+        metrics: Tuple[int, float, float, float],
+        location: str,
+        language: str,
+        ranking_score: Optional[float] = None,
+        opportunity_score: Optional[float] = None
+    ) -> Optional[RecommendedTopic]:
+        """Build a RecommendedTopic, fetching related keywords and content gaps concurrently."""
+        search_volume, difficulty, competition, cpc = metrics
+        try:
+            related, content_gaps = await asyncio.gather(
+                self.df_client.get_related_keywords(
+                    keyword=keyword,
+                    location_name=location,
+                    language_code=language,
+                    tenant_id="default",
+                    depth=1,
+                    limit=10
+                ),
+                self._identify_content_gaps(keyword)
             )
-            
         except Exception as e:
             logger.warning(f"Failed to analyze topic potential for {keyword}: {e}")
             return None
+        
+        # Handle different response formats
+        related_keywords = []
+        if isinstance(related, dict) and "items" in related:
+            related_keywords = [r.get("keyword", "") for r in related.get("items", [])[:10] if r.get("keyword")]
+        elif isinstance(related, list):
+            related_keywords = [r.get("keyword", "") for r in related[:10] if isinstance(r, dict) and r.get("keyword")]
+        
+        if ranking_score is None:
+            ranking_score = self._calculate_ranking_score(search_volume, difficulty, competition, cpc)
+        if opportunity_score is None:
+            opportunity_score = self._calculate_opportunity_score(search_volume, difficulty, competition)
+        
+        return RecommendedTopic(
+            topic=keyword.title(),
+            primary_keyword=keyword,
+            search_volume=search_volume,
+            difficulty=difficulty,
+            competition=competition,
+            cpc=cpc,
+            ranking_score=ranking_score,
+            opportunity_score=opportunity_score,
+            related_keywords=related_keywords,
+            content_gaps=content_gaps,
+            estimated_traffic=int(search_volume * 0.1),  # Conservative estimate: 10% CTR
+            reason=self._generate_recommendation_reason(search_volume, difficulty, competition, cpc)
+        )
     
     def _calculate_ranking_score(
         self,
@@ -340,55 +629,9 @@ class TopicRecommendationEngine:
         """
         Calculate ranking score (0-100) for a topic.
         
-        Higher score = better ranking opportunity.
+        Higher score = better ranking opportunity. See ``RANKING_TIERS``.
         """
-        # Volume score (0-40 points)
-        if search_volume >= 10000:
-            volume_score = 40
-        elif search_volume >= 5000:
-            volume_score = 35
-        elif search_volume >= 1000:
-            volume_score = 30
-        elif search_volume >= 500:
-            volume_score = 25
-        elif search_volume >= 100:
-            volume_score = 20
-        else:
-            volume_score = 10
-        
-        # Difficulty score (0-30 points) - lower difficulty = higher score
-        if difficulty <= 30:
-            difficulty_score = 30
-        elif difficulty <= 50:
-            difficulty_score = 25
-        elif difficulty <= 70:
-            difficulty_score = 20
-        else:
-            difficulty_score = 10
-        
-        # Competition score (0-20 points) - lower competition = higher score
-        if competition <= 0.3:
-            competition_score = 20
-        elif competition <= 0.5:
-            competition_score = 15
-        elif competition <= 0.7:
-            competition_score = 10
-        else:
-            competition_score = 5
-        
-        # CPC score (0-10 points) - higher CPC = more commercial value
-        if cpc >= 5.0:
-            cpc_score = 10
-        elif cpc >= 2.0:
-            cpc_score = 8
-        elif cpc >= 1.0:
-            cpc_score = 6
-        elif cpc >= 0.5:
-            cpc_score = 4
-        else:
-            cpc_score = 2
-        
-        return volume_score + difficulty_score + competition_score + cpc_score
+        return float(ranking_scores([search_volume], [difficulty], [competition], [cpc])[0])
     
     def _calculate_opportunity_score(
         self,
@@ -399,38 +642,9 @@ class TopicRecommendationEngine:
         """
         Calculate opportunity score (0-100) for content gaps.
         
-        Higher score = better content gap opportunity.
+        Higher score = better content gap opportunity. See ``OPPORTUNITY_TIERS``.
         """
-        # High volume + low difficulty + low competition = high opportunity
-        opportunity = 0.0
-        
-        # Volume component (40%)
-        if search_volume >= 1000:
-            opportunity += 40
-        elif search_volume >= 500:
-            opportunity += 30
-        elif search_volume >= 100:
-            opportunity += 20
-        else:
-            opportunity += 10
-        
-        # Low difficulty component (35%)
-        if difficulty <= 40:
-            opportunity += 35
-        elif difficulty <= 60:
-            opportunity += 25
-        else:
-            opportunity += 15
-        
-        # Low competition component (25%)
-        if competition <= 0.4:
-            opportunity += 25
-        elif competition <= 0.6:
-            opportunity += 15
-        else:
-            opportunity += 5
-        
-        return min(100.0, opportunity)
+        return float(opportunity_scores([search_volume], [difficulty], [competition])[0])
     
     def _generate_recommendation_reason(
         self,
@@ -582,39 +796,9 @@ class TopicRecommendationEngine:
         Calculate opportunity score based on content gaps.
         
         Higher score = better opportunity (competitors rank but you don't).
+        See ``GAP_OPPORTUNITY_TIERS``.
         """
-        score = 0.0
-        
-        # Gap size component (40 points)
-        gap_size = competitor_coverage_pct - your_coverage_pct
-        if gap_size >= 50:
-            score += 40
-        elif gap_size >= 30:
-            score += 30
-        elif gap_size >= 10:
-            score += 20
-        else:
-            score += 10
-        
-        # Competition level component (30 points)
-        # Lower competition = higher opportunity
-        if competitor_coverage_pct <= 30:
-            score += 30
-        elif competitor_coverage_pct <= 50:
-            score += 20
-        elif competitor_coverage_pct <= 70:
-            score += 10
-        
-        # SERP saturation component (30 points)
-        # Fewer results = less saturated = better opportunity
-        if total_results < 5:
-            score += 30
-        elif total_results < 8:
-            score += 20
-        else:
-            score += 10
-        
-        return min(100.0, score)
+        return float(gap_opportunity_scores([competitor_coverage_pct], [your_coverage_pct], [total_results])[0])
     
     async def _identify_content_gaps(
         self,
@@ -838,7 +1022,7 @@ Return only valid JSON, no markdown formatting."""
         for topic in topics:
             if not topic:
                 continue
-            key = getattr(topic, 'primary_keyword', '').lower().strip()
+            key = normalize_topic_key(getattr(topic, 'primary_keyword', ''))
             if key and key not in seen:
                 seen.add(key)
                 unique.append(topic)
@@ -7,22 +7,42 @@ enabling better autoscaling and cost optimization for long-running tasks.
 
 import os
 import json
+import random
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Union
 
 try:
     from google.cloud import tasks_v2
     from google.protobuf import duration_pb2
+    from google.api_core import exceptions as google_exceptions
     CLOUD_TASKS_AVAILABLE = True
 except ImportError:
     # Cloud Tasks not available - will use in-memory processing
     CLOUD_TASKS_AVAILABLE = False
     tasks_v2 = None
     duration_pb2 = None
+    google_exceptions = None
+
+from .task_queue_emulator import LocalTaskQueue
+from ..monitoring.tracing import SpanKind, current_traceparent, traced
 
 logger = logging.getLogger(__name__)
 
 
+def _is_retryable(error: Exception) -> bool:
+    """Transient gRPC errors worth retrying when enqueueing."""
+    if google_exceptions is None:
+        return False
+    return isinstance(error, (
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.InternalServerError,
+        google_exceptions.Aborted,
+    ))
+
+
 class CloudTasksService:
     """Service for managing Cloud Tasks for blog generation."""
     
@@ -30,7 +50,10 @@ class CloudTasksService:
         self,
         project_id: Optional[str] = None,
         location: Optional[str] = None,
-        queue_name: Optional[str] = None
+        queue_name: Optional[str] = None,
+        emulator: Optional[LocalTaskQueue] = None,
+        max_attempts: int = 3,
+        max_concurrency: int = 20
     ):
         """
         Initialize Cloud Tasks service.
@@ -39,18 +62,36 @@ class CloudTasksService:
             project_id: GCP project ID (defaults to env var)
             location: GCP location (defaults to env var or 'europe-west1')
             queue_name: Cloud Tasks queue name (defaults to env var or 'blog-generation-queue')
+            emulator: In-process queue to use instead of Cloud Tasks (also enabled
+                by CLOUD_TASKS_EMULATOR=true)
+            max_attempts: Attempts per task on transient enqueue errors
+            max_concurrency: Concurrent create_task calls during bulk enqueue
         """
+        # Cloud Tasks queue location (must be a valid Cloud Tasks region)
+        # Note: Queue can be in different region than Cloud Run service
+        # Using europe-west1 as it's closest to europe-west9 and is a valid Cloud Tasks location
+        self.location = location or os.getenv("CLOUD_TASKS_QUEUE_LOCATION", "europe-west1")
+        self.queue_name = queue_name or os.getenv("CLOUD_TASKS_QUEUE_NAME", "blog-generation-queue")
+        self.max_attempts = max(1, max_attempts)
+        self.max_concurrency = max(1, max_concurrency)
+        self._async_client = None
+        
+        if emulator is None and os.getenv("CLOUD_TASKS_EMULATOR", "false").lower() == "true":
+            emulator = LocalTaskQueue()
+        self.emulator = emulator
+        if self.emulator is not None:
+            logger.info("Cloud Tasks emulator enabled; tasks stay in-process")
+            self.client = None
+            self.project_id = project_id or "local"
+            self.queue_path = self.queue_name
+            return
+        
         if not CLOUD_TASKS_AVAILABLE:
             logger.warning("Cloud Tasks library not available. Async processing will use in-memory queue.")
             self.client = None
             return
             
         self.project_id = project_id or os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("GCP_PROJECT_ID")
-        # Cloud Tasks queue location (must be a valid Cloud Tasks region)
-        # Note: Queue can be in different region than Cloud Run service
-        # Using europe-west1 as it's closest to europe-west9 and is a valid Cloud Tasks location
-        self.location = location or os.getenv("CLOUD_TASKS_QUEUE_LOCATION", "europe-west1")
-        self.queue_name = queue_name or os.getenv("CLOUD_TASKS_QUEUE_NAME", "blog-generation-queue")
         
         if not self.project_id:
             raise ValueError("Project ID must be provided or set in GOOGLE_CLOUD_PROJECT env var")
@@ -67,6 +108,8 @@ class CloudTasksService:
         """
         Create a Cloud Task for blog generation.
         
+        Synchronous; prefer create_blog_generation_task_async from async handlers.
+        
         Args:
             request_data: Blog generation request data
             worker_url: URL of the worker service endpoint
@@ -75,37 +118,14 @@ class CloudTasksService:
         Returns:
             Task name/ID
         """
+        if self.emulator is not None:
+            return self._emulate(request_data, worker_url, schedule_time, self.queue_name)
         if not CLOUD_TASKS_AVAILABLE or self.client is None:
             logger.warning("Cloud Tasks not available, returning placeholder task name")
             return "in-memory-task-placeholder"
             
         try:
-            headers = {"Content-Type": "application/json"}
-            # If attribution is present in payload, also send it as headers (useful for proxy logging).
-            usage = request_data.get("usage") if isinstance(request_data, dict) else None
-            if isinstance(usage, dict):
-                if usage.get("usage_source"):
-                    headers["x-usage-source"] = str(usage.get("usage_source"))
-                if usage.get("usage_client"):
-                    headers["x-usage-client"] = str(usage.get("usage_client"))
-                if usage.get("request_id"):
-                    headers["x-request-id"] = str(usage.get("request_id"))
-
-            # Prepare HTTP request
-            http_request = tasks_v2.HttpRequest(
-                http_method=tasks_v2.HttpMethod.POST,
-                url=worker_url,
-                headers=headers,
-                body=json.dumps(request_data).encode()
-            )
-            
-            # Create task
-            task = tasks_v2.Task(
-                http_request=http_request,
-                schedule_time=schedule_time if schedule_time else None
-            )
-            
-            # Create the task
+            task = self._build_task(request_data, worker_url, schedule_time)
             response = self.client.create_task(
                 request={"parent": self.queue_path, "task": task}
             )
@@ -127,6 +147,8 @@ class CloudTasksService:
         """
         Create a Cloud Task for image generation.
         
+        Synchronous; prefer create_image_generation_task_async from async handlers.
+        
         Args:
             request_data: Image generation request data
             worker_url: URL of the worker service endpoint
@@ -136,43 +158,16 @@ class CloudTasksService:
         Returns:
             Task name/ID
         """
+        if self.emulator is not None:
+            return self._emulate(request_data, worker_url, schedule_time, queue_name or self.queue_name)
         if not CLOUD_TASKS_AVAILABLE or self.client is None:
             logger.warning("Cloud Tasks not available, returning placeholder task name")
             return "in-memory-task-placeholder"
         
-        # Use image-specific queue if provided, otherwise use default
-        queue_path = self.queue_path
-        if queue_name:
-            queue_path = self.client.queue_path(self.project_id, self.location, queue_name)
-        
         try:
-            headers = {"Content-Type": "application/json"}
-            usage = request_data.get("usage") if isinstance(request_data, dict) else None
-            if isinstance(usage, dict):
-                if usage.get("usage_source"):
-                    headers["x-usage-source"] = str(usage.get("usage_source"))
-                if usage.get("usage_client"):
-                    headers["x-usage-client"] = str(usage.get("usage_client"))
-                if usage.get("request_id"):
-                    headers["x-request-id"] = str(usage.get("request_id"))
-
-            # Prepare HTTP request
-            http_request = tasks_v2.HttpRequest(
-                http_method=tasks_v2.HttpMethod.POST,
-                url=worker_url,
-                headers=headers,
-                body=json.dumps(request_data).encode()
-            )
-            
-            # Create task with shorter timeout for images (images are faster than blogs)
-            task = tasks_v2.Task(
-                http_request=http_request,
-                schedule_time=schedule_time if schedule_time else None
-            )
-            
-            # Create the task
+            task = self._build_task(request_data, worker_url, schedule_time)
             response = self.client.create_task(
-                request={"parent": queue_path, "task": task}
+                request={"parent": self._queue_path(queue_name), "task": task}
             )
             
             logger.info(f"Created Image Generation Cloud Task: {response.name}")
@@ -182,6 +177,159 @@ class CloudTasksService:
             logger.error(f"Failed to create Image Generation Cloud Task: {e}")
             raise
     
+    async def create_blog_generation_task_async(
+        self,
+        request_data: Dict[str, Any],
+        worker_url: str,
+        schedule_time: Optional[int] = None
+    ) -> str:
+        """Non-blocking create_blog_generation_task with retry on transient errors."""
+        task_name = await self._create_task_async(request_data, worker_url, schedule_time, None)
+        logger.info(f"Created Cloud Task: {task_name}")
+        return task_name
+    
+    async def create_image_generation_task_async(
+        self,
+        request_data: Dict[str, Any],
+        worker_url: str,
+        schedule_time: Optional[int] = None,
+        queue_name: Optional[str] = None
+    ) -> str:
+        """Non-blocking create_image_generation_task with retry on transient errors."""
+        task_name = await self._create_task_async(request_data, worker_url, schedule_time, queue_name)
+        logger.info(f"Created Image Generation Cloud Task: {task_name}")
+        return task_name
+    
+    async def enqueue_batch(
+        self,
+        requests_data: List[Dict[str, Any]],
+        worker_url: str,
+        queue_name: Optional[str] = None,
+        schedule_time: Optional[int] = None
+    ) -> List[Union[str, Exception]]:
+        """
+        Enqueue many tasks concurrently over the shared async channel.
+        
+        Args:
+            requests_data: One payload per task
+            worker_url: URL of the worker service endpoint
+            queue_name: Optional queue name (defaults to the service queue)
+            schedule_time: Optional Unix timestamp to schedule all tasks
+            
+        Returns:
+            Task names in input order; a failed enqueue is returned as its exception
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def enqueue_one(request_data: Dict[str, Any]) -> str:
+            async with semaphore:
+                return await self._create_task_async(request_data, worker_url, schedule_time, queue_name)
+        
+        results = await asyncio.gather(
+            *(enqueue_one(data) for data in requests_data),
+            return_exceptions=True
+        )
+        failures = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(f"Enqueued {len(results) - failures}/{len(results)} Cloud Tasks")
+        return list(results)
+    
+    @traced("cloud_tasks enqueue", SpanKind.UPSTREAM)
+    async def _create_task_async(
+        self,
+        request_data: Dict[str, Any],
+        worker_url: str,
+        schedule_time: Optional[int],
+        queue_name: Optional[str]
+    ) -> str:
+        """Create one task on the async client, retrying transient errors with jittered backoff."""
+        if self.emulator is not None:
+            return self._emulate(request_data, worker_url, schedule_time, queue_name or self.queue_name)
+        if not CLOUD_TASKS_AVAILABLE or self.client is None:
+            logger.warning("Cloud Tasks not available, returning placeholder task name")
+            return "in-memory-task-placeholder"
+        
+        client = self._get_async_client()
+        task = self._build_task(request_data, worker_url, schedule_time)
+        parent = self._queue_path(queue_name)
+        
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = await client.create_task(request={"parent": parent, "task": task})
+                return response.name
+            except Exception as e:
+                if attempt >= self.max_attempts or not _is_retryable(e):
+                    logger.error(f"Failed to create Cloud Task: {e}")
+                    raise
+                # Full jitter: spread retries so a burst of failures doesn't retry in lockstep
+                delay = random.uniform(0, min(5.0, 0.2 * (2 ** attempt)))
+                logger.warning(f"Cloud Task enqueue attempt {attempt} failed ({e}); retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        raise RuntimeError("unreachable")
+    
+    def _get_async_client(self):
+        """Lazily create the async client so its gRPC channel binds to the running loop."""
+        if self._async_client is None:
+            self._async_client = tasks_v2.CloudTasksAsyncClient()
+        return self._async_client
+    
+    def _queue_path(self, queue_name: Optional[str]) -> str:
+        """Full queue path for an optional queue override."""
+        if not queue_name:
+            return self.queue_path
+        return self.client.queue_path(self.project_id, self.location, queue_name)
+    
+    def _build_headers(self, request_data: Dict[str, Any]) -> Dict[str, str]:
+        """HTTP headers for the worker request."""
+        headers = {"Content-Type": "application/json"}
+        # If attribution is present in payload, also send it as headers (useful for proxy logging).
+        usage = request_data.get("usage") if isinstance(request_data, dict) else None
+        if isinstance(usage, dict):
+            if usage.get("usage_source"):
+                headers["x-usage-source"] = str(usage.get("usage_source"))
+            if usage.get("usage_client"):
+                headers["x-usage-client"] = str(usage.get("usage_client"))
+            if usage.get("request_id"):
+                headers["x-request-id"] = str(usage.get("request_id"))
+        # Continue the enqueueing request's trace in the worker
+        traceparent = current_traceparent()
+        if traceparent:
+            headers["traceparent"] = traceparent
+        return headers
+    
+    def _build_task(
+        self,
+        request_data: Dict[str, Any],
+        worker_url: str,
+        schedule_time: Optional[int]
+    ):
+        """Build the tasks_v2.Task for a worker request."""
+        http_request = tasks_v2.HttpRequest(
+            http_method=tasks_v2.HttpMethod.POST,
+            url=worker_url,
+            headers=self._build_headers(request_data),
+            body=json.dumps(request_data).encode()
+        )
+        return tasks_v2.Task(
+            http_request=http_request,
+            schedule_time=schedule_time if schedule_time else None
+        )
+    
+    def _emulate(
+        self,
+        request_data: Dict[str, Any],
+        worker_url: str,
+        schedule_time: Optional[int],
+        queue_name: str
+    ) -> str:
+        """Hand the task to the in-process emulator."""
+        return self.emulator.create_task(
+            queue=queue_name,
+            url=worker_url,
+            headers=self._build_headers(request_data),
+            body=json.dumps(request_data).encode(),
+            schedule_time=schedule_time
+        )
+    
     def get_task_status(self, task_name: str) -> Dict[str, Any]:
         """
         Get task status (requires Cloud Tasks API v2beta3 or monitoring).
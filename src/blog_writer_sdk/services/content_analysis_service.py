@@ -8,7 +8,7 @@ import asyncio
 import logging
 import os
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..integrations.dataforseo_business import DataForSEOBusinessClient, ensure_business_client
 from ..models.content_routing_models import (
@@ -19,10 +19,29 @@ from ..models.content_routing_models import (
     SourceEndpoint,
     SourceName,
 )
-from .evidence_store import EvidenceStore
+from .evidence_store import EvidenceStore, get_evidence_store, timestamp_age_seconds
 
 logger = logging.getLogger(__name__)
 
+# Bump when bundles or fetch logic change so stored analyses are not reused
+ANALYSIS_CONFIG_VERSION = os.getenv("CONTENT_ANALYSIS_CONFIG_VERSION", "1.0")
+
+# How long an analysis of unchanged content may be reused (bi-weekly monitoring cadence)
+ANALYSIS_FRESHNESS_SECONDS = int(os.getenv("CONTENT_ANALYSIS_FRESHNESS_SECONDS", str(14 * 86400)))
+
+# Evidence freshness per source: listings change slowly, social/LLM/merchant data quickly
+EVIDENCE_TTL_SECONDS: Dict[SourceName, int] = {
+    SourceName.GOOGLE: 7 * 86400,
+    SourceName.TRIPADVISOR: 7 * 86400,
+    SourceName.TRUSTPILOT: 7 * 86400,
+    SourceName.SOCIAL: 86400,
+    SourceName.CONTENT_ANALYSIS: 86400,
+    SourceName.MERCHANT: 86400,
+    SourceName.AI_OPTIMIZATION: 86400,
+}
+
+EvidenceItem = Tuple[str, str, Optional[str], Dict]
+
 
 class ContentAnalysisService:
     """High-level coordinator for content analysis/enrichment."""
@@ -31,45 +50,45 @@ class ContentAnalysisService:
         self,
         dataforseo_client: Optional[DataForSEOBusinessClient] = None,
         evidence_store: Optional[EvidenceStore] = None,
+        config_version: Optional[str] = None,
+        freshness_seconds: Optional[int] = None,
+        evidence_ttl_seconds: Optional[Dict[SourceName, int]] = None,
     ):
         self.client = ensure_business_client(dataforseo_client)
-        self.evidence_store = evidence_store or EvidenceStore()
+        self.evidence_store = evidence_store or get_evidence_store()
         self.environment = os.getenv("ENVIRONMENT", "dev")
-
-    async def analyze(self, request: ContentAnalysisRequest) -> Dict:
-        """Perform analysis and persist evidence."""
+        self.config_version = config_version or ANALYSIS_CONFIG_VERSION
+        self.freshness_seconds = ANALYSIS_FRESHNESS_SECONDS if freshness_seconds is None else freshness_seconds
+        self.evidence_ttl_seconds = {**EVIDENCE_TTL_SECONDS, **(evidence_ttl_seconds or {})}
+
+    async def analyze(self, request: ContentAnalysisRequest, force_refresh: bool = False) -> Dict:
+        """
+        Perform analysis and persist evidence.
+
+        A fresh analysis of the same content about the same entity (same org,
+        entity identifiers, category and config version) is reused; only
+        endpoints whose evidence has expired are refetched. force_refresh always runs a full analysis.
+        """
         bundle = resolve_bundle(request.content_category)
-        content_id = str(uuid.uuid4())
-        analysis_id = str(uuid.uuid4())
         content_hash = request.content_hash()
-
-        # Fetch endpoints in parallel where possible
-        tasks = []
-        task_endpoints: List[SourceEndpoint] = []
-        for ep in bundle.endpoints:
-            # Skip endpoints lacking identifiers
-            if not self._has_identifiers(request, ep):
-                continue
-            tasks.append(self._fetch_endpoint(ep, request))
-            task_endpoints.append(ep)
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Rebuild evidence_items deterministically
-        evidence_items = []
-        for idx, res in enumerate(results):
-            ep = task_endpoints[idx]
-            if isinstance(res, Exception):
-                logger.warning(f"{ep.endpoint} failed: {res}")
-                continue
-            evidence_items.append(
-                (
-                    ep.source.value,
-                    ep.endpoint,
-                    self._entity_ref(request, ep),
-                    res or {},
-                )
+        entity_key = request.entity_key()
+        endpoints = self._eligible_endpoints(request, bundle.endpoints)
+
+        if not force_refresh:
+            existing = await self.evidence_store.find_reusable_analysis(
+                org_id=request.org_id,
+                content_hash=content_hash,
+                entity_key=entity_key,
+                content_category=request.content_category.value,
+                config_version=self.config_version,
+                max_age_seconds=self.freshness_seconds,
             )
+            if existing:
+                return await self._reuse_analysis(existing, request, endpoints, bundle.name)
+
+        content_id = str(uuid.uuid4())
+        analysis_id = str(uuid.uuid4())
+        evidence_items = await self._fetch_evidence(request, endpoints)
 
         evidence_records: List[EvidenceRecord] = await self.evidence_store.save_evidence_batch(
             analysis_id=analysis_id, items=evidence_items
@@ -92,7 +111,9 @@ class ContentAnalysisService:
             content_category=request.content_category.value,
             entity_type=request.entity_type.value if request.entity_type else None,
             summary=summary,
+            config_version=self.config_version,
             analysis_id=analysis_id,
+            entity_key=entity_key,
         )
 
         return {
@@ -100,40 +121,22 @@ class ContentAnalysisService:
             "content_id": content_id,
             "evidence_count": len(evidence_records),
             "bundle": bundle.name,
+            "reused": False,
+            "refetched_endpoints": [ep.endpoint for ep in endpoints],
         }
 
     async def refresh(self, analysis_id: str, request: ContentAnalysisRequest) -> Dict:
         """Refresh sources for an existing analysis (fetch deltas)."""
         bundle = resolve_bundle(request.content_category)
-        tasks = []
-        task_endpoints: List[SourceEndpoint] = []
-        for ep in bundle.endpoints:
-            if not self._has_identifiers(request, ep):
-                continue
-            tasks.append(self._fetch_endpoint(ep, request))
-            task_endpoints.append(ep)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        evidence_items = []
-        for idx, res in enumerate(results):
-            ep = task_endpoints[idx]
-            if isinstance(res, Exception):
-                logger.warning(f"{ep.endpoint} refresh failed: {res}")
-                continue
-            evidence_items.append(
-                (
-                    ep.source.value,
-                    ep.endpoint,
-                    self._entity_ref(request, ep),
-                    res or {},
-                )
-            )
+        endpoints = self._eligible_endpoints(request, bundle.endpoints)
+        evidence_items = await self._fetch_evidence(request, endpoints, label="refresh")
+        new_records = await self._save_changed_evidence(analysis_id, evidence_items)
 
-        new_records = await self.evidence_store.save_evidence_batch(
-            analysis_id=analysis_id, items=evidence_items
-        )
-
-        return {"analysis_id": analysis_id, "new_evidence": len(new_records)}
+        return {
+            "analysis_id": analysis_id,
+            "new_evidence": len(new_records),
+            "unchanged_evidence": len(evidence_items) - len(new_records),
+        }
 
     async def refresh_from_saved(self, analysis_id: str) -> Dict:
         """Refresh using stored request snapshot (for scheduled jobs)."""
@@ -150,6 +153,88 @@ class ContentAnalysisService:
         req = ContentAnalysisRequest(**snapshot)
         return await self.refresh(analysis_id=analysis_id, request=req)
 
+    async def _reuse_analysis(
+        self,
+        existing: Dict,
+        request: ContentAnalysisRequest,
+        endpoints: List[SourceEndpoint],
+        bundle_name: str,
+    ) -> Dict:
+        """Serve a stored analysis, refetching only endpoints with expired evidence."""
+        analysis_id = existing["analysis_id"]
+        fetch_times = await self.evidence_store.endpoint_fetch_times(analysis_id)
+        expired = [
+            ep for ep in endpoints
+            if timestamp_age_seconds(fetch_times.get(ep.endpoint)) > self.evidence_ttl_seconds.get(ep.source, 0)
+        ]
+
+        new_records: List[EvidenceRecord] = []
+        if expired:
+            evidence_items = await self._fetch_evidence(request, expired, label="incremental")
+            new_records = await self._save_changed_evidence(analysis_id, evidence_items)
+        logger.info(
+            f"Reused analysis {analysis_id}: refetched {len(expired)}/{len(endpoints)} endpoints, "
+            f"{len(new_records)} new evidence"
+        )
+
+        return {
+            "analysis_id": analysis_id,
+            "content_id": existing.get("content_id"),
+            "evidence_count": existing.get("summary", {}).get("evidence_count", 0) + len(new_records),
+            "bundle": bundle_name,
+            "reused": True,
+            "refetched_endpoints": [ep.endpoint for ep in expired],
+        }
+
+    def _eligible_endpoints(
+        self, request: ContentAnalysisRequest, endpoints: List[SourceEndpoint]
+    ) -> List[SourceEndpoint]:
+        """Endpoints whose identifiers are present on the request."""
+        return [ep for ep in endpoints if self._has_identifiers(request, ep)]
+
+    async def _fetch_evidence(
+        self,
+        request: ContentAnalysisRequest,
+        endpoints: List[SourceEndpoint],
+        label: str = "fetch",
+    ) -> List[EvidenceItem]:
+        """Fetch endpoints in parallel and return evidence items in endpoint order."""
+        results = await asyncio.gather(
+            *(self._fetch_endpoint(ep, request) for ep in endpoints), return_exceptions=True
+        )
+
+        evidence_items: List[EvidenceItem] = []
+        for ep, res in zip(endpoints, results):
+            if isinstance(res, Exception):
+                logger.warning(f"{ep.endpoint} {label} failed: {res}")
+                continue
+            evidence_items.append(
+                (
+                    ep.source.value,
+                    ep.endpoint,
+                    self._entity_ref(request, ep),
+                    res or {},
+                )
+            )
+        return evidence_items
+
+    async def _save_changed_evidence(
+        self, analysis_id: str, evidence_items: List[EvidenceItem]
+    ) -> List[EvidenceRecord]:
+        """Persist only payloads not seen before; mark every fetched endpoint as fresh."""
+        fetch_times = await self.evidence_store.endpoint_fetch_times(analysis_id)
+        seen = await asyncio.gather(
+            *(self.evidence_store.is_payload_seen(source, payload) for source, _, _, payload in evidence_items)
+        )
+        # An unchanged payload is only skipped if this analysis already holds evidence for the endpoint
+        changed = [
+            item for item, was_seen in zip(evidence_items, seen)
+            if not (was_seen and item[1] in fetch_times)
+        ]
+        new_records = await self.evidence_store.save_evidence_batch(analysis_id=analysis_id, items=changed)
+        await self.evidence_store.record_fetches(analysis_id, [item[1] for item in evidence_items])
+        return new_records
+
     async def _fetch_endpoint(self, endpoint: SourceEndpoint, request: ContentAnalysisRequest) -> Dict:
         """Dispatch to the right client call based on endpoint id."""
         try:
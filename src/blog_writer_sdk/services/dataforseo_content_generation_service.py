@@ -6,11 +6,16 @@ Supports multiple blog types: brands, top 10, product reviews, and custom conten
 Enhanced with word count tolerance, SEO optimization, and backlink analysis.
 """
 
+import asyncio
 import logging
 import re
+import time
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from ..integrations.dataforseo_integration import DataForSEOClient
+from ..integrations.dataforseo_clients import get_client_registry
+from ..models.progress_models import PipelineStage, ProgressCallback, ProgressUpdate
+from ..monitoring.tracing import SpanKind, start_span
 
 logger = logging.getLogger(__name__)
 
@@ -93,8 +98,7 @@ class DataForSEOContentGenerationService:
     async def initialize(self, tenant_id: str = "default"):
         """Initialize the DataForSEO client if not already initialized."""
         if not self.client:
-            self.client = DataForSEOClient()
-            await self.client.initialize_credentials(tenant_id)
+            self.client = await get_client_registry().acquire(tenant_id)
         
         self.is_configured = self.client.is_configured
         
@@ -206,22 +210,7 @@ class DataForSEOContentGenerationService:
             seo_score += 10
             seo_factors.append("Sufficient content depth")
         
-        # Truncate content if significantly over target (optional)
-        optimized_content = content
-        if word_count > max_words * 1.5:  # More than 50% over max
-            # Try to truncate at a natural break point
-            words = content.split()
-            truncated_words = words[:max_words]
-            # Find last sentence boundary
-            truncated_text = " ".join(truncated_words)
-            last_period = max(
-                truncated_text.rfind("."),
-                truncated_text.rfind("!"),
-                truncated_text.rfind("?")
-            )
-            if last_period > len(truncated_text) * 0.8:  # If period is near end
-                optimized_content = truncated_text[:last_period + 1]
-                logger.info(f"Content truncated from {word_count} to {len(optimized_content.split())} words")
+        optimized_content = self._fit_content_length(content, target_word_count)
         
         return {
             "content": optimized_content,
@@ -238,6 +227,79 @@ class DataForSEOContentGenerationService:
             "readability_score": self._calculate_readability_score(optimized_content)
         }
     
+    def _fit_content_length(self, content: str, target_word_count: int) -> str:
+        """
+        Truncate content that is significantly over the target word count.
+        
+        Independent of keywords, so the final content is known before the
+        SEO metrics are computed.
+        
+        Args:
+            content: Generated content
+            target_word_count: Target word count
+            
+        Returns:
+            Content, truncated at a sentence boundary if more than 50% over max
+        """
+        _, max_words = self._calculate_word_count_range(target_word_count)
+        words = content.split()
+        if len(words) <= max_words * 1.5:
+            return content
+        
+        # Try to truncate at a natural break point
+        truncated_text = " ".join(words[:max_words])
+        # Find last sentence boundary
+        last_period = max(
+            truncated_text.rfind("."),
+            truncated_text.rfind("!"),
+            truncated_text.rfind("?")
+        )
+        if last_period > len(truncated_text) * 0.8:  # If period is near end
+            optimized_content = truncated_text[:last_period + 1]
+            logger.info(f"Content truncated from {len(words)} to {len(optimized_content.split())} words")
+            return optimized_content
+        return content
+    
+    @staticmethod
+    def _extract_title(content: str, topic: str) -> str:
+        """Use the first line of the content as title when it looks like one."""
+        title = topic
+        if content:
+            first_line = content.split("\n")[0].strip()
+            if len(first_line) < 100 and len(first_line) > 10:
+                title = first_line.replace("#", "").strip()
+        return title
+    
+    @staticmethod
+    async def _emit_progress(
+        progress_callback: Optional[ProgressCallback],
+        stage: PipelineStage,
+        stage_number: int,
+        total_stages: int,
+        status: str,
+        details: Optional[str] = None,
+        elapsed_ms: Optional[float] = None,
+        stage_elapsed_ms: Optional[float] = None
+    ):
+        """Emit progress update if callback is available."""
+        if not progress_callback:
+            return
+        progress = ProgressUpdate(
+            stage=stage.value,
+            stage_number=stage_number,
+            total_stages=total_stages,
+            progress_percentage=(stage_number / total_stages) * 100,
+            status=status,
+            details=details,
+            timestamp=time.time(),
+            elapsed_ms=elapsed_ms,
+            stage_elapsed_ms=stage_elapsed_ms
+        )
+        try:
+            await progress_callback(progress)
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
+    
     def _calculate_readability_score(self, content: str) -> float:
         """
         Calculate simple readability score (0-100).
@@ -1119,17 +1181,18 @@ Write in a {tone} tone."""
         optimize_for_traffic: bool = True,
         analyze_backlinks: bool = False,
         backlink_url: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
         Generate complete blog content using DataForSEO Content Generation API.
         
-        This method:
-        1. Generates subtopics from the topic
-        2. Generates main content based on blog type
-        3. Generates meta tags
-        4. Post-processes for SEO and traffic optimization
-        5. Optionally analyzes backlinks for keyword extraction
+        Runs as a staged pipeline:
+        1. Backlink analysis (optional) runs alongside subtopics and text generation
+        2. Subtopics, then main content (depends on the first subtopic)
+        3. Meta tags start as soon as the final content is known
+        4. SEO post-processing metrics are computed off the event loop while
+           meta tags are generated
         
         Args:
             topic: Main topic for the blog
@@ -1143,6 +1206,7 @@ Write in a {tone} tone."""
             optimize_for_traffic: Enable SEO post-processing (default: True)
             analyze_backlinks: Analyze backlinks for keyword extraction (default: False)
             backlink_url: URL to analyze for backlinks (required if analyze_backlinks=True)
+            progress_callback: Optional async callback receiving ProgressUpdate events
             **kwargs: Additional parameters specific to blog type
         
         Returns:
@@ -1166,36 +1230,68 @@ Write in a {tone} tone."""
         total_cost = 0.0
         total_tokens = 0
         backlink_keywords = []
+        run_backlinks = bool(analyze_backlinks and backlink_url)
+        total_stages = 3 + (1 if optimize_for_traffic else 0) + (1 if run_backlinks else 0)
+        completed_stages = 0
+        started = time.perf_counter()
+        # Stages overlap, so each keeps its own span and start time
+        stage_started: Dict[PipelineStage, float] = {}
+        stage_spans: Dict[PipelineStage, Any] = {}
         
-        try:
-            # Optional: Analyze backlinks for keyword extraction
-            if analyze_backlinks and backlink_url:
-                logger.info(f"Analyzing backlinks for keyword extraction: {backlink_url}")
-                backlink_analysis = await self.analyze_backlinks_for_keywords(
-                    url=backlink_url,
-                    limit=100,
-                    tenant_id=tenant_id
-                )
-                backlink_keywords = backlink_analysis.get("extracted_keywords", [])
-                if backlink_keywords:
-                    # Merge backlink keywords with provided keywords
-                    keywords = list(set(keywords + backlink_keywords[:10]))  # Add top 10
-                    logger.info(f"Added {len(backlink_keywords)} keywords from backlink analysis")
-            
-            # Step 1: Build prompt based on blog type
-            prompt = self._build_prompt_for_blog_type(
-                blog_type=blog_type,
-                topic=topic,
-                keywords=keywords,
-                tone=tone,
-                word_count=word_count,
-                target_audience=target_audience or "general audience",
-                **kwargs
+        async def emit(stage: PipelineStage, status: str, details: Optional[str] = None, finished: bool = False):
+            # Stages overlap, so progress counts finished stages
+            nonlocal completed_stages
+            now = time.perf_counter()
+            if stage not in stage_started:
+                stage_started[stage] = now
+                stage_spans[stage] = start_span(f"stage {stage.value}", SpanKind.STAGE, stage=stage.value)
+            if finished:
+                completed_stages += 1
+                stage_spans.pop(stage).end()
+            await self._emit_progress(
+                progress_callback, stage, completed_stages, total_stages, status, details,
+                elapsed_ms=round((now - started) * 1000, 1),
+                stage_elapsed_ms=round((now - stage_started[stage]) * 1000, 1)
+            )
+        
+        async def backlink_stage() -> List[str]:
+            logger.info(f"Analyzing backlinks for keyword extraction: {backlink_url}")
+            await emit(PipelineStage.KEYWORD_ANALYSIS, "Analyzing backlinks for keyword extraction", backlink_url)
+            backlink_analysis = await self.analyze_backlinks_for_keywords(
+                url=backlink_url,
+                limit=100,
+                tenant_id=tenant_id
             )
+            extracted = backlink_analysis.get("extracted_keywords", [])
+            await emit(
+                PipelineStage.KEYWORD_ANALYSIS, "Backlink analysis complete",
+                f"Extracted {len(extracted)} keywords", finished=True
+            )
+            return extracted
+        
+        async def meta_stage(title: str, content: str) -> Dict[str, Any]:
+            logger.info("Generating meta tags")
+            await emit(PipelineStage.FINALIZATION, "Generating meta tags")
+            meta_result = await self.generate_meta_tags(
+                title=title,
+                content=content[:5000],  # Limit content for meta generation
+                language=language,
+                tenant_id=tenant_id
+            )
+            await emit(PipelineStage.FINALIZATION, "Meta tags generated", finished=True)
+            return meta_result
+        
+        backlink_task: Optional[asyncio.Task] = None
+        meta_task: Optional[asyncio.Task] = None
+        try:
+            # Stage 1: Backlink analysis is independent of subtopics and text generation
+            if run_backlinks:
+                backlink_task = asyncio.create_task(backlink_stage())
             
-            # Step 2: Generate subtopics
+            # Stage 2: Generate subtopics
             # Use just the topic for subtopic generation (API expects simple topic string)
             logger.info(f"Generating subtopics for blog type: {blog_type.value}")
+            await emit(PipelineStage.RESEARCH_OUTLINE, "Generating subtopics", f"Blog type: {blog_type.value}")
             subtopics_result = await self.generate_subtopics(
                 text=topic,  # Use topic directly, not the detailed prompt
                 max_subtopics=10,
@@ -1204,8 +1300,12 @@ Write in a {tone} tone."""
             )
             subtopics = subtopics_result.get("subtopics", [])
             total_cost += subtopics_result.get("cost", 0.0)
+            await emit(
+                PipelineStage.RESEARCH_OUTLINE, "Subtopics generated",
+                f"{len(subtopics)} subtopics", finished=True
+            )
             
-            # Step 3: Generate main content
+            # Stage 3: Generate main content
             # Estimate tokens needed (roughly 1 token = 0.75 words)
             # Account for ±25% tolerance
             min_words, max_words = self._calculate_word_count_range(word_count)
@@ -1224,6 +1324,7 @@ Write in a {tone} tone."""
             else:
                 logger.info(f"Using topic only: {content_topic}")
             
+            await emit(PipelineStage.DRAFT_GENERATION, "Generating main content", f"Target: {word_count} words")
             content_result = await self.generate_text(
                 prompt=content_topic,  # Use simplified topic instead of detailed prompt
                 max_tokens=max_tokens,  # Keep for backward compatibility
@@ -1233,15 +1334,37 @@ Write in a {tone} tone."""
                 tenant_id=tenant_id,
                 word_count=word_count  # Pass actual word_count target to API
             )
-            generated_content = content_result.get("text", "")
+            raw_content = content_result.get("text", "")
             total_tokens += content_result.get("tokens_used", 0)
             total_cost += content_result.get("cost", 0.0)
+            await emit(
+                PipelineStage.DRAFT_GENERATION, "Main content generated",
+                f"{len(raw_content.split())} words", finished=True
+            )
+            
+            # Stage 4: Length fitting doesn't depend on keywords, so the final
+            # content (and title) are known now and meta tags can start
+            if optimize_for_traffic:
+                generated_content = await asyncio.to_thread(self._fit_content_length, raw_content, word_count)
+            else:
+                generated_content = raw_content
+            title = self._extract_title(generated_content, topic)
+            meta_task = asyncio.create_task(meta_stage(title, generated_content))
             
-            # Step 4: Post-process for SEO and traffic optimization
+            if backlink_task is not None:
+                backlink_keywords = await backlink_task
+                if backlink_keywords:
+                    # Merge backlink keywords with provided keywords
+                    keywords = list(set(keywords + backlink_keywords[:10]))  # Add top 10
+                    logger.info(f"Added {len(backlink_keywords)} keywords from backlink analysis")
+            
+            # Stage 5: SEO metrics (CPU-bound) run off the loop while meta tags generate
             if optimize_for_traffic:
                 logger.info("Post-processing content for SEO and traffic optimization")
-                seo_result = self._post_process_content_for_seo(
-                    content=generated_content,
+                await emit(PipelineStage.SEO_POLISH, "Post-processing content for SEO")
+                seo_result = await asyncio.to_thread(
+                    self._post_process_content_for_seo,
+                    content=raw_content,
                     keywords=keywords,
                     target_word_count=word_count
                 )
@@ -1260,25 +1383,14 @@ Write in a {tone} tone."""
                         "actual": seo_result["word_count"]
                     }
                 }
+                await emit(
+                    PipelineStage.SEO_POLISH, "SEO post-processing complete",
+                    f"SEO score: {seo_result['seo_score']}", finished=True
+                )
             else:
                 seo_metrics = {}
             
-            # Step 5: Generate title (use first part of content or topic)
-            title = topic
-            if generated_content:
-                # Try to extract a title from the first line or use topic
-                first_line = generated_content.split("\n")[0].strip()
-                if len(first_line) < 100 and len(first_line) > 10:
-                    title = first_line.replace("#", "").strip()
-            
-            # Step 6: Generate meta tags
-            logger.info("Generating meta tags")
-            meta_result = await self.generate_meta_tags(
-                title=title,
-                content=generated_content[:5000],  # Limit content for meta generation
-                language=language,
-                tenant_id=tenant_id
-            )
+            meta_result = await meta_task
             total_cost += meta_result.get("cost", 0.0)
             
             return {
@@ -1303,3 +1415,9 @@ Write in a {tone} tone."""
         except Exception as e:
             logger.error(f"Blog content generation failed: {e}", exc_info=True)
             raise
+        finally:
+            for task in (backlink_task, meta_task):
+                if task is not None and not task.done():
+                    task.cancel()
+            for stage_span in stage_spans.values():
+                stage_span.end()
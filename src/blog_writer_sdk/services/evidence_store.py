@@ -3,29 +3,89 @@ Evidence store for DataForSEO-derived enrichment.
 
 Persists Analyses and Evidence in Supabase when available, with a Redis/memory
 cache to avoid re-fetching unchanged inputs. Falls back to in-memory storage if
-Supabase is not configured.
+Supabase is not configured. Database calls go through the async Supabase client
+(or a worker thread) so they never block the event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
 import hashlib
+import json
 import logging
+import os
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from ..cache.redis_cache import CacheManager
 from ..integrations.supabase_client import SupabaseClient
 from ..models.content_routing_models import AnalysisRecord, EvidenceRecord
+from ..monitoring.tracing import SpanKind, span
 
 logger = logging.getLogger(__name__)
 
 
+# Fetch-time maps outlive the default dataforseo_result TTL so reuse windows work
+FETCH_TIMES_TTL = 30 * 86400
+
+# Serialized payloads at least this large are stored zlib-compressed (0 disables)
+COMPRESSION_THRESHOLD = int(os.getenv("EVIDENCE_COMPRESSION_THRESHOLD", str(256 * 1024)))
+COMPRESSED_ENCODING = "zlib+base64"
+
+
+def canonical_json(payload: Any) -> bytes:
+    """Compact JSON with sorted keys; identical payloads always serialize identically."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
 def _hash_payload(payload: Dict) -> str:
     """Stable hash for payload deduplication."""
-    return hashlib.sha256(str(payload).encode("utf-8")).hexdigest()
+    return hashlib.sha256(canonical_json(payload)).hexdigest()
+
+
+def compress_payload(serialized: bytes, threshold: int = COMPRESSION_THRESHOLD) -> Optional[Dict]:
+    """Return a compressed envelope for large serialized payloads, else None."""
+    if threshold <= 0 or len(serialized) < threshold:
+        return None
+    return {
+        "_encoding": COMPRESSED_ENCODING,
+        "data": base64.b64encode(zlib.compress(serialized, 6)).decode("ascii"),
+    }
+
+
+def decompress_payload(payload: Any) -> Any:
+    """Inverse of compress_payload; other payloads are returned unchanged."""
+    if isinstance(payload, dict) and payload.get("_encoding") == COMPRESSED_ENCODING:
+        return json.loads(zlib.decompress(base64.b64decode(payload["data"])))
+    return payload
+
+
+def timestamp_age_seconds(timestamp: Optional[str]) -> float:
+    """Seconds since an ISO timestamp (naive UTC or offset-aware); inf if unknown."""
+    if not timestamp:
+        return float("inf")
+    try:
+        parsed = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    except ValueError:
+        return float("inf")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return (datetime.utcnow() - parsed).total_seconds()
 
 
 class EvidenceStore:
@@ -38,10 +98,12 @@ class EvidenceStore:
         supabase: Optional[SupabaseClient] = None,
         cache: Optional[CacheManager] = None,
         environment: str = "dev",
+        compression_threshold: int = COMPRESSION_THRESHOLD,
     ):
         self.supabase = supabase
         self.cache = cache or CacheManager(default_ttl=3600)
         self.environment = environment
+        self.compression_threshold = compression_threshold
         self._mem_analyses: Dict[str, Dict] = {}
         self._mem_evidence: Dict[str, Dict] = {}
 
@@ -59,9 +121,11 @@ class EvidenceStore:
         summary: Dict,
         config_version: str = "1.0",
         analysis_id: Optional[str] = None,
+        entity_key: str = "",
     ) -> AnalysisRecord:
-        """Persist an analysis and cache it."""
+        """Persist an analysis and cache it; entity_key is kept in the summary for reuse lookups."""
         analysis_id = analysis_id or str(uuid4())
+        summary = {**summary, "entity_key": entity_key}
         record = AnalysisRecord(
             analysis_id=analysis_id,
             content_id=content_id,
@@ -80,12 +144,16 @@ class EvidenceStore:
             value=record.model_dump(),
             cache_type="dataforseo_result",
         )
+        await self.cache.set(
+            key=self._analysis_index_key(org_id, content_hash, entity_key, content_category, config_version),
+            value=record.model_dump(),
+            ttl=FETCH_TIMES_TTL,
+        )
 
         # Supabase (best-effort)
         if self.supabase:
             try:
-                table = self.supabase._get_table_name("content_analyses")  # type: ignore
-                self.supabase.client.table(table).insert(record.model_dump()).execute()
+                await self._execute("content_analyses", lambda t: t.insert(record.model_dump()))
             except Exception as e:
                 logger.warning(f"Supabase save_analysis failed: {e}")
         else:
@@ -101,13 +169,9 @@ class EvidenceStore:
 
         if self.supabase:
             try:
-                table = self.supabase._get_table_name("content_analyses")  # type: ignore
-                result = (
-                    self.supabase.client.table(table)
-                    .select("*")
-                    .eq("analysis_id", analysis_id)
-                    .limit(1)
-                    .execute()
+                result = await self._execute(
+                    "content_analyses",
+                    lambda t: t.select("*").eq("analysis_id", analysis_id).limit(1),
                 )
                 if result.data:
                     record = result.data[0]
@@ -122,17 +186,69 @@ class EvidenceStore:
 
         return self._mem_analyses.get(analysis_id)
 
+    async def find_reusable_analysis(
+        self,
+        org_id: str,
+        content_hash: str,
+        entity_key: str,
+        content_category: str,
+        config_version: str,
+        max_age_seconds: float,
+    ) -> Optional[Dict]:
+        """
+        Return the latest analysis of identical content about the same entity,
+        or None if none is fresh.
+
+        Lookup order is cache index → Supabase → memory; only analyses created
+        within max_age_seconds are returned.
+        """
+        index_key = self._analysis_index_key(org_id, content_hash, entity_key, content_category, config_version)
+        cached = await self.cache.get(index_key)
+        if cached and timestamp_age_seconds(cached.get("created_at")) <= max_age_seconds:
+            return cached
+
+        record: Optional[Dict] = None
+        if self.supabase:
+            try:
+                result = await self._execute(
+                    "content_analyses",
+                    lambda t: t.select("*")
+                    .eq("org_id", org_id)
+                    .eq("content_hash", content_hash)
+                    .eq("summary->>entity_key", entity_key)
+                    .eq("content_category", content_category)
+                    .eq("config_version", config_version)
+                    .order("created_at", desc=True)
+                    .limit(1),
+                )
+                if result.data:
+                    record = result.data[0]
+            except Exception as e:
+                logger.warning(f"Supabase find_reusable_analysis failed: {e}")
+        else:
+            matches = [
+                a for a in self._mem_analyses.values()
+                if a["org_id"] == org_id
+                and a["content_hash"] == content_hash
+                and a["summary"].get("entity_key") == entity_key
+                and a["content_category"] == content_category
+                and a.get("config_version") == config_version
+            ]
+            if matches:
+                record = max(matches, key=lambda a: a["created_at"])
+
+        if record and timestamp_age_seconds(record.get("created_at")) <= max_age_seconds:
+            await self.cache.set(index_key, record, ttl=FETCH_TIMES_TTL)
+            return record
+        return None
+
     async def list_analyses(self, limit: int = 100) -> List[Dict]:
         """List stored analyses for monitoring."""
         if self.supabase:
             try:
-                table = self.supabase._get_table_name("content_analyses")  # type: ignore
-                result = (
-                    self.supabase.client.table(table)
-                    .select("*")
-                    .order("created_at", desc=True)
-                    .limit(limit)
-                    .execute()
+                result = await self._execute(
+                    "content_analyses",
+                    lambda t: t.select("*").order("created_at", desc=True).limit(limit),
                 )
                 return result.data or []
             except Exception as e:
@@ -160,9 +276,13 @@ class EvidenceStore:
             return results
 
         rows = []
+        stored_payloads: List[Dict] = []
         for source, endpoint, entity_ref, payload in items:
             evidence_id = str(uuid4())
-            payload_hash = _hash_payload(payload)
+            # Serialize once: the same bytes feed the hash and optional compression
+            serialized = canonical_json(payload)
+            payload_hash = hashlib.sha256(serialized).hexdigest()
+            stored_payloads.append(compress_payload(serialized, self.compression_threshold) or payload)
             row = EvidenceRecord(
                 evidence_id=evidence_id,
                 analysis_id=analysis_id,
@@ -178,15 +298,19 @@ class EvidenceStore:
 
         # Cache hashes to avoid duplicates
         for row in rows:
-            cache_key = self._cache_key("evidence", f"{row.source}:{row.payload_hash}")
+            # row.source is a SourceName; key on its value to match is_payload_seen
+            cache_key = self._cache_key("evidence", f"{row.source.value}:{row.payload_hash}")
             await self.cache.set(cache_key, row.model_dump(), cache_type="dataforseo_result")
+        await self.record_fetches(analysis_id, [row.endpoint for row in rows])
 
-        # Supabase best-effort
+        # Supabase best-effort: one bulk insert for the whole batch
         if self.supabase:
             try:
-                table = self.supabase._get_table_name("content_evidence")  # type: ignore
-                payload = [r.model_dump() for r in rows]
-                self.supabase.client.table(table).insert(payload).execute()
+                payload = [
+                    {**r.model_dump(exclude={"payload"}), "payload": stored}
+                    for r, stored in zip(rows, stored_payloads)
+                ]
+                await self._execute("content_evidence", lambda t: t.insert(payload))
             except Exception as e:
                 logger.warning(f"Supabase save_evidence_batch failed: {e}")
         else:
@@ -200,20 +324,54 @@ class EvidenceStore:
         # No cache to keep it simple; Supabase first
         if self.supabase:
             try:
-                table = self.supabase._get_table_name("content_evidence")  # type: ignore
-                result = (
-                    self.supabase.client.table(table)
-                    .select("*")
-                    .eq("analysis_id", analysis_id)
-                    .execute()
+                result = await self._execute(
+                    "content_evidence",
+                    lambda t: t.select("*").eq("analysis_id", analysis_id),
                 )
                 if result.data:
-                    return result.data
+                    return [
+                        {**row, "payload": decompress_payload(row.get("payload"))}
+                        for row in result.data
+                    ]
             except Exception as e:
                 logger.warning(f"Supabase list_evidence failed: {e}")
 
         return [v for v in self._mem_evidence.values() if v["analysis_id"] == analysis_id]
 
+    async def record_fetches(
+        self,
+        analysis_id: str,
+        endpoints: List[str],
+        fetched_at: Optional[str] = None,
+    ) -> None:
+        """Mark endpoints as fetched for an analysis, even when no new evidence was stored."""
+        if not endpoints:
+            return
+        fetched_at = fetched_at or datetime.utcnow().isoformat()
+        fetch_times = await self.endpoint_fetch_times(analysis_id)
+        for endpoint in endpoints:
+            fetch_times[endpoint] = fetched_at
+        await self.cache.set(self._cache_key("fetched", analysis_id), fetch_times, ttl=FETCH_TIMES_TTL)
+
+    async def endpoint_fetch_times(self, analysis_id: str) -> Dict[str, str]:
+        """
+        Latest fetch time per endpoint for an analysis.
+
+        Falls back to the stored evidence rows when the cached map is missing
+        (e.g. after a cache flush).
+        """
+        cached = await self.cache.get(self._cache_key("fetched", analysis_id))
+        if cached:
+            return dict(cached)
+
+        fetch_times: Dict[str, str] = {}
+        for row in await self.list_evidence(analysis_id):
+            endpoint = row.get("endpoint")
+            fetched_at = row.get("fetched_at")
+            if endpoint and fetched_at and fetched_at > fetch_times.get(endpoint, ""):
+                fetch_times[endpoint] = fetched_at
+        return fetch_times
+
     async def is_payload_seen(self, source: str, payload: Dict) -> bool:
         """Check if payload hash already cached to avoid re-fetch."""
         payload_hash = _hash_payload(payload)
@@ -225,11 +383,48 @@ class EvidenceStore:
     # Utilities
     # ------------------------------------------------------------------ #
 
+    async def _execute(self, base_table: str, build: Callable[[Any], Any]) -> Any:
+        """
+        Run a Supabase query without blocking the event loop.
+
+        build receives the table query builder and returns the query to execute;
+        the async client is used when available, otherwise a worker thread.
+        """
+        table = self.supabase._get_table_name(base_table)  # type: ignore
+        async_client = None
+        get_async_client = getattr(self.supabase, "get_async_client", None)
+        if get_async_client:
+            try:
+                async_client = await get_async_client()
+            except Exception as e:
+                logger.debug(f"Async Supabase client unavailable, using thread: {e}")
+        with span(f"db {base_table}", SpanKind.DB, table=table, client="async" if async_client is not None else "thread"):
+            if async_client is not None:
+                return await build(async_client.table(table)).execute()
+            return await run_in_thread(lambda: build(self.supabase.client.table(table)).execute())  # type: ignore
+
     def _cache_key(self, prefix: str, key: str) -> str:
         return f"content:{prefix}:{key}"
 
+    def _analysis_index_key(
+        self, org_id: str, content_hash: str, entity_key: str, content_category: str, config_version: str
+    ) -> str:
+        return self._cache_key(
+            "analysis_index", f"{org_id}:{content_category}:{config_version}:{content_hash}:{entity_key}"
+        )
+
 
 async def run_in_thread(fn, *args, **kwargs):
     """Utility to offload blocking DB calls."""
     return await asyncio.to_thread(fn, *args, **kwargs)
 
+
+_evidence_store: Optional[EvidenceStore] = None
+
+
+def get_evidence_store() -> EvidenceStore:
+    """Process-wide in-memory/cache-backed store so analyses can be reused across requests."""
+    global _evidence_store
+    if _evidence_store is None:
+        _evidence_store = EvidenceStore()
+    return _evidence_store
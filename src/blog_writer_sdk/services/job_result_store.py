@@ -0,0 +1,96 @@
+"""
+Result storage for async blog generation jobs.
+
+Completed results are kept out of the job records that status polling reads.
+Each result is serialized once when it is stored and served as raw bytes by
+the result endpoint, so it is never copied or re-encoded on a poll.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from ..api.fast_json import JSONFragment, dumps
+
+logger = logging.getLogger(__name__)
+
+
+class JobResultStore:
+    """
+    Bounded in-memory store of serialized job results.
+
+    Features:
+    - Results serialized once on completion
+    - LRU bound on the number of results kept
+    - Decoded access for callers that need the dict (SSE, admin)
+    """
+
+    def __init__(self, max_results: Optional[int] = None):
+        """
+        Initialize the store.
+
+        Args:
+            max_results: Maximum results kept
+                (env JOB_RESULT_STORE_MAX, default 500)
+        """
+        self.max_results = max_results or int(os.getenv("JOB_RESULT_STORE_MAX", "500"))
+        self._results: "OrderedDict[str, JSONFragment]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, job_id: str, result: Any) -> int:
+        """
+        Serialize and store a job's result.
+
+        Args:
+            job_id: Job identifier
+            result: Result payload (dict or Pydantic model)
+
+        Returns:
+            Serialized size in bytes
+        """
+        fragment = JSONFragment(dumps(result))
+        with self._lock:
+            self._results[job_id] = fragment
+            self._results.move_to_end(job_id)
+            while len(self._results) > self.max_results:
+                evicted, _ = self._results.popitem(last=False)
+                logger.info(f"Evicted stored result for job {evicted}")
+        return len(fragment)
+
+    def get(self, job_id: str) -> Optional[JSONFragment]:
+        """Serialized result for a job, or None if absent or evicted."""
+        with self._lock:
+            return self._results.get(job_id)
+
+    def load(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Decoded result for a job, or None if absent or evicted."""
+        fragment = self.get(job_id)
+        return json.loads(fragment.data) if fragment is not None else None
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._results.pop(job_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sizes = [len(fragment) for fragment in self._results.values()]
+        return {
+            "stored_results": len(sizes),
+            "stored_bytes": sum(sizes),
+            "max_results": self.max_results,
+        }
+
+
+# Global job result store instance
+_job_result_store: Optional[JobResultStore] = None
+
+
+def get_job_result_store() -> JobResultStore:
+    """Get the process-wide job result store."""
+    global _job_result_store
+    if _job_result_store is None:
+        _job_result_store = JobResultStore()
+    return _job_result_store
@@ -0,0 +1,196 @@
+"""
+Service registry with lazy construction and concurrent warm-up.
+
+Services are registered as factories with their dependencies. A service is
+built at most once: either on first use (``await registry.get(name)``) or by
+``warm_up``, which builds independent services concurrently. The registry
+tracks per-service state and build time so readiness probes can report which
+services are warm.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceState(str, Enum):
+    """Lifecycle state of a registered service."""
+    PENDING = "pending"
+    WARMING = "warming"
+    READY = "ready"
+    DISABLED = "disabled"  # factory ran but returned None (e.g. not configured)
+    FAILED = "failed"
+
+
+@dataclass
+class ServiceSpec:
+    """Registered service and its runtime status."""
+    name: str
+    factory: Callable[[], Any]
+    depends_on: Sequence[str] = ()
+    critical: bool = False
+    in_thread: bool = False
+    state: ServiceState = ServiceState.PENDING
+    instance: Any = None
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    # Created on first build, inside the running loop rather than at registration
+    lock: Optional[asyncio.Lock] = None
+
+
+class ServiceRegistry:
+    """
+    Registry of lazily constructed application services.
+
+    Features:
+    - Build once, on first use or during warm-up
+    - Dependencies are built before dependents; independent services in parallel
+    - Blocking factories can run in a worker thread
+    - Per-service state and timings for readiness reporting
+    """
+
+    def __init__(self):
+        self._services: Dict[str, ServiceSpec] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        depends_on: Iterable[str] = (),
+        critical: bool = False,
+        in_thread: bool = False
+    ) -> None:
+        """
+        Register a service factory.
+
+        Args:
+            name: Unique service name
+            factory: Callable (sync or async) returning the service, or None if unavailable
+            depends_on: Services that must be built first
+            critical: Whether readiness requires this service
+            in_thread: Run a blocking sync factory in a worker thread
+        """
+        self._services[name] = ServiceSpec(
+            name=name,
+            factory=factory,
+            depends_on=tuple(depends_on),
+            critical=critical,
+            in_thread=in_thread
+        )
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._services)
+
+    def peek(self, name: str) -> Any:
+        """Return the instance if already built, without building it."""
+        spec = self._services.get(name)
+        return spec.instance if spec else None
+
+    async def get(self, name: str) -> Any:
+        """
+        Return a service, building it (and its dependencies) on first use.
+
+        Failed services are retried on the next call; a factory returning None
+        marks the service disabled and is not retried.
+        """
+        spec = self._services[name]
+        if spec.state in (ServiceState.READY, ServiceState.DISABLED):
+            return spec.instance
+
+        if spec.lock is None:
+            spec.lock = asyncio.Lock()
+        async with spec.lock:
+            if spec.state in (ServiceState.READY, ServiceState.DISABLED):
+                return spec.instance
+
+            for dependency in spec.depends_on:
+                await self.get(dependency)
+
+            spec.state = ServiceState.WARMING
+            started = time.perf_counter()
+            try:
+                if spec.in_thread:
+                    instance = await asyncio.to_thread(spec.factory)
+                else:
+                    instance = spec.factory()
+                if inspect.isawaitable(instance):
+                    instance = await instance
+            except Exception as e:
+                spec.state = ServiceState.FAILED
+                spec.error = str(e)
+                spec.duration_ms = (time.perf_counter() - started) * 1000
+                logger.warning(f"Service '{name}' failed to initialize: {e}")
+                return None
+
+            spec.instance = instance
+            spec.error = None
+            spec.duration_ms = (time.perf_counter() - started) * 1000
+            spec.state = ServiceState.READY if instance is not None else ServiceState.DISABLED
+            logger.info(f"Service '{name}' {spec.state.value} in {spec.duration_ms:.1f}ms")
+            return instance
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Build services concurrently, respecting dependencies.
+
+        Args:
+            names: Services to warm (default: all registered)
+
+        Returns:
+            Status of every registered service after warm-up
+        """
+        targets = list(names) if names is not None else self.names
+        started = time.perf_counter()
+        await asyncio.gather(*(self.get(name) for name in targets), return_exceptions=True)
+        logger.info(f"Warmed {len(targets)} services in {(time.perf_counter() - started) * 1000:.1f}ms")
+        return self.status()
+
+    def start_warm_up(self, names: Optional[Iterable[str]] = None) -> asyncio.Task:
+        """Warm services in the background and return the task."""
+        return asyncio.create_task(self.warm_up(names))
+
+    def critical_names(self) -> List[str]:
+        return [name for name, spec in self._services.items() if spec.critical]
+
+    def is_ready(self, require_all: bool = False) -> bool:
+        """True when every critical (or every, with require_all) service has been built."""
+        settled = (ServiceState.READY, ServiceState.DISABLED)
+        specs = self._services.values()
+        critical_ready = all(s.state in settled for s in specs if s.critical)
+        if not require_all:
+            return critical_ready
+        # Non-critical failures still count as settled; they are reported, not gating
+        return critical_ready and all(
+            s.state in settled or s.state == ServiceState.FAILED for s in specs
+        )
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-service state, build time and last error."""
+        return {
+            name: {
+                "state": spec.state.value,
+                "critical": spec.critical,
+                "duration_ms": round(spec.duration_ms, 1) if spec.duration_ms is not None else None,
+                "error": spec.error,
+            }
+            for name, spec in self._services.items()
+        }
+
+
+# Global registry instance
+_service_registry: Optional[ServiceRegistry] = None
+
+
+def get_service_registry() -> ServiceRegistry:
+    """Get the global service registry."""
+    global _service_registry
+    if _service_registry is None:
+        _service_registry = ServiceRegistry()
+    return _service_registry
@@ -0,0 +1,142 @@
+"""
+In-process Cloud Tasks emulator.
+
+Stands in for Cloud Tasks in tests and offline runs. Tasks are recorded in
+memory and can optionally be dispatched to their worker URL (or to a
+registered handler) on the running event loop, mimicking Cloud Tasks push
+delivery without a GCP project.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class EmulatedTask:
+    """A task accepted by the emulator."""
+    name: str
+    queue: str
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+    schedule_time: Optional[int] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    dispatched: bool = False
+    response_status: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return json.loads(self.body.decode()) if self.body else {}
+
+
+class LocalTaskQueue:
+    """
+    Minimal in-memory Cloud Tasks replacement.
+
+    Features:
+    - Same task naming scheme as Cloud Tasks
+    - Optional push dispatch over HTTP or to an in-process handler
+    - Task inspection for tests (``tasks``, ``tasks_for``)
+    """
+
+    def __init__(
+        self,
+        dispatch: Optional[bool] = None,
+        handler: Optional[TaskHandler] = None,
+        dispatch_timeout: float = 600.0
+    ):
+        """
+        Initialize the emulator.
+
+        Args:
+            dispatch: Deliver tasks after enqueueing (defaults to
+                CLOUD_TASKS_EMULATOR_DISPATCH env var)
+            handler: Optional coroutine ``handler(url, payload)`` used instead of HTTP
+            dispatch_timeout: HTTP timeout for push delivery in seconds
+        """
+        if dispatch is None:
+            dispatch = os.getenv("CLOUD_TASKS_EMULATOR_DISPATCH", "false").lower() == "true"
+        self.dispatch = dispatch
+        self.handler = handler
+        self.dispatch_timeout = dispatch_timeout
+        self.tasks: List[EmulatedTask] = []
+        self._inflight: set = set()
+
+    def create_task(
+        self,
+        queue: str,
+        url: str,
+        headers: Dict[str, str],
+        body: bytes,
+        schedule_time: Optional[int] = None
+    ) -> str:
+        """Record a task and schedule its delivery if dispatch is enabled."""
+        name = f"projects/local/locations/local/queues/{queue}/tasks/{uuid.uuid4().hex}"
+        task = EmulatedTask(
+            name=name,
+            queue=queue,
+            url=url,
+            headers=dict(headers),
+            body=body,
+            schedule_time=schedule_time
+        )
+        self.tasks.append(task)
+
+        if self.dispatch:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.debug(f"No running loop; task {name} recorded but not dispatched")
+            else:
+                delivery = loop.create_task(self._deliver(task))
+                self._inflight.add(delivery)
+                delivery.add_done_callback(self._inflight.discard)
+
+        return name
+
+    def tasks_for(self, queue: str) -> List[EmulatedTask]:
+        """Return tasks enqueued on a given queue."""
+        return [t for t in self.tasks if t.queue == queue]
+
+    async def drain(self) -> None:
+        """Wait for all in-flight deliveries to finish."""
+        if self._inflight:
+            await asyncio.gather(*list(self._inflight), return_exceptions=True)
+
+    def clear(self) -> None:
+        """Forget all recorded tasks."""
+        self.tasks.clear()
+
+    async def _deliver(self, task: EmulatedTask) -> None:
+        """Push a task to its handler or worker URL."""
+        if task.schedule_time:
+            delay = task.schedule_time - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        try:
+            if self.handler is not None:
+                await self.handler(task.url, task.payload)
+                task.response_status = 200
+            else:
+                async with httpx.AsyncClient(timeout=self.dispatch_timeout) as client:
+                    response = await client.post(task.url, content=task.body, headers=task.headers)
+                    task.response_status = response.status_code
+        except Exception as e:
+            task.error = str(e)
+            logger.warning(f"Emulated task {task.name} delivery failed: {e}")
+        finally:
+            task.dispatched = True
@@ -14,6 +14,7 @@ from decimal import Decimal
 logger = logging.getLogger(__name__)
 
 from ..monitoring.request_context import get_usage_attribution, UNKNOWN_BUCKET
+from ..monitoring.tracing import SpanKind, span
 
 # Try to import Supabase
 try:
@@ -153,7 +154,8 @@ class UsageLogger:
             
             table_name = self._get_table_name("ai_usage_logs")
             try:
-                result = self.client.table(table_name).insert(record).execute()
+                with span("db ai_usage_logs", SpanKind.DB, table=table_name):
+                    result = self.client.table(table_name).insert(record).execute()
             except Exception as e:
                 # If the DB table hasn't been migrated yet, retry without the new columns.
                 msg = str(e).lower()
@@ -0,0 +1,153 @@
+"""
+Multi-pattern string matching (Aho-Corasick).
+
+Finds every occurrence of many patterns (anchor texts, keywords) in a single
+left-to-right pass over the text, instead of one ``in``/``find`` scan per
+pattern. Compiled matchers are cached so a tenant's link-target set is only
+compiled once.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One pattern occurrence; ``start``/``end`` index into the scanned text."""
+    start: int
+    end: int
+    pattern: str
+    payload: Any
+
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    Each pattern carries a payload (e.g. a ``(link_index, keyword_index)``
+    tuple); the same pattern may be registered with several payloads.
+    Matching is case-insensitive by default. Empty patterns are ignored.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]], ignore_case: bool = True):
+        """
+        Compile the automaton.
+
+        Args:
+            patterns: ``(pattern, payload)`` pairs
+            ignore_case: Match case-insensitively
+        """
+        self.ignore_case = ignore_case
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[str, Any]]] = [[]]
+        self.pattern_count = 0
+
+        for pattern, payload in patterns:
+            key = pattern.lower() if ignore_case else pattern
+            if not key:
+                continue
+            node = 0
+            for char in key:
+                next_node = self._goto[node].get(char)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][char] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = next_node
+            self._out[node].append((key, payload))
+            self.pattern_count += 1
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit matches ending at the failure state (suffix patterns)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[PatternMatch]:
+        """
+        Yield every (possibly overlapping) occurrence, ordered by end position.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            PatternMatch for each occurrence
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        haystack = text.lower() if self.ignore_case else text
+        node = 0
+        for index, char in enumerate(haystack):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for pattern, payload in out[node]:
+                yield PatternMatch(index - len(pattern) + 1, index + 1, pattern, payload)
+
+    def find_all(self, text: str) -> List[PatternMatch]:
+        return list(self.iter_matches(text))
+
+    def first_occurrences(self, text: str) -> Dict[Any, PatternMatch]:
+        """Earliest occurrence of each payload's pattern (like ``str.find``)."""
+        first: Dict[Any, PatternMatch] = {}
+        for match in self.iter_matches(text):
+            # Occurrences of one pattern are yielded in start order
+            if match.payload not in first:
+                first[match.payload] = match
+        return first
+
+    def contains_any(self, text: str) -> bool:
+        return next(self.iter_matches(text), None) is not None
+
+
+_matcher_cache: "OrderedDict[Hashable, MultiPatternMatcher]" = OrderedDict()
+_matcher_cache_lock = threading.Lock()
+MATCHER_CACHE_SIZE = 64
+
+
+def get_cached_matcher(
+    key: Hashable,
+    patterns: Iterable[Tuple[str, Any]],
+    ignore_case: bool = True
+) -> MultiPatternMatcher:
+    """
+    Return a compiled matcher for ``key``, compiling ``patterns`` on a miss.
+
+    The key must determine the patterns and payloads (e.g. a tuple of the
+    pattern strings in payload order); least recently used matchers are evicted.
+
+    Args:
+        key: Hashable identity of the pattern set
+        patterns: ``(pattern, payload)`` pairs, only consumed on a cache miss
+        ignore_case: Match case-insensitively
+
+    Returns:
+        Compiled matcher
+    """
+    cache_key = (key, ignore_case)
+    with _matcher_cache_lock:
+        matcher: Optional[MultiPatternMatcher] = _matcher_cache.get(cache_key)
+        if matcher is not None:
+            _matcher_cache.move_to_end(cache_key)
+            return matcher
+
+    matcher = MultiPatternMatcher(patterns, ignore_case=ignore_case)
+    with _matcher_cache_lock:
+        _matcher_cache[cache_key] = matcher
+        while len(_matcher_cache) > MATCHER_CACHE_SIZE:
+            _matcher_cache.popitem(last=False)
+    return matcher
@@ -0,0 +1,78 @@
+"""
+Tests for the batch readability and SEO scorer.
+"""
+
+import pytest
+from src.blog_writer_sdk.seo import batch_scorer
+from src.blog_writer_sdk.seo.batch_scorer import BatchContentScorer, ParsedDocument, count_syllables
+from src.blog_writer_sdk.seo.readability_analyzer import ReadabilityAnalyzer
+
+
+SAMPLE_CONTENT = """# Python Programming Guide
+
+Python programming is easy to learn. Python programming helps teams ship fast.
+
+## Why Python
+
+- Simple syntax
+- Large ecosystem
+
+Read our [setup guide](/blog/python-setup) and the [docs](https://docs.python.org).
+"""
+
+
+class TestBatchContentScorer:
+    """Test cases for BatchContentScorer."""
+
+    @pytest.fixture
+    def scorer(self):
+        return BatchContentScorer()
+
+    def test_count_syllables_matches_analyzer(self):
+        """Memoized syllable counting keeps the analyzer heuristic."""
+        analyzer = ReadabilityAnalyzer()
+        for word in ["the", "programming", "readable", "optimization", "queue"]:
+            assert analyzer._count_syllables(word) == count_syllables(word)
+
+    def test_parsed_document(self):
+        """Parsing extracts structure and link counts once."""
+        doc = ParsedDocument.parse(SAMPLE_CONTENT, keywords=["python programming"])
+        assert doc.h1_count == 1
+        assert doc.h2_count == 1
+        assert doc.list_count == 2
+        assert doc.internal_links == 1
+        assert doc.external_links == 1
+        assert doc.primary_keyword_stats()["in_intro"] is True
+
+    def test_flesch_matches_single_document_analyzer(self, scorer):
+        """Batch readability agrees with ReadabilityAnalyzer.analyze."""
+        metrics = ReadabilityAnalyzer().analyze(SAMPLE_CONTENT)
+        result = scorer.score_documents([{"content": SAMPLE_CONTENT}])[0]
+        assert result["readability"]["flesch_reading_ease"] == pytest.approx(
+            metrics.flesch_reading_ease, abs=0.1
+        )
+
+    def test_results_preserve_order_and_ids(self, scorer):
+        """Results come back in request order with ids echoed."""
+        docs = [
+            {"id": f"doc-{i}", "content": SAMPLE_CONTENT * (i + 1), "keywords": ["python"]}
+            for i in range(5)
+        ]
+        results = scorer.score_documents(docs)
+        assert [r["id"] for r in results] == [d["id"] for d in docs]
+        assert all(0 <= r["overall_score"] <= 100 for r in results)
+
+    def test_python_fallback_matches_numpy(self, scorer, monkeypatch):
+        """The pure-Python path produces the same scores as the vectorized path."""
+        if not batch_scorer.NUMPY_AVAILABLE:
+            pytest.skip("NumPy not installed")
+        docs = [
+            {"content": SAMPLE_CONTENT, "title": "Short", "keywords": ["python"]},
+            {"content": "", "excerpt": "x" * 150},
+        ]
+        vectorized = scorer.score_documents(docs)
+        monkeypatch.setattr(batch_scorer, "NUMPY_AVAILABLE", False)
+        assert scorer.score_documents(docs) == vectorized
+
+    def test_empty_batch(self, scorer):
+        assert scorer.score_documents([]) == []
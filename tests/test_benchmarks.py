@@ -0,0 +1,134 @@
+"""
+Tests for the offline benchmark helpers.
+"""
+
+import asyncio
+import random
+
+import pytest
+from benchmarks import run as bench_run
+from benchmarks.compare import compare_results
+from benchmarks.metrics import percentile, summarize
+from benchmarks.scenarios import Scenario, ScenarioError, SCENARIOS, select, topic_for
+from benchmarks.upstreams import LatencyModel, UpstreamReplay, LATENCY_PROFILES
+
+
+class TestMetrics:
+    """Percentiles and summaries."""
+
+    def test_percentile_interpolates(self):
+        values = [10, 20, 30, 40]
+        assert percentile(values, 0) == 10
+        assert percentile(values, 100) == 40
+        assert percentile(values, 50) == pytest.approx(25)
+
+    def test_summarize_empty(self):
+        assert summarize([])["p99"] == 0.0
+
+
+class TestLatencyModel:
+    """Latency spec parsing and sampling."""
+
+    def test_fixed(self):
+        assert LatencyModel.parse("fixed:120").sample_ms() == 120
+
+    def test_uniform_bounds(self):
+        model = LatencyModel.parse("uniform:min=50,max=60", random.Random(1))
+        assert all(50 <= model.sample_ms() <= 60 for _ in range(100))
+
+    def test_lognormal_median(self):
+        model = LatencyModel.parse("lognormal:median=100,sigma=0.5", random.Random(1))
+        samples = [model.sample_ms() for _ in range(2000)]
+        assert percentile(samples, 50) == pytest.approx(100, rel=0.1)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            LatencyModel.parse("gamma:shape=2")
+
+    def test_round_trip(self):
+        spec = "uniform:min=50,max=200"
+        assert LatencyModel.parse(spec).to_spec() == spec
+
+
+class TestReplay:
+    """Recorded fixture rendering."""
+
+    def test_dataforseo_task_fills_keywords(self):
+        replay = UpstreamReplay(LATENCY_PROFILES["zero"])
+        task = replay.dataforseo_task(
+            "dataforseo_labs/google/keyword_overview/live",
+            {"keywords": ["sourdough starter", "rye bread"]}
+        )
+        keywords = [item["keyword"] for item in task["result"]]
+        assert keywords[:2] == ["sourdough starter", "rye bread"]
+
+    def test_unknown_endpoint_uses_default(self):
+        replay = UpstreamReplay(LATENCY_PROFILES["zero"])
+        assert replay.dataforseo_task("not/an/endpoint", {"keyword": "x"})["status_code"] == 20000
+
+
+class TestScenarios:
+    """Scenario selection."""
+
+    def test_topics_unique(self):
+        topics = [topic_for(i) for i in range(30)]
+        assert len(set(topics)) == 30
+
+    def test_unknown_scenario(self):
+        with pytest.raises(ValueError):
+            select(["nope"])
+
+
+class TestCompare:
+    """Baseline regression detection."""
+
+    def _doc(self, rps, p95, errors=0):
+        return {"scenarios": {"blog_job@c8": {
+            "errors": errors,
+            "throughput_rps": rps,
+            "latency_ms": {"p50": 100, "p95": p95, "p99": p95},
+        }}}
+
+    def test_no_regression_within_threshold(self):
+        assert compare_results(self._doc(10, 110), self._doc(10, 100)) == []
+
+    def test_latency_and_throughput_regressions(self):
+        regressions = compare_results(self._doc(5, 200), self._doc(10, 100))
+        assert {r["metric"] for r in regressions} == {"throughput_rps", "latency_ms.p95", "latency_ms.p99"}
+
+    def test_new_errors_are_regressions(self):
+        regressions = compare_results(self._doc(10, 100, errors=2), self._doc(10, 100))
+        assert regressions[0]["metric"] == "errors"
+
+
+class TestRunner:
+    """Failure reporting and end-to-end scenario runs."""
+
+    @pytest.mark.asyncio
+    async def test_all_failed_scenario_is_flagged(self):
+        async def broken(client, iteration):
+            raise ScenarioError("500 upstream")
+
+        result = await bench_run.run_scenario(
+            None, Scenario("broken", broken, ""), UpstreamReplay(LATENCY_PROFILES["zero"]),
+            concurrency=2, iterations=4, warmup=0, offset=0
+        )
+
+        assert result["failed"] is True
+        assert result["error_rate"] == 1.0
+        assert result["latency_ms"] is None
+
+    def test_every_scenario_succeeds_at_zero_latency(self, monkeypatch):
+        for name, value in bench_run.BENCH_ENV.items():
+            monkeypatch.setenv(name, value)
+        for name in bench_run.DROPPED_ENV:
+            monkeypatch.delenv(name, raising=False)
+
+        results = asyncio.run(bench_run.run_benchmarks(
+            select(list(SCENARIOS)), [1], iterations=1, warmup=0,
+            replay=UpstreamReplay(LATENCY_PROFILES["zero"])
+        ))
+
+        failures = {name: r["error_samples"] for name, r in results.items() if r["errors"]}
+        assert failures == {}
+        assert len(results) == len(SCENARIOS)
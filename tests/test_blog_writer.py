@@ -2,6 +2,8 @@
 Tests for the main BlogWriter class.
 """
 
+import asyncio
+
 import pytest
 from src.blog_writer_sdk import BlogWriter
 from src.blog_writer_sdk.models.blog_models import (
@@ -126,3 +128,112 @@ class TestBlogWriter:
         
         assert blog_writer.default_tone == ContentTone.FRIENDLY
         assert blog_writer.default_length == ContentLength.EXTENDED
+
+
+class SlowGenerator:
+    """Content generator stub that records how many calls overlap."""
+    
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.sections = 0
+    
+    async def _work(self, text, delay):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(delay)
+        self.active -= 1
+        return text
+    
+    async def generate_introduction(self, topic, tone, keywords):
+        return await self._work("intro", 0.03)
+    
+    async def generate_section(self, heading, topic, keyword_focus, tone, target_words):
+        # Later sections finish first, so ordering cannot depend on completion
+        self.sections += 1
+        return await self._work(f"body of {heading}", 0.05 / self.sections)
+    
+    async def generate_faq(self, topic, keywords):
+        return await self._work("faq", 0.01)
+    
+    async def generate_conclusion(self, topic, tone, key_points):
+        return await self._work("conclusion", 0.0)
+
+
+class TestConcurrentGeneration:
+    """Sections are generated concurrently but assembled in outline order."""
+    
+    @pytest.fixture
+    def request_with_sections(self):
+        return BlogRequest(
+            topic="Home Composting",
+            keywords=["compost bins", "worm farms", "kitchen scraps"],
+            include_faq=True,
+        )
+    
+    @pytest.mark.asyncio
+    async def test_section_order_is_preserved(self, request_with_sections):
+        writer = BlogWriter(max_concurrent_sections=4)
+        writer.content_generator = SlowGenerator()
+        outline = await writer._create_content_outline(request_with_sections)
+        
+        content = await writer._generate_traditional_content(request_with_sections, outline)
+        
+        headings = [line for line in content.splitlines() if line.startswith("## ")]
+        assert headings == [
+            "## Understanding Compost Bins",
+            "## Understanding Worm Farms",
+            "## Understanding Kitchen Scraps",
+            "## Frequently Asked Questions",
+            "## Conclusion",
+        ]
+        assert content.startswith("intro")
+        assert writer.content_generator.peak > 1
+    
+    @pytest.mark.asyncio
+    async def test_budget_caps_concurrency(self, request_with_sections):
+        writer = BlogWriter(max_concurrent_sections=2)
+        writer.content_generator = SlowGenerator()
+        outline = await writer._create_content_outline(request_with_sections)
+        
+        await asyncio.gather(
+            writer._generate_traditional_content(request_with_sections, outline),
+            writer._generate_traditional_content(request_with_sections, outline),
+        )
+        
+        assert writer.content_generator.peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_keyword_analysis_is_deduplicated_and_isolates_errors(self):
+        writer = BlogWriter()
+        calls = []
+        
+        async def analyze_keyword(keyword):
+            calls.append(keyword)
+            if keyword == "bad":
+                raise ValueError("no data")
+            return keyword.upper()
+        
+        writer.keyword_analyzer.analyze_keyword = analyze_keyword
+        results = await writer._analyze_keywords(["seo", "bad", "seo", "tools"])
+        
+        assert sorted(calls) == ["bad", "seo", "tools"]
+        assert results == {"seo": "SEO", "bad": {"error": "no data"}, "tools": "TOOLS"}
+    
+    @pytest.mark.asyncio
+    async def test_keyword_analysis_uses_batch_api(self):
+        class BatchAnalyzer:
+            def __init__(self):
+                self.batches = []
+            
+            async def analyze_keywords_comprehensive(self, keywords, tenant_id):
+                self.batches.append(keywords)
+                return {keyword: len(keyword) for keyword in keywords}
+        
+        analyzer = BatchAnalyzer()
+        writer = BlogWriter(enhanced_keyword_analyzer=analyzer)
+        
+        results = await writer._analyze_keywords(["seo", "tools", "seo"])
+        
+        assert analyzer.batches == [["seo", "tools"]]
+        assert results == {"seo": 3, "tools": 5}
@@ -0,0 +1,111 @@
+"""
+Tests for async and batched Cloud Tasks enqueueing.
+"""
+
+import time
+
+import pytest
+from src.blog_writer_sdk.services import cloud_tasks_service as cts
+from src.blog_writer_sdk.services.cloud_tasks_service import CloudTasksService
+from src.blog_writer_sdk.services.task_queue_emulator import LocalTaskQueue
+
+
+class TestCloudTasksEmulator:
+    """Cloud Tasks service backed by the in-process emulator."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_batch_preserves_order(self):
+        queue = LocalTaskQueue(dispatch=False)
+        service = CloudTasksService(queue_name="blog-generation-queue", emulator=queue)
+
+        payloads = [{"job_id": f"job-{i}", "usage": {"request_id": f"req-{i}"}} for i in range(25)]
+        names = await service.enqueue_batch(payloads, worker_url="http://localhost/worker",
+                                            queue_name="image-generation-queue")
+
+        assert len(names) == 25
+        assert len(set(names)) == 25
+        tasks = queue.tasks_for("image-generation-queue")
+        assert [t.payload["job_id"] for t in tasks] == [p["job_id"] for p in payloads]
+        assert tasks[0].headers["x-request-id"] == "req-0"
+
+    @pytest.mark.asyncio
+    async def test_emulator_dispatches_to_handler(self):
+        received = []
+
+        async def handler(url, payload):
+            received.append((url, payload["job_id"]))
+
+        queue = LocalTaskQueue(dispatch=True, handler=handler)
+        service = CloudTasksService(emulator=queue)
+        await service.create_blog_generation_task_async({"job_id": "abc"}, "http://localhost/api/v1/blog/worker")
+        await queue.drain()
+
+        assert received == [("http://localhost/api/v1/blog/worker", "abc")]
+        assert queue.tasks[0].dispatched and queue.tasks[0].response_status == 200
+
+    @pytest.mark.asyncio
+    async def test_schedule_time_is_unix_epoch(self, monkeypatch):
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        async def handler(url, payload):
+            pass
+
+        queue = LocalTaskQueue(dispatch=True, handler=handler)
+        monkeypatch.setattr("src.blog_writer_sdk.services.task_queue_emulator.asyncio.sleep", fake_sleep)
+        queue.create_task("default", "http://w", {}, b"{}", schedule_time=int(time.time()) + 60)
+        await queue.drain()
+
+        assert len(delays) == 1 and 55 <= delays[0] <= 60
+
+    def test_sync_path_uses_emulator(self):
+        queue = LocalTaskQueue(dispatch=False)
+        service = CloudTasksService(emulator=queue)
+        name = service.create_image_generation_task({"job_id": "x"}, "http://w", queue_name="images")
+        assert name.startswith("projects/local/locations/local/queues/images/tasks/")
+
+
+class FlakyAsyncClient:
+    """Async client stub that fails transiently before succeeding."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    async def create_task(self, request):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise cts.google_exceptions.ServiceUnavailable("try again")
+        return type("Task", (), {"name": f"{request['parent']}/tasks/{self.calls}"})()
+
+
+@pytest.mark.skipif(not cts.CLOUD_TASKS_AVAILABLE, reason="google-cloud-tasks not installed")
+class TestCloudTasksRetry:
+    """Retry with jitter on transient enqueue errors."""
+
+    def _service(self, client, monkeypatch, max_attempts=3):
+        monkeypatch.setattr(cts.tasks_v2, "CloudTasksClient", lambda: type(
+            "C", (), {"queue_path": staticmethod(lambda p, l, q: f"projects/{p}/locations/{l}/queues/{q}")}
+        )())
+        monkeypatch.setattr(cts.random, "uniform", lambda a, b: 0)
+        service = CloudTasksService(project_id="proj", max_attempts=max_attempts)
+        service._async_client = client
+        return service
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self, monkeypatch):
+        client = FlakyAsyncClient(failures=2)
+        service = self._service(client, monkeypatch)
+        name = await service.create_blog_generation_task_async({"job_id": "1"}, "http://w")
+        assert client.calls == 3
+        assert name.endswith("/tasks/3")
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_failures_per_item(self, monkeypatch):
+        client = FlakyAsyncClient(failures=100)
+        service = self._service(client, monkeypatch, max_attempts=2)
+        results = await service.enqueue_batch([{"job_id": "1"}, {"job_id": "2"}], "http://w")
+        assert all(isinstance(r, Exception) for r in results)
+        assert client.calls == 4
@@ -0,0 +1,86 @@
+"""
+Tests for concurrent drafting in ConsensusGenerator.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from src.blog_writer_sdk.ai.consensus_generator import ConsensusGenerator
+
+
+class FakeProviderManager:
+    """Provider manager whose drafts take a configurable time per provider."""
+
+    def __init__(self, draft_delays, fail=()):
+        self.draft_delays = draft_delays
+        self.fail = set(fail)
+        self.cancelled = []
+
+    async def generate_content(self, request, preferred_provider):
+        is_draft = "Focus on comprehensive" in request.prompt or "Focus on clarity" in request.prompt
+        try:
+            await asyncio.sleep(self.draft_delays[preferred_provider] if is_draft else 0)
+        except asyncio.CancelledError:
+            self.cancelled.append(preferred_provider)
+            raise
+        if is_draft and preferred_provider in self.fail:
+            raise RuntimeError(f"{preferred_provider} unavailable")
+        return SimpleNamespace(
+            content=f"{preferred_provider} content",
+            tokens_used=10,
+            cost=0.01,
+            provider=preferred_provider,
+        )
+
+
+def _generator(manager, **kwargs):
+    return ConsensusGenerator(SimpleNamespace(provider_manager=manager), **kwargs)
+
+
+class TestConsensusGenerator:
+    """Test cases for the concurrent drafting policy."""
+
+    @pytest.mark.asyncio
+    async def test_drafts_run_concurrently(self):
+        manager = FakeProviderManager({"openai": 0.2, "anthropic": 0.2})
+        start = time.perf_counter()
+        result = await _generator(manager).generate_with_consensus("topic", "outline", ["kw"])
+        assert time.perf_counter() - start < 0.35
+        assert [d["provider"] for d in result.draft_variations] == ["openai", "anthropic"]
+        assert result.synthesis_metadata["drafts_compared"] == 2
+        assert result.total_tokens == 40
+
+    @pytest.mark.asyncio
+    async def test_first_k_cancels_straggler(self):
+        manager = FakeProviderManager({"openai": 5, "anthropic": 0.01})
+        result = await _generator(manager, min_drafts=1).generate_with_consensus(
+            "topic", "outline", ["kw"]
+        )
+        assert [d["provider"] for d in result.draft_variations] == ["anthropic"]
+        assert result.synthesis_metadata["synthesis_method"] == "single_draft"
+        assert manager.cancelled == ["openai"]
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_stragglers(self):
+        manager = FakeProviderManager({"openai": 0.01, "anthropic": 5})
+        start = time.perf_counter()
+        result = await _generator(manager, draft_deadline=0.1).generate_with_consensus(
+            "topic", "outline", ["kw"]
+        )
+        assert time.perf_counter() - start < 1
+        assert [d["provider"] for d in result.draft_variations] == ["openai"]
+        assert manager.cancelled == ["anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_failed_draft_is_tolerated(self):
+        manager = FakeProviderManager({"openai": 0.01, "anthropic": 0.01}, fail=["openai"])
+        result = await _generator(manager).generate_with_consensus("topic", "outline", ["kw"])
+        assert [d["provider"] for d in result.draft_variations] == ["anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_all_drafts_failing_raises(self):
+        manager = FakeProviderManager({"openai": 0, "anthropic": 0}, fail=["openai", "anthropic"])
+        with pytest.raises(RuntimeError):
+            await _generator(manager).generate_with_consensus("topic", "outline", ["kw"])
@@ -0,0 +1,214 @@
+"""
+Tests for content-hash reuse and incremental refresh in ContentAnalysisService.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from src.blog_writer_sdk.cache.redis_cache import CacheManager
+from src.blog_writer_sdk.models.content_routing_models import (
+    ContentAnalysisRequest,
+    ContentCategory,
+    ContentFormatChoice,
+    SourceName,
+)
+from src.blog_writer_sdk.services.content_analysis_service import ContentAnalysisService
+from src.blog_writer_sdk.services.evidence_store import EvidenceStore
+
+
+class StubBusinessClient:
+    """Records calls and returns a payload per endpoint."""
+
+    def __init__(self):
+        self.calls = []
+        self.version = 1
+
+    async def sentiment_analysis(self, keyword, tenant_id=None):
+        self.calls.append("sentiment")
+        return {"sentiment": self.version}
+
+    async def llm_responses_live(self, platform, prompt, tenant_id=None):
+        self.calls.append("llm")
+        return {"answer": self.version}
+
+    async def tripadvisor_search(self, keyword, location=None, tenant_id=None):
+        self.calls.append("tripadvisor")
+        return {"items": [keyword]}
+
+    async def google_hotel_searches(self, keyword, tenant_id=None):
+        self.calls.append("hotel_searches")
+        return {"items": [keyword]}
+
+
+def _request(content="Review of the Grand Hotel", **entity):
+    entity.setdefault("entity_name", "Grand Hotel")
+    return ContentAnalysisRequest(
+        content=content,
+        org_id="org-1",
+        user_id="user-1",
+        content_format=ContentFormatChoice.REVIEW,
+        content_category=ContentCategory.ENTITY_REVIEW,
+        **entity,
+    )
+
+
+def _service(client, **kwargs):
+    store = EvidenceStore(cache=CacheManager())
+    store.cache.redis_client = None
+    return ContentAnalysisService(dataforseo_client=client, evidence_store=store, **kwargs)
+
+
+class TestContentAnalysisReuse:
+    """Analysis reuse keyed on content hash, entity, category and config version."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_reuses_analysis(self):
+        client = StubBusinessClient()
+        service = _service(client)
+
+        first = await service.analyze(_request())
+        fan_out = len(client.calls)
+        second = await service.analyze(_request())
+
+        assert fan_out == 4
+        assert len(client.calls) == fan_out
+        assert second["reused"] and second["refetched_endpoints"] == []
+        assert second["analysis_id"] == first["analysis_id"]
+        assert second["content_id"] == first["content_id"]
+
+    @pytest.mark.asyncio
+    async def test_changed_content_or_config_runs_full_analysis(self):
+        client = StubBusinessClient()
+        service = _service(client)
+        first = await service.analyze(_request())
+
+        other = await service.analyze(_request(content="Updated review"))
+        bumped = await _service(client, config_version="2.0").analyze(_request())
+        forced = await service.analyze(_request(), force_refresh=True)
+
+        assert not other["reused"] and other["analysis_id"] != first["analysis_id"]
+        assert not bumped["reused"]
+        assert not forced["reused"]
+        assert len(client.calls) == 16
+
+    @pytest.mark.asyncio
+    async def test_same_content_for_other_entity_runs_full_analysis(self):
+        client = StubBusinessClient()
+        service = _service(client)
+        first = await service.analyze(_request())
+
+        renamed = await service.analyze(_request(entity_name="Grand Hotel Annex"))
+        other_listing = await service.analyze(_request(google_cid="1234567890"))
+        again = await service.analyze(_request())
+
+        assert not renamed["reused"] and renamed["analysis_id"] != first["analysis_id"]
+        assert not other_listing["reused"] and other_listing["analysis_id"] != first["analysis_id"]
+        assert again["reused"] and again["analysis_id"] == first["analysis_id"]
+
+    @pytest.mark.asyncio
+    async def test_only_expired_endpoints_are_refetched(self):
+        client = StubBusinessClient()
+        service = _service(client, evidence_ttl_seconds={SourceName.CONTENT_ANALYSIS: 3600})
+        first = await service.analyze(_request())
+
+        stale = (datetime.utcnow() - timedelta(hours=2)).isoformat()
+        await service.evidence_store.record_fetches(
+            first["analysis_id"], ["content_analysis/sentiment_analysis/live"], fetched_at=stale
+        )
+        client.calls.clear()
+        client.version = 2
+
+        result = await service.analyze(_request())
+
+        assert client.calls == ["sentiment"]
+        assert result["refetched_endpoints"] == ["content_analysis/sentiment_analysis/live"]
+        assert result["evidence_count"] == first["evidence_count"] + 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_unchanged_payloads(self):
+        client = StubBusinessClient()
+        service = _service(client)
+        first = await service.analyze(_request())
+
+        client.version = 2
+        result = await service.refresh(first["analysis_id"], _request())
+
+        # sentiment and llm payloads changed; tripadvisor and hotel searches did not
+        assert result["new_evidence"] == 2
+        assert result["unchanged_evidence"] == 2
+        evidence = await service.evidence_store.list_evidence(first["analysis_id"])
+        assert len(evidence) == 6
+
+
+class FakeQuery:
+    """Chainable query recording inserts into a shared table dict."""
+
+    def __init__(self, tables, name, log):
+        self.tables, self.name, self.log = tables, name, log
+        self.op, self.rows, self.filters = "select", None, []
+
+    def insert(self, rows):
+        self.op, self.rows = "insert", rows
+        return self
+
+    def select(self, *_):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append((column, value))
+        return self
+
+    def _result(self):
+        table = self.tables.setdefault(self.name, [])
+        if self.op == "insert":
+            self.log.append((self.name, len(self.rows) if isinstance(self.rows, list) else 1))
+            table.extend(self.rows if isinstance(self.rows, list) else [self.rows])
+            return type("Result", (), {"data": self.rows})()
+        rows = [r for r in table if all(r.get(c) == v for c, v in self.filters)]
+        return type("Result", (), {"data": rows})()
+
+    async def execute(self):
+        return self._result()
+
+
+class FakeAsyncSupabase:
+    """SupabaseClient stand-in exposing only the async client."""
+
+    def __init__(self):
+        self.tables, self.inserts = {}, []
+
+    def _get_table_name(self, base_name):
+        return f"{base_name}_test"
+
+    async def get_async_client(self):
+        fake = self
+        return type("AsyncClient", (), {"table": lambda _, name: FakeQuery(fake.tables, name, fake.inserts)})()
+
+
+class TestEvidencePersistence:
+    """Canonical hashing, bulk inserts and payload compression."""
+
+    def test_payload_hash_is_canonical(self):
+        from src.blog_writer_sdk.services.evidence_store import _hash_payload
+
+        assert _hash_payload({"a": 1, "b": [1, 2]}) == _hash_payload({"b": [1, 2], "a": 1})
+        assert _hash_payload({"a": 1}) != _hash_payload({"a": 2})
+
+    @pytest.mark.asyncio
+    async def test_evidence_batch_is_one_insert_with_compression(self):
+        supabase = FakeAsyncSupabase()
+        store = EvidenceStore(supabase=supabase, cache=CacheManager(), compression_threshold=1024)
+        store.cache.redis_client = None
+        large = {"items": [{"review": "great stay " * 20, "n": i} for i in range(50)]}
+
+        await store.save_evidence_batch(
+            "analysis-1",
+            [("google", "reviews", "cid", large), ("social", "facebook", None, {"likes": 3})],
+        )
+
+        assert supabase.inserts == [("content_evidence_test", 2)]
+        stored = supabase.tables["content_evidence_test"]
+        assert stored[0]["payload"]["_encoding"] == "zlib+base64"
+        assert stored[1]["payload"] == {"likes": 3}
+        evidence = await store.list_evidence("analysis-1")
+        assert evidence[0]["payload"] == large
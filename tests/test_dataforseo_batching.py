@@ -0,0 +1,116 @@
+"""
+Tests for DataForSEO request micro-batching.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.integrations.dataforseo_batching import DataForSEOMicroBatcher
+from src.blog_writer_sdk.integrations.dataforseo_integration import DataForSEOClient
+
+ENDPOINT = "dataforseo_labs/bulk_keyword_difficulty/live"
+
+
+class FakeAPI:
+    """Records POSTs and answers each task like DataForSEO would."""
+
+    def __init__(self, reject_batches=False):
+        self.posts = []
+        self.reject_batches = reject_batches
+
+    async def send(self, endpoint, payload, tenant_id):
+        self.posts.append(payload)
+        await asyncio.sleep(0.01)
+        if self.reject_batches and len(payload) > 1:
+            return {"status": "error", "message": "request failed", "data": []}
+        tasks = []
+        # Answer out of order to exercise tag matching
+        for task in reversed(payload):
+            ok = task["keywords"] != ["bad"]
+            tasks.append({
+                "status_code": 20000 if ok else 40501,
+                "cost": 0.01,
+                "data": dict(task),
+                "result": [{"items": [{"keyword": task["keywords"][0]}]}] if ok else None,
+            })
+        return {
+            "status_code": 20000,
+            "cost": 0.01 * len(payload),
+            "tasks_count": len(payload),
+            "tasks": tasks,
+        }
+
+
+def _task(keyword, location="United States"):
+    return {"keywords": [keyword], "location_name": location, "language_code": "en"}
+
+
+class TestDataForSEOMicroBatcher:
+    """Coalescing, demultiplexing and per-task isolation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_post(self):
+        api = FakeAPI()
+        batcher = DataForSEOMicroBatcher(api.send, window_ms=5)
+
+        responses = await asyncio.gather(
+            *(batcher.submit(ENDPOINT, _task(f"kw{i}"), "t") for i in range(5)),
+            batcher.submit(ENDPOINT, _task("bad"), "t"),
+            batcher.submit(ENDPOINT, _task("uk", location="United Kingdom"), "t"),
+        )
+
+        assert sorted(len(post) for post in api.posts) == [1, 6]
+        for i, response in enumerate(responses[:5]):
+            task = response["tasks"][0]
+            assert response["tasks_count"] == 1 and response["cost"] == 0.01
+            assert task["result"][0]["items"][0]["keyword"] == f"kw{i}"
+            assert "tag" not in task["data"]
+        assert responses[5]["tasks"][0]["status_code"] == 40501
+        assert responses[5]["tasks_error"] == 1
+        assert responses[6]["tasks"][0]["result"][0]["items"][0]["keyword"] == "uk"
+
+    @pytest.mark.asyncio
+    async def test_task_limit_splits_batches(self):
+        api = FakeAPI()
+        batcher = DataForSEOMicroBatcher(api.send, window_ms=50, endpoint_limits={ENDPOINT: 3})
+
+        await asyncio.gather(*(batcher.submit(ENDPOINT, _task(f"kw{i}"), "t") for i in range(7)))
+
+        assert [len(post) for post in api.posts] == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_tasks(self):
+        api = FakeAPI(reject_batches=True)
+        batcher = DataForSEOMicroBatcher(api.send, window_ms=5)
+
+        responses = await asyncio.gather(*(batcher.submit(ENDPOINT, _task(f"kw{i}"), "t") for i in range(3)))
+
+        assert [len(post) for post in api.posts] == [3, 1, 1, 1]
+        assert [r["tasks"][0]["result"][0]["items"][0]["keyword"] for r in responses] == ["kw0", "kw1", "kw2"]
+        assert not batcher.accepts(ENDPOINT, [_task("kw")])
+        assert batcher.get_stats()["fallback_tasks"] == 3
+
+
+class RecordingClient(DataForSEOClient):
+    """Client whose HTTP layer is the fake API."""
+
+    def __init__(self, api, **kwargs):
+        self.api = api
+        super().__init__(api_key="key", api_secret="secret", **kwargs)
+
+    async def _send_request(self, endpoint, payload, tenant_id, use_ai_format=True):
+        return await self.api.send(endpoint, payload, tenant_id)
+
+
+class TestClientIntegration:
+    """Opt-in routing through DataForSEOClient._make_request."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled,expected_posts", [(True, 1), (False, 3)])
+    async def test_client_batches_only_when_enabled(self, enabled, expected_posts):
+        api = FakeAPI()
+        client = RecordingClient(api, micro_batching=enabled)
+
+        await asyncio.gather(*(client._make_request(ENDPOINT, [_task(f"kw{i}")], "t") for i in range(3)))
+
+        assert len(api.posts) == expected_posts
@@ -0,0 +1,127 @@
+"""
+Tests for the DataForSEO endpoint capability registry.
+"""
+
+import pytest
+from src.blog_writer_sdk.integrations.dataforseo_capabilities import (
+    CapabilityStatus,
+    DataForSEOCapabilityRegistry,
+    classify_status,
+)
+from src.blog_writer_sdk.integrations.dataforseo_integration import DataForSEOClient
+
+
+class FakeCacheManager:
+    """Shared-cache stub standing in for Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.gets = 0
+
+    async def get(self, key, data_type=None):
+        self.gets += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl=None, cache_type=None):
+        self.data[key] = dict(value)
+        return True
+
+
+def _registry(cache=None, now=None, **kwargs):
+    now = now if now is not None else [1000.0]
+    return DataForSEOCapabilityRegistry(
+        cache_manager_getter=lambda: cache, clock=lambda: now[0], **kwargs
+    )
+
+
+class TestCapabilityRegistry:
+    """Classification, TTLs and cross-instance persistence."""
+
+    def test_classify_status(self):
+        assert classify_status(20000) == CapabilityStatus.AVAILABLE
+        assert classify_status(40204) == CapabilityStatus.SUBSCRIPTION_REQUIRED
+        assert classify_status(40402) == CapabilityStatus.INVALID_PATH
+        assert classify_status(50000) is None
+        assert classify_status(40501, "Invalid Field: 'location_name'.") is None
+        assert classify_status(40501, "Invalid Field: 'location_name'.", scoped=True) == CapabilityStatus.UNSUPPORTED
+        assert classify_status(40501, "Invalid Field: 'keyword'.", scoped=True) is None
+
+    @pytest.mark.asyncio
+    async def test_negative_entries_expire(self):
+        now = [1000.0]
+        registry = _registry(now=now)
+        await registry.record("t1", "content_generation/generate_text/live", 40204, "Access denied.")
+
+        blocked = await registry.blocked("t1", "content_generation/generate_text/live")
+        assert blocked.to_response()["tasks"][0]["status_code"] == 40204
+        assert await registry.blocked("t2", "content_generation/generate_text/live") is None
+
+        now[0] += registry.ttls[CapabilityStatus.SUBSCRIPTION_REQUIRED] + 1
+        assert await registry.blocked("t1", "content_generation/generate_text/live") is None
+
+    @pytest.mark.asyncio
+    async def test_shared_across_instances(self):
+        cache = FakeCacheManager()
+        first, second = _registry(cache), _registry(cache, remote_check_interval=60)
+
+        await first.record("t1", "some/path/live", 40402, "Invalid Path.")
+        await first.set_working_path("t1", "ai_search_volume", "good/path/live")
+
+        assert (await second.blocked("t1", "some/path/live")).status == CapabilityStatus.INVALID_PATH
+        assert await second.get_working_path("t1", "ai_search_volume") == "good/path/live"
+        assert "t1" in second.snapshot()["tenants"]
+
+        # Local misses are trusted for the check interval
+        gets = cache.gets
+        assert await second.get("t1", "unknown/live") is None
+        assert await second.get("t1", "unknown/live") is None
+        assert cache.gets == gets + 1
+
+
+class ProbeClient(DataForSEOClient):
+    """Client answering AI search volume probes from a path table."""
+
+    def __init__(self, statuses):
+        super().__init__(api_key="key", api_secret="secret", micro_batching=False)
+        self.capabilities = _registry()
+        self.statuses = statuses
+        self.posts = []
+
+    async def _send_request(self, endpoint, payload, tenant_id, use_ai_format=True):
+        self.posts.append(endpoint)
+        status = self.statuses.get(endpoint, 40402)
+        items = [{"keyword": k, "ai_search_volume": 10} for k in payload[0].get("keywords", [])]
+        return {
+            "status_code": 20000,
+            "tasks": [{
+                "status_code": status,
+                "status_message": "Ok." if status == 20000 else "Invalid Path.",
+                "result": [{"items": items}] if status == 20000 else None,
+            }],
+        }
+
+
+class TestClientCapabilities:
+    """Probing skips known-dead paths on later calls."""
+
+    @pytest.mark.asyncio
+    async def test_ai_search_volume_remembers_working_path(self):
+        working = "ai_optimization/keyword_data/search_volume/live"
+        client = ProbeClient({working: 20000})
+
+        first = await client.get_ai_search_volume(["seo"], "United States", "en", "t1")
+        assert client.posts[-1] == working and len(client.posts) == 2
+        assert first["seo"]["ai_search_volume"] == 10
+
+        client.posts.clear()
+        second = await client.get_ai_search_volume(["content"], "United States", "en", "t1")
+        assert client.posts == [working]
+        assert second["content"]["ai_search_volume"] == 10
+
+    @pytest.mark.asyncio
+    async def test_subscription_gated_endpoint_skipped(self):
+        client = ProbeClient({"content_generation/generate_text/live": 40204})
+        for _ in range(3):
+            data = await client._make_request("content_generation/generate_text/live", [{"text": "x"}], "t1")
+            assert data["tasks"][0]["status_code"] == 40204
+        assert len(client.posts) == 1
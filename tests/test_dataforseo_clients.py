@@ -0,0 +1,71 @@
+"""
+Tests for the shared DataForSEO client registry.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.integrations.dataforseo_clients import DataForSEOClientRegistry
+
+
+class FakeCredentialService:
+    """Credential service returning rotating keys per tenant."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_credentials(self, tenant_id, provider):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"api_key": f"{tenant_id}-key-{self.calls}", "api_secret": "secret"}
+
+
+class TestDataForSEOClientRegistry:
+    """Sharing, bounds, credential refresh and stats."""
+
+    def test_equivalent_settings_share_a_client(self):
+        registry = DataForSEOClientRegistry()
+        first = registry.get_client("t1", api_key="k", api_secret="s", location="United States", language_code="en")
+        same = registry.get_client("t1", api_key=" k ", api_secret="s", location="United States", language_code="en")
+        other_market = registry.get_client("t1", api_key="k", api_secret="s", location="Germany", language_code="de")
+        other_keys = registry.get_client("t1", api_key="k2", api_secret="s", location="United States", language_code="en")
+
+        assert first is same
+        assert first is not other_market and first is not other_keys
+        assert registry.get_stats()["shared_clients"] == 3
+
+    def test_lru_bound(self):
+        registry = DataForSEOClientRegistry(max_clients=2)
+        a = registry.get_client("a", api_key="k", api_secret="s")
+        registry.get_client("b", api_key="k", api_secret="s")
+        registry.get_client("a", api_key="k", api_secret="s")
+        registry.get_client("c", api_key="k", api_secret="s")
+
+        assert [c["tenant_id"] for c in registry.get_stats()["clients"]] == ["a", "c"]
+        assert registry.get_client("a", api_key="k", api_secret="s") is a
+
+    @pytest.mark.asyncio
+    async def test_credentials_initialized_once_and_refreshed(self, monkeypatch):
+        for name in ("DATAFORSEO_API_KEY", "DATAFORSEO_API_SECRET"):
+            monkeypatch.delenv(name, raising=False)
+        service = FakeCredentialService()
+        registry = DataForSEOClientRegistry()
+
+        clients = await asyncio.gather(*(registry.acquire("t1", credential_service=service) for _ in range(5)))
+
+        assert all(client is clients[0] for client in clients)
+        assert service.calls == 1 and clients[0].api_key == "t1-key-1"
+
+        assert await registry.refresh_credentials("t1") == 1
+        assert clients[0].api_key == "t1-key-2" and clients[0].is_configured
+
+    def test_cache_hit_rate(self):
+        registry = DataForSEOClientRegistry()
+        client = registry.get_client("t1", api_key="k", api_secret="s")
+        client._cache["search_volume_x"] = ({}, 0)
+        for key in ("search_volume_x", "search_volume_x", "search_volume_x", "missing"):
+            _ = key in client._cache
+
+        stats = registry.get_stats()["clients"][0]
+        assert (stats["cache_hits"], stats["cache_misses"], stats["cache_hit_rate"]) == (3, 1, 0.75)
+        assert registry.get_stats()["live_instances"] >= 1
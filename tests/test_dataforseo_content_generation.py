@@ -0,0 +1,104 @@
+"""
+Tests for the staged DataForSEO content generation pipeline.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.services.dataforseo_content_generation_service import (
+    BlogType,
+    DataForSEOContentGenerationService,
+)
+
+
+class FakeContentClient:
+    """DataForSEO client stub that records when each call starts and ends."""
+
+    is_configured = True
+
+    def __init__(self, text, delay=0.05):
+        self.text = text
+        self.delay = delay
+        self.events = []
+        self.meta_request = None
+
+    async def _call(self, name, result):
+        self.events.append(f"{name}:start")
+        await asyncio.sleep(self.delay)
+        self.events.append(f"{name}:end")
+        return result
+
+    async def get_backlinks(self, target, target_type, limit, tenant_id):
+        return await self._call("backlinks", {"extracted_keywords": ["link building", "anchor text"]})
+
+    async def generate_subtopics(self, text, max_subtopics, language, tenant_id):
+        return await self._call("subtopics", {"subtopics": ["Basics", "Advanced"], "count": 2})
+
+    async def generate_text(self, prompt, max_tokens, temperature, tenant_id, word_count):
+        return await self._call("text", {"text": self.text, "tokens_used": 1000})
+
+    async def generate_meta_tags(self, title, content, tenant_id):
+        self.meta_request = {"title": title, "content": content}
+        return await self._call("meta", {"meta_title": "Meta", "meta_description": "Description"})
+
+
+LONG_TEXT = "# SEO Guide For Teams\n\n" + " ".join(["Search engines reward helpful content."] * 600)
+
+
+class TestStagedGeneration:
+    """Concurrent stages, progress events and unchanged results."""
+
+    @pytest.mark.asyncio
+    async def test_backlinks_overlap_generation_and_results_match(self):
+        client = FakeContentClient(LONG_TEXT)
+        service = DataForSEOContentGenerationService(dataforseo_client=client)
+        updates = []
+
+        async def progress_callback(update):
+            updates.append(update.dict())
+
+        result = await service.generate_blog_content(
+            topic="SEO guide",
+            keywords=["seo"],
+            blog_type=BlogType.GUIDE,
+            word_count=1000,
+            analyze_backlinks=True,
+            backlink_url="https://example.com/post",
+            progress_callback=progress_callback,
+        )
+
+        # Backlinks run alongside subtopics/text instead of before them
+        assert client.events.index("backlinks:start") < client.events.index("subtopics:end")
+        assert client.events.index("meta:start") > client.events.index("text:end")
+
+        expected = service._post_process_content_for_seo(
+            LONG_TEXT, list({"seo", "link building", "anchor text"}), 1000
+        )
+        assert result["content"] == expected["content"]
+        assert len(result["content"].split()) <= 1250
+        assert result["seo_metrics"]["within_tolerance"] is False
+        assert result["seo_metrics"]["word_count_range"]["actual"] == expected["word_count"]
+        assert set(result["seo_metrics"]["keyword_density"]) == {"seo", "link building", "anchor text"}
+        assert client.meta_request["content"] == expected["content"][:5000]
+        assert result["meta_title"] == "Meta"
+        assert result["cost"] == pytest.approx(1000 * service.PRICE_PER_TOKEN + service.PRICE_PER_SUBTOPIC_TASK + service.PRICE_PER_META_TASK)
+
+        percentages = [u["progress_percentage"] for u in updates]
+        assert percentages == sorted(percentages)
+        assert percentages[-1] == 100
+        assert {u["stage"] for u in updates} == {
+            "keyword_analysis", "research_outline", "draft_generation", "seo_polish", "finalization"
+        }
+
+    @pytest.mark.asyncio
+    async def test_without_post_processing(self):
+        client = FakeContentClient("Short Title Line Here\n\nBody text.", delay=0)
+        service = DataForSEOContentGenerationService(dataforseo_client=client)
+
+        result = await service.generate_blog_content(
+            topic="Topic", keywords=["body"], optimize_for_traffic=False
+        )
+
+        assert result["title"] == "Short Title Line Here"
+        assert result["seo_metrics"] == {}
+        assert client.meta_request["content"] == "Short Title Line Here\n\nBody text."
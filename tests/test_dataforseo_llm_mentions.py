@@ -0,0 +1,89 @@
+"""
+Tests for concurrent platform querying in LLM mentions search.
+"""
+
+import asyncio
+import time
+
+import pytest
+from src.blog_writer_sdk.integrations.dataforseo_capabilities import DataForSEOCapabilityRegistry
+from src.blog_writer_sdk.integrations.dataforseo_integration import DataForSEOClient
+
+
+class PlatformClient(DataForSEOClient):
+    """Client answering LLM mentions requests per platform with a delay."""
+
+    def __init__(self, platforms):
+        super().__init__(api_key="key", api_secret="secret", micro_batching=False)
+        self.capabilities = DataForSEOCapabilityRegistry(cache_manager_getter=lambda: None)
+        self.platforms = platforms  # platform -> (delay, total_count)
+        self.started = []
+        self.cancelled = []
+
+    async def _send_request(self, endpoint, payload, tenant_id, use_ai_format=True):
+        platform = payload[0]["platform"]
+        delay, total_count = self.platforms[platform]
+        self.started.append(platform)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(platform)
+            raise
+        return {
+            "status_code": 20000,
+            "tasks": [{
+                "status_code": 20000,
+                "result": [{
+                    "total_count": total_count,
+                    "items": [{"ai_search_volume": total_count, "mentions_count": total_count}] if total_count else [],
+                }],
+            }],
+        }
+
+
+class TestLLMMentionsRacing:
+    """Auto mode queries platforms concurrently and caches outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_first_non_empty_cancels_slower_platform(self):
+        client = PlatformClient({"chat_gpt": (0.5, 10), "google": (0.02, 500)})
+
+        started = time.perf_counter()
+        result = await client.get_llm_mentions_search("seo tools", platform="auto")
+        elapsed = time.perf_counter() - started
+
+        assert result["platform"] == "google"
+        assert elapsed < 0.4
+        await asyncio.sleep(0)
+        assert sorted(client.started) == ["chat_gpt", "google"]
+        assert client.cancelled == ["chat_gpt"]
+
+    @pytest.mark.asyncio
+    async def test_best_policy_waits_for_highest_count(self):
+        client = PlatformClient({"chat_gpt": (0.05, 900), "google": (0.01, 500)})
+
+        result = await client.get_llm_mentions_search("seo tools", platform="auto", selection_policy="best")
+
+        assert result["platform"] == "chat_gpt"
+        assert client.cancelled == []
+
+    @pytest.mark.asyncio
+    async def test_empty_platform_falls_through_and_results_are_cached(self):
+        client = PlatformClient({"chat_gpt": (0.01, 0), "google": (0.03, 200)})
+
+        first = await client.get_llm_mentions_search("seo tools", platform="auto")
+        assert first["platform"] == "google"
+        assert sorted(client.started) == ["chat_gpt", "google"]
+
+        # Known platform with data is reused without any request
+        client.started.clear()
+        again = await client.get_llm_mentions_search("seo tools", platform="auto")
+        assert again is first and client.started == []
+
+        # The empty chat_gpt answer was cached as well
+        explicit = await client.get_llm_mentions_search("seo tools", platform="chat_gpt")
+        assert explicit["mentions_count"] == 0 and client.started == []
+
+        # Different location is a separate cache entry
+        await client.get_llm_mentions_search("seo tools", location_name="Germany", platform="google")
+        assert client.started == ["google"]
@@ -0,0 +1,115 @@
+"""
+Tests for the fast JSON response path and SSE encoder.
+"""
+
+import gzip
+import json
+from datetime import datetime
+from enum import Enum
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from src.blog_writer_sdk.api import fast_json
+from src.blog_writer_sdk.api.blog_streaming import BlogGenerationStage, stream_blog_stage_update
+from src.blog_writer_sdk.api.fast_json import (
+    cached_fragment,
+    dumps,
+    fast_json_response,
+    negotiate_encoding,
+    sse_event,
+)
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Keyword(BaseModel):
+    keyword: str
+    seen_at: datetime
+
+
+def _payload():
+    return {
+        "keywords": [Keyword(keyword=f"kw {i}", seen_at=datetime(2030, 1, 1, 12, i)) for i in range(3)],
+        "color": Color.RED,
+        "tags": {"seo"},
+        1: "int key",
+        "text": "café ✓",
+    }
+
+
+EXPECTED = {
+    "keywords": [{"keyword": f"kw {i}", "seen_at": f"2030-01-01T12:0{i}:00"} for i in range(3)],
+    "color": "red",
+    "tags": ["seo"],
+    "1": "int key",
+    "text": "café ✓",
+}
+
+
+class TestDumps:
+    """Serialization with orjson and the stdlib fallback."""
+
+    @pytest.mark.parametrize("orjson_enabled", [True, False])
+    def test_matches_jsonable_shape(self, monkeypatch, orjson_enabled):
+        if not orjson_enabled:
+            monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", False)
+        assert json.loads(dumps(_payload())) == EXPECTED
+
+    @pytest.mark.parametrize("orjson_enabled", [True, False])
+    def test_fragments_are_spliced(self, monkeypatch, orjson_enabled):
+        if not orjson_enabled:
+            monkeypatch.setattr(fast_json, "ORJSON_AVAILABLE", False)
+        result = {"sections": [{"title": "Intro", "words": 120}], "big": 2 ** 70}
+        fragment = cached_fragment(("test", orjson_enabled), result)
+
+        assert cached_fragment(("test", orjson_enabled), {"ignored": True}) is fragment
+        decoded = json.loads(dumps({"job_id": "j1", "result": fragment, "other": [fragment]}))
+        assert decoded == {"job_id": "j1", "result": result, "other": [result]}
+
+    def test_sse_event(self):
+        assert sse_event({"a": 1}, event="stage") == 'event: stage\ndata: {"a":1}\n\n'
+
+    @pytest.mark.asyncio
+    async def test_stage_update_is_parseable(self):
+        message = await stream_blog_stage_update(BlogGenerationStage.DRAFT_GENERATION, 40.0, data={"words": 10})
+        assert message.startswith("data: ") and message.endswith("\n\n")
+        assert json.loads(message[6:])["data"] == {"words": 10}
+
+
+class TestCompression:
+    """Accept-Encoding negotiation and compressed responses."""
+
+    def test_negotiation(self, monkeypatch):
+        monkeypatch.setattr(fast_json, "BROTLI_AVAILABLE", True)
+        assert negotiate_encoding("gzip, deflate, br", 5000) == "br"
+        assert negotiate_encoding("br;q=0.5, gzip", 5000) == "gzip"
+        assert negotiate_encoding("gzip;q=0, br;q=0", 5000) is None
+        assert negotiate_encoding("*", 5000) == "br"
+        assert negotiate_encoding("gzip", 10) is None
+
+        monkeypatch.setattr(fast_json, "BROTLI_AVAILABLE", False)
+        assert negotiate_encoding("br, gzip;q=0.1", 5000) == "gzip"
+        assert negotiate_encoding("br", 5000) is None
+
+    def test_response_compressed_per_request(self):
+        app = FastAPI()
+        payload = {"keywords": [{"keyword": f"keyword {i}", "volume": i} for i in range(500)]}
+
+        @app.get("/big")
+        async def big(request: Request):
+            return fast_json_response(payload, request)
+
+        client = TestClient(app)
+        compressed = client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["vary"] == "Accept-Encoding"
+        assert compressed.json() == payload
+
+        plain = client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert len(plain.content) > len(gzip.compress(plain.content))
+        assert plain.json() == payload
@@ -0,0 +1,113 @@
+"""
+Tests for the Google Custom Search result cache and quota budget.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.integrations.google_custom_search import (
+    GoogleCustomSearchClient,
+    SearchQuotaTracker,
+    SearchResultCache,
+)
+
+
+class FakeSearchClient(GoogleCustomSearchClient):
+    """Client answering searches without HTTP, spending quota per call."""
+
+    def __init__(self, now, daily_limit=10, reserve=0.2, fail=False):
+        clock = lambda: now[0]
+        super().__init__(
+            api_key="key",
+            search_engine_id="cx",
+            result_cache=SearchResultCache(cache_manager_getter=lambda: None, clock=clock),
+            quota=SearchQuotaTracker(daily_limit=daily_limit, reserve=reserve, clock=clock),
+        )
+        self.fail = fail
+        self.calls = []
+
+    async def _fetch_results(self, query, num_results, language, country, date_restrict, safe):
+        self.calls.append(query)
+        self.quota.record()
+        await asyncio.sleep(0.01)
+        if self.fail:
+            return [], False
+        return [{"title": f"{query} {len(self.calls)}", "link": "https://example.org", "display_link": "example.org"}], True
+
+
+class TestSearchCache:
+    """Normalized caching, per-method TTLs and dedup."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_queries_share_cache_and_inflight_calls(self):
+        client = FakeSearchClient([0.0])
+
+        results = await asyncio.gather(
+            client.search("Dog  Grooming Tips"),
+            client.search("dog grooming tips"),
+            client.search("DOG grooming tips "),
+        )
+        again = await client.search("dog grooming tips")
+
+        assert client.calls == ["Dog  Grooming Tips"]
+        assert results[0] == results[1] == results[2] == again
+        stats = client.get_stats()
+        assert (stats["deduplicated"], stats["cache_hits"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_recency_searches_expire_sooner(self):
+        now = [0.0]
+        client = FakeSearchClient(now, daily_limit=100)
+
+        await client.get_recent_information("ai news")
+        await client.analyze_competitors("ai news")
+        now[0] = 2 * 3600
+        await client.get_recent_information("ai news")
+        await client.analyze_competitors("ai news")
+
+        assert client.calls == ["ai news", "ai news", "ai news"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        client = FakeSearchClient([0.0], fail=True)
+
+        assert await client.search("pricing") == []
+        client.fail = False
+        assert len(await client.search("pricing")) == 1
+        assert client.calls == ["pricing", "pricing"]
+
+
+class TestQuotaBudget:
+    """Stale results are served instead of spending the reserve."""
+
+    @pytest.mark.asyncio
+    async def test_low_quota_serves_stale_results(self):
+        now = [0.0]
+        client = FakeSearchClient(now, daily_limit=5, reserve=0.4)
+
+        first = await client.search("seo tools")
+        for query in ("a", "b"):
+            await client.search(query)
+        assert client.quota.is_low()
+
+        now[0] = 7 * 3600  # past the 'search' TTL
+        assert await client.search("seo tools") == first
+        assert client.calls == ["seo tools", "a", "b"]
+        assert client.get_stats()["stale_served"] == 1
+
+        # Uncached queries may still use the reserve, then stop
+        await client.search("c")
+        await client.search("d")
+        assert await client.search("e") == []
+        assert client.calls[-2:] == ["c", "d"]
+        assert client.get_stats()["quota_skipped"] == 1
+
+    def test_budget_resets_daily(self):
+        now = [0.0]
+        quota = SearchQuotaTracker(daily_limit=3, reserve=0, clock=lambda: now[0])
+        quota.record(2)
+        quota.mark_exhausted()
+        assert quota.remaining() == 0
+
+        now[0] += 86400
+        assert quota.remaining() == 3
@@ -0,0 +1,124 @@
+"""
+Tests for batched, cached Knowledge Graph entity resolution.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.integrations.google_knowledge_graph import (
+    EntityCache,
+    GoogleKnowledgeGraphClient,
+    score_entity_candidates,
+)
+from src.blog_writer_sdk.seo.keyword_clustering import ClusteringResult, KeywordCluster, KeywordClustering
+
+
+class FakeKnowledgeGraphClient(GoogleKnowledgeGraphClient):
+    """Client whose API calls are answered from a table."""
+
+    def __init__(self, known, max_concurrency=2, fail=(), cache=None):
+        super().__init__(
+            api_key="test",
+            max_concurrency=max_concurrency,
+            entity_cache=cache or EntityCache(cache_manager_getter=lambda: None),
+        )
+        self.known = known
+        self.fail = set(fail)
+        self.queries = []
+        self.active = 0
+        self.peak = 0
+
+    async def _search(self, query, limit=10, languages=None, types=None, indent=True):
+        self.queries.append(query)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if query in self.fail:
+            return None
+        name = self.known.get(query.lower())
+        return [{"name": name, "types": ["Place"]}] if name else []
+
+
+CONTENT = (
+    "Our bakery in New York opened last year. Visitors from New York love it.\n"
+    "The team uses Square for payments. Square handles every order.\n"
+    "This guide covers everything. However, Brooklyn is next."
+)
+
+
+class TestCandidateScoring:
+    """Precompiled extraction ranks likely entities first."""
+
+    def test_ranks_repeated_multiword_names_first(self):
+        candidates = score_entity_candidates(CONTENT, limit=10)
+
+        assert candidates[:3] == ["New York", "Square", "Brooklyn"]
+        assert "This" not in candidates and "However" not in candidates
+        assert score_entity_candidates(CONTENT, limit=1) == ["New York"]
+
+
+class TestEntityResolution:
+    """Bounded concurrency, dedup and positive/negative caching."""
+
+    @pytest.mark.asyncio
+    async def test_resolution_is_bounded_and_cached(self):
+        client = FakeKnowledgeGraphClient({"new york": "New York City", "square": "Square, Inc."})
+
+        entities = await client.extract_entities_from_content(CONTENT, limit=5)
+        assert [e["name"] for e in entities] == ["New York City", "Square, Inc."]
+        assert client.peak <= 2
+        first_queries = len(client.queries)
+
+        # Same names (including unknown ones) are not looked up again
+        again = await client.extract_entities_from_content(CONTENT, limit=5)
+        assert again == entities
+        assert len(client.queries) == first_queries
+        assert await client.get_entity_details("NEW  YORK") == entities[0]
+        assert len(client.queries) == first_queries
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        client = FakeKnowledgeGraphClient({"brooklyn": "Brooklyn"}, fail={"Brooklyn"})
+
+        assert await client.get_entity_details("Brooklyn") is None
+        client.fail.clear()
+        assert (await client.get_entity_details("Brooklyn"))["name"] == "Brooklyn"
+        assert client.queries == ["Brooklyn", "Brooklyn"]
+
+    @pytest.mark.asyncio
+    async def test_negative_entries_expire(self):
+        now = [0.0]
+        cache = EntityCache(negative_ttl=60, cache_manager_getter=lambda: None, clock=lambda: now[0])
+        client = FakeKnowledgeGraphClient({}, cache=cache)
+
+        await client.get_entity_details("Nowhere")
+        await client.get_entity_details("Nowhere")
+        assert client.queries == ["Nowhere"]
+        now[0] = 61
+        await client.get_entity_details("Nowhere")
+        assert client.queries == ["Nowhere", "Nowhere"]
+
+
+class TestKeywordClusteringEntities:
+    """Entity grouping reuses the batched resolver."""
+
+    @pytest.mark.asyncio
+    async def test_marks_entity_clusters(self):
+        client = FakeKnowledgeGraphClient({"brooklyn": "Brooklyn", "pizza": "Pizza Hut"})
+        clustering = KeywordClustering(knowledge_graph_client=client)
+        result = ClusteringResult(
+            clusters=[
+                KeywordCluster(topic, [topic], 1.0, [topic], "topic")
+                for topic in ("brooklyn", "pizza", "bakery tips")
+            ],
+            unclustered=[],
+            total_keywords=3,
+            cluster_count=3,
+        )
+
+        entities = await clustering.resolve_entity_clusters(result)
+
+        assert set(entities) == {"brooklyn"}
+        types = {c.parent_topic: c.category_type for c in result.clusters}
+        assert types == {"brooklyn": "entity", "pizza": "topic", "bakery tips": "topic"}
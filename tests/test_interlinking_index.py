@@ -0,0 +1,81 @@
+"""
+Tests for the inverted-index interlinking engine.
+"""
+
+import random
+
+from src.blog_writer_sdk.seo.interlinking_analyzer import InterlinkingAnalyzer
+from src.blog_writer_sdk.seo.interlinking_index import InterlinkIndexRegistry
+
+WORDS = ["seo", "content", "marketing", "email", "guide", "python", "tips", "local", "ads", "art", "smart"]
+
+
+def _inventory(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"post-{i}",
+            "title": " ".join(rng.sample(WORDS, 3)).title(),
+            "url": f"https://example.com/post-{i}",
+            "keywords": [" ".join(rng.sample(WORDS, rng.randint(1, 2))) for _ in range(rng.randint(0, 3))],
+            "published_at": "2020-01-01T00:00:00Z",
+        }
+        for i in range(count)
+    ]
+
+
+def _normalize(matches):
+    return {
+        keyword: [(m["content"]["id"], m["match_type"], round(m["score"], 6)) for m in found]
+        for keyword, found in matches.items()
+    }
+
+
+class TestInterlinkIndex:
+    """Indexed matching agrees with the linear matcher and syncs incrementally."""
+
+    def test_index_matches_linear_scan(self):
+        analyzer = InterlinkingAnalyzer()
+        content = analyzer.normalize_content(_inventory(300))
+        keywords = ["seo", "smart ads", "email marketing guide", "art", "python tips", "unrelated phrase", "a"]
+
+        linear = analyzer.match_keywords_to_content(keywords, content)
+        indexed = analyzer.match_keywords_to_content(keywords, content, index=analyzer.build_index(content))
+
+        assert _normalize(indexed) == _normalize(linear)
+
+    def test_top_k_opportunities(self):
+        analyzer = InterlinkingAnalyzer()
+        result = analyzer.analyze_interlinking_opportunities(["seo guide"], _inventory(200), top_k=5)
+
+        opportunities = result["per_keyword"][0]["interlink_opportunities"]
+        scores = [o["relevance_score"] for o in opportunities]
+        assert len(opportunities) == 5
+        assert scores == sorted(scores, reverse=True)
+
+    def test_registry_syncs_only_changed_items(self):
+        analyzer = InterlinkingAnalyzer()
+        registry = InterlinkIndexRegistry(max_sites=2)
+        items = _inventory(50)
+
+        index, counts = registry.sync("tenant:webflow:site", analyzer.normalize_content(items))
+        assert counts["added"] == 50
+
+        _, counts = registry.sync("tenant:webflow:site", analyzer.normalize_content(items))
+        assert counts == {"added": 0, "updated": 0, "removed": 0, "unchanged": 50}
+
+        items[0] = dict(items[0], keywords=["zebra crossing"])
+        again, counts = registry.sync("tenant:webflow:site", analyzer.normalize_content(items[:-1]))
+        assert again is index
+        assert counts == {"added": 0, "updated": 1, "removed": 1, "unchanged": 48}
+        assert [index.content(p)["id"] for p, kind, _ in index.search("zebra crossing")] == ["post-0"]
+        assert "post-49" not in index
+
+    def test_registry_evicts_least_recent_site(self):
+        analyzer = InterlinkingAnalyzer()
+        registry = InterlinkIndexRegistry(max_sites=2)
+        for site in ("a", "b", "c"):
+            registry.sync(site, analyzer.normalize_content(_inventory(3)))
+
+        assert registry.get("a") is None
+        assert registry.get("c") is not None
@@ -0,0 +1,95 @@
+"""
+Tests for compact job records: bounded progress log, deltas and stored results.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.blog_writer_sdk.models.job_models import PROGRESS_HISTORY_LIMIT, BlogGenerationJob, JobStatus
+from src.blog_writer_sdk.services.job_result_store import JobResultStore, get_job_result_store
+
+
+def _job(job_id="job-1"):
+    return BlogGenerationJob(job_id=job_id, request={"topic": "dogs"})
+
+
+class TestProgressLog:
+    """Ring buffer with sequence numbers."""
+
+    def test_history_is_bounded(self):
+        job = _job()
+        for i in range(PROGRESS_HISTORY_LIMIT + 10):
+            job.add_progress({"stage": f"stage_{i}", "progress_percentage": 1.0})
+
+        assert len(job.progress_updates) == PROGRESS_HISTORY_LIMIT
+        assert job.progress_seq == PROGRESS_HISTORY_LIMIT + 10
+        assert job.progress_updates[0]["seq"] == 11
+        assert job.current_stage == f"stage_{PROGRESS_HISTORY_LIMIT + 9}"
+
+    def test_deltas_since_sequence(self):
+        job = _job()
+        for i in range(5):
+            job.add_progress({"stage": f"s{i}"})
+
+        updates, truncated = job.progress_since(3)
+        assert [u["seq"] for u in updates] == [4, 5] and not truncated
+        assert job.progress_since(5) == ([], False)
+
+        for i in range(PROGRESS_HISTORY_LIMIT):
+            job.add_progress({"stage": "more"})
+        updates, truncated = job.progress_since(3)
+        assert truncated and len(updates) == PROGRESS_HISTORY_LIMIT
+
+    def test_constructed_history_is_bounded(self):
+        job = BlogGenerationJob(
+            job_id="j", request={}, progress_updates=[{"seq": i} for i in range(PROGRESS_HISTORY_LIMIT * 2)]
+        )
+        assert job.progress_updates.maxlen == PROGRESS_HISTORY_LIMIT
+
+
+class TestJobResultStore:
+    """Results serialized once, bounded and evictable."""
+
+    def test_store_and_evict(self):
+        store = JobResultStore(max_results=2)
+        store.put("a", {"title": "A"})
+        store.put("b", {"title": "B"})
+        store.put("c", {"title": "C"})
+
+        assert store.get("a") is None
+        assert store.load("c") == {"title": "C"}
+        assert store.get_stats()["stored_results"] == 2
+
+
+class TestJobEndpoints:
+    """Status deltas and one-time result fetch."""
+
+    @pytest.fixture
+    def client(self):
+        import main
+        job = _job("job-endpoint")
+        main.blog_generation_jobs[job.job_id] = job
+        yield TestClient(main.app), job
+        main.blog_generation_jobs.pop(job.job_id, None)
+        get_job_result_store().discard(job.job_id)
+
+    def test_status_deltas_and_result(self, client):
+        http, job = client
+        job.status = JobStatus.PROCESSING
+        for i in range(3):
+            job.add_progress({"stage": "draft_generation", "progress_percentage": 10.0 * i})
+
+        data = http.get(f"/api/v1/blog/jobs/{job.job_id}?since=2").json()
+        assert [u["seq"] for u in data["progress_updates"]] == [3]
+        assert data["last_seq"] == 3 and data["result_url"] is None
+        assert http.get(f"/api/v1/blog/jobs/{job.job_id}/result").status_code == 409
+
+        get_job_result_store().put(job.job_id, {"title": "Done"})
+        job.result_available = True
+        job.status = JobStatus.COMPLETED
+
+        delta = http.get(f"/api/v1/blog/jobs/{job.job_id}?since=3").json()
+        assert delta["progress_updates"] == [] and delta["result"] is None
+        assert http.get(delta["result_url"]).json() == {"title": "Done"}
+
+        legacy = http.get(f"/api/v1/blog/jobs/{job.job_id}").json()
+        assert legacy["result"] == {"title": "Done"} and len(legacy["progress_updates"]) == 3
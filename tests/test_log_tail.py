@@ -0,0 +1,113 @@
+"""
+Tests for the shared log tailer.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.monitoring.log_tail import LogFilter, LogTailer
+
+
+def _record(n, severity="INFO", request_id=None, org_id=None, second=None):
+    return {
+        "insert_id": f"id-{n}",
+        "timestamp": f"2030-01-01T00:00:{second if second is not None else n:02d}+00:00",
+        "severity": severity,
+        "message": f"message {n}",
+        "request_id": request_id,
+        "org_id": org_id,
+    }
+
+
+class ScriptedFetch:
+    """Blocking fetch stub returning queued batches and counting calls."""
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.calls = 0
+
+    def __call__(self, since):
+        self.calls += 1
+        return self.batches.pop(0) if self.batches else []
+
+
+async def _take(iterator, count):
+    return [await iterator.__anext__() for _ in range(count)]
+
+
+class TestLogTailer:
+    """Shared polling, fan-out, filtering and replay."""
+
+    @pytest.mark.asyncio
+    async def test_one_poll_feeds_all_subscribers(self):
+        fetch = ScriptedFetch([[_record(1), _record(2)]])
+        tailer = LogTailer(fetch=fetch, poll_interval=0.01, idle_timeout=0)
+
+        streams = [tailer.subscribe() for _ in range(10)]
+        results = await asyncio.gather(*(_take(s, 2) for s in streams))
+
+        assert all([r["insert_id"] for r in result] == ["id-1", "id-2"] for result in results)
+        assert fetch.calls <= 3
+        for stream in streams:
+            await stream.aclose()
+        await tailer.stop()
+
+    @pytest.mark.asyncio
+    async def test_server_side_filters(self):
+        tailer = LogTailer(fetch=ScriptedFetch([]))
+        errors = tailer.subscribe(LogFilter(min_severity="warning"))
+        org = tailer.subscribe(LogFilter(org_id="org-2", request_id="req-9"))
+        first_error, first_org = asyncio.ensure_future(errors.__anext__()), asyncio.ensure_future(org.__anext__())
+        await asyncio.sleep(0)
+
+        tailer.publish([
+            _record(1, "DEBUG", org_id="org-2"),
+            _record(2, "ERROR", org_id="org-1"),
+            _record(3, "INFO", request_id="req-9", org_id="org-2"),
+        ])
+
+        assert (await first_error)["insert_id"] == "id-2"
+        assert (await first_org)["insert_id"] == "id-3"
+        await errors.aclose()
+        await org.aclose()
+        await tailer.stop()
+
+    @pytest.mark.asyncio
+    async def test_overlapping_polls_are_deduplicated_and_replayed(self):
+        tailer = LogTailer(fetch=ScriptedFetch([]), buffer_size=3)
+        tailer.publish([_record(1), _record(2, second=5), _record(3, second=5)])
+        # Next poll starts at the boundary timestamp and sees id-3 again
+        assert tailer.publish([_record(3, second=5), _record(4, second=6)]) == 1
+
+        late = tailer.subscribe(replay=2)
+        assert [r["insert_id"] for r in await _take(late, 2)] == ["id-3", "id-4"]
+        assert [r["insert_id"] for r in tailer.buffer] == ["id-2", "id-3", "id-4"]
+        await late.aclose()
+        await tailer.stop()
+
+    @pytest.mark.asyncio
+    async def test_replay_larger_than_queue_is_clamped(self):
+        tailer = LogTailer(fetch=ScriptedFetch([]), buffer_size=10, max_queue=4)
+        tailer.publish([_record(n) for n in range(10)])
+
+        late = tailer.subscribe(replay=10)
+        assert [r["insert_id"] for r in await _take(late, 4)] == ["id-6", "id-7", "id-8", "id-9"]
+        await late.aclose()
+        await tailer.stop()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_and_idle_shutdown(self):
+        fetch = ScriptedFetch([])
+        tailer = LogTailer(fetch=fetch, poll_interval=0.01, idle_timeout=0.02)
+
+        stream = tailer.subscribe(heartbeat=0.01)
+        assert await stream.__anext__() is None
+        assert tailer.subscriber_count == 1
+        await stream.aclose()
+        assert tailer.subscriber_count == 0
+
+        await asyncio.sleep(0.1)
+        assert not tailer.stats()["running"]
+        polls = fetch.calls
+        await asyncio.sleep(0.05)
+        assert fetch.calls == polls
@@ -0,0 +1,161 @@
+"""
+Tests for the concurrent media upload pipeline.
+"""
+
+import asyncio
+import io
+
+import pytest
+from src.blog_writer_sdk.integrations import media_storage as ms
+from src.blog_writer_sdk.integrations.media_storage import (
+    MediaUploadPipeline,
+    media_content_hash,
+    media_size,
+    open_media_stream,
+)
+
+
+class RecordingUploader:
+    """Upload stub that tracks concurrency and can fail the first attempts."""
+
+    def __init__(self, failures=None, delay=0.01):
+        self.failures = dict(failures or {})
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, media_file):
+        filename = media_file["filename"]
+        self.calls.append(filename)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures.get(filename, 0) > 0:
+                self.failures[filename] -= 1
+                raise ConnectionError(f"upload of {filename} dropped")
+            return {"id": filename, "url": f"https://cdn/{filename}"}
+        finally:
+            self.in_flight -= 1
+
+
+def _files(count):
+    return [{"data": f"image-{i}".encode(), "filename": f"img-{i}.png"} for i in range(count)]
+
+
+class TestMediaUploadPipeline:
+    """Concurrency, ordering, dedup and retry behaviour."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        monkeypatch.setattr(ms.random, "uniform", lambda a, b: 0)
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order_with_bounded_concurrency(self):
+        uploader = RecordingUploader()
+        pipeline = MediaUploadPipeline(uploader, max_concurrency=3)
+
+        results = await pipeline.upload_all(_files(10))
+
+        assert [r["id"] for r in results] == [f"img-{i}.png" for i in range(10)]
+        assert 1 < uploader.max_in_flight <= 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_content_uploaded_once(self):
+        uploader = RecordingUploader()
+        pipeline = MediaUploadPipeline(uploader)
+        files = [
+            {"data": b"same", "filename": "a.png"},
+            {"data": io.BytesIO(b"same"), "filename": "b.png"},
+            {"data": b"other", "filename": "c.png"},
+        ]
+
+        results = await pipeline.upload_all(files)
+
+        assert uploader.calls == ["a.png", "c.png"]
+        assert results[0] == results[1] and results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_same_content_with_different_alt_text_is_kept(self):
+        uploader = RecordingUploader()
+        pipeline = MediaUploadPipeline(uploader)
+        files = [
+            {"data": b"same", "filename": "a.png", "alt_text": "A red bicycle"},
+            {"data": b"same", "filename": "b.png", "alt_text": "Bicycle in the rain"},
+            {"data": b"same", "filename": "c.png", "alt_text": "A red bicycle"},
+        ]
+
+        results = await pipeline.upload_all(files)
+
+        assert uploader.calls == ["a.png", "b.png"]
+        assert results[0] == results[2]
+        assert results[1]["id"] == "b.png"
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_are_retried(self):
+        uploader = RecordingUploader(failures={"img-1.png": 2})
+        pipeline = MediaUploadPipeline(uploader, max_attempts=3)
+
+        results = await pipeline.upload_all(_files(3))
+
+        assert all("error" not in r for r in results)
+        assert uploader.calls.count("img-1.png") == 3
+
+    @pytest.mark.asyncio
+    async def test_rerun_resumes_only_failed_files(self):
+        uploader = RecordingUploader(failures={"img-2.png": 1})
+        pipeline = MediaUploadPipeline(uploader, max_attempts=1)
+
+        first = await pipeline.upload_all(_files(4))
+        assert first[2] == {"error": "upload of img-2.png dropped", "filename": "img-2.png"}
+
+        uploader.calls.clear()
+        second = await pipeline.upload_all(_files(4))
+        assert uploader.calls == ["img-2.png"]
+        assert all("error" not in r for r in second)
+
+    @pytest.mark.asyncio
+    async def test_raise_on_error(self):
+        pipeline = MediaUploadPipeline(RecordingUploader(failures={"img-0.png": 5}), max_attempts=2)
+        with pytest.raises(ConnectionError):
+            await pipeline.upload_all(_files(2), raise_on_error=True)
+
+
+class TestMediaStorageManagerBatch:
+    """Batches through the manager share one pipeline per folder."""
+
+    @pytest.mark.asyncio
+    async def test_rerun_uploads_only_failed_files(self, monkeypatch):
+        monkeypatch.setattr(ms.random, "uniform", lambda a, b: 0)
+        uploader = RecordingUploader(failures={"img-1.png": 1})
+        manager = ms.MediaStorageManager()
+
+        async def upload_media(media_data, filename, folder=None, metadata=None):
+            return await uploader({"data": media_data, "filename": filename})
+
+        manager.upload_media = upload_media
+        first = await manager.batch_upload_media(_files(3), folder="posts", max_attempts=1)
+        assert "error" in first[1]
+
+        uploader.calls.clear()
+        second = await manager.batch_upload_media(_files(3), folder="posts", max_attempts=1)
+        assert uploader.calls == ["img-1.png"]
+        assert all("error" not in r for r in second)
+
+
+class TestMediaStreams:
+    """Helpers for streamed media."""
+
+    def test_stream_helpers_do_not_consume_stream(self):
+        stream = io.BytesIO(b"x" * 1000)
+        stream.seek(10)
+
+        assert media_size(stream) == 1000
+        assert stream.tell() == 10
+        assert media_content_hash(stream) == media_content_hash(b"x" * 1000)
+
+        wrapped = open_media_stream(stream)
+        assert wrapped.read() == b"x" * 1000
+        wrapped.close()
+        assert not stream.closed
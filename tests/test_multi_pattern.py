@@ -0,0 +1,105 @@
+"""
+Tests for multi-pattern matching and its use in link/keyword insertion.
+"""
+
+import random
+
+import pytest
+from src.blog_writer_sdk.ai.multi_stage_pipeline import MultiStageGenerationPipeline
+from src.blog_writer_sdk.seo.semantic_keyword_integrator import KeywordCluster, SemanticKeywordIntegrator
+from src.blog_writer_sdk.utils.multi_pattern import MultiPatternMatcher, get_cached_matcher
+
+
+class TestMultiPatternMatcher:
+    """Aho-Corasick matching agrees with naive substring search."""
+
+    def test_matches_every_occurrence(self):
+        rng = random.Random(3)
+        patterns = ["he", "she", "his", "hers", "a", "ab", "bab", "abab"]
+        matcher = MultiPatternMatcher((p, p) for p in patterns)
+
+        for _ in range(50):
+            text = "".join(rng.choice("abehirs ") for _ in range(60))
+            expected = sorted(
+                (i, i + len(p), p) for p in patterns for i in range(len(text)) if text.startswith(p, i)
+            )
+            found = sorted((m.start, m.end, m.payload) for m in matcher.iter_matches(text))
+            assert found == expected
+
+    def test_first_occurrences_case_insensitive(self):
+        matcher = MultiPatternMatcher([("SEO", "seo"), ("content marketing", "cm"), ("", "empty")])
+        first = matcher.first_occurrences("Content Marketing and seo; more SEO")
+
+        assert set(first) == {"seo", "cm"}
+        assert (first["cm"].start, first["seo"].start) == (0, 22)
+        assert matcher.pattern_count == 2
+
+    def test_cached_matcher_compiled_once(self):
+        calls = []
+
+        def patterns():
+            calls.append(1)
+            return [("alpha", 0)]
+
+        first = get_cached_matcher(("test", "alpha"), patterns())
+        second = get_cached_matcher(("test", "alpha"), [])
+        assert first is second
+        assert len(calls) == 1
+
+
+class TestInternalLinkInsertion:
+    """Link insertion through the compiled matcher."""
+
+    @pytest.mark.asyncio
+    async def test_links_follow_target_priority_and_share_lines(self):
+        content = "\n".join([
+            "# Title",
+            "Email marketing works best when paired with a solid SEO strategy for small teams.",
+            "Nothing relevant in this paragraph, it is long enough but mentions no targets.",
+            "A [content calendar](/existing) keeps Content Calendar planning honest for everyone.",
+        ])
+        targets = [
+            {"url": "/seo", "title": "SEO Strategy", "keywords": ["seo"]},
+            {"url": "/email", "title": "Email Marketing", "keywords": []},
+            {"url": "/calendar", "title": "Editorial", "keywords": ["content calendar"]},
+        ]
+
+        linked, legacy, metadata = await MultiStageGenerationPipeline._generate_and_insert_internal_links(
+            None, content, [], "topic", internal_link_targets=targets, max_links=5
+        )
+
+        lines = linked.split("\n")
+        assert lines[1] == (
+            "[Email marketing](/email) works best when paired with a solid [SEO strategy](/seo) for small teams."
+        )
+        # First occurrence is already linked, so the target is skipped on this line
+        assert "(/calendar)" not in lines[3]
+        assert [link["url"] for link in legacy] == ["/seo", "/email"]
+        assert metadata["inserted"][0]["relevance_score"] == 0.8
+
+
+class TestSemanticIntegrationPoints:
+    """Indexed integration points agree with the pairwise relevance check."""
+
+    def test_matches_pairwise_check(self):
+        integrator = SemanticKeywordIntegrator()
+        clusters = [
+            KeywordCluster("email marketing", ["email tools", "marketing automation", "newsletter"], {}, {}),
+            KeywordCluster("seo audit", ["technical seo", "site audit checklist"], {}, {}),
+        ]
+        content = (
+            "Email campaigns need good tools. Marketing teams automate a lot! "
+            "An seo audit starts with a checklist. Nothing here. Technical email marketing audit."
+        )
+
+        expected = []
+        for i, sentence in enumerate(content.replace("!", ".").split(". ")):
+            for cluster in clusters:
+                for keyword in cluster.related_keywords[:5]:
+                    if integrator._is_semantically_relevant(sentence, keyword, cluster.primary_keyword):
+                        expected.append((i, keyword))
+                        break
+
+        points = integrator._identify_integration_points(content, clusters)
+        assert [(p["position"], p["keyword"]) for p in points] == expected
+        assert sorted(integrator._extract_used_keywords(content, clusters)) == ["email marketing", "seo audit"]
@@ -0,0 +1,111 @@
+"""
+Tests for keyset pagination and NDJSON streaming helpers.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from src.blog_writer_sdk.api.pagination import (
+    apply_keyset,
+    decode_cursor,
+    encode_cursor,
+    keyset_slice,
+    ndjson_response,
+    next_cursor,
+)
+
+
+class RecordingQuery:
+    """Query builder stub recording filter and order calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def or_(self, expression):
+        self.calls.append(("or", expression))
+        return self
+
+    def order(self, column, desc=False):
+        self.calls.append(("order", column, desc))
+        return self
+
+
+def _jobs(count):
+    base = datetime(2024, 1, 1)
+    # Pairs share a timestamp so the id tie-breaker matters
+    return [{"id": f"job-{i:02d}", "created_at": base + timedelta(minutes=i // 2)} for i in range(count)]
+
+
+class TestKeysetPagination:
+    """Cursor encoding and (created_at, id) keyset paging."""
+
+    def test_cursor_round_trip(self):
+        cursor = encode_cursor(datetime(2024, 5, 1, 12, 30), "abc")
+        assert decode_cursor(cursor) == ("2024-05-01T12:30:00", "abc")
+
+        with pytest.raises(HTTPException):
+            decode_cursor("not-a-cursor")
+
+    def test_pages_cover_every_item_once_in_order(self):
+        jobs = _jobs(11)
+        key = lambda job: (job["created_at"], job["id"])
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = keyset_slice(jobs, key, limit=4, cursor=cursor)
+            seen.extend(job["id"] for job in page)
+            if not cursor:
+                break
+
+        assert seen == [f"job-{i:02d}" for i in reversed(range(11))]
+
+    def test_page_is_stable_when_new_items_arrive(self):
+        jobs = _jobs(6)
+        key = lambda job: (job["created_at"], job["id"])
+        first, cursor = keyset_slice(jobs, key, limit=3)
+
+        jobs.append({"id": "job-new", "created_at": datetime(2030, 1, 1)})
+        second, _ = keyset_slice(jobs, key, limit=3, cursor=cursor)
+
+        assert [j["id"] for j in second] == ["job-02", "job-01", "job-00"]
+
+    def test_apply_keyset_filters_after_cursor(self):
+        query = apply_keyset(RecordingQuery(), encode_cursor("2024-01-01T00:00:00+00:00", "id-9"))
+
+        assert query.calls == [
+            ("or", 'created_at.lt."2024-01-01T00:00:00+00:00",'
+                   'and(created_at.eq."2024-01-01T00:00:00+00:00",id.lt."id-9")'),
+            ("order", "created_at", True),
+            ("order", "id", True),
+        ]
+
+    def test_next_cursor_only_for_full_pages(self):
+        rows = [{"id": "a", "created_at": "2024-01-02"}, {"id": "b", "created_at": "2024-01-01"}]
+        assert next_cursor(rows, limit=3) is None
+        assert decode_cursor(next_cursor(rows, limit=2)) == ("2024-01-01", "b")
+
+
+class TestNdjsonResponse:
+    """Newline-delimited JSON streaming."""
+
+    def test_streams_sync_and_async_rows(self):
+        app = FastAPI()
+
+        async def rows():
+            for i in range(3):
+                yield {"n": i, "at": datetime(2024, 1, 1)}
+
+        app.get("/async")(lambda: ndjson_response(rows()))
+        app.get("/sync")(lambda: ndjson_response(iter([{"n": 1}]), filename="x.ndjson"))
+        client = TestClient(app)
+
+        streamed = client.get("/async")
+        assert streamed.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["n"] for line in streamed.text.splitlines()] == [0, 1, 2]
+
+        exported = client.get("/sync")
+        assert exported.text == '{"n":1}\n'
+        assert "x.ndjson" in exported.headers["content-disposition"]
@@ -0,0 +1,153 @@
+"""
+Tests for latency-aware AI provider routing, hedging and circuit breakers.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.ai.base_provider import (
+    AIProviderConfig,
+    AIProviderError,
+    AIProviderManager,
+    AIProviderType,
+    AIRequest,
+    AIResponse,
+    BaseAIProvider,
+    ContentType,
+)
+from src.blog_writer_sdk.ai.provider_routing import CircuitState, ProviderRouter
+
+
+class FakeProvider(BaseAIProvider):
+    """Provider stub with scripted delay and failures."""
+
+    def __init__(self, name, delay=0.0, fail=False):
+        super().__init__(api_key="test")
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    @property
+    def provider_type(self):
+        return AIProviderType.OPENAI
+
+    @property
+    def supported_models(self):
+        return ["fake"]
+
+    @property
+    def default_model(self):
+        return "fake"
+
+    async def initialize(self):
+        pass
+
+    async def generate_content(self, request, model=None):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise AIProviderError("boom", self.name)
+        return AIResponse(content=self.name, provider=self.name, model="fake")
+
+    async def validate_api_key(self):
+        return True
+
+    def estimate_cost(self, tokens, model=None):
+        return 0.0
+
+    def get_rate_limits(self):
+        return {}
+
+
+def _manager(*providers, hedging=True, **router_kwargs):
+    router_kwargs.setdefault("default_hedge_delay", 0.05)
+    router_kwargs.setdefault("hedge_min_delay", 0.0)
+    manager = AIProviderManager(router=ProviderRouter(**router_kwargs), hedging_enabled=hedging)
+    for priority, provider in enumerate(providers, start=1):
+        manager.add_provider(
+            provider.name, provider,
+            AIProviderConfig(provider_type=AIProviderType.OPENAI, api_key="test", priority=priority)
+        )
+    return manager
+
+
+REQUEST = AIRequest(prompt="hello", content_type=ContentType.SECTION)
+
+
+class TestProviderRouter:
+    """EWMA ranking and circuit breaker state machine."""
+
+    def test_rank_prefers_fastest_measured(self):
+        router = ProviderRouter(alpha=0.5)
+        router.record_success("slow:default", 0.5)
+        router.record_success("fast:default", 0.2)
+
+        assert router.rank(["new:default", "slow:default", "fast:default"]) == [
+            "new:default", "fast:default", "slow:default"
+        ]
+        for _ in range(3):
+            router.record_failure("fast:default")
+        assert router.rank(["slow:default", "fast:default"]) == ["slow:default", "fast:default"]
+
+    def test_circuit_opens_and_half_opens(self):
+        now = [0.0]
+        router = ProviderRouter(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+        router.record_failure("p:default")
+        assert router.allow("p:default")
+        router.record_failure("p:default")
+        assert not router.allow("p:default")
+
+        now[0] = 11
+        assert router.allow("p:default")
+        assert not router.allow("p:default")  # one probe at a time
+        router.record_failure("p:default")
+        assert router.is_open("p:default")
+
+        now[0] = 22
+        assert router.allow("p:default")
+        router.record_success("p:default", 0.1)
+        assert router.snapshot()["p:default"]["circuit_state"] == CircuitState.CLOSED
+
+
+class TestAIProviderManagerRouting:
+    """Hedged requests through the manager."""
+
+    @pytest.mark.asyncio
+    async def test_hedges_slow_primary_and_cancels_loser(self):
+        slow, fast = FakeProvider("slow", delay=1.0), FakeProvider("fast", delay=0.01)
+        manager = _manager(slow, fast)
+
+        response = await manager.generate_content(REQUEST)
+
+        assert response.provider == "fast"
+        await asyncio.sleep(0)
+        assert slow.cancelled == 1
+        # The abandoned attempt counts as a slow sample, so routing flips
+        assert manager._route(None, None) == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_failover_without_hedging(self):
+        broken, backup = FakeProvider("broken", fail=True), FakeProvider("backup")
+        manager = _manager(broken, backup, hedging=False, failure_threshold=2)
+
+        for _ in range(3):
+            assert (await manager.generate_content(REQUEST)).provider == "backup"
+
+        # Circuit opened after two failures; the third request skipped it
+        assert broken.calls == 2
+        assert manager.get_provider_status()["broken"]["routing"]["broken:default"]["circuit_state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_all_failing_raises(self):
+        manager = _manager(FakeProvider("a", fail=True), FakeProvider("b", fail=True), failure_threshold=1)
+
+        with pytest.raises(AIProviderError, match="All AI providers failed"):
+            await manager.generate_content(REQUEST)
+        with pytest.raises(AIProviderError, match="circuit open"):
+            await manager.generate_content(REQUEST)
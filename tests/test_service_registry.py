@@ -0,0 +1,90 @@
+"""
+Tests for the lazy service registry.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.services.service_registry import ServiceRegistry
+
+
+class TestServiceRegistry:
+    """Lazy construction, dependency order, concurrency and readiness."""
+
+    @pytest.mark.asyncio
+    async def test_services_built_once_on_first_use(self):
+        calls = []
+        registry = ServiceRegistry()
+        registry.register("db", lambda: calls.append("db") or "db-client")
+
+        assert registry.peek("db") is None
+        results = await asyncio.gather(registry.get("db"), registry.get("db"))
+
+        assert results == ["db-client", "db-client"]
+        assert calls == ["db"]
+
+    @pytest.mark.asyncio
+    async def test_dependencies_first_and_independent_services_in_parallel(self):
+        order = []
+
+        def make(name, delay):
+            async def factory():
+                order.append(f"start:{name}")
+                await asyncio.sleep(delay)
+                order.append(f"end:{name}")
+                return name
+            return factory
+
+        registry = ServiceRegistry()
+        registry.register("a", make("a", 0.05))
+        registry.register("b", make("b", 0.05))
+        registry.register("c", make("c", 0), depends_on=["a", "b"])
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await registry.warm_up()
+
+        assert loop.time() - started < 0.09
+        assert order.index("start:c") > max(order.index("end:a"), order.index("end:b"))
+
+    @pytest.mark.asyncio
+    async def test_readiness_tracks_critical_services(self):
+        gate = asyncio.Event()
+
+        async def slow():
+            await gate.wait()
+            return "warm"
+
+        def broken():
+            raise RuntimeError("no credentials")
+
+        registry = ServiceRegistry()
+        registry.register("cache", lambda: "cache", critical=True)
+        registry.register("search", slow)
+        registry.register("secrets", broken, in_thread=True)
+        registry.register("optional", lambda: None)
+
+        await registry.warm_up(registry.critical_names())
+        background = registry.start_warm_up()
+        await asyncio.sleep(0.05)
+
+        assert registry.is_ready()
+        assert not registry.is_ready(require_all=True)
+        assert registry.status()["search"]["state"] == "warming"
+
+        gate.set()
+        await background
+        status = registry.status()
+        assert registry.is_ready(require_all=True)
+        assert status["secrets"]["state"] == "failed"
+        assert status["secrets"]["error"] == "no credentials"
+        assert status["optional"]["state"] == "disabled"
+
+    def test_registration_outside_event_loop(self):
+        registry = ServiceRegistry()
+        registry.register("flaky", lambda: 1 / 0)
+
+        # Registration happens at import time, before any event loop exists
+        assert asyncio.run(registry.get("flaky")) is None
+        assert asyncio.run(registry.get("flaky")) is None
+        assert registry.status()["flaky"]["state"] == "failed"
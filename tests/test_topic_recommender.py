@@ -0,0 +1,131 @@
+"""
+Tests for vectorized topic scoring and selection.
+"""
+
+import random
+
+import pytest
+from src.blog_writer_sdk.seo import topic_recommender
+from src.blog_writer_sdk.seo.topic_recommender import (
+    TopicCandidateTable,
+    TopicRecommendationEngine,
+    gap_opportunity_scores,
+    opportunity_scores,
+    ranking_scores,
+)
+
+
+def _ranking_reference(volume, difficulty, competition, cpc):
+    volume_score = 40 if volume >= 10000 else 35 if volume >= 5000 else 30 if volume >= 1000 else 25 if volume >= 500 else 20 if volume >= 100 else 10
+    difficulty_score = 30 if difficulty <= 30 else 25 if difficulty <= 50 else 20 if difficulty <= 70 else 10
+    competition_score = 20 if competition <= 0.3 else 15 if competition <= 0.5 else 10 if competition <= 0.7 else 5
+    cpc_score = 10 if cpc >= 5 else 8 if cpc >= 2 else 6 if cpc >= 1 else 4 if cpc >= 0.5 else 2
+    return volume_score + difficulty_score + competition_score + cpc_score
+
+
+def _candidates(count, seed=11):
+    rng = random.Random(seed)
+    boundaries = [0, 99, 100, 500, 1000, 5000, 10000, 20000]
+    return (
+        [rng.choice(boundaries + [rng.randint(0, 20000)]) for _ in range(count)],
+        [rng.choice([30, 40, 50, 60, 70, rng.uniform(0, 100)]) for _ in range(count)],
+        [rng.choice([0.3, 0.4, 0.5, 0.6, 0.7, rng.random()]) for _ in range(count)],
+        [rng.choice([0.5, 1.0, 2.0, 5.0, rng.uniform(0, 8)]) for _ in range(count)],
+    )
+
+
+class StubDataForSEO:
+    """DataForSEO stub returning overview rows in the raw task format."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+        self.overview_calls = 0
+        self.related_calls = []
+
+    async def get_keyword_suggestions(self, seed_keyword, **kwargs):
+        return [{"keyword": k} for k in self.metrics][:kwargs.get("limit", 50)]
+
+    async def get_related_keywords(self, keyword, **kwargs):
+        self.related_calls.append(keyword)
+        return {"items": [{"keyword": f"{keyword} tips"}]}
+
+    async def get_keyword_overview(self, keywords, **kwargs):
+        self.overview_calls += 1
+        items = [
+            {
+                "keyword": k,
+                "keyword_info": {"search_volume": v, "competition": c, "cpc": p},
+                "keyword_properties": {"keyword_difficulty": d},
+            }
+            for k, (v, d, c, p) in self.metrics.items() if k in keywords
+        ]
+        return {"tasks": [{"result": [{"items": items}]}]}
+
+
+class TestVectorizedScoring:
+    """Columnar scoring matches the per-topic thresholds."""
+
+    @pytest.mark.parametrize("numpy_enabled", [True, False])
+    def test_matches_scalar_thresholds(self, monkeypatch, numpy_enabled):
+        if not numpy_enabled:
+            monkeypatch.setattr(topic_recommender, "NUMPY_AVAILABLE", False)
+        volume, difficulty, competition, cpc = _candidates(500)
+
+        scores = list(ranking_scores(volume, difficulty, competition, cpc))
+        expected = [_ranking_reference(*row) for row in zip(volume, difficulty, competition, cpc)]
+        assert scores == expected
+        assert max(opportunity_scores(volume, difficulty, competition)) <= 100
+        assert list(gap_opportunity_scores([60, 40, 80], [0, 0, 0], [3, 7, 10])) == [80, 70, 50]
+
+    def test_scalar_methods_delegate(self):
+        engine = TopicRecommendationEngine()
+        assert engine._calculate_ranking_score(10000, 30, 0.3, 5.0) == 100
+        assert engine._calculate_opportunity_score(50, 90, 0.9) == 30
+        assert engine._calculate_gap_opportunity_score(10, 0, 10) == 60
+
+
+class TestCandidateSelection:
+    """Dedup and top-k selection over the candidate table."""
+
+    @pytest.mark.parametrize("numpy_enabled", [True, False])
+    def test_top_k_is_stable_sort_prefix(self, monkeypatch, numpy_enabled):
+        if not numpy_enabled:
+            monkeypatch.setattr(topic_recommender, "NUMPY_AVAILABLE", False)
+        rng = random.Random(5)
+        scores = [rng.choice([10, 20, 30, 40]) for _ in range(300)]
+        mask = [rng.random() > 0.3 for _ in scores]
+
+        expected = sorted((i for i in range(len(scores)) if mask[i]), key=lambda i: -scores[i])[:25]
+        assert TopicCandidateTable.top_k(scores, 25, mask) == expected
+        assert TopicCandidateTable.top_k(scores, 0) == []
+
+    def test_unique_mask_normalizes_keywords(self):
+        table = TopicCandidateTable(
+            ["SEO  Tips", "seo tips", "", "email", " Email "], [1] * 5, [1] * 5, [1] * 5, [1] * 5
+        )
+        assert list(table.unique_mask()) == [True, False, False, True, False]
+
+    @pytest.mark.asyncio
+    async def test_recommend_topics_builds_only_selected(self, monkeypatch):
+        rng = random.Random(2)
+        metrics = {
+            f"keyword {i}": (rng.randint(0, 20000), rng.uniform(0, 100), rng.random(), rng.uniform(0, 8))
+            for i in range(1500)
+        }
+        monkeypatch.setattr(topic_recommender, "SUGGESTIONS_PER_SEED", 1500)
+        client = StubDataForSEO(metrics)
+        engine = TopicRecommendationEngine(dataforseo_client=client)
+
+        result = await engine.recommend_topics(
+            ["seed"], min_search_volume=100, max_difficulty=70, max_topics=20, include_ai_suggestions=False
+        )
+
+        topics = result.recommended_topics
+        assert len(topics) == 20
+        assert client.overview_calls == 3
+        assert sorted(client.related_calls[1:]) == sorted(t.primary_keyword for t in topics)
+        assert all(t.search_volume >= 100 and t.difficulty <= 70 for t in topics)
+        eligible = [_ranking_reference(*m) for m in metrics.values() if m[0] >= 100 and m[1] <= 70]
+        assert [t.ranking_score for t in topics] == sorted(eligible, reverse=True)[:20]
+        assert result.high_priority_topics == [t for t in topics if t.ranking_score >= 70][:5]
+        assert result.low_competition_topics == [t for t in topics if t.difficulty < 40][:5]
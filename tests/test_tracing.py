@@ -0,0 +1,214 @@
+"""
+Tests for request tracing.
+"""
+
+import asyncio
+
+import pytest
+from src.blog_writer_sdk.monitoring import tracing
+from src.blog_writer_sdk.monitoring.tracing import (
+    LogSpanExporter,
+    NOOP_SPAN,
+    OTLPSpanExporter,
+    SpanKind,
+    current_span,
+    current_traceparent,
+    end_trace,
+    incoming_traceparent,
+    parse_traceparent,
+    span,
+    start_span,
+    start_trace,
+    timing_breakdown,
+    traced,
+)
+from src.blog_writer_sdk.services.cloud_tasks_service import CloudTasksService
+from src.blog_writer_sdk.services.task_queue_emulator import LocalTaskQueue
+
+
+class RecordingExporter(tracing.SpanExporter):
+    def __init__(self):
+        self.traces = []
+
+    def export(self, trace):
+        self.traces.append(trace)
+
+
+@pytest.fixture
+def exporter():
+    recorder = RecordingExporter()
+    tracing.set_span_exporter(recorder)
+    yield recorder
+    tracing.set_span_exporter(None)
+
+
+class TestSpans:
+    """Nesting, context propagation and export."""
+
+    def test_span_outside_trace_is_noop(self):
+        with span("orphan") as s:
+            assert s is NOOP_SPAN
+        assert current_span() is None
+
+    def test_nested_spans_and_export(self, exporter):
+        root = start_trace("GET /x")
+        with span("outer", SpanKind.STAGE) as outer:
+            with span("inner", SpanKind.UPSTREAM) as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+        end_trace(root)
+
+        assert current_span() is None
+        trace = exporter.traces[0]
+        names = {s.name: s for s in trace.spans}
+        assert names["inner"].parent_id == names["outer"].span_id
+        assert names["outer"].parent_id == root.span_id
+        assert trace.root is root
+
+    def test_error_is_recorded(self, exporter):
+        root = start_trace("GET /x")
+        with pytest.raises(ValueError):
+            with span("fails"):
+                raise ValueError("boom")
+        end_trace(root)
+        failed = next(s for s in exporter.traces[0].spans if s.name == "fails")
+        assert failed.error == "ValueError: boom"
+
+    @pytest.mark.asyncio
+    async def test_child_tasks_attach_to_current_span(self, exporter):
+        @traced("work", SpanKind.UPSTREAM)
+        async def work(i):
+            await asyncio.sleep(0)
+            return i
+
+        root = start_trace("POST /x")
+        with span("fan-out") as parent:
+            assert await asyncio.gather(*(work(i) for i in range(3))) == [0, 1, 2]
+        end_trace(root)
+
+        children = [s for s in exporter.traces[0].spans if s.name == "work"]
+        assert len(children) == 3
+        assert all(s.parent_id == parent.span_id for s in children)
+
+    def test_manual_span_restores_parent(self, exporter):
+        root = start_trace("GET /x")
+        stage = start_span("stage one", SpanKind.STAGE)
+        assert current_span() is stage
+        stage.end()
+        assert current_span() is root
+        end_trace(root)
+
+    def test_span_cap(self, exporter, monkeypatch):
+        monkeypatch.setenv("TRACING_MAX_SPANS", "5")
+        root = start_trace("GET /x")
+        for i in range(10):
+            with span(f"s{i}"):
+                pass
+        end_trace(root)
+        trace = exporter.traces[0]
+        assert len(trace.spans) <= 6
+        assert trace.dropped >= 5
+
+    def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("TRACING_ENABLED", "false")
+        assert start_trace("GET /x") is NOOP_SPAN
+
+
+class TestPropagation:
+    """traceparent parsing and Cloud Tasks propagation."""
+
+    def test_parse_traceparent(self):
+        value = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        assert parse_traceparent(value) == ("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7")
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+
+    def test_continues_incoming_trace(self, exporter):
+        value = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        root = start_trace("POST /worker", traceparent=value)
+        assert root.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert root.parent_id == "00f067aa0ba902b7"
+        end_trace(root)
+
+    def test_cloud_trace_context_fallback(self):
+        value = incoming_traceparent({"x-cloud-trace-context": "4bf92f3577b34da6a3ce929d0e0e4736/1;o=1"})
+        assert value == "00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000001-01"
+
+    @pytest.mark.asyncio
+    async def test_cloud_tasks_carry_traceparent(self, exporter):
+        queue = LocalTaskQueue(dispatch=False)
+        service = CloudTasksService(emulator=queue)
+        root = start_trace("POST /api/v1/blog/generate-enhanced")
+        await service.create_blog_generation_task_async({"job_id": "abc"}, "http://localhost/api/v1/blog/worker")
+        end_trace(root)
+
+        trace_id, parent_id = parse_traceparent(queue.tasks[0].headers["traceparent"])
+        assert trace_id == root.trace_id
+        enqueue = next(s for s in exporter.traces[0].spans if s.name == "cloud_tasks enqueue")
+        assert parent_id == enqueue.span_id
+
+    def test_no_header_outside_trace(self):
+        assert current_traceparent() is None
+        assert "traceparent" not in CloudTasksService(emulator=LocalTaskQueue(dispatch=False))._build_headers({})
+
+
+class TestBreakdown:
+    """Per-job timing summaries."""
+
+    def test_breakdown_groups_by_kind(self, exporter):
+        root = start_trace("POST /worker")
+        for stage in ("research", "draft"):
+            with span(f"stage {stage}", SpanKind.STAGE):
+                with span("llm openai", SpanKind.UPSTREAM):
+                    pass
+        with span("cache get", SpanKind.CACHE):
+            pass
+        breakdown = timing_breakdown()
+        end_trace(root)
+
+        assert [s["name"] for s in breakdown["stages"]] == ["stage research", "stage draft"]
+        assert breakdown["by_kind"]["upstream"]["count"] == 2
+        assert breakdown["by_kind"]["cache"]["count"] == 1
+        assert breakdown["trace_id"] == root.trace_id
+        assert all(s["kind"] != "stage" for s in breakdown["slowest"])
+
+    def test_breakdown_outside_trace(self):
+        assert timing_breakdown() is None
+
+
+class TestExporters:
+    """Structured log and OTLP encoding."""
+
+    def test_log_exporter_skips_fast_traces(self, caplog):
+        exporter = LogSpanExporter(min_duration_ms=10_000)
+        trace = tracing.Trace()
+        trace.root = tracing.Span("GET /x", SpanKind.SERVER, trace, None)
+        trace.root.end()
+        with caplog.at_level("INFO", logger="blog_writer.tracing"):
+            exporter.export(trace)
+        assert not caplog.records
+
+    def test_log_exporter_writes_breakdown(self, caplog):
+        exporter = LogSpanExporter(min_duration_ms=0, project_id="proj")
+        trace = tracing.Trace()
+        trace.root = tracing.Span("GET /x", SpanKind.SERVER, trace, None)
+        trace.root.end()
+        with caplog.at_level("INFO", logger="blog_writer.tracing"):
+            exporter.export(trace)
+        record = caplog.records[0]
+        assert record.trace_timing["trace_id"] == trace.trace_id
+        assert getattr(record, "logging.googleapis.com/trace") == f"projects/proj/traces/{trace.trace_id}"
+
+    def test_otlp_payload(self):
+        exporter = OTLPSpanExporter("http://collector:4318/v1/traces", service_name="svc")
+        trace = tracing.Trace()
+        s = tracing.Span("dataforseo x", SpanKind.UPSTREAM, trace, "00f067aa0ba902b7", {"tasks": 2})
+        s.record_error(RuntimeError("down"))
+        s.end()
+        payload = exporter._payload([s])
+        encoded = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert encoded["traceId"] == trace.trace_id
+        assert encoded["parentSpanId"] == "00f067aa0ba902b7"
+        assert encoded["kind"] == 3
+        assert encoded["status"]["code"] == 2
+        assert {"key": "tasks", "value": {"intValue": "2"}} in encoded["attributes"]